@@ -54,6 +54,7 @@ func (h *ProxyHandler) Register(r chi.Router) {
 	// Training Service — train + backtest + models
 	r.Handle("/api/risk/train/*", h.reverseProxy(h.trainingURL))
 	r.Handle("/api/risk/train", h.reverseProxy(h.trainingURL))
+	r.Handle("/api/risk/backtest/*", h.reverseProxy(h.trainingURL))
 	r.Handle("/api/risk/backtest", h.reverseProxy(h.trainingURL))
 	r.Handle("/api/risk/models/*", h.reverseProxy(h.trainingURL))
 	r.Handle("/api/risk/models", h.reverseProxy(h.trainingURL))
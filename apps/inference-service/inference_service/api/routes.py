@@ -4,6 +4,10 @@ Endpoints:
   POST /api/risk/predict              — compute risk metrics for a portfolio
   GET  /api/risk/predict/health       — model health check (which models are loaded)
   GET  /api/risk/scenarios            — list available stress scenarios
+  POST /api/risk/scenarios            — create a user-defined stress scenario
+  GET  /api/risk/scenarios/{id}       — get a single stress scenario
+  PUT  /api/risk/scenarios/{id}       — replace a user-defined stress scenario
+  DELETE /api/risk/scenarios/{id}     — delete a user-defined stress scenario
   POST /api/risk/scenarios/run        — run a stress test scenario
   GET  /api/risk/correlation          — pairwise correlation matrix for portfolio assets
 """
@@ -19,9 +23,18 @@ from sqlalchemy import text
 
 from ..config import get_settings
 from ..db import get_engine
-from ..models.loader import get_registry
+from ..models.loader import GLOBAL_SCOPE, get_registry
 from ..models.predictor import PredictionResult, predict
-from ..scenarios import SCENARIOS, StressRequest, StressResult, run_scenario
+from ..scenarios import (
+    CompiledScenario,
+    StressRequest,
+    StressResult,
+    create_scenario,
+    delete_scenario,
+    get_catalogue,
+    run_scenario,
+    update_scenario,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +86,8 @@ class ModelHealthResponse(BaseModel):
     status: str
     loaded_models: list[str]
     fallback_available: bool
+    scoped_models: list[str] = []      # "type/scope" of lazily loaded per-portfolio models
+    scoped_cache_bytes: int = 0
 
 
 # ---------------------------------------------------------------------------
@@ -254,6 +269,10 @@ async def model_health() -> ModelHealthResponse:
         status="ok" if loaded else "degraded",
         loaded_models=loaded,
         fallback_available=True,  # historical simulation always available
+        scoped_models=[
+            f"{model_type}/{scope}" for model_type, scope in registry.loaded_keys() if scope != GLOBAL_SCOPE
+        ],
+        scoped_cache_bytes=registry.scoped_bytes(),
     )
 
 
@@ -392,6 +411,7 @@ class ScenarioInfo(BaseModel):
     # Historical-only fields (None for parametric)
     period_start: Optional[str] = None
     period_end: Optional[str] = None
+    builtin: bool = False
 
 
 class ScenariosListResponse(BaseModel):
@@ -399,13 +419,65 @@ class ScenariosListResponse(BaseModel):
     total: int
 
 
+class ScenarioDefinitionBody(BaseModel):
+    type: Literal["historical", "parametric"] = Field(..., description="Scenario family")
+    name: str = Field(..., min_length=1, max_length=200)
+    description: str = Field("", max_length=2000)
+    # Parametric: required. Historical: optional override of the replay vol multiplier.
+    vol_multiplier: Optional[float] = Field(None, ge=1.0, le=20.0)
+    corr_shock: Optional[float] = Field(None, ge=0.0, le=1.0)
+    # Historical only: crisis period (ISO dates)
+    period_start: Optional[str] = Field(None, description="YYYY-MM-DD")
+    period_end: Optional[str] = Field(None, description="YYYY-MM-DD")
+
+
+class ScenarioCreateRequest(ScenarioDefinitionBody):
+    id: str = Field(
+        ...,
+        min_length=1,
+        max_length=64,
+        pattern=r"^[a-z0-9_\-]+$",
+        description="Scenario key used in POST /api/risk/scenarios/run",
+    )
+
+
+def _scenario_info(scenario: CompiledScenario) -> ScenarioInfo:
+    period = scenario.period
+    return ScenarioInfo(
+        id=scenario.scenario_id,
+        type=scenario.scenario_type,
+        name=scenario.name,
+        description=scenario.description,
+        vol_multiplier=scenario.vol_multiplier if scenario.scenario_type == "parametric" else None,
+        corr_shock=scenario.corr_shock if scenario.scenario_type == "parametric" else None,
+        period_start=period[0] if period else None,
+        period_end=period[1] if period else None,
+        builtin=scenario.builtin,
+    )
+
+
+def _scenario_defn(scenario_id: str, body: ScenarioDefinitionBody) -> dict:
+    period = None
+    if body.period_start is not None or body.period_end is not None:
+        period = (body.period_start, body.period_end)
+    return {
+        "id": scenario_id,
+        "type": body.type,
+        "name": body.name,
+        "description": body.description,
+        "vol_multiplier": body.vol_multiplier,
+        "corr_shock": body.corr_shock,
+        "period": period,
+    }
+
+
 class ScenarioRunRequest(BaseModel):
     portfolio_id: int = Field(..., description="Portfolio ID to stress-test")
     scenario_id: str = Field(
         ...,
         description=(
-            "Scenario key: historical_2008 | historical_2020 | historical_1998 | "
-            "parametric_mild | parametric_severe | custom"
+            "Scenario key from GET /api/risk/scenarios (e.g. historical_2008, "
+            "parametric_severe, or a user-defined id) or custom"
         ),
     )
     # Optional overrides / custom scenario params
@@ -462,30 +534,64 @@ class ScenarioRunResponse(BaseModel):
 
 @router.get("/api/risk/scenarios", response_model=ScenariosListResponse)
 async def list_scenarios() -> ScenariosListResponse:
-    """Return the catalogue of built-in stress scenarios.
+    """Return the stress scenario catalogue (built-in and user-defined).
 
     Each entry describes either a **historical replay** scenario (with a
     crisis period) or a **parametric stress** scenario (with vol_multiplier
     and corr_shock).  Pass the ``id`` field to ``POST /api/risk/scenarios/run``.
     """
-    items: list[ScenarioInfo] = []
-    for sid, sdef in SCENARIOS.items():
-        period = sdef.get("period")
-        items.append(
-            ScenarioInfo(
-                id=sid,
-                type=sdef["type"],
-                name=sdef["name"],
-                description=sdef.get("description", ""),
-                vol_multiplier=sdef.get("vol_multiplier"),
-                corr_shock=sdef.get("corr_shock"),
-                period_start=period[0] if period else None,
-                period_end=period[1] if period else None,
-            )
-        )
+    items = [_scenario_info(s) for s in get_catalogue().all()]
     return ScenariosListResponse(scenarios=items, total=len(items))
 
 
+@router.post("/api/risk/scenarios", response_model=ScenarioInfo, status_code=201)
+async def create_stress_scenario(body: ScenarioCreateRequest) -> ScenarioInfo:
+    """Persist a user-defined stress scenario.
+
+    The scenario is available to ``POST /api/risk/scenarios/run`` immediately
+    on this replica and within ``scenario_catalogue_refresh_s`` on the others.
+    """
+    if get_catalogue().get(body.id) is not None:
+        raise HTTPException(status_code=409, detail=f"Scenario '{body.id}' already exists")
+    try:
+        compiled = create_scenario(_scenario_defn(body.id, body))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _scenario_info(compiled)
+
+
+@router.get("/api/risk/scenarios/{scenario_id}", response_model=ScenarioInfo)
+async def get_stress_scenario(scenario_id: str) -> ScenarioInfo:
+    """Return a single scenario from the catalogue."""
+    scenario = get_catalogue().get(scenario_id)
+    if scenario is None:
+        raise HTTPException(status_code=404, detail=f"Scenario '{scenario_id}' not found")
+    return _scenario_info(scenario)
+
+
+@router.put("/api/risk/scenarios/{scenario_id}", response_model=ScenarioInfo)
+async def update_stress_scenario(scenario_id: str, body: ScenarioDefinitionBody) -> ScenarioInfo:
+    """Replace a user-defined scenario. Built-in scenarios are read-only."""
+    try:
+        compiled = update_scenario(_scenario_defn(scenario_id, body))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if compiled is None:
+        raise HTTPException(status_code=404, detail=f"Scenario '{scenario_id}' not found")
+    return _scenario_info(compiled)
+
+
+@router.delete("/api/risk/scenarios/{scenario_id}", status_code=204)
+async def delete_stress_scenario(scenario_id: str) -> None:
+    """Delete a user-defined scenario. Built-in scenarios cannot be deleted."""
+    try:
+        deleted = delete_scenario(scenario_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if not deleted:
+        raise HTTPException(status_code=404, detail=f"Scenario '{scenario_id}' not found")
+
+
 @router.post("/api/risk/scenarios/run", response_model=ScenarioRunResponse)
 async def run_stress_scenario(body: ScenarioRunRequest) -> ScenarioRunResponse:
     """Run a stress test scenario for a portfolio.
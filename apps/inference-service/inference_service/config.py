@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Optional
 
 from pydantic_settings import BaseSettings
 
@@ -26,12 +27,28 @@ class Settings(BaseSettings):
     kafka_consumer_group: str = "inference-service"
     kafka_topic_portfolio_updated: str = "portfolio.updated"
     kafka_topic_model_trained: str = "model.trained"
+    kafka_topic_market_data: str = "market.data.ingested"
 
     # Inference defaults
     default_alpha: float = 0.99
     default_horizon_days: int = 1
     default_lookback_days: int = 252
     monte_carlo_simulations: int = 10_000
+    monte_carlo_sampler: str = "pseudo"    # pseudo | antithetic | sobol | importance
+    monte_carlo_workers: int = 1           # threads per simulation (results depend on this value)
+    # Adaptive MC: when set, monte_carlo_simulations is the pilot size and paths are
+    # added until max(SE/VaR, SE/CVaR) <= target or the budget is reached
+    monte_carlo_target_rel_error: Optional[float] = None
+    monte_carlo_max_simulations: int = 1_000_000
+    monte_carlo_dtype: str = "float64"     # float64 | float32 (simulation precision)
+
+    # Model registry: portfolio / symbol-set scoped models are loaded lazily and
+    # evicted least-recently-used beyond this many bytes (global models are pinned)
+    model_registry_max_bytes: int = 512 * 1024 * 1024
+    model_registry_miss_ttl_s: float = 300.0   # re-check MLflow for a scope without a model after this
+
+    # Stress scenario catalogue: how often (seconds) to check stress_scenarios for changes
+    scenario_catalogue_refresh_s: float = 30.0
 
     model_config = {"env_file": ".env", "case_sensitive": False}
 
@@ -1,10 +1,11 @@
 """Kafka consumer for the Inference Service.
 
-Listens on two topics:
-  - `portfolio.updated`  — triggers automatic risk recalculation for the portfolio
-  - `model.trained`      — hot-reloads the new model version into the registry
+Listens on three topics:
+  - `portfolio.updated`     — triggers automatic risk recalculation for the portfolio
+  - `model.trained`         — hot-reloads the new model version into the registry
+  - `market.data.ingested`  — advances the online variance state of loaded GARCH models
 
-Both consumers run in a single background daemon thread.
+All consumers run in a single background daemon thread.
 
 Reliability improvements:
   - Exponential backoff retry for transient failures (e.g. market data not yet ingested)
@@ -25,7 +26,8 @@ from kafka import KafkaConsumer
 from kafka.errors import KafkaError, NoBrokersAvailable
 
 from .config import get_settings
-from .models.loader import get_registry, reload_model
+from .models.garch_state import advance_variance_state
+from .models.loader import NOT_SERVED_MODEL_NAMES, get_registry, reload_model
 from .models.predictor import predict
 
 logger = logging.getLogger(__name__)
@@ -175,6 +177,9 @@ def _handle_model_trained(event: dict) -> None:
             "model.trained event missing model_name or version: %s", event
         )
         return
+    if model_name in NOT_SERVED_MODEL_NAMES:
+        logger.debug("model.trained for %s v%s — not served from MLflow, ignored", model_name, model_version)
+        return
 
     logger.info(
         "model.trained received: model=%s version=%s — hot-reloading",
@@ -188,6 +193,34 @@ def _handle_model_trained(event: dict) -> None:
         logger.error("Hot-reload failed: %s v%s", model_name, model_version)
 
 
+def _handle_market_data_ingested(event: dict) -> None:
+    """Fold newly ingested returns into every loaded GARCH model's variance state.
+
+    Events that name symbols only touch models over an overlapping symbol set;
+    an event without symbols (bulk ingest) touches all of them.
+    """
+    if event.get("status", "completed") != "completed":
+        return
+    ingested = set(event.get("symbols") or [])
+    for model in get_registry().models("garch"):
+        state = model.variance_state
+        if state is None or (ingested and ingested.isdisjoint(state.symbols)):
+            continue
+        try:
+            applied = advance_variance_state(state)
+        except Exception as exc:
+            logger.warning(
+                "Could not advance GARCH variance state of %s v%s: %s",
+                model.model_name, model.model_version, exc,
+            )
+            continue
+        if applied:
+            logger.info(
+                "market.data.ingested: %s v%s variance state now as of %s (%d new returns)",
+                model.model_name, model.model_version, state.asof, applied,
+            )
+
+
 # ---------------------------------------------------------------------------
 # Consumer loop
 # ---------------------------------------------------------------------------
@@ -199,6 +232,7 @@ def _consumer_loop(stop_event: threading.Event) -> None:
     topics = [
         cfg.kafka_topic_portfolio_updated,
         cfg.kafka_topic_model_trained,
+        cfg.kafka_topic_market_data,
     ]
 
     try:
@@ -227,6 +261,8 @@ def _consumer_loop(stop_event: threading.Event) -> None:
                                 _handle_portfolio_updated(msg.value)
                             elif topic == cfg.kafka_topic_model_trained:
                                 _handle_model_trained(msg.value)
+                            elif topic == cfg.kafka_topic_market_data:
+                                _handle_market_data_ingested(msg.value)
                             else:
                                 logger.debug("Unhandled topic: %s", topic)
                         except Exception as exc:
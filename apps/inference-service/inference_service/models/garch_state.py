@@ -0,0 +1,306 @@
+"""Compact GARCH models and their online conditional-variance state.
+
+Training logs each GARCH fit as ``model/garch_params.json``: the (p, q, dist,
+mean) specification, parameters in decimal units and the last p residuals and
+q conditional variances (``compact_artifact`` in the training service).
+``CompactGarch`` is that document; forecasting from it needs only the
+variance recursion
+
+    σ²ₜ₊₁ = ω + Σ αᵢ (rₜ₊₁₋ᵢ − μ)² + Σ βⱼ σ²ₜ₊₁₋ⱼ
+
+so this service neither imports arch nor unpickles an ``ARCHModelResult``
+for runs that logged it. Older runs that only have the pickle are converted
+to a ``CompactGarch`` once at load time (``compact_from_fit``).
+
+A pickled fit forecasts from the last return it was fitted on, so between
+retrains every prediction would ignore the returns that have arrived since.
+``GarchVarianceState`` carries the variance forward instead: each new
+portfolio return is folded into the recursion in O(p + q), which is exactly
+what arch would compute if the model were re-filtered on the longer series
+(parameters stay frozen until the next retrain).
+
+The state is built when a GARCH model is loaded — starting at the training
+run's ``data_end`` and immediately caught up on any returns stored since —
+and advanced on every ``market.data.ingested`` event. A return that shows up
+for a date the state has already passed makes it re-filter from the end of
+the training sample. Runs that predate ``data_end`` keep forecasting from the
+end of their training sample.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from ..db import get_engine
+
+logger = logging.getLogger(__name__)
+
+COMPACT_ARTIFACT = "garch_params.json"   # must match training-service
+_COMPACT_FORMATS = {1}
+
+# arch distribution names (pickled fits) → training-service dist names
+_ARCH_DISTS = {
+    "normal": "normal",
+    "standardized student's t": "t",
+    "standardized skew student's t": "skewt",
+}
+_SHAPE_PARAMS = ("nu", "eta", "lambda")
+
+
+@dataclass(frozen=True)
+class CompactGarch:
+    """A fitted GARCH(p, q) reduced to what forecasting needs (decimal units)."""
+    dist: str                        # normal | t | skewt
+    dist_params: dict[str, float]    # nu (t); eta, lambda (skewt)
+    omega: float
+    alpha: tuple[float, ...]         # ARCH coefficients α₁..αₚ
+    beta: tuple[float, ...]          # GARCH coefficients β₁..β_q
+    mu: float
+    resid: tuple[float, ...]         # last p residuals, newest first
+    sigma2: tuple[float, ...]        # last q conditional variances, newest first
+    data_end: Optional[date] = None  # date of the last training return
+
+    @classmethod
+    def from_dict(cls, doc: dict) -> "CompactGarch":
+        if doc.get("format") not in _COMPACT_FORMATS:
+            raise ValueError(f"Unsupported GARCH artifact format {doc.get('format')!r}")
+        return cls(
+            dist=doc["dist"],
+            dist_params={k: float(v) for k, v in doc.get("dist_params", {}).items()},
+            omega=float(doc["omega"]),
+            alpha=tuple(float(a) for a in doc["alpha"]),
+            beta=tuple(float(b) for b in doc["beta"]),
+            mu=float(doc.get("mu", 0.0)),
+            resid=tuple(float(e) for e in doc["resid"]),
+            sigma2=tuple(float(s) for s in doc["sigma2"]),
+            data_end=date.fromisoformat(doc["data_end"][:10]) if doc.get("data_end") else None,
+        )
+
+    def next_variance(self) -> float:
+        """σ² of the first return after the training sample."""
+        return (
+            self.omega
+            + sum(a * e * e for a, e in zip(self.alpha, self.resid))
+            + sum(b * s for b, s in zip(self.beta, self.sigma2))
+        )
+
+
+def load_compact_garch(path: str) -> CompactGarch:
+    with open(path) as f:
+        return CompactGarch.from_dict(json.load(f))
+
+
+def compact_from_fit(arch_result: Any) -> CompactGarch:
+    """Convert a pickled arch GARCH(p, q) result (zero or constant mean).
+
+    Raises:
+        ValueError: For models outside that family (other mean or volatility
+                    processes, unknown distributions).
+    """
+    params = arch_result.params
+    dist = _ARCH_DISTS.get(arch_result.model.distribution.name.lower())
+    if dist is None:
+        raise ValueError(f"unsupported distribution {arch_result.model.distribution.name!r}")
+    alpha = [float(params[k]) for k in params.index if k.startswith("alpha[")]
+    beta = [float(params[k]) for k in params.index if k.startswith("beta[")]
+    known = {"mu", "omega", *_SHAPE_PARAMS}
+    if any(k not in known and not k.startswith(("alpha[", "beta[")) for k in params.index):
+        raise ValueError(f"unsupported GARCH parameters {list(params.index)}")
+
+    # arch works in percentage returns: ω and σ² scale by 100², μ and ε by 100
+    cond_vol = np.asarray(arch_result.conditional_volatility, dtype=float)
+    resid = np.asarray(arch_result.resid, dtype=float)
+    return CompactGarch(
+        dist=dist,
+        dist_params={k: float(params[k]) for k in _SHAPE_PARAMS if k in params.index},
+        omega=float(params["omega"]) / 1e4,
+        alpha=tuple(alpha),
+        beta=tuple(beta),
+        mu=float(params.get("mu", 0.0)) / 100.0,
+        resid=tuple(resid[::-1][:len(alpha)] / 100.0),
+        sigma2=tuple(cond_vol[::-1][:len(beta)] ** 2 / 1e4),
+    )
+
+
+@dataclass
+class GarchVarianceState:
+    """Conditional variance of the next portfolio return, in decimal units, as of *asof*."""
+    omega: float
+    alpha: tuple[float, ...]
+    beta: tuple[float, ...]
+    mu: float
+    sigma2: list[float]               # σ²ₜ₊₁, σ²ₜ, … (q values, newest first)
+    resid2: list[float]               # ε²ₜ, ε²ₜ₋₁, … (p values, newest first)
+    asof: Optional[date]              # date of the last return folded in; None → frozen
+    symbols: list[str]
+    weights: Optional[dict[str, float]] = None   # None → equal weights
+    n_updates: int = 0
+    applied: list[date] = field(default_factory=list)   # dates folded in since the seed
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _seed: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # State at the end of the training sample, for re-filtering after a late return
+        self._seed = (list(self.sigma2), list(self.resid2), self.asof)
+
+    @property
+    def seed_asof(self) -> Optional[date]:
+        return self._seed[2]
+
+    def reseed(self) -> None:
+        """Rewind to the end of the training sample; returns are then folded in again."""
+        with self._lock:
+            sigma2, resid2, self.asof = self._seed
+            self.sigma2, self.resid2 = list(sigma2), list(resid2)
+            self.applied = []
+
+    def _step(self, resid2: list[float], sigma2: list[float]) -> float:
+        return (
+            self.omega
+            + sum(a * e for a, e in zip(self.alpha, resid2))
+            + sum(b * s for b, s in zip(self.beta, sigma2))
+        )
+
+    def update(self, ret: float, asof: date) -> bool:
+        """Fold the return of *asof* into σ²; returns observed out of order are ignored."""
+        with self._lock:
+            if self.asof is None or asof <= self.asof:
+                return False
+            self.resid2 = [(ret - self.mu) ** 2, *self.resid2[:-1]]
+            self.sigma2 = [self._step(self.resid2, self.sigma2), *self.sigma2[:-1]]
+            self.asof = asof
+            self.applied.append(asof)
+            self.n_updates += 1
+            return True
+
+    def variance(self, horizon_days: int = 1) -> float:
+        """Variance of the *horizon_days*-th return ahead (not cumulative).
+
+        Future squared residuals are replaced by their expectation σ², which
+        for GARCH(1,1) gives σ̄² + (α + β)ʰ⁻¹ (σ²ₜ₊₁ − σ̄²).
+        """
+        with self._lock:
+            resid2, sigma2 = list(self.resid2), list(self.sigma2)
+        for _ in range(horizon_days - 1):
+            resid2 = [sigma2[0], *resid2[:-1]]
+            sigma2 = [self._step(resid2, sigma2), *sigma2[:-1]]
+        return sigma2[0]
+
+    @property
+    def volatility(self) -> float:
+        return float(np.sqrt(self.sigma2[0]))
+
+
+def variance_state(model: CompactGarch, run_params: dict) -> GarchVarianceState:
+    """Online state of *model*, starting at the end of its training sample.
+
+    The training run's params supply the portfolio (``symbols``, ``weights``)
+    and, for artifacts without one, ``data_end``. Without a ``data_end`` the
+    state is frozen at the training sample's forecast.
+    """
+    asof = model.data_end
+    if asof is None and run_params.get("data_end"):
+        asof = date.fromisoformat(run_params["data_end"][:10])
+    weights = run_params.get("weights", "equal")
+    return GarchVarianceState(
+        omega=model.omega,
+        alpha=model.alpha,
+        beta=model.beta,
+        mu=model.mu,
+        sigma2=[model.next_variance(), *model.sigma2[:-1]],
+        resid2=[e * e for e in model.resid],
+        asof=asof,
+        symbols=[s for s in run_params.get("symbols", "").split(",") if s],
+        weights=None if weights == "equal" else json.loads(weights),
+    )
+
+
+def _ready_returns(df: pd.DataFrame, symbols: list[str]) -> pd.DataFrame:
+    """(date × symbol) returns of *df* that can be folded in now, in date order.
+
+    A date some symbol has no return for is dropped, as in training, if that
+    symbol already has a later return (a gap in its calendar). If the symbol
+    has not been ingested that far yet, the date is still pending: it and
+    every later date are held back, so the state does not move past a day
+    that is only partly ingested.
+    """
+    pivot = (
+        df.pivot(index="price_date", columns="symbol", values="ret")
+        .sort_index()
+        .reindex(columns=symbols)
+    )
+    # True where the symbol has a return on this date or a later one
+    reached = pivot.notna().iloc[::-1].cummax().iloc[::-1]
+    pending = ~reached.all(axis=1).to_numpy()
+    if pending.any():
+        pivot = pivot.iloc[: int(pending.argmax())]
+    return pivot.dropna()
+
+
+def advance_variance_state(state: GarchVarianceState) -> int:
+    """Fold every stored portfolio return after ``state.asof`` into *state*.
+
+    Returns are aligned like the training pipeline (dates on which every
+    symbol has a return, weights normalised over those symbols); dates still
+    being ingested are left for a later call (``_ready_returns``). The returns
+    since the training sample are re-read each time: if a date the state has
+    already passed has appeared among them, the state is re-seeded and
+    re-filtered. Returns the number of observations applied.
+    """
+    if state.seed_asof is None or not state.symbols:
+        return 0
+    engine = get_engine()
+    with engine.connect() as conn:
+        df = pd.read_sql(
+            text(
+                """
+                SELECT symbol, price_date, ret
+                FROM processed_returns
+                WHERE symbol = ANY(:symbols) AND price_date > :asof
+                ORDER BY price_date ASC
+                """
+            ),
+            conn,
+            params={"symbols": state.symbols, "asof": state.seed_asof},
+        )
+    if df.empty:
+        return 0
+
+    df["ret"] = df["ret"].astype(float)
+    pivot = _ready_returns(df, state.symbols)
+    if pivot.empty:
+        return 0
+    if state.weights is None:
+        w = np.full(pivot.shape[1], 1.0 / pivot.shape[1])
+    else:
+        w = np.array([state.weights.get(s, 0.0) for s in pivot.columns], dtype=float)
+        if w.sum() <= 0:
+            return 0
+        w = w / w.sum()
+    port = pivot.to_numpy() @ w
+    dates = [pd.Timestamp(d).date() for d in pivot.index]
+
+    start = len(state.applied)
+    if dates[:start] != state.applied:
+        # A return arrived for a date the state has already moved past
+        logger.warning(
+            "GARCH variance state: returns before %s changed — re-filtering from %s",
+            state.asof, state.seed_asof,
+        )
+        state.reseed()
+        start = 0
+    applied = sum(state.update(float(r), d) for d, r in zip(dates[start:], port[start:]))
+    if applied:
+        logger.info(
+            "GARCH variance state advanced by %d returns to %s (σ=%.4f%%)",
+            applied, state.asof, state.volatility * 100.0,
+        )
+    return applied
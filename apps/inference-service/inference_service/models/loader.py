@@ -4,32 +4,111 @@ Loads the latest production GARCH model from the MLflow Model Registry on startu
 and supports hot-reloading when a `model.trained` Kafka event arrives.
 
 Architecture:
-  - GARCH model: stored as a pickled ARCHModelResult artifact under `model/` path.
-  - Monte Carlo: stored as a JSON artifact with GBM params (mu, sigma, cov matrix).
+  - GARCH model: a compact JSON artifact (`model/garch_params.json`) loaded into
+    a ``CompactGarch`` — no arch import needed. Runs that predate it only have a
+    pickled ARCHModelResult under `model/`, which is converted at load time.
+  - Monte Carlo: mlflow.pyfunc MonteCarloModel under `model/`, plus (newer runs)
+    a MultiAssetMonteCarloModel under `multiasset_model/` that prices any weight
+    vector over the trained symbol universe.
   - Historical: no model needed — computed directly from processed_returns.
 
-The loader maintains a thread-safe in-memory cache of the current active model.
+The loader maintains a thread-safe in-memory cache of the active models, keyed
+by (model_type, scope):
+
+  - scope "global" is the model trained on the training request's symbols
+    (``riskops-garch`` / ``riskops-montecarlo``). It is loaded eagerly on
+    startup, hot-reloaded on ``model.trained`` and never evicted.
+  - scope "portfolio-<id>" or "symbols-<hash>" is a model fitted for one
+    portfolio or one symbol set, registered in MLflow as
+    ``riskops-<type>--<scope>`` (see ``registered_model_name``) by a
+    training-service run with ``scope=portfolio|symbols``. These are loaded
+    lazily on first use and evicted least-recently-used once the cache
+    exceeds ``model_registry_max_bytes``; a model larger than the whole
+    cache is not cached at all.
+
+A miss never blocks the request that caused it: ``ModelRegistry.get`` returns
+None at once and schedules the load on a small thread pool (one in-flight load
+per key), so the caller falls back to a wider scope until the model arrives.
+Scopes without a registered model are remembered for
+``model_registry_miss_ttl_s`` so MLflow is not queried on every request.
+
+Scoped lookups are only worth making for scopes that have a registered model.
+The registry therefore tracks the scoped names it knows of — listed from
+MLflow at startup, extended by ``model.trained`` events for scoped names — and
+callers skip scopes outside that set (``ModelRegistry.registered_scopes``).
+While no scoped model exists, resolving a prediction's model costs nothing
+beyond the global lookup.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import pickle
 import threading
 import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import mlflow
 from mlflow.tracking import MlflowClient
 
 from ..config import get_settings
+from .garch_state import (
+    COMPACT_ARTIFACT,
+    CompactGarch,
+    advance_variance_state,
+    compact_from_fit,
+    load_compact_garch,
+    variance_state,
+)
 
 logger = logging.getLogger(__name__)
 
 # MLflow registered model names (must match training-service)
 GARCH_MODEL_NAME = "riskops-garch"
 MONTECARLO_MODEL_NAME = "riskops-montecarlo"
+_BASE_MODEL_NAMES = {"garch": GARCH_MODEL_NAME, "montecarlo": MONTECARLO_MODEL_NAME}
+# Registered by training-service but not loaded from MLflow here: the universe
+# job's per-symbol GARCH parameters are read from symbol_volatility_models in
+# Postgres, so its model.trained events need no hot-reload.
+UNIVERSE_MODEL_NAME = "riskops-garch-universe"
+NOT_SERVED_MODEL_NAMES = frozenset({UNIVERSE_MODEL_NAME})
+
+GLOBAL_SCOPE = "global"
+SYMBOLS_SCOPE_PREFIX = "symbols-"
+# Size charged to the LRU for artifacts that cannot be pickled to measure them
+_DEFAULT_MODEL_BYTES = 1 << 20
+
+ModelKey = tuple[str, str]   # (model_type, scope)
+
+
+def portfolio_scope(portfolio_id: int) -> str:
+    return f"portfolio-{portfolio_id}"
+
+
+def symbols_scope(symbols: list[str]) -> str:
+    """Order-independent scope for a symbol set (hashed to keep MLflow names short)."""
+    digest = hashlib.sha1(",".join(sorted(set(symbols))).encode("utf-8")).hexdigest()
+    return f"{SYMBOLS_SCOPE_PREFIX}{digest[:12]}"
+
+
+def registered_model_name(model_type: str, scope: str = GLOBAL_SCOPE) -> str:
+    """MLflow registered model name of (model_type, scope)."""
+    base = _BASE_MODEL_NAMES[model_type]
+    return base if scope == GLOBAL_SCOPE else f"{base}--{scope}"
+
+
+def parse_model_name(model_name: str) -> Optional[ModelKey]:
+    """Inverse of ``registered_model_name``; None for names this service does not serve."""
+    base, _, scope = model_name.partition("--")
+    for model_type, name in _BASE_MODEL_NAMES.items():
+        if base == name:
+            return model_type, scope or GLOBAL_SCOPE
+    return None
 
 
 @dataclass
@@ -39,8 +118,24 @@ class LoadedModel:
     model_name: str          # MLflow registered model name
     model_version: str       # MLflow model version string
     run_id: str              # MLflow run ID
-    artifact: Any            # The actual model object (ARCHModelResult or dict)
+    artifact: Any            # The actual model object (CompactGarch or pyfunc model)
     metrics: dict = field(default_factory=dict)
+    portfolio_artifact: Any = None   # montecarlo only: multi-asset pyfunc, if logged
+    scope: str = GLOBAL_SCOPE
+    size_bytes: int = 0      # in-memory footprint charged to the registry's LRU
+    variance_state: Any = None   # garch only: GarchVarianceState advanced on new returns
+
+    @property
+    def key(self) -> ModelKey:
+        return self.model_type, self.scope
+
+
+def _approx_bytes(*objects: Any) -> int:
+    """Pickled size of *objects* — a proxy for their in-memory footprint."""
+    try:
+        return sum(len(pickle.dumps(o, protocol=pickle.HIGHEST_PROTOCOL)) for o in objects if o is not None)
+    except Exception:
+        return _DEFAULT_MODEL_BYTES
 
 
 def _setup_mlflow() -> None:
@@ -52,7 +147,11 @@ def _setup_mlflow() -> None:
     os.environ.setdefault("AWS_SECRET_ACCESS_KEY", cfg.aws_secret_access_key)
 
 
-def _get_latest_version(client: MlflowClient, model_name: str) -> Optional[str]:
+def _get_latest_version(
+    client: MlflowClient,
+    model_name: str,
+    log_missing: bool = True,
+) -> Optional[str]:
     """Return the latest version number for a registered model, or None if not found."""
     try:
         versions = client.get_latest_versions(model_name)
@@ -65,7 +164,8 @@ def _get_latest_version(client: MlflowClient, model_name: str) -> Optional[str]:
                     return v.version
         return versions[0].version
     except mlflow.exceptions.MlflowException as exc:
-        logger.warning("Could not fetch versions for model %s: %s", model_name, exc)
+        if log_missing:
+            logger.warning("Could not fetch versions for model %s: %s", model_name, exc)
         return None
 
 
@@ -79,65 +179,100 @@ def _download_artifact(client: MlflowClient, run_id: str, artifact_path: str) ->
     return local_path
 
 
-def load_garch_model(client: MlflowClient, version: str) -> Optional[LoadedModel]:
-    """Load a GARCH model artifact from MLflow.
+def _load_compact_artifact(client: MlflowClient, run_id: str) -> Optional[CompactGarch]:
+    try:
+        path = _download_artifact(client, run_id, f"model/{COMPACT_ARTIFACT}")
+    except Exception:
+        return None   # runs logged before the compact artifact existed
+    return load_compact_garch(path)
+
+
+def _load_pickled_artifact(client: MlflowClient, run_id: str) -> Optional[CompactGarch]:
+    local_dir = _download_artifact(client, run_id, "model")
+
+    # Find the .pkl file inside the downloaded directory
+    pkl_path: Optional[str] = None
+    if os.path.isfile(local_dir) and local_dir.endswith(".pkl"):
+        pkl_path = local_dir
+    elif os.path.isdir(local_dir):
+        for fname in os.listdir(local_dir):
+            if fname.endswith(".pkl"):
+                pkl_path = os.path.join(local_dir, fname)
+                break
+    if pkl_path is None:
+        return None
+
+    with open(pkl_path, "rb") as f:
+        arch_result = pickle.load(f)
+    logger.info("GARCH run_id=%s has no %s — converted its pickled fit", run_id, COMPACT_ARTIFACT)
+    return compact_from_fit(arch_result)
+
+
+def load_garch_model(
+    client: MlflowClient,
+    version: str,
+    scope: str = GLOBAL_SCOPE,
+) -> Optional[LoadedModel]:
+    """Load a GARCH model artifact from MLflow as a ``CompactGarch``.
 
-    The training service stores the pickled ARCHModelResult under `model/` artifact path.
-    We download the pickle file and deserialise it.
+    Only ``model/garch_params.json`` is downloaded when the run has it; runs
+    that predate the compact artifact fall back to the pickled
+    ARCHModelResult under `model/` (which needs arch to unpickle).
     """
+    model_name = registered_model_name("garch", scope)
     try:
-        mv = client.get_model_version(GARCH_MODEL_NAME, version)
+        mv = client.get_model_version(model_name, version)
         run_id = mv.run_id
 
-        # Download the model artifact directory
-        local_dir = _download_artifact(client, run_id, "model")
-
-        # Find the .pkl file inside the downloaded directory
-        pkl_path: Optional[str] = None
-        if os.path.isfile(local_dir) and local_dir.endswith(".pkl"):
-            pkl_path = local_dir
-        elif os.path.isdir(local_dir):
-            for fname in os.listdir(local_dir):
-                if fname.endswith(".pkl"):
-                    pkl_path = os.path.join(local_dir, fname)
-                    break
-
-        if pkl_path is None:
+        compact = _load_compact_artifact(client, run_id)
+        if compact is None:
+            compact = _load_pickled_artifact(client, run_id)
+        if compact is None:
             logger.warning(
-                "No .pkl file found in GARCH model artifact for version %s (run_id=%s)",
-                version, run_id,
+                "No GARCH model artifact found for version %s (run_id=%s)", version, run_id,
             )
             return None
 
-        with open(pkl_path, "rb") as f:
-            arch_result = pickle.load(f)
-
         # Fetch metrics from the run
         run = client.get_run(run_id)
         metrics = dict(run.data.metrics)
 
+        # Online variance state, caught up on returns stored since training
+        state = variance_state(compact, dict(run.data.params))
+        try:
+            advance_variance_state(state)
+        except Exception as exc:
+            logger.warning("Could not catch up GARCH variance state of %s v%s: %s", model_name, version, exc)
+
         logger.info(
-            "Loaded GARCH model version=%s run_id=%s  VaR=%.6f  CVaR=%.6f",
-            version, run_id,
+            "Loaded GARCH model %s version=%s run_id=%s  VaR=%.6f  CVaR=%.6f",
+            model_name, version, run_id,
             metrics.get("var", float("nan")),
             metrics.get("cvar", float("nan")),
         )
 
         return LoadedModel(
             model_type="garch",
-            model_name=GARCH_MODEL_NAME,
+            model_name=model_name,
             model_version=version,
             run_id=run_id,
-            artifact=arch_result,
+            artifact=compact,
             metrics=metrics,
+            scope=scope,
+            size_bytes=_approx_bytes(compact),
+            variance_state=state,
         )
 
     except Exception as exc:
-        logger.error("Failed to load GARCH model version=%s: %s", version, exc)
+        logger.error("Failed to load GARCH model %s version=%s: %s", model_name, version, exc)
         return None
 
 
-def load_montecarlo_model(client: MlflowClient, version: str) -> Optional[LoadedModel]:
+def load_montecarlo_model(
+    client: MlflowClient,
+    version: str,
+    scope: str = GLOBAL_SCOPE,
+) -> Optional[LoadedModel]:
     """Load a Monte Carlo pyfunc model from MLflow.
 
     The training service stores the model as a proper mlflow.pyfunc model
@@ -145,74 +280,276 @@ def load_montecarlo_model(client: MlflowClient, version: str) -> Optional[Loaded
     We load it with mlflow.pyfunc.load_model() so the Inference Service can
     call pyfunc_model.predict(input_df) directly.
     """
+    model_name = registered_model_name("montecarlo", scope)
     try:
         import mlflow.pyfunc
 
-        mv = client.get_model_version(MONTECARLO_MODEL_NAME, version)
+        mv = client.get_model_version(model_name, version)
         run_id = mv.run_id
 
         # Load the pyfunc model from the MLflow run URI
         model_uri = f"runs:/{run_id}/model"
         pyfunc_model = mlflow.pyfunc.load_model(model_uri)
 
+        # Older runs have no multi-asset model — portfolios then use the scalar one
+        try:
+            multiasset_model = mlflow.pyfunc.load_model(f"runs:/{run_id}/multiasset_model")
+        except Exception as exc:
+            logger.info("No multi-asset MC model in run_id=%s (%s)", run_id, exc)
+            multiasset_model = None
+
         run = client.get_run(run_id)
         metrics = dict(run.data.metrics)
 
         logger.info(
-            "Loaded Monte Carlo pyfunc model version=%s run_id=%s  VaR=%.6f  CVaR=%.6f",
-            version, run_id,
+            "Loaded Monte Carlo pyfunc model %s version=%s run_id=%s  VaR=%.6f  CVaR=%.6f",
+            model_name, version, run_id,
             metrics.get("var", float("nan")),
             metrics.get("cvar", float("nan")),
         )
 
         return LoadedModel(
             model_type="montecarlo",
-            model_name=MONTECARLO_MODEL_NAME,
+            model_name=model_name,
             model_version=version,
             run_id=run_id,
             artifact=pyfunc_model,   # mlflow.pyfunc.PyFuncModel — has .predict()
             metrics=metrics,
+            portfolio_artifact=multiasset_model,
+            scope=scope,
+            size_bytes=_approx_bytes(pyfunc_model, multiasset_model),
         )
 
     except Exception as exc:
-        logger.error("Failed to load Monte Carlo pyfunc model version=%s: %s", version, exc)
+        logger.error("Failed to load Monte Carlo pyfunc model %s version=%s: %s", model_name, version, exc)
+        return None
+
+
+_LOADERS = {"garch": load_garch_model, "montecarlo": load_montecarlo_model}
+
+
+def _list_scoped_keys(client: MlflowClient) -> Optional[set[ModelKey]]:
+    """(model_type, scope) of every scoped model registered in MLflow; None if listing fails."""
+    keys: set[ModelKey] = set()
+    try:
+        page_token = None
+        while True:
+            page = client.search_registered_models(
+                filter_string="name LIKE 'riskops-%--%'", page_token=page_token,
+            )
+            for registered in page:
+                key = parse_model_name(registered.name)
+                if key is not None and key[1] != GLOBAL_SCOPE:
+                    keys.add(key)
+            page_token = page.token
+            if not page_token:
+                return keys
+    except mlflow.exceptions.MlflowException as exc:
+        logger.warning("Could not list scoped models — serving global models only: %s", exc)
         return None
 
 
+def load_scoped_model(key: ModelKey, version: Optional[str] = None) -> Optional[LoadedModel]:
+    """Load (model_type, scope) from MLflow — the latest version unless *version* is given.
+
+    Returns None when no model is registered under that scope.
+    """
+    model_type, scope = key
+    _setup_mlflow()
+    client = MlflowClient()
+    if version is None:
+        # Most portfolios have no dedicated model; that is not worth a warning
+        version = _get_latest_version(
+            client, registered_model_name(model_type, scope), log_missing=scope == GLOBAL_SCOPE,
+        )
+        if version is None:
+            return None
+    return _LOADERS[model_type](client, version, scope)
+
+
 class ModelRegistry:
-    """Thread-safe in-memory registry of loaded models.
+    """Thread-safe in-memory registry of loaded models keyed by (model_type, scope).
 
-    Holds the currently active model per model_type.
-    Supports hot-reload via `reload_model()`.
+    Global-scope models are set explicitly (startup, hot-reload) and pinned.
+    Other scopes are loaded on demand through *loader* and kept in an LRU
+    bounded by *max_bytes* of ``LoadedModel.size_bytes``.
+
+    The registry lock only guards dictionary bookkeeping; loads run on the
+    registry's own thread pool, so a slow MLflow download for one key never
+    delays lookups of any other key.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        loader: Optional[Callable[[ModelKey], Optional[LoadedModel]]] = None,
+        max_bytes: int = 512 << 20,
+        miss_ttl_s: float = 300.0,
+        load_workers: int = 2,
+    ) -> None:
         self._lock = threading.RLock()
-        self._models: dict[str, LoadedModel] = {}  # model_type → LoadedModel
-
-    def get(self, model_type: str) -> Optional[LoadedModel]:
+        self._models: OrderedDict[ModelKey, LoadedModel] = OrderedDict()  # LRU order, oldest first
+        self._loader = loader
+        self._max_bytes = max_bytes
+        self._miss_ttl_s = miss_ttl_s
+        self._scoped_bytes = 0
+        self._loading: dict[ModelKey, Future] = {}
+        self._misses: dict[ModelKey, float] = {}   # key → monotonic time of the empty lookup
+        self._registered: set[ModelKey] = set()     # scoped keys known to exist in MLflow
+        self._load_workers = load_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get(
+        self,
+        model_type: str,
+        scope: str = GLOBAL_SCOPE,
+        wait_s: float = 0.0,
+    ) -> Optional[LoadedModel]:
+        """Return the cached model for (model_type, scope), or None.
+
+        On a miss for a non-global scope the load is scheduled in the
+        background; pass *wait_s* > 0 to wait that long for it (only this key
+        is waited on).
+        """
+        key = (model_type, scope)
         with self._lock:
-            return self._models.get(model_type)
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+            future = self._schedule_load(key) if scope != GLOBAL_SCOPE else None
+        if future is None or wait_s <= 0:
+            return None
+        try:
+            return future.result(timeout=wait_s)
+        except Exception:
+            return None
 
     def set(self, model: LoadedModel) -> None:
+        """Cache *model*; a scoped model larger than the whole cache is rejected (as a miss)."""
         with self._lock:
-            self._models[model.model_type] = model
+            previous = self._models.pop(model.key, None)
+            if previous is not None and previous.scope != GLOBAL_SCOPE:
+                self._scoped_bytes -= previous.size_bytes
+            if model.scope != GLOBAL_SCOPE and model.size_bytes > self._max_bytes:
+                self._misses[model.key] = time.monotonic()
+                logger.warning(
+                    "Model type=%s scope=%s (%d KiB) exceeds the %d MiB cache — not cached",
+                    model.model_type, model.scope, model.size_bytes >> 10, self._max_bytes >> 20,
+                )
+                return
+            self._models[model.key] = model
+            self._misses.pop(model.key, None)
+            if model.scope != GLOBAL_SCOPE:
+                self._scoped_bytes += model.size_bytes
+                self._evict(keep=model.key)
             logger.info(
-                "Model registry updated: type=%s version=%s",
-                model.model_type, model.model_version,
+                "Model registry updated: type=%s scope=%s version=%s (%d KiB)",
+                model.model_type, model.scope, model.model_version, model.size_bytes >> 10,
             )
 
+    def invalidate(self, model_type: str, scope: str) -> None:
+        """Forget (model_type, scope) so the next ``get`` reloads it."""
+        key = (model_type, scope)
+        with self._lock:
+            model = self._models.pop(key, None)
+            if model is not None and scope != GLOBAL_SCOPE:
+                self._scoped_bytes -= model.size_bytes
+            self._misses.pop(key, None)
+
+    def contains(self, model_type: str, scope: str = GLOBAL_SCOPE) -> bool:
+        with self._lock:
+            return (model_type, scope) in self._models
+
+    def note_registered(self, model_type: str, scope: str) -> None:
+        """Record that a model is registered under (model_type, scope)."""
+        if scope != GLOBAL_SCOPE:
+            with self._lock:
+                self._registered.add((model_type, scope))
+
+    def replace_registered(self, keys: set[ModelKey]) -> None:
+        """Replace the known scoped keys (e.g. with a fresh MLflow listing)."""
+        with self._lock:
+            self._registered = {key for key in keys if key[1] != GLOBAL_SCOPE}
+
+    def registered_scopes(self, model_type: str) -> set[str]:
+        """Scopes of *model_type* known to have a registered model (never "global")."""
+        with self._lock:
+            return {scope for t, scope in self._registered if t == model_type}
+
     def loaded_types(self) -> list[str]:
         with self._lock:
-            return list(self._models.keys())
+            return sorted({model_type for model_type, _ in self._models})
+
+    def models(self, model_type: str) -> list[LoadedModel]:
+        with self._lock:
+            return [m for (t, _), m in self._models.items() if t == model_type]
+
+    def loaded_keys(self) -> list[ModelKey]:
+        with self._lock:
+            return list(self._models)
+
+    def scoped_bytes(self) -> int:
+        with self._lock:
+            return self._scoped_bytes
 
     def is_empty(self) -> bool:
         with self._lock:
             return len(self._models) == 0
 
+    # -- internals (called with self._lock held) ---------------------------
+
+    def _schedule_load(self, key: ModelKey) -> Optional[Future]:
+        if self._loader is None:
+            return None
+        future = self._loading.get(key)
+        if future is not None:
+            return future
+        missed_at = self._misses.get(key)
+        if missed_at is not None and time.monotonic() - missed_at < self._miss_ttl_s:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._load_workers, thread_name_prefix="model-loader",
+            )
+        future = self._executor.submit(self._load, key)
+        self._loading[key] = future
+        return future
+
+    def _load(self, key: ModelKey) -> Optional[LoadedModel]:
+        model: Optional[LoadedModel] = None
+        try:
+            model = self._loader(key)
+        except Exception as exc:
+            logger.error("Lazy load of model %s failed: %s", key, exc)
+        with self._lock:
+            self._loading.pop(key, None)
+            if model is None:
+                self._misses[key] = time.monotonic()
+            else:
+                self.set(model)
+        return model
+
+    def _evict(self, keep: ModelKey) -> None:
+        for key in list(self._models):
+            if self._scoped_bytes <= self._max_bytes:
+                return
+            model = self._models[key]
+            if model.scope == GLOBAL_SCOPE or key == keep:
+                continue
+            del self._models[key]
+            self._scoped_bytes -= model.size_bytes
+            logger.info(
+                "Evicted model type=%s scope=%s (%d KiB) — cache over %d MiB",
+                model.model_type, model.scope, model.size_bytes >> 10, self._max_bytes >> 20,
+            )
+
 
 # Module-level singleton registry
-_registry = ModelRegistry()
+_registry = ModelRegistry(
+    loader=load_scoped_model,
+    max_bytes=get_settings().model_registry_max_bytes,
+    miss_ttl_s=get_settings().model_registry_miss_ttl_s,
+)
 
 
 def get_registry() -> ModelRegistry:
@@ -253,6 +590,11 @@ def load_all_models() -> None:
             MONTECARLO_MODEL_NAME,
         )
 
+    scoped = _list_scoped_keys(client)
+    _registry.replace_registered(scoped or set())
+    if scoped:
+        logger.info("Scoped models registered in MLflow: %d", len(scoped))
+
     if _registry.is_empty():
         logger.warning(
             "No ML models loaded — all predictions will use historical simulation fallback"
@@ -264,20 +606,24 @@ def load_all_models() -> None:
 def reload_model(model_name: str, model_version: str) -> bool:
     """Hot-reload a specific model version.
 
-    Called when a `model.trained` Kafka event arrives.
-    Returns True if the model was successfully loaded and registered.
+    Called when a `model.trained` Kafka event arrives. Global models are
+    always loaded; a scoped model is only loaded if it is currently cached —
+    otherwise its key is invalidated and the next request loads it lazily.
+    Returns True if the model was successfully loaded (or invalidated).
     """
-    _setup_mlflow()
-    client = MlflowClient()
-
-    if model_name == GARCH_MODEL_NAME:
-        model = load_garch_model(client, model_version)
-    elif model_name == MONTECARLO_MODEL_NAME:
-        model = load_montecarlo_model(client, model_version)
-    else:
+    key = parse_model_name(model_name)
+    if key is None:
         logger.warning("Unknown model name for hot-reload: %s", model_name)
         return False
 
+    model_type, scope = key
+    _registry.note_registered(model_type, scope)
+    if scope != GLOBAL_SCOPE and not _registry.contains(model_type, scope):
+        _registry.invalidate(model_type, scope)
+        logger.info("Scoped model %s v%s not cached — will load on next use", model_name, model_version)
+        return True
+
+    model = load_scoped_model(key, version=model_version)
     if model is None:
         return False
 
@@ -1,9 +1,11 @@
 """Risk prediction engine for the Inference Service.
 
 Supports three methods:
-  1. garch      — uses the loaded ARCHModelResult to forecast conditional volatility,
-                  then derives parametric VaR/CVaR.
-  2. montecarlo — calls the loaded mlflow.pyfunc MonteCarloModel.predict().
+  1. garch      — forecasts conditional volatility from the loaded compact GARCH
+                  model's online variance state, then derives parametric VaR/CVaR.
+  2. montecarlo — calls the loaded mlflow.pyfunc MultiAssetMonteCarloModel with
+                  the portfolio's weights (or MonteCarloModel.predict() when the
+                  portfolio holds symbols outside the trained universe).
   3. historical — non-parametric empirical quantile from processed_returns (fallback).
 
 All methods return a unified PredictionResult dataclass that includes both core
@@ -14,15 +16,25 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 from scipy import stats
+from scipy.special import gammaln
 from sqlalchemy import text
 
+from ..config import get_settings
 from ..db import get_engine
-from .loader import LoadedModel, ModelRegistry
+from .garch_state import CompactGarch
+from .loader import (
+    GLOBAL_SCOPE,
+    SYMBOLS_SCOPE_PREFIX,
+    LoadedModel,
+    ModelRegistry,
+    portfolio_scope,
+    symbols_scope,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -153,6 +165,36 @@ class PredictionResult:
 # Data loading helpers
 # ---------------------------------------------------------------------------
 
+def _load_positions(conn: Any, portfolio_id: int) -> tuple[list[str], np.ndarray]:
+    """Return (symbols, normalised weights) of a portfolio's positions."""
+    positions_df = pd.read_sql(
+        text(
+            """
+            SELECT symbol, weight
+            FROM portfolio_positions
+            WHERE portfolio_id = :pid
+            ORDER BY symbol
+            """
+        ),
+        conn,
+        params={"pid": portfolio_id},
+    )
+
+    if positions_df.empty:
+        raise ValueError(f"Portfolio {portfolio_id} has no positions")
+
+    symbols = positions_df["symbol"].tolist()
+    weights = positions_df["weight"].astype(float).values
+    return symbols, weights / weights.sum()  # normalise
+
+
+def _load_portfolio_weights(portfolio_id: int) -> dict[str, float]:
+    """Normalised {symbol: weight} of a portfolio's positions."""
+    with get_engine().connect() as conn:
+        symbols, weights = _load_positions(conn, portfolio_id)
+    return dict(zip(symbols, weights.tolist()))
+
+
 def _load_portfolio_returns(
     portfolio_id: int,
     lookback_days: int = 252,
@@ -164,25 +206,7 @@ def _load_portfolio_returns(
     engine = get_engine()
     with engine.connect() as conn:
         # Get portfolio positions
-        positions_df = pd.read_sql(
-            text(
-                """
-                SELECT symbol, weight
-                FROM portfolio_positions
-                WHERE portfolio_id = :pid
-                ORDER BY symbol
-                """
-            ),
-            conn,
-            params={"pid": portfolio_id},
-        )
-
-        if positions_df.empty:
-            raise ValueError(f"Portfolio {portfolio_id} has no positions")
-
-        symbols = positions_df["symbol"].tolist()
-        weights = positions_df["weight"].astype(float).values
-        weights = weights / weights.sum()  # normalise
+        symbols, weights = _load_positions(conn, portfolio_id)
 
         # Load returns for those symbols
         returns_df = pd.read_sql(
@@ -286,6 +310,18 @@ def predict_historical(
 # GARCH prediction
 # ---------------------------------------------------------------------------
 
+def _skewt_ppf(pits: np.ndarray, eta: float, lam: float) -> np.ndarray:
+    """Quantiles of Hansen's standardised skewed Student-t (arch's SkewStudent)."""
+    c = np.exp(gammaln((eta + 1.0) / 2.0) - gammaln(eta / 2.0)) / np.sqrt(np.pi * (eta - 2.0))
+    a = 4.0 * lam * c * (eta - 2.0) / (eta - 1.0)
+    b = np.sqrt(1.0 + 3.0 * lam ** 2 - a ** 2)
+    pits = np.asarray(pits, dtype=float)
+    left = pits < (1.0 - lam) / 2.0
+    u = np.where(left, pits / (1.0 - lam), 0.5 + (pits - (1.0 - lam) / 2.0) / (1.0 + lam))
+    icdf = stats.t.ppf(u, eta) * np.where(left, 1.0 - lam, 1.0 + lam) * np.sqrt(1.0 - 2.0 / eta)
+    return (icdf - a) / b
+
+
 def predict_garch(
     portfolio_id: int,
     model: LoadedModel,
@@ -293,34 +329,28 @@ def predict_garch(
     horizon_days: int = 1,
     lookback_days: int = 252,
 ) -> PredictionResult:
-    """Parametric VaR/CVaR using the loaded GARCH model's conditional volatility forecast."""
-    arch_result = model.artifact  # ARCHModelResult from arch library
+    """Parametric VaR/CVaR from the loaded GARCH model's conditional volatility forecast.
 
-    # 1-step-ahead conditional volatility forecast (in percentage points)
-    forecast = arch_result.forecast(horizon=horizon_days, reindex=False)
-    cond_var_pct = float(forecast.variance.iloc[-1, horizon_days - 1])
-    cond_vol_pct = np.sqrt(cond_var_pct)
-    cond_vol = cond_vol_pct / 100.0  # back to decimal
+    The variance comes from the model's online state, which starts at the end
+    of the training sample and is advanced with every return ingested since.
+    """
+    garch: CompactGarch = model.artifact
+    cond_vol = float(np.sqrt(model.variance_state.variance(horizon_days)))
 
     # Annualised volatility
     vol_annualised = cond_vol * np.sqrt(252)
 
-    # Parametric VaR/CVaR — use the distribution the model was actually trained with.
-    # arch stores the distribution name in arch_result.model.distribution.name
-    # and fitted parameters in arch_result.params (e.g. 'nu', 'lambda').
+    # Parametric VaR/CVaR — use the distribution the model was actually trained with
     q_level = 1.0 - alpha  # left-tail quantile level (e.g. 0.01 for 99% VaR)
-    try:
-        dist_name: str = arch_result.model.distribution.name.lower()
-    except Exception:
-        dist_name = "normal"
+    dist_name = garch.dist
 
-    if dist_name in ("normal", "gaussian"):
+    if dist_name == "normal":
         z = stats.norm.ppf(q_level)
         var = float(-z * cond_vol)
         cvar = float(stats.norm.pdf(z) / (1.0 - alpha) * cond_vol)
 
-    elif dist_name in ("t", "studentst", "student's t"):
-        nu = float(arch_result.params.get("nu", 0.0))
+    elif dist_name == "t":
+        nu = float(garch.dist_params.get("nu", 0.0))
         if nu < 2.1:
             logger.warning(
                 "GARCH dist='t' but nu=%.2f (invalid) — falling back to Normal for VaR/CVaR", nu
@@ -336,9 +366,10 @@ def predict_garch(
             cdf_z = float(q_level)
             cvar = float(pdf_z / cdf_z * (nu + (z / scale) ** 2) / (nu - 1) * scale * cond_vol)
 
-    elif dist_name in ("skewt", "skewed student's t", "skewstudent"):
-        nu = float(arch_result.params.get("nu", 0.0))
-        lam = float(arch_result.params.get("lambda", 0.0))
+    elif dist_name == "skewt":
+        # arch names the skew-t degrees of freedom 'eta'
+        nu = float(garch.dist_params.get("eta", garch.dist_params.get("nu", 0.0)))
+        lam = float(garch.dist_params.get("lambda", 0.0))
         if nu < 2.1:
             logger.warning(
                 "GARCH dist='skewt' but nu=%.2f (invalid) — falling back to Normal", nu
@@ -347,25 +378,10 @@ def predict_garch(
             var = float(-z * cond_vol)
             cvar = float(stats.norm.pdf(z) / (1.0 - alpha) * cond_vol)
         else:
-            try:
-                from arch.univariate.distribution import SkewStudent
-                skewt_dist = SkewStudent()
-                z = float(skewt_dist.ppf(q_level, parameters=np.array([nu, lam])))
-                var = float(-z * cond_vol)
-                tail_probs = np.linspace(1e-6, q_level, 10_000)
-                tail_quantiles = skewt_dist.ppf(tail_probs, parameters=np.array([nu, lam]))
-                cvar = float(-np.mean(tail_quantiles) * cond_vol)
-            except Exception as exc:
-                logger.warning(
-                    "SkewStudent CVaR computation failed (%s) — falling back to Student-t", exc
-                )
-                scale = np.sqrt((nu - 2.0) / nu)
-                z = float(stats.t.ppf(q_level, df=nu) * scale)
-                var = float(-z * cond_vol)
-                pdf_z = stats.t.pdf(z / scale, df=nu) / scale
-                cvar = float(
-                    pdf_z / q_level * (nu + (z / scale) ** 2) / (nu - 1) * scale * cond_vol
-                )
+            z = float(_skewt_ppf(np.array([q_level]), nu, lam)[0])
+            var = float(-z * cond_vol)
+            tail_quantiles = _skewt_ppf(np.linspace(1e-6, q_level, 10_000), nu, lam)
+            cvar = float(-np.mean(tail_quantiles) * cond_vol)
 
     else:
         # Unknown distribution — fall back to Normal with a warning
@@ -400,7 +416,7 @@ def predict_garch(
         sharpe_ratio=sharpe,
         sortino_ratio=sortino,
         beta_to_benchmark=beta,
-        model_version=f"garch-v{model.model_version}",
+        model_version=_model_label(model),
     )
 
 
@@ -415,29 +431,60 @@ def predict_montecarlo(
     horizon_days: int = 1,
     lookback_days: int = 252,
     n_simulations: int = 10_000,
+    sampler: Optional[str] = None,
 ) -> PredictionResult:
     """VaR/CVaR from Monte Carlo GBM simulation using the loaded pyfunc model.
 
     The artifact is an mlflow.pyfunc.PyFuncModel (MonteCarloModel) that was
     trained on historical portfolio returns. We call pyfunc_model.predict()
-    with the desired simulation parameters.
+    with the desired simulation parameters. When the run also carries a
+    MultiAssetMonteCarloModel and every position is in its universe, that
+    model is called with the portfolio's own weights instead.
 
     Falls back to re-estimating GBM params from current portfolio returns if
     the artifact is not a pyfunc model (e.g. old JSON-format artifact).
+
+    *sampler* (pseudo | antithetic | sobol | importance) defaults to
+    ``Settings.monte_carlo_sampler``; worker count, adaptive-mode target /
+    budget and simulation dtype are taken from Settings as well.
     """
     import pandas as pd
 
     pyfunc_model = model.artifact  # mlflow.pyfunc.PyFuncModel
+    cfg = get_settings()
+    if sampler is None:
+        sampler = cfg.monte_carlo_sampler
 
     # Build input DataFrame for the pyfunc model
-    input_df = pd.DataFrame([{
+    sim_params = {
         "n_simulations": n_simulations,
         "horizon_days": horizon_days,
         "alpha": alpha,
-    }])
+        "sampler": sampler,
+        "n_workers": cfg.monte_carlo_workers,
+        "target_rel_error": cfg.monte_carlo_target_rel_error,
+        "max_simulations": cfg.monte_carlo_max_simulations,
+        "dtype": cfg.monte_carlo_dtype,
+    }
+    input_df = pd.DataFrame([sim_params])
+
+    output_df = None
+    if model.portfolio_artifact is not None:
+        try:
+            weights = _load_portfolio_weights(portfolio_id)
+            output_df = model.portfolio_artifact.predict(
+                pd.DataFrame([{**sim_params, "weights": weights}])
+            )
+        except ValueError as exc:
+            # e.g. positions outside the trained symbol universe
+            logger.info(
+                "Multi-asset MC not applicable to portfolio %d (%s) — using portfolio-level model",
+                portfolio_id, exc,
+            )
 
     try:
-        output_df = pyfunc_model.predict(input_df)
+        if output_df is None:
+            output_df = pyfunc_model.predict(input_df)
         var = float(output_df["var"].iloc[0])
         cvar = float(output_df["cvar"].iloc[0])
         vol = float(output_df["volatility"].iloc[0])
@@ -491,7 +538,7 @@ def predict_montecarlo(
         sharpe_ratio=sharpe,
         sortino_ratio=sortino,
         beta_to_benchmark=beta,
-        model_version=f"montecarlo-v{model.model_version}",
+        model_version=_model_label(model),
     )
 
 
@@ -499,6 +546,37 @@ def predict_montecarlo(
 # Unified predict entry point
 # ---------------------------------------------------------------------------
 
+def _model_label(model: LoadedModel) -> str:
+    """risk_results.model_version tag, e.g. "garch-v3" or "garch--portfolio-7-v1"."""
+    scope = "" if model.scope == GLOBAL_SCOPE else f"--{model.scope}"
+    return f"{model.model_type}{scope}-v{model.model_version}"
+
+
+def _resolve_model(
+    registry: ModelRegistry,
+    model_type: str,
+    portfolio_id: int,
+) -> Optional[LoadedModel]:
+    """Most specific loaded model for a portfolio: portfolio → symbol set → global.
+
+    Only scopes with a registered model are looked up, and the portfolio's
+    symbols are only queried while some symbol-set model exists. Scoped
+    misses only schedule a background load, so until that lands the
+    portfolio is served by the next wider model.
+    """
+    scopes = registry.registered_scopes(model_type)
+    model = None
+    if scopes:
+        scope = portfolio_scope(portfolio_id)
+        if scope in scopes:
+            model = registry.get(model_type, scope)
+        if model is None and any(s.startswith(SYMBOLS_SCOPE_PREFIX) for s in scopes):
+            scope = symbols_scope(list(_load_portfolio_weights(portfolio_id)))
+            if scope in scopes:
+                model = registry.get(model_type, scope)
+    return model or registry.get(model_type)
+
+
 def predict(
     portfolio_id: int,
     method: str,
@@ -515,7 +593,8 @@ def predict(
     Args:
         portfolio_id: ID of the portfolio to compute risk for.
         method: "historical" | "garch" | "montecarlo"
-        registry: The global ModelRegistry instance.
+        registry: The global ModelRegistry instance; the most specific
+            (portfolio, symbol set, global) model loaded for the portfolio is used.
         alpha: VaR confidence level (e.g. 0.99).
         horizon_days: Forecast horizon in trading days.
         lookback_days: How many days of returns to use.
@@ -528,7 +607,7 @@ def predict(
         return predict_historical(portfolio_id, alpha, horizon_days, lookback_days)
 
     if method == "garch":
-        model = registry.get("garch")
+        model = _resolve_model(registry, "garch", portfolio_id)
         if model is None:
             logger.warning(
                 "GARCH model not loaded — falling back to historical for portfolio %d",
@@ -538,7 +617,7 @@ def predict(
         return predict_garch(portfolio_id, model, alpha, horizon_days, lookback_days)
 
     if method == "montecarlo":
-        model = registry.get("montecarlo")
+        model = _resolve_model(registry, "montecarlo", portfolio_id)
         if model is None:
             logger.warning(
                 "Monte Carlo model not loaded — falling back to historical for portfolio %d",
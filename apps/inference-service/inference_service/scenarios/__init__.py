@@ -2,10 +2,32 @@
 
 Public API:
     SCENARIOS          — dict of built-in scenario definitions
+    get_catalogue()    — persisted, hot-reloading catalogue of compiled scenarios
+    CompiledScenario   — immutable, ready-to-run scenario definition
+    create_scenario()  — persist a user-defined scenario
+    update_scenario()  — replace a user-defined scenario
+    delete_scenario()  — remove a user-defined scenario
     run_scenario()     — execute a scenario and return StressResult
     StressRequest      — input dataclass
     StressResult       — output dataclass
 """
+from .catalogue import (
+    CompiledScenario,
+    create_scenario,
+    delete_scenario,
+    get_catalogue,
+    update_scenario,
+)
 from .engine import SCENARIOS, StressRequest, StressResult, run_scenario
 
-__all__ = ["SCENARIOS", "StressRequest", "StressResult", "run_scenario"]
+__all__ = [
+    "SCENARIOS",
+    "CompiledScenario",
+    "StressRequest",
+    "StressResult",
+    "create_scenario",
+    "delete_scenario",
+    "get_catalogue",
+    "run_scenario",
+    "update_scenario",
+]
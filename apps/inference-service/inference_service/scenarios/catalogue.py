@@ -0,0 +1,540 @@
+"""Persisted stress scenario catalogue.
+
+Scenario definitions live in the ``stress_scenarios`` table (migration 007)
+and are managed through the CRUD endpoints in ``api/routes.py``. On load,
+every row is compiled into an immutable ``CompiledScenario`` that carries
+the derived stress parameters and memoises the crisis-period return matrix
+per symbol universe, so repeated runs of the same scenario do not re-query
+or re-derive anything.
+
+Hot reload
+----------
+The catalogue keeps a cheap fingerprint of the table (row count + latest
+``updated_at``). At most once every ``scenario_catalogue_refresh_s`` seconds
+the fingerprint is re-read; if it changed, the whole catalogue is recompiled.
+Writes made through this process invalidate the catalogue immediately, so
+changes made by another replica are picked up within one refresh interval
+and no restart is needed.
+
+If the table is unreachable the built-in ``SCENARIOS`` below are served, so
+stress testing keeps working on a database without migration 007.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Optional
+
+import numpy as np
+from sqlalchemy import text
+
+from ..config import get_settings
+from ..db import get_engine
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Built-in scenario catalogue (seeded into stress_scenarios by migration 007)
+# ---------------------------------------------------------------------------
+
+#: Scenario definitions.  Each entry is a dict with either:
+#:   - ``type="historical"`` + ``period=(start, end)`` ISO date strings
+#:   - ``type="parametric"`` + ``vol_multiplier`` + ``corr_shock``
+SCENARIOS: dict[str, dict] = {
+    "historical_2008": {
+        "id": "historical_2008",
+        "type": "historical",
+        "name": "Global Financial Crisis 2008",
+        "period": ("2008-09-01", "2009-03-31"),
+        "description": "Lehman collapse, credit freeze, global equity −50 %",
+    },
+    "historical_2020": {
+        "id": "historical_2020",
+        "type": "historical",
+        "name": "COVID-19 Crash 2020",
+        "period": ("2020-02-19", "2020-03-23"),
+        "description": "Fastest 30 % drawdown in history, VIX > 80",
+    },
+    "historical_1998": {
+        "id": "historical_1998",
+        "type": "historical",
+        "name": "LTCM / Russia Default 1998",
+        "period": ("1998-08-01", "1998-10-31"),
+        "description": "Russian sovereign default, LTCM collapse, liquidity crisis",
+    },
+    "parametric_mild": {
+        "id": "parametric_mild",
+        "type": "parametric",
+        "name": "Mild Stress (2× volatility)",
+        "vol_multiplier": 2.0,
+        "corr_shock": 0.7,
+        "description": "Moderate stress: 2× volatility, correlations pushed to 0.7",
+    },
+    "parametric_severe": {
+        "id": "parametric_severe",
+        "type": "parametric",
+        "name": "Severe Stress (4× volatility)",
+        "vol_multiplier": 4.0,
+        "corr_shock": 0.95,
+        "description": "Severe stress: 4× volatility, correlations → 1",
+    },
+}
+
+# Crisis vol multipliers used when replaying historical scenarios
+# (relative to a calm market baseline)
+_CRISIS_VOL_MULTIPLIERS: dict[str, float] = {
+    "historical_2008": 4.0,
+    "historical_2020": 5.0,
+    "historical_1998": 3.0,
+}
+
+_DEFAULT_CRISIS_VOL_MULTIPLIER = 3.0
+_DEFAULT_CRISIS_CORR_SHOCK = 0.8
+
+# Scenario ids that cannot be used for persisted scenarios
+RESERVED_SCENARIO_IDS = frozenset({"custom", "run"})
+
+# Upper bound on memoised ad-hoc "custom" scenarios
+_MAX_CUSTOM_SCENARIOS = 128
+
+
+def stress_sigma_scale(vol_multiplier: float, corr_shock: float) -> float:
+    """Effective σ multiplier of a parametric stress.
+
+    The portfolio is simulated as a single asset, so the correlation shock is
+    approximated by an additional vol bump (see ``_run_parametric_stress``):
+        effective_sigma = sigma * vol_multiplier * (1 + corr_shock * 0.5)
+    """
+    return vol_multiplier * (1.0 + corr_shock * 0.5)
+
+
+# ---------------------------------------------------------------------------
+# Compiled scenario
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class CompiledScenario:
+    """Immutable, ready-to-run scenario definition.
+
+    ``vol_multiplier`` / ``corr_shock`` are already resolved to their
+    effective defaults, and ``sigma_scale`` is the derived parametric σ
+    multiplier. Crisis return series are memoised per symbol universe.
+    """
+    scenario_id: str
+    scenario_type: str                      # "historical" | "parametric"
+    name: str
+    description: str
+    vol_multiplier: float
+    corr_shock: float
+    sigma_scale: float
+    period: Optional[tuple[str, str]] = None
+    builtin: bool = False
+
+    # symbols tuple → read-only equal-weighted crisis return series
+    _crisis_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False,
+    )
+
+    def crisis_returns(
+        self,
+        symbols: list[str],
+        loader: Callable[[list[str], str, str], np.ndarray],
+    ) -> np.ndarray:
+        """Return the crisis-period portfolio returns for *symbols*.
+
+        The result of *loader* is cached per symbol universe. Empty results
+        (crisis data not ingested yet) are not cached so that a later ingest
+        is picked up without a catalogue reload.
+        """
+        if self.period is None:
+            raise ValueError(f"Scenario '{self.scenario_id}' has no crisis period")
+
+        key = tuple(sorted(symbols))
+        with self._cache_lock:
+            cached = self._crisis_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rets = loader(list(key), self.period[0], self.period[1])
+        if len(rets) > 0:
+            rets = np.array(rets, dtype=float)
+            rets.setflags(write=False)
+            with self._cache_lock:
+                self._crisis_cache[key] = rets
+        return rets
+
+    def to_dict(self) -> dict:
+        """Serialise in the same shape as the ``SCENARIOS`` entries."""
+        d: dict = {
+            "id": self.scenario_id,
+            "type": self.scenario_type,
+            "name": self.name,
+            "description": self.description,
+            "builtin": self.builtin,
+        }
+        if self.scenario_type == "parametric":
+            d["vol_multiplier"] = self.vol_multiplier
+            d["corr_shock"] = self.corr_shock
+        else:
+            d["period"] = self.period
+        return d
+
+
+def compile_scenario(defn: dict, builtin: bool = False) -> CompiledScenario:
+    """Validate a scenario definition dict and compile it.
+
+    Raises:
+        ValueError — missing or inconsistent fields
+    """
+    scenario_id = defn["id"]
+    scenario_type = defn["type"]
+
+    if scenario_type == "parametric":
+        vol_multiplier = defn.get("vol_multiplier")
+        corr_shock = defn.get("corr_shock")
+        if vol_multiplier is None or corr_shock is None:
+            raise ValueError(
+                f"Parametric scenario '{scenario_id}' requires vol_multiplier and corr_shock."
+            )
+        period = None
+    elif scenario_type == "historical":
+        period = defn.get("period")
+        if not period or not period[0] or not period[1]:
+            raise ValueError(
+                f"Historical scenario '{scenario_id}' requires period_start and period_end."
+            )
+        try:
+            start, end = date.fromisoformat(str(period[0])), date.fromisoformat(str(period[1]))
+        except ValueError as exc:
+            raise ValueError(
+                f"Historical scenario '{scenario_id}': period dates must be YYYY-MM-DD ({exc})."
+            ) from exc
+        if start > end:
+            raise ValueError(
+                f"Historical scenario '{scenario_id}': period_start must not be after period_end."
+            )
+        period = (start.isoformat(), end.isoformat())
+        vol_multiplier = defn.get("vol_multiplier")
+        if vol_multiplier is None:
+            vol_multiplier = _CRISIS_VOL_MULTIPLIERS.get(scenario_id, _DEFAULT_CRISIS_VOL_MULTIPLIER)
+        corr_shock = defn.get("corr_shock")
+        if corr_shock is None:
+            corr_shock = _DEFAULT_CRISIS_CORR_SHOCK
+    else:
+        raise ValueError(f"Unsupported scenario type: {scenario_type!r}")
+
+    vol_multiplier = float(vol_multiplier)
+    corr_shock = float(corr_shock)
+    if vol_multiplier <= 0:
+        raise ValueError(f"vol_multiplier must be > 0, got {vol_multiplier}")
+    if not (0.0 <= corr_shock <= 1.0):
+        raise ValueError(f"corr_shock must be in [0, 1], got {corr_shock}")
+
+    return CompiledScenario(
+        scenario_id=scenario_id,
+        scenario_type=scenario_type,
+        name=defn.get("name") or scenario_id,
+        description=defn.get("description", ""),
+        vol_multiplier=vol_multiplier,
+        corr_shock=corr_shock,
+        sigma_scale=stress_sigma_scale(vol_multiplier, corr_shock),
+        period=period,
+        builtin=builtin,
+    )
+
+
+def _row_to_defn(row) -> dict:
+    """Convert a stress_scenarios row into a scenario definition dict."""
+    period = None
+    if row.period_start is not None and row.period_end is not None:
+        period = (_iso(row.period_start), _iso(row.period_end))
+    return {
+        "id": row.scenario_id,
+        "type": row.scenario_type,
+        "name": row.name,
+        "description": row.description or "",
+        "vol_multiplier": float(row.vol_multiplier) if row.vol_multiplier is not None else None,
+        "corr_shock": float(row.corr_shock) if row.corr_shock is not None else None,
+        "period": period,
+    }
+
+
+def _iso(value) -> str:
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+# ---------------------------------------------------------------------------
+# Catalogue
+# ---------------------------------------------------------------------------
+
+class ScenarioCatalogue:
+    """Thread-safe, hot-reloading cache of compiled scenarios."""
+
+    def __init__(self, refresh_interval_s: float = 30.0) -> None:
+        self._lock = threading.RLock()
+        self._refresh_interval_s = refresh_interval_s
+        self._scenarios: Optional[dict[str, CompiledScenario]] = None
+        self._fingerprint: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._generation = 0        # bumped by invalidate()
+        self._custom: OrderedDict[tuple[float, float], CompiledScenario] = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, scenario_id: str) -> Optional[CompiledScenario]:
+        return self._current().get(scenario_id)
+
+    def all(self) -> list[CompiledScenario]:
+        return list(self._current().values())
+
+    def custom(self, vol_multiplier: float, corr_shock: float) -> CompiledScenario:
+        """Return the compiled ad-hoc "custom" parametric scenario (memoised)."""
+        key = (round(float(vol_multiplier), 6), round(float(corr_shock), 6))
+        with self._lock:
+            compiled = self._custom.get(key)
+            if compiled is not None:
+                self._custom.move_to_end(key)
+                return compiled
+
+        compiled = compile_scenario({
+            "id": "custom",
+            "type": "parametric",
+            "name": "Custom Parametric Stress",
+            "description": f"vol×{vol_multiplier:.1f}, corr_shock={corr_shock:.2f}",
+            "vol_multiplier": vol_multiplier,
+            "corr_shock": corr_shock,
+        })
+        with self._lock:
+            self._custom[key] = compiled
+            while len(self._custom) > _MAX_CUSTOM_SCENARIOS:
+                self._custom.popitem(last=False)
+        return compiled
+
+    # ------------------------------------------------------------------
+    # Reload
+    # ------------------------------------------------------------------
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup."""
+        with self._lock:
+            self._scenarios = None
+            self._fingerprint = None
+            self._generation += 1
+
+    def _current(self) -> dict[str, CompiledScenario]:
+        with self._lock:
+            now = time.monotonic()
+            scenarios = self._scenarios
+            if scenarios is not None and now - self._checked_at < self._refresh_interval_s:
+                return scenarios
+            # Other callers keep serving *scenarios* while this one checks the table
+            self._checked_at = now
+            known_fingerprint = self._fingerprint
+            generation = self._generation
+
+        # The database round-trips run outside the lock; the result is swapped in below
+        try:
+            fingerprint = _fetch_fingerprint()
+        except Exception as exc:
+            if scenarios is not None:
+                return scenarios
+            logger.warning("Scenario catalogue unavailable (%s) — serving built-in scenarios", exc)
+            return self._swap(_compile_builtins(), None, generation)
+
+        if scenarios is not None and fingerprint == known_fingerprint:
+            return scenarios
+
+        try:
+            loaded = _load_compiled()
+        except Exception as exc:
+            logger.warning("Scenario catalogue reload failed: %s", exc)
+            if scenarios is not None:
+                return scenarios
+            return self._swap(_compile_builtins(), None, generation)
+        logger.info("Scenario catalogue (re)loaded: %d scenarios", len(loaded))
+        return self._swap(loaded, fingerprint, generation)
+
+    def _swap(
+        self,
+        scenarios: dict[str, CompiledScenario],
+        fingerprint: Optional[tuple],
+        generation: int,
+    ) -> dict[str, CompiledScenario]:
+        """Install *scenarios* unless the catalogue was invalidated since *generation*."""
+        with self._lock:
+            if self._generation == generation:
+                self._scenarios = scenarios
+                self._fingerprint = fingerprint
+        return scenarios
+
+
+def _fetch_fingerprint() -> tuple:
+    engine = get_engine()
+    with engine.connect() as conn:
+        row = conn.execute(
+            text("SELECT COUNT(*), MAX(updated_at) FROM stress_scenarios")
+        ).fetchone()
+    return (row[0], row[1])
+
+
+def _load_compiled() -> dict[str, CompiledScenario]:
+    engine = get_engine()
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT scenario_id, scenario_type, name, description, vol_multiplier,
+                       corr_shock, period_start, period_end, builtin
+                FROM stress_scenarios
+                ORDER BY builtin DESC, scenario_id
+                """
+            )
+        ).fetchall()
+
+    compiled: dict[str, CompiledScenario] = {}
+    for row in rows:
+        try:
+            compiled[row.scenario_id] = compile_scenario(_row_to_defn(row), builtin=bool(row.builtin))
+        except (ValueError, KeyError) as exc:
+            logger.warning("Skipping invalid scenario '%s': %s", row.scenario_id, exc)
+    return compiled
+
+
+def _compile_builtins() -> dict[str, CompiledScenario]:
+    return {sid: compile_scenario(sdef, builtin=True) for sid, sdef in SCENARIOS.items()}
+
+
+# ---------------------------------------------------------------------------
+# CRUD
+# ---------------------------------------------------------------------------
+
+def _validated_params(defn: dict) -> dict:
+    """Compile *defn* for validation and return the SQL bind parameters."""
+    if defn["id"] in RESERVED_SCENARIO_IDS:
+        raise ValueError(f"Scenario id '{defn['id']}' is reserved")
+    compiled = compile_scenario(defn)
+    period = compiled.period or (None, None)
+    return {
+        "scenario_id": defn["id"],
+        "scenario_type": defn["type"],
+        "name": defn.get("name") or defn["id"],
+        "description": defn.get("description", ""),
+        "vol_multiplier": defn.get("vol_multiplier"),
+        "corr_shock": defn.get("corr_shock"),
+        "period_start": period[0],
+        "period_end": period[1],
+    }
+
+
+def create_scenario(defn: dict) -> CompiledScenario:
+    """Insert a new user-defined scenario.
+
+    Raises:
+        ValueError — invalid definition or the id already exists
+    """
+    params = _validated_params(defn)
+    engine = get_engine()
+    with engine.begin() as conn:
+        row = conn.execute(
+            text(
+                """
+                INSERT INTO stress_scenarios
+                    (scenario_id, scenario_type, name, description, vol_multiplier,
+                     corr_shock, period_start, period_end, builtin)
+                VALUES
+                    (:scenario_id, :scenario_type, :name, :description, :vol_multiplier,
+                     :corr_shock, :period_start, :period_end, FALSE)
+                ON CONFLICT (scenario_id) DO NOTHING
+                RETURNING scenario_id
+                """
+            ),
+            params,
+        ).fetchone()
+    if row is None:
+        raise ValueError(f"Scenario '{defn['id']}' already exists")
+
+    _catalogue.invalidate()
+    logger.info("Created stress scenario '%s' (%s)", defn["id"], defn["type"])
+    return compile_scenario(defn)
+
+
+def update_scenario(defn: dict) -> Optional[CompiledScenario]:
+    """Replace a user-defined scenario. Returns None if it does not exist.
+
+    Raises:
+        ValueError — invalid definition or the scenario is built-in
+    """
+    params = _validated_params(defn)
+    engine = get_engine()
+    with engine.begin() as conn:
+        existing = conn.execute(
+            text("SELECT builtin FROM stress_scenarios WHERE scenario_id = :scenario_id"),
+            {"scenario_id": defn["id"]},
+        ).fetchone()
+        if existing is None:
+            return None
+        if existing[0]:
+            raise ValueError(f"Built-in scenario '{defn['id']}' cannot be modified")
+        conn.execute(
+            text(
+                """
+                UPDATE stress_scenarios SET
+                    scenario_type = :scenario_type,
+                    name = :name,
+                    description = :description,
+                    vol_multiplier = :vol_multiplier,
+                    corr_shock = :corr_shock,
+                    period_start = :period_start,
+                    period_end = :period_end,
+                    updated_at = NOW()
+                WHERE scenario_id = :scenario_id
+                """
+            ),
+            params,
+        )
+
+    _catalogue.invalidate()
+    logger.info("Updated stress scenario '%s'", defn["id"])
+    return compile_scenario(defn)
+
+
+def delete_scenario(scenario_id: str) -> bool:
+    """Delete a user-defined scenario. Returns False if it does not exist.
+
+    Raises:
+        ValueError — the scenario is built-in
+    """
+    engine = get_engine()
+    with engine.begin() as conn:
+        existing = conn.execute(
+            text("SELECT builtin FROM stress_scenarios WHERE scenario_id = :scenario_id"),
+            {"scenario_id": scenario_id},
+        ).fetchone()
+        if existing is None:
+            return False
+        if existing[0]:
+            raise ValueError(f"Built-in scenario '{scenario_id}' cannot be deleted")
+        conn.execute(
+            text("DELETE FROM stress_scenarios WHERE scenario_id = :scenario_id"),
+            {"scenario_id": scenario_id},
+        )
+
+    _catalogue.invalidate()
+    logger.info("Deleted stress scenario '%s'", scenario_id)
+    return True
+
+
+# Module-level singleton catalogue
+_catalogue = ScenarioCatalogue(refresh_interval_s=get_settings().scenario_catalogue_refresh_s)
+
+
+def get_catalogue() -> ScenarioCatalogue:
+    """Return the global scenario catalogue singleton."""
+    return _catalogue
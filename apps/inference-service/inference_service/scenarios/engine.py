@@ -12,6 +12,9 @@ Supports two scenario families:
 
 Both paths share the same output type: ``StressResult``.
 
+Scenario definitions are resolved through the persisted, precompiled
+catalogue in ``catalogue.py``; the built-in ``SCENARIOS`` are its fallback.
+
 The engine is intentionally self-contained — it reads portfolio returns
 from Postgres (``processed_returns``) and does not depend on any loaded
 ML model.
@@ -19,6 +22,7 @@ ML model.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
@@ -27,58 +31,12 @@ import numpy as np
 import pandas as pd
 from sqlalchemy import text
 
+from ..config import get_settings
 from ..db import get_engine
+from .catalogue import SCENARIOS, CompiledScenario, get_catalogue, stress_sigma_scale  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Built-in scenario catalogue
-# ---------------------------------------------------------------------------
-
-#: Scenario definitions.  Each entry is a dict with either:
-#:   - ``type="historical"`` + ``period=(start, end)`` ISO date strings
-#:   - ``type="parametric"`` + ``vol_multiplier`` + ``corr_shock``
-SCENARIOS: dict[str, dict] = {
-    "historical_2008": {
-        "id": "historical_2008",
-        "type": "historical",
-        "name": "Global Financial Crisis 2008",
-        "period": ("2008-09-01", "2009-03-31"),
-        "description": "Lehman collapse, credit freeze, global equity −50 %",
-    },
-    "historical_2020": {
-        "id": "historical_2020",
-        "type": "historical",
-        "name": "COVID-19 Crash 2020",
-        "period": ("2020-02-19", "2020-03-23"),
-        "description": "Fastest 30 % drawdown in history, VIX > 80",
-    },
-    "historical_1998": {
-        "id": "historical_1998",
-        "type": "historical",
-        "name": "LTCM / Russia Default 1998",
-        "period": ("1998-08-01", "1998-10-31"),
-        "description": "Russian sovereign default, LTCM collapse, liquidity crisis",
-    },
-    "parametric_mild": {
-        "id": "parametric_mild",
-        "type": "parametric",
-        "name": "Mild Stress (2× volatility)",
-        "vol_multiplier": 2.0,
-        "corr_shock": 0.7,
-        "description": "Moderate stress: 2× volatility, correlations pushed to 0.7",
-    },
-    "parametric_severe": {
-        "id": "parametric_severe",
-        "type": "parametric",
-        "name": "Severe Stress (4× volatility)",
-        "vol_multiplier": 4.0,
-        "corr_shock": 0.95,
-        "description": "Severe stress: 4× volatility, correlations → 1",
-    },
-}
-
-
 # ---------------------------------------------------------------------------
 # Request / Result types
 # ---------------------------------------------------------------------------
@@ -86,7 +44,7 @@ SCENARIOS: dict[str, dict] = {
 @dataclass
 class StressRequest:
     portfolio_id: int
-    scenario_id: str                        # key in SCENARIOS or "custom"
+    scenario_id: str                        # catalogue scenario id or "custom"
     # Parametric overrides (used when scenario_id == "custom" or to override)
     vol_multiplier: Optional[float] = None  # e.g. 3.0
     corr_shock: Optional[float] = None      # push correlations toward 1 (0–1)
@@ -283,6 +241,8 @@ def _run_parametric_stress(
     corr_shock: float,
     n_simulations: int,
     alpha: float,
+    n_workers: Optional[int] = None,
+    dtype: Optional[str] = None,
 ) -> np.ndarray:
     """Generate a stressed P&L distribution via GBM with scaled volatility.
 
@@ -296,16 +256,41 @@ def _run_parametric_stress(
     covariance matrix; here we approximate it by an additional vol bump:
       effective_sigma = sigma * vol_multiplier * (1 + corr_shock * 0.5)
     This gives a conservative upper bound consistent with the plan.
+
+    With ``n_workers > 1`` (default: ``Settings.monte_carlo_workers``) the draws
+    are split across threads, each using a ``SeedSequence(42).spawn`` child
+    stream and concatenated in worker order, so the sample is reproducible
+    for a given worker count.
+
+    ``dtype="float32"`` (default: ``Settings.monte_carlo_dtype``) draws the
+    normals in single precision; the returned sample is always float64.
     """
     mu = float(np.mean(port_rets))
     sigma = float(np.std(port_rets, ddof=1))
 
     # Apply vol multiplier + correlation shock approximation
-    stressed_sigma = sigma * vol_multiplier * (1.0 + corr_shock * 0.5)
+    stressed_sigma = sigma * stress_sigma_scale(vol_multiplier, corr_shock)
     # Drift is kept at historical mean (no drift adjustment in stress)
-    rng = np.random.default_rng(seed=42)
-    simulated = rng.normal(loc=mu, scale=stressed_sigma, size=n_simulations)
-    return simulated
+    if n_workers is None:
+        n_workers = get_settings().monte_carlo_workers
+    n_workers = max(1, min(n_workers, n_simulations))
+    if dtype is None:
+        dtype = get_settings().monte_carlo_dtype
+
+    def draw(rng: np.random.Generator, size: int) -> np.ndarray:
+        if dtype == "float64":
+            return rng.normal(loc=mu, scale=stressed_sigma, size=size)
+        z = rng.standard_normal(size, dtype=dtype)
+        return (mu + stressed_sigma * z).astype(np.float64)
+
+    if n_workers == 1:
+        return draw(np.random.default_rng(seed=42), n_simulations)
+
+    sizes = [len(part) for part in np.array_split(np.arange(n_simulations), n_workers)]
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(42).spawn(n_workers)]
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="stress-worker") as pool:
+        parts = list(pool.map(draw, rngs, sizes))
+    return np.concatenate(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -362,47 +347,41 @@ def _run_historical_replay(
 # Public entry point
 # ---------------------------------------------------------------------------
 
-# Crisis vol multipliers used when replaying historical scenarios
-# (relative to a calm market baseline)
-_CRISIS_VOL_MULTIPLIERS: dict[str, float] = {
-    "historical_2008": 4.0,
-    "historical_2020": 5.0,
-    "historical_1998": 3.0,
-}
-
-
-def run_scenario(req: StressRequest) -> StressResult:
-    """Execute a stress scenario and return a StressResult.
+def _resolve_scenario(req: StressRequest) -> CompiledScenario:
+    """Look up the compiled scenario for a request.
 
     Raises:
-        ValueError  — unknown scenario_id or invalid parameters
-        RuntimeError — no market data available for the portfolio
+        ValueError — unknown scenario_id or missing custom parameters
     """
-    # Resolve scenario definition
+    catalogue = get_catalogue()
     if req.scenario_id == "custom":
         if req.vol_multiplier is None or req.corr_shock is None:
             raise ValueError(
                 "Custom scenario requires vol_multiplier and corr_shock parameters."
             )
-        scenario_def: dict = {
-            "id": "custom",
-            "type": "parametric",
-            "name": "Custom Parametric Stress",
-            "description": (
-                f"vol×{req.vol_multiplier:.1f}, corr_shock={req.corr_shock:.2f}"
-            ),
-        }
-    elif req.scenario_id in SCENARIOS:
-        scenario_def = SCENARIOS[req.scenario_id]
-    else:
+        return catalogue.custom(req.vol_multiplier, req.corr_shock)
+
+    scenario = catalogue.get(req.scenario_id)
+    if scenario is None:
+        available = [s.scenario_id for s in catalogue.all()] + ["custom"]
         raise ValueError(
-            f"Unknown scenario_id '{req.scenario_id}'. "
-            f"Available: {list(SCENARIOS.keys()) + ['custom']}"
+            f"Unknown scenario_id '{req.scenario_id}'. Available: {available}"
         )
+    return scenario
+
+
+def run_scenario(req: StressRequest) -> StressResult:
+    """Execute a stress scenario and return a StressResult.
+
+    Raises:
+        ValueError  — unknown scenario_id or invalid parameters
+        RuntimeError — no market data available for the portfolio
+    """
+    scenario = _resolve_scenario(req)
 
     # Allow request-level overrides of vol_multiplier / corr_shock
-    vol_multiplier = req.vol_multiplier
-    corr_shock = req.corr_shock
+    vol_multiplier = req.vol_multiplier if req.vol_multiplier is not None else scenario.vol_multiplier
+    corr_shock = req.corr_shock if req.corr_shock is not None else scenario.corr_shock
 
     # Load current portfolio returns (for μ/σ estimation)
     port_rets, symbols = _load_portfolio_returns(
@@ -410,15 +389,10 @@ def run_scenario(req: StressRequest) -> StressResult:
         lookback_days=req.lookback_days,
     )
 
-    scenario_type = scenario_def["type"]
+    scenario_type = scenario.scenario_type
     fallback_used = False  # will be set True if historical data is missing
 
     if scenario_type == "parametric":
-        if vol_multiplier is None:
-            vol_multiplier = scenario_def.get("vol_multiplier", 2.0)
-        if corr_shock is None:
-            corr_shock = scenario_def.get("corr_shock", 0.7)
-
         sim_rets = _run_parametric_stress(
             port_rets=port_rets,
             vol_multiplier=vol_multiplier,
@@ -428,18 +402,8 @@ def run_scenario(req: StressRequest) -> StressResult:
         )
 
     elif scenario_type == "historical":
-        period: tuple[str, str] = scenario_def["period"]
-        crisis_rets = _load_historical_crisis_returns(
-            symbols=symbols,
-            period_start=period[0],
-            period_end=period[1],
-        )
-        # Use crisis-specific vol multiplier unless caller overrides
-        default_vol_mult = _CRISIS_VOL_MULTIPLIERS.get(req.scenario_id, 3.0)
-        if vol_multiplier is None:
-            vol_multiplier = default_vol_mult
-        if corr_shock is None:
-            corr_shock = 0.8
+        # Crisis series are memoised on the compiled scenario per symbol universe
+        crisis_rets = scenario.crisis_returns(symbols, _load_historical_crisis_returns)
 
         sim_rets, fallback_used = _run_historical_replay(
             crisis_rets=crisis_rets,
@@ -474,7 +438,7 @@ def run_scenario(req: StressRequest) -> StressResult:
     return StressResult(
         portfolio_id=req.portfolio_id,
         scenario_id=req.scenario_id,
-        scenario_name=scenario_def.get("name", req.scenario_id),
+        scenario_name=scenario.name,
         scenario_type=scenario_type,
         stressed_var=stressed_var,
         stressed_cvar=stressed_cvar,
@@ -485,5 +449,5 @@ def run_scenario(req: StressRequest) -> StressResult:
         p1_return=p1,
         mean_return=mean_ret,
         n_observations=len(sim_rets),
-        description=scenario_def.get("description", ""),
+        description=scenario.description,
     )
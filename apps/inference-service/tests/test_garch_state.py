@@ -0,0 +1,87 @@
+"""GarchVarianceState: partly ingested and late-arriving days are not skipped."""
+from __future__ import annotations
+
+from contextlib import nullcontext
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from inference_service.models import garch_state
+from inference_service.models.garch_state import GarchVarianceState, advance_variance_state
+
+START = date(2024, 1, 1)
+DAYS = [START + timedelta(days=k) for k in range(1, 5)]
+RETURNS = {
+    "AAPL": [0.012, -0.031, 0.004, 0.020],
+    "MSFT": [-0.008, -0.025, 0.011, 0.015],
+}
+
+
+def _state() -> GarchVarianceState:
+    return GarchVarianceState(
+        omega=2e-6, alpha=(0.08,), beta=(0.90,), mu=0.0,
+        sigma2=[1e-4], resid2=[4e-5], asof=START, symbols=["AAPL", "MSFT"],
+    )
+
+
+class _Store:
+    """processed_returns stand-in for advance_variance_state's query."""
+
+    def __init__(self) -> None:
+        self.rows: list[dict] = []
+
+    def ingest(self, symbol: str, *days: int) -> None:
+        for k in days:
+            self.rows.append({"symbol": symbol, "price_date": DAYS[k], "ret": RETURNS[symbol][k]})
+
+    def read_sql(self, _query, _conn, params) -> pd.DataFrame:
+        rows = [r for r in self.rows if r["symbol"] in params["symbols"] and r["price_date"] > params["asof"]]
+        return pd.DataFrame(rows, columns=["symbol", "price_date", "ret"])
+
+
+class _Engine:
+    def connect(self):
+        return nullcontext()
+
+
+@pytest.fixture
+def store(monkeypatch) -> _Store:
+    store = _Store()
+    monkeypatch.setattr(garch_state, "get_engine", _Engine)
+    monkeypatch.setattr(garch_state.pd, "read_sql", store.read_sql)
+    return store
+
+
+def _reference(n_days: int) -> GarchVarianceState:
+    state = _state()
+    for k in range(n_days):
+        state.update(0.5 * (RETURNS["AAPL"][k] + RETURNS["MSFT"][k]), DAYS[k])
+    return state
+
+
+def test_partly_ingested_day_is_held_back(store):
+    state = _state()
+    store.ingest("AAPL", 0, 1, 2)
+    store.ingest("MSFT", 0)
+    assert advance_variance_state(state) == 1
+    assert state.asof == DAYS[0]
+
+    store.ingest("MSFT", 1, 2)
+    assert advance_variance_state(state) == 2
+    assert state.applied == DAYS[:3]
+    assert state.sigma2 == pytest.approx(_reference(3).sigma2, rel=1e-12)
+
+
+def test_late_return_for_a_passed_day_refilters_from_the_seed(store):
+    state = _state()
+    store.ingest("AAPL", 0, 1, 2)
+    store.ingest("MSFT", 0, 2)       # day 1 looks like a gap in MSFT's calendar
+    assert advance_variance_state(state) == 2
+    assert state.applied == [DAYS[0], DAYS[2]]
+
+    store.ingest("MSFT", 1)          # ... until it is backfilled
+    advance_variance_state(state)
+    assert state.applied == DAYS[:3]
+    assert state.sigma2 == pytest.approx(_reference(3).sigma2, rel=1e-12)
+    assert state.resid2 == pytest.approx(_reference(3).resid2, rel=1e-12)
@@ -0,0 +1,119 @@
+"""ModelRegistry: byte-bounded LRU, miss TTL, non-blocking scoped loads."""
+from __future__ import annotations
+
+import threading
+import time
+
+from inference_service.models import predictor
+from inference_service.models.loader import (
+    GLOBAL_SCOPE,
+    LoadedModel,
+    ModelRegistry,
+    portfolio_scope,
+    symbols_scope,
+)
+
+
+def _model(scope: str, size_bytes: int = 100, model_type: str = "garch") -> LoadedModel:
+    return LoadedModel(
+        model_type=model_type, model_name=f"riskops-{model_type}--{scope}", model_version="1",
+        run_id="run", artifact=None, scope=scope, size_bytes=size_bytes,
+    )
+
+
+class _Loader:
+    """Loader stand-in: counts calls, optionally blocks until released."""
+
+    def __init__(self, models: dict | None = None, block: bool = False) -> None:
+        self.models = models or {}
+        self.calls: list = []
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self, key):
+        self.calls.append(key)
+        self.release.wait(5.0)
+        return self.models.get(key)
+
+
+def test_lru_evicts_oldest_scoped_model_beyond_max_bytes():
+    registry = ModelRegistry(max_bytes=300)
+    registry.set(_model(GLOBAL_SCOPE, size_bytes=10_000))
+    for scope in ("a", "b", "c"):
+        registry.set(_model(scope))
+    assert registry.get("garch", "a") is not None   # "a" becomes most recently used
+    registry.set(_model("d"))
+
+    assert not registry.contains("garch", "b")
+    assert all(registry.contains("garch", s) for s in ("a", "c", "d"))
+    assert registry.contains("garch")                # global models are pinned and not charged
+    assert registry.scoped_bytes() == 300
+
+
+def test_model_larger_than_cache_is_rejected():
+    registry = ModelRegistry(max_bytes=300)
+    registry.set(_model("a"))
+    registry.set(_model("a", size_bytes=301))
+    assert not registry.contains("garch", "a")
+    assert registry.scoped_bytes() == 0
+
+
+def test_scoped_miss_returns_at_once_and_loads_in_background():
+    loader = _Loader({("garch", "a"): _model("a")}, block=True)
+    registry = ModelRegistry(loader=loader)
+
+    t0 = time.monotonic()
+    assert registry.get("garch", "a") is None
+    assert registry.get("garch", "a") is None        # one in-flight load per key
+    assert time.monotonic() - t0 < 1.0
+
+    loader.release.set()
+    assert registry.get("garch", "a", wait_s=5.0) is not None
+    assert loader.calls == [("garch", "a")]
+
+
+def test_missing_scope_is_not_reloaded_within_ttl():
+    loader = _Loader()
+    registry = ModelRegistry(loader=loader, miss_ttl_s=60.0)
+    assert registry.get("garch", "a", wait_s=5.0) is None
+    assert registry.get("garch", "a", wait_s=5.0) is None
+    assert loader.calls == [("garch", "a")]
+
+    expired = ModelRegistry(loader=loader, miss_ttl_s=0.0)
+    expired.get("garch", "b", wait_s=5.0)
+    expired.get("garch", "b", wait_s=5.0)
+    assert loader.calls.count(("garch", "b")) == 2
+
+
+def test_global_miss_never_schedules_a_load():
+    loader = _Loader()
+    registry = ModelRegistry(loader=loader)
+    assert registry.get("garch", wait_s=1.0) is None
+    assert loader.calls == []
+
+
+def test_resolve_model_skips_scopes_without_registered_model(monkeypatch):
+    weight_queries: list[int] = []
+
+    def load_weights(portfolio_id: int) -> dict[str, float]:
+        weight_queries.append(portfolio_id)
+        return {"AAPL": 0.5, "MSFT": 0.5}
+
+    monkeypatch.setattr(predictor, "_load_portfolio_weights", load_weights)
+    loader = _Loader()
+    registry = ModelRegistry(loader=loader)
+    registry.set(_model(GLOBAL_SCOPE))
+
+    assert predictor._resolve_model(registry, "garch", 7).scope == GLOBAL_SCOPE
+    assert weight_queries == [] and loader.calls == []
+
+    # A registered symbol-set model is looked up (and served once loaded)
+    scope = symbols_scope(["MSFT", "AAPL"])
+    loader.models[("garch", scope)] = _model(scope)
+    registry.note_registered("garch", scope)
+    predictor._resolve_model(registry, "garch", 7)
+    assert weight_queries == [7]
+    assert registry.get("garch", scope, wait_s=5.0) is not None
+    assert predictor._resolve_model(registry, "garch", 7).scope == scope
+    assert ("garch", portfolio_scope(7)) not in loader.calls
@@ -0,0 +1,65 @@
+"""Scenario catalogue: period validation and reloads outside the catalogue lock."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from inference_service.scenarios import catalogue
+from inference_service.scenarios.catalogue import ScenarioCatalogue, compile_scenario
+
+
+def _historical(start, end) -> dict:
+    return {"id": "crash", "type": "historical", "period": (start, end)}
+
+
+@pytest.mark.parametrize("start,end", [("2020-02-30", "2020-03-23"), ("2020/02/19", "2020-03-23"), ("crash", "x")])
+def test_invalid_period_dates_are_rejected(start, end):
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        compile_scenario(_historical(start, end))
+
+
+def test_period_order_is_compared_as_dates():
+    compiled = compile_scenario(_historical("2020-02-19", "2020-03-23"))
+    assert compiled.period == ("2020-02-19", "2020-03-23")
+    with pytest.raises(ValueError, match="must not be after"):
+        compile_scenario(_historical("2020-03-23", "2020-02-19"))
+
+
+def test_reload_does_not_hold_the_catalogue_lock(monkeypatch):
+    cat = ScenarioCatalogue(refresh_interval_s=0.0)
+    lock_free: list[bool] = []
+
+    def try_lock() -> None:
+        acquired = cat._lock.acquire(timeout=1.0)
+        lock_free.append(acquired)
+        if acquired:
+            cat._lock.release()
+
+    def fetch_fingerprint() -> tuple:
+        # The lock is re-entrant, so probe it from another thread
+        probe = threading.Thread(target=try_lock)
+        probe.start()
+        probe.join()
+        return (1, None)
+
+    loaded = {"crash": compile_scenario(_historical("2020-02-19", "2020-03-23"))}
+    monkeypatch.setattr(catalogue, "_fetch_fingerprint", fetch_fingerprint)
+    monkeypatch.setattr(catalogue, "_load_compiled", lambda: loaded)
+
+    assert cat.get("crash") is loaded["crash"]
+    assert lock_free == [True]
+
+
+def test_invalidate_during_reload_discards_the_stale_result(monkeypatch):
+    cat = ScenarioCatalogue(refresh_interval_s=60.0)
+    stale = {"crash": compile_scenario(_historical("2020-02-19", "2020-03-23"))}
+
+    def load_compiled() -> dict:
+        cat.invalidate()        # e.g. a write on this replica while the rows were read
+        return stale
+
+    monkeypatch.setattr(catalogue, "_fetch_fingerprint", lambda: (1, None))
+    monkeypatch.setattr(catalogue, "_load_compiled", load_compiled)
+    assert cat.get("crash") is stale["crash"]
+    assert cat._scenarios is None
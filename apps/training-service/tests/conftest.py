@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import warnings
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _quiet_arch():
+    # arch warns about convergence / starting values on short windows
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
@@ -0,0 +1,19 @@
+"""Simulated return series shared by the tests (no database, MLflow or Kafka needed)."""
+from __future__ import annotations
+
+import numpy as np
+
+from training_service.benchmarks.garch_rolling import simulate_garch_returns
+
+
+def garch_series(seed: int, n_obs: int = 312) -> np.ndarray:
+    """Last *n_obs* returns of a GARCH(1,1) path (ω=2e-6, α=0.08, β=0.90)."""
+    return simulate_garch_returns(2_000, seed=seed)[-n_obs:]
+
+
+def asset_series(seed: int, n_obs: int, n_assets: int) -> np.ndarray:
+    """(n_obs × n_assets) returns: a GARCH common factor plus Normal noise."""
+    rng = np.random.default_rng(seed)
+    factor = simulate_garch_returns(n_obs, seed=seed)
+    betas = rng.uniform(0.6, 1.4, n_assets)
+    return factor[:, None] * betas + rng.normal(0.0, 0.006, (n_obs, n_assets))
@@ -0,0 +1,27 @@
+"""Invalid backtest requests must fail up front, before any window is fitted."""
+from __future__ import annotations
+
+import pytest
+
+from training_service.backtesting.rolling_backtest import ModelSpec, rolling_predictions, run_comparative_backtest
+from training_service.models.garch import GARCHParams
+
+from .simulated import garch_series
+
+CONSTANT_MEAN = GARCHParams(mean="Constant")
+
+
+def test_native_engine_rejects_unsupported_params():
+    returns = garch_series(0, 300)
+    with pytest.raises(ValueError, match="engine='native'"):
+        rolling_predictions(
+            returns, "garch", lookback_days=252, test_days=40, garch_engine="native", garch_params=CONSTANT_MEAN,
+        )
+
+
+def test_comparative_native_spec_rejects_unsupported_params():
+    # Used to come back as an all-NaN series for the native spec
+    returns = garch_series(0, 300)
+    specs = [ModelSpec("historical"), ModelSpec("garch", garch_params=CONSTANT_MEAN, garch_engine="native")]
+    with pytest.raises(ValueError, match="engine='native'"):
+        run_comparative_backtest(returns, specs, lookback_days=252, test_days=40)
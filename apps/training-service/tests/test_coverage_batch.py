@@ -0,0 +1,69 @@
+"""Batch Kupiec / Christoffersen tests must equal the scalar tests row by row."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from training_service.backtesting.christoffersen import christoffersen_test, christoffersen_test_batch
+from training_service.backtesting.kupiec import kupiec_test, kupiec_test_batch
+from training_service.backtesting.rolling_backtest import ModelSpec, run_comparative_backtest, summarise_backtest
+
+from .simulated import garch_series
+
+ALPHA = 0.95
+_COUNTS = ("n_00", "n_01", "n_10", "n_11")
+_STATS = ("pi_01", "pi_11", "pi_hat", "lr_ind", "p_value_ind", "lr_cc", "p_value_cc")
+
+
+def _ragged_hits(seed: int, n_rows: int = 40, max_len: int = 250) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    hits = (rng.random((n_rows, max_len)) < 0.08).astype(np.int64)
+    lengths = rng.integers(2, max_len + 1, size=n_rows)
+    # Rows whose last valid day is a hit: the case that used to add a 1→0 into the padding
+    rows = np.arange(0, n_rows, 2)
+    hits[rows, lengths[rows] - 1] = 1
+    return hits, lengths
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_christoffersen_batch_matches_scalar_with_ragged_lengths(seed):
+    hits, lengths = _ragged_hits(seed)
+    batch = christoffersen_test_batch(hits, ALPHA, lengths=lengths)
+    for row, n in enumerate(lengths):
+        scalar = christoffersen_test(hits[row, :n], ALPHA)
+        for name in _COUNTS:
+            assert batch[name][row] == getattr(scalar, name), (row, name)
+        for name in _STATS:
+            assert batch[name][row] == pytest.approx(getattr(scalar, name), rel=1e-9, abs=1e-12), (row, name)
+        assert batch["violations"][row] == scalar.kupiec.violations
+        assert batch["lr_uc"][row] == pytest.approx(scalar.kupiec.lr_statistic, rel=1e-9, abs=1e-12)
+        assert bool(batch["reject_h0"][row]) == scalar.reject_h0
+
+
+def test_kupiec_batch_matches_scalar():
+    hits, lengths = _ragged_hits(2)
+    violations = np.array([h[:n].sum() for h, n in zip(hits, lengths)])
+    batch = kupiec_test_batch(violations, lengths, ALPHA)
+    for row, (x, n) in enumerate(zip(violations, lengths)):
+        scalar = kupiec_test(int(x), int(n), ALPHA)
+        assert batch["lr_statistic"][row] == pytest.approx(scalar.lr_statistic, rel=1e-9, abs=1e-12)
+        assert batch["p_value"][row] == pytest.approx(scalar.p_value, rel=1e-9, abs=1e-12)
+        assert bool(batch["reject_h0"][row]) == scalar.reject_h0
+
+
+def test_comparative_backtest_tests_match_per_model_summary():
+    # Coverage tests of all specs come from one batch call; each must equal summarise_backtest
+    returns = garch_series(6, 252 + 80)
+    specs = [ModelSpec("historical"), ModelSpec("montecarlo", n_simulations=2_000)]
+    comparison = run_comparative_backtest(returns, specs, alpha=ALPHA, lookback_days=252, test_days=80)
+    for r in comparison.results.values():
+        ref = summarise_backtest(r.day_results, r.model_type, ALPHA, 252, 80)
+        assert r.status == ref.status
+        assert r.kupiec.lr_statistic == pytest.approx(ref.kupiec.lr_statistic, rel=1e-9, abs=1e-12)
+        assert r.kupiec.p_value == pytest.approx(ref.kupiec.p_value, rel=1e-9, abs=1e-12)
+        for name in _COUNTS:
+            assert getattr(r.christoffersen, name) == getattr(ref.christoffersen, name)
+        for name in _STATS:
+            assert getattr(r.christoffersen, name) == pytest.approx(
+                getattr(ref.christoffersen, name), rel=1e-9, abs=1e-12,
+            )
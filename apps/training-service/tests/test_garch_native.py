@@ -0,0 +1,18 @@
+"""Native batched GARCH(1,1) must agree with arch on simulated series."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from training_service.benchmarks.garch_native import run_benchmark
+
+N_SERIES = 40
+
+
+@pytest.mark.parametrize("dist", ["normal", "t"])
+def test_native_matches_arch(dist):
+    res = run_benchmark(N_SERIES, 500, dist)
+    # Occasional local maxima / boundary optima are allowed, as in the benchmark gate
+    assert np.mean(res["vol_rel_diff"] <= 1e-2) >= 0.95
+    assert np.median(res["ll_diff"]) > -1e-3
+    assert res["converged"] >= 0.95
@@ -0,0 +1,40 @@
+"""WarmStartGarch must never fit worse than a cold train_garch on the same window."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from training_service.models.garch import GARCHParams, WarmStartGarch, train_garch
+
+from .simulated import garch_series
+
+LOOKBACK = 252
+WINDOWS = 60
+GARCH_11 = GARCHParams(p=1, q=1, dist="normal", mean="Zero")
+
+
+@pytest.mark.parametrize("seed", [1, 2, 5])
+def test_warm_fits_match_cold_likelihood(seed):
+    returns = garch_series(seed, LOOKBACK + WINDOWS)
+    fitter = WarmStartGarch(returns, GARCH_11)
+
+    deficits = []
+    for i in range(WINDOWS):
+        warm = fitter.fit_window(i, i + LOOKBACK)
+        cold = train_garch(returns[i : i + LOOKBACK], garch_params=GARCH_11)
+        deficits.append(cold.log_likelihood - warm.log_likelihood)
+
+    assert fitter.warm_fits == WINDOWS - 1
+    # Optimiser tolerance only; a stuck warm start loses several LL points
+    assert max(deficits) < 1e-3
+
+
+def test_bound_fit_is_rechecked_cold():
+    # Seed 1 drifts onto α = 0 after ~30 windows; the cold re-check must catch it
+    returns = garch_series(1, LOOKBACK + WINDOWS)
+    fitter = WarmStartGarch(returns, GARCH_11)
+    for i in range(WINDOWS):
+        fitter.fit_window(i, i + LOOKBACK)
+    assert fitter.cold_checks > 0
+    assert fitter.cold_wins > 0
+    assert np.isfinite(fitter.fit_window(WINDOWS - 1, WINDOWS - 1 + LOOKBACK).var)
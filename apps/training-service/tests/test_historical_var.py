@@ -0,0 +1,34 @@
+"""Vectorised rolling historical VaR must equal a per-window np.quantile loop."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from training_service.backtesting.rolling_backtest import rolling_predictions
+from training_service.models.historical import rolling_historical_var
+
+from .simulated import garch_series
+
+LOOKBACK = 252
+ALPHAS = (0.95, 0.975, 0.99)
+
+
+def _loop_var(returns: np.ndarray, n_windows: int) -> np.ndarray:
+    return np.array([
+        [-np.quantile(returns[i : i + LOOKBACK], 1.0 - a) for a in ALPHAS] for i in range(n_windows)
+    ])
+
+
+@pytest.mark.parametrize("method", ["auto", "partition", "sorted"])
+def test_rolling_var_matches_quantile_loop(method):
+    rng = np.random.default_rng(0)
+    returns = 0.01 * rng.standard_t(4, LOOKBACK + 499)
+    var = rolling_historical_var(returns, LOOKBACK, list(ALPHAS), method=method)
+    np.testing.assert_allclose(var, _loop_var(returns, 500), rtol=0, atol=1e-12)
+
+
+def test_backtest_uses_loop_equivalent_series():
+    returns = garch_series(4, LOOKBACK + 120)
+    days, _ = rolling_predictions(returns, "historical", alpha=0.99, lookback_days=LOOKBACK, test_days=120)
+    expected = _loop_var(returns, 120)[:, ALPHAS.index(0.99)]
+    np.testing.assert_allclose([d.var_predicted for d in days], expected, rtol=0, atol=1e-12)
@@ -0,0 +1,28 @@
+"""Sobol' batches are powers of two and never exceed the requested path count."""
+from __future__ import annotations
+
+import pytest
+
+from training_service.models.montecarlo import MonteCarloParams, _batch_sizes, run_monte_carlo
+
+from .simulated import garch_series
+
+
+@pytest.mark.parametrize("n_simulations", [1, 3, 1_000, 10_000, 16_384, 100_000])
+@pytest.mark.parametrize("alpha", [0.95, 0.99, 0.999])
+def test_sobol_batches_fit_in_budget(n_simulations, alpha):
+    sizes = _batch_sizes(n_simulations, 20, "sobol", alpha)
+    per_batch = sizes[0]
+    assert set(sizes) == {per_batch}
+    assert per_batch & (per_batch - 1) == 0
+    assert len(sizes) <= 20
+    assert n_simulations / 2 <= sum(sizes) <= n_simulations
+
+
+def test_sobol_run_reports_paths_used():
+    # Rounding up used to simulate 16,384 paths here
+    res = run_monte_carlo(
+        garch_series(0, 500), alpha=0.999, mc_params=MonteCarloParams(n_simulations=10_000, sampler="sobol"),
+    )
+    assert res.n_simulations == 8_192
+    assert res.params["n_simulations"] == 8_192
@@ -0,0 +1,56 @@
+"""Common-shock Monte Carlo backtest must equal one run_monte_carlo per window."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from training_service.backtesting.rolling_backtest import _mc_params, rolling_predictions
+from training_service.models.covariance import CovarianceCache
+from training_service.models.montecarlo import run_monte_carlo
+
+from .simulated import asset_series, garch_series
+
+LOOKBACK = 252
+TEST_DAYS = 40
+N_SIMULATIONS = 4_000
+ALPHA = 0.99
+
+
+def _per_window_var(returns, horizon_days, sampler, weights=None) -> np.ndarray:
+    mc_params = _mc_params(N_SIMULATIONS, sampler)
+    cache = CovarianceCache(max_entries=2)
+    out = []
+    for i in range(TEST_DAYS):
+        end = i + LOOKBACK
+        if weights is not None:
+            res = run_monte_carlo(
+                returns[i:end], ALPHA, horizon_days, weights, mc_params, cache.get(returns, end, LOOKBACK),
+            )
+        else:
+            res = run_monte_carlo(returns[i:end], ALPHA, horizon_days, mc_params=mc_params)
+        out.append(res.var)
+    return np.asarray(out)
+
+
+def _backtest_var(returns, horizon_days, sampler, weights=None) -> np.ndarray:
+    days, _ = rolling_predictions(
+        returns, "montecarlo", alpha=ALPHA, lookback_days=LOOKBACK, test_days=TEST_DAYS,
+        horizon_days=horizon_days, n_simulations=N_SIMULATIONS, mc_sampler=sampler, weights=weights,
+    )
+    return np.array([d.var_predicted for d in days])
+
+
+@pytest.mark.parametrize("sampler", ["pseudo", "antithetic", "sobol"])
+@pytest.mark.parametrize("horizon_days", [1, 10])
+def test_single_asset_matches_per_window(sampler, horizon_days):
+    returns = garch_series(2, LOOKBACK + TEST_DAYS)
+    expected = _per_window_var(returns, horizon_days, sampler)
+    np.testing.assert_allclose(_backtest_var(returns, horizon_days, sampler), expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("horizon_days", [1, 10])
+def test_multi_asset_matches_per_window(horizon_days):
+    returns = asset_series(2, LOOKBACK + TEST_DAYS, 4)
+    weights = np.full(4, 0.25)
+    expected = _per_window_var(returns, horizon_days, "pseudo", weights)
+    np.testing.assert_allclose(_backtest_var(returns, horizon_days, "pseudo", weights), expected, rtol=1e-9)
@@ -0,0 +1,36 @@
+"""Float32 Monte Carlo must stay within FLOAT32_REL_TOLERANCE of float64."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from training_service.benchmarks.mc_precision import arithmetic_error, end_to_end
+from training_service.models.montecarlo import FLOAT32_REL_TOLERANCE
+
+from .simulated import asset_series, garch_series
+
+N_SIMULATIONS = 100_000
+N_ASSETS = 8
+
+
+def _portfolio(kind: str) -> tuple[np.ndarray, np.ndarray | None]:
+    if kind == "single":
+        return garch_series(0, 750), None
+    return asset_series(0, 750, N_ASSETS), np.full(N_ASSETS, 1.0 / N_ASSETS)
+
+
+@pytest.mark.parametrize("kind", ["single", "multi"])
+@pytest.mark.parametrize("alpha,horizon_days", [(0.99, 1), (0.99, 10), (0.975, 10)])
+def test_float32_arithmetic_within_tolerance(kind, alpha, horizon_days):
+    # Same float64 shocks, cast to float32: rounding error only, no sampling noise
+    returns, weights = _portfolio(kind)
+    var_err, cvar_err = arithmetic_error(returns, alpha, horizon_days, N_SIMULATIONS, weights=weights)
+    assert var_err <= FLOAT32_REL_TOLERANCE
+    assert cvar_err <= FLOAT32_REL_TOLERANCE
+
+
+@pytest.mark.parametrize("kind", ["single", "multi"])
+def test_float32_run_within_standard_errors(kind):
+    returns, weights = _portfolio(kind)
+    res = end_to_end(returns, 0.99, 10, N_SIMULATIONS, weights=weights)
+    assert res["ok"], res
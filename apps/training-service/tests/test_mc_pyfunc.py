@@ -0,0 +1,36 @@
+"""Monte Carlo pyfunc models: shared covariance factors and one drift convention."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("mlflow")
+
+from training_service.models.covariance import estimate_factors  # noqa: E402
+from training_service.models.mc_pyfunc import MonteCarloModel, MultiAssetMonteCarloModel  # noqa: E402
+
+from .simulated import asset_series, garch_series  # noqa: E402
+
+
+def test_multiasset_from_returns_uses_covariance_factors():
+    returns = asset_series(0, 260, 3)
+    # A duplicated column makes the covariance singular, so the PD repair kicks in
+    returns = np.column_stack([returns, returns[:, 0]])
+    model = MultiAssetMonteCarloModel.from_returns(returns, ["A", "B", "C", "D"])
+    factors = estimate_factors(returns)
+    assert factors.repaired
+    np.testing.assert_array_equal(model.chol, factors.chol)
+    np.testing.assert_array_equal(model.drift, factors.mean)
+
+
+@pytest.mark.parametrize("sampler,horizon", [("pseudo", 1), ("antithetic", 10)])
+def test_one_symbol_multiasset_model_matches_scalar_model(sampler, horizon):
+    returns = garch_series(4, 252)
+    scalar = MonteCarloModel.from_returns(returns, seed=7)
+    multi = MultiAssetMonteCarloModel.from_returns(returns[:, None], ["A"], seed=7)
+    request = pd.DataFrame([{"n_simulations": 5_000, "horizon_days": horizon, "alpha": 0.99, "sampler": sampler}])
+    expected = scalar.predict(None, request).iloc[0]
+    got = multi.predict(None, request).iloc[0]
+    for name in ("var", "cvar", "volatility"):
+        assert got[name] == pytest.approx(expected[name], rel=1e-9), name
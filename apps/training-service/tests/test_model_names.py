@@ -0,0 +1,28 @@
+"""Scoped registered model names (must match the Inference Service's loader)."""
+from __future__ import annotations
+
+import pytest
+
+from training_service.pipelines.train import TrainRequest, model_scope, registered_model_name
+
+
+def test_global_and_portfolio_names():
+    assert registered_model_name("garch", model_scope(TrainRequest(symbols=["AAPL"]))) == "riskops-garch"
+    req = TrainRequest(symbols=["AAPL"], scope="portfolio", portfolio_id=7)
+    assert registered_model_name("montecarlo", model_scope(req)) == "riskops-montecarlo--portfolio-7"
+
+
+def test_symbol_scope_is_order_independent():
+    a = model_scope(TrainRequest(symbols=["MSFT", "AAPL"], scope="symbols"))
+    b = model_scope(TrainRequest(symbols=["AAPL", "MSFT", "AAPL"], scope="symbols"))
+    # Same digest as inference_service.models.loader.symbols_scope(["AAPL", "MSFT"])
+    assert a == b == "symbols-1b7002f37d43"
+
+
+@pytest.mark.parametrize("req", [
+    TrainRequest(symbols=["AAPL"], scope="portfolio"),
+    TrainRequest(symbols=["AAPL"], scope="sector"),
+])
+def test_invalid_scope_is_rejected(req):
+    with pytest.raises(ValueError):
+        model_scope(req)
@@ -2,10 +2,16 @@
 
 Endpoints:
   POST /api/risk/train              — trigger model training (async background task)
+  POST /api/risk/train/universe     — refit per-symbol volatility models (async background task)
   GET  /api/risk/train/status/{id}  — get training run status from Postgres training_jobs
   GET  /api/risk/train/run/{run_id} — get MLflow run details by run_id
   GET  /api/risk/models             — list registered models from model_registry
-  POST /api/risk/backtest           — run rolling window out-of-sample VaR backtest
+  POST /api/risk/backtest           — run rolling window out-of-sample VaR backtest (synchronous)
+  POST /api/risk/backtest/jobs      — queue the same backtest as a background job
+  GET  /api/risk/backtest/jobs/{id} — backtest job status, percent complete and summary
+  GET  /api/risk/backtest/jobs/{id}/days   — per-day VaR / realised return / violation rows
+  POST /api/risk/backtest/jobs/{id}/cancel — cancel a queued or running backtest job
+  POST /api/risk/backtest/compare   — backtest several models over the same windows, ranked by loss
 """
 from __future__ import annotations
 
@@ -16,23 +22,45 @@ import time
 import urllib.request
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta, timezone
+from dataclasses import asdict
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Optional
 
+import numpy as np
+
 import mlflow
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 
 from ..backtesting import (
+    BacktestCancelled,
     BacktestReport,
+    ModelSpec,
+    RollingBacktestResult,
     build_report,
     log_backtest_to_mlflow,
+    run_comparative_backtest,
+    run_incremental_backtest,
     run_rolling_backtest,
 )
 from ..config import get_settings
 from ..db import get_engine
-from ..pipelines.train import TrainRequest, TrainResult, load_returns, build_portfolio_returns, run_training
+from ..models.garch import GARCHParams
+from ..pipelines.plots import render_run_plots, schedule_plot_rendering
+from ..pipelines.train import (
+    TrainRequest,
+    TrainResult,
+    UniverseTrainRequest,
+    build_portfolio_returns,
+    build_returns_matrix,
+    load_returns,
+    model_scope,
+    portfolio_weight_vector,
+    returns_dates,
+    run_training,
+    run_universe_training,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +152,23 @@ def _job_create(job_id: str, req: TrainRequest) -> None:
         )
 
 
+def _job_create_universe(job_id: str, req: UniverseTrainRequest) -> None:
+    """Insert a queued training_jobs row for a universe run (symbols NULL = all)."""
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO training_jobs
+                    (job_id, status, model_type, symbols, lookback_days, created_at, updated_at)
+                VALUES
+                    (:job_id, 'queued', 'universe', :symbols, :lookback_days, NOW(), NOW())
+                """
+            ),
+            {"job_id": job_id, "symbols": req.symbols, "lookback_days": req.lookback_days},
+        )
+
+
 def _job_set_running(job_id: str) -> None:
     engine = get_engine()
     with engine.begin() as conn:
@@ -192,6 +237,240 @@ def _job_get(job_id: str) -> Optional[dict[str, Any]]:
     }
 
 
+# ---------------------------------------------------------------------------
+# Postgres backtest job helpers
+# ---------------------------------------------------------------------------
+
+# Minimum interval between progress writes of a running backtest job (seconds)
+_BACKTEST_PROGRESS_WRITE_S = 1.0
+
+
+def _json_safe(value: Any) -> Any:
+    """Replace NaN/inf with None — JSONB rejects them."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+def _backtest_job_create(job_id: str, body: "BacktestRequestBody") -> None:
+    """Insert a new backtest job row in Postgres (status=queued)."""
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO backtest_jobs
+                    (job_id, status, model_type, symbols, alpha, lookback_days, test_days,
+                     request, created_at, updated_at)
+                VALUES
+                    (:job_id, 'queued', :model_type, :symbols, :alpha, :lookback_days, :test_days,
+                     cast(:request as jsonb), NOW(), NOW())
+                """
+            ),
+            {
+                "job_id": job_id,
+                "model_type": body.model_type,
+                "symbols": body.symbols,
+                "alpha": body.alpha,
+                "lookback_days": body.lookback_days,
+                "test_days": body.test_days,
+                "request": json.dumps(body.model_dump()),
+            },
+        )
+
+
+def _backtest_job_set_running(job_id: str, days_total: int) -> bool:
+    """Mark a queued job running; False if it was cancelled before it started."""
+    engine = get_engine()
+    with engine.begin() as conn:
+        row = conn.execute(
+            text(
+                """
+                UPDATE backtest_jobs
+                SET status='running', days_total=:days_total, updated_at=NOW()
+                WHERE job_id=:job_id AND status='queued'
+                RETURNING job_id
+                """
+            ),
+            {"job_id": job_id, "days_total": days_total},
+        ).fetchone()
+    return row is not None
+
+
+def _backtest_job_progress(job_id: str, days_done: int) -> bool:
+    """Record progress; returns True when cancellation has been requested."""
+    engine = get_engine()
+    with engine.begin() as conn:
+        row = conn.execute(
+            text(
+                """
+                UPDATE backtest_jobs
+                SET days_done=:days_done, updated_at=NOW()
+                WHERE job_id=:job_id
+                RETURNING cancel_requested
+                """
+            ),
+            {"job_id": job_id, "days_done": days_done},
+        ).fetchone()
+    return bool(row and row[0])
+
+
+def _backtest_job_set_completed(
+    job_id: str,
+    summary: dict,
+    result: RollingBacktestResult,
+    dates: list[date],
+) -> None:
+    """Store the per-day rows and the summary in one transaction."""
+    rows = [
+        {
+            "job_id": job_id,
+            "price_date": dates[d.t],
+            "var_predicted": d.var_predicted,
+            "realised_return": d.realised_return,
+            "violation": bool(d.violation),
+        }
+        for d in result.day_results
+    ]
+    engine = get_engine()
+    with engine.begin() as conn:
+        if rows:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO backtest_results
+                        (job_id, price_date, var_predicted, realised_return, violation)
+                    VALUES
+                        (:job_id, :price_date, :var_predicted, :realised_return, :violation)
+                    ON CONFLICT (job_id, price_date) DO NOTHING
+                    """
+                ),
+                rows,
+            )
+        conn.execute(
+            text(
+                """
+                UPDATE backtest_jobs
+                SET status='completed', days_done=days_total,
+                    result=cast(:result as jsonb), updated_at=NOW()
+                WHERE job_id=:job_id
+                """
+            ),
+            {"job_id": job_id, "result": json.dumps(_json_safe(summary))},
+        )
+
+
+def _backtest_job_set_finished(job_id: str, status: str, error: Optional[str] = None) -> None:
+    """Mark a job failed or cancelled."""
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                UPDATE backtest_jobs
+                SET status=:status, error=:error, updated_at=NOW()
+                WHERE job_id=:job_id
+                """
+            ),
+            {"job_id": job_id, "status": status, "error": error},
+        )
+
+
+def _backtest_job_request_cancel(job_id: str) -> Optional[str]:
+    """Flag a queued/running job for cancellation; returns its status, None if not cancellable.
+
+    A queued job is cancelled at once; a running one stops at its next
+    progress write.
+    """
+    engine = get_engine()
+    with engine.begin() as conn:
+        row = conn.execute(
+            text(
+                """
+                UPDATE backtest_jobs
+                SET cancel_requested=TRUE,
+                    status=CASE WHEN status='queued' THEN 'cancelled' ELSE status END,
+                    updated_at=NOW()
+                WHERE job_id=:job_id AND status IN ('queued', 'running')
+                RETURNING status
+                """
+            ),
+            {"job_id": job_id},
+        ).fetchone()
+    return row[0] if row else None
+
+
+def _backtest_job_get(job_id: str) -> Optional[dict[str, Any]]:
+    """Fetch a backtest job row from Postgres. Returns None if not found."""
+    engine = get_engine()
+    with engine.connect() as conn:
+        row = conn.execute(
+            text(
+                """
+                SELECT job_id, status, model_type, days_done, days_total, cancel_requested,
+                       result, error, created_at, updated_at
+                FROM backtest_jobs
+                WHERE job_id = :job_id
+                """
+            ),
+            {"job_id": job_id},
+        ).fetchone()
+    if row is None:
+        return None
+    return {
+        "job_id": row[0],
+        "status": row[1],
+        "model_type": row[2],
+        "days_done": row[3],
+        "days_total": row[4],
+        "cancel_requested": row[5],
+        "result": row[6],    # already a dict from JSONB
+        "error": row[7],
+        "created_at": str(row[8]),
+        "updated_at": str(row[9]),
+    }
+
+
+def _backtest_job_days(job_id: str) -> list[dict[str, Any]]:
+    engine = get_engine()
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT price_date, var_predicted, realised_return, violation
+                FROM backtest_results
+                WHERE job_id = :job_id
+                ORDER BY price_date ASC
+                """
+            ),
+            {"job_id": job_id},
+        ).fetchall()
+    return [
+        {"price_date": str(r[0]), "var_predicted": r[1], "realised_return": r[2], "violation": r[3]}
+        for r in rows
+    ]
+
+
+class _BacktestJobProgress:
+    """progress_callback of a backtest job: throttled progress writes + cancellation."""
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        self._last_write = 0.0
+
+    def __call__(self, done: int, total: int) -> None:
+        now = time.monotonic()
+        if done < total and now - self._last_write < _BACKTEST_PROGRESS_WRITE_S:
+            return
+        self._last_write = now
+        if _backtest_job_progress(self.job_id, done):
+            raise BacktestCancelled(f"backtest job {self.job_id} cancelled after {done}/{total} days")
+
+
 # ---------------------------------------------------------------------------
 # Request / Response schemas
 # ---------------------------------------------------------------------------
@@ -218,6 +497,50 @@ class TrainRequestBody(BaseModel):
         default=10_000, ge=1_000, le=100_000,
         description="Number of Monte Carlo simulations",
     )
+    mc_sampler: str = Field(
+        default="pseudo",
+        description="Monte Carlo sampler: pseudo | antithetic | sobol | importance",
+        pattern="^(pseudo|antithetic|sobol|importance)$",
+    )
+    mc_target_rel_error: Optional[float] = Field(
+        default=None, gt=0.0, le=0.5,
+        description="Adaptive MC: add paths until the relative VaR/CVaR standard error "
+                    "reaches this value (n_simulations is then the pilot size)",
+    )
+    garch_tournament: bool = Field(
+        default=False,
+        description="Choose the GARCH (p, q, dist, mean) specification by a parallel "
+                    "tournament (BIC + quick backtest) instead of GARCH(1,1)-normal",
+    )
+    scope: str = Field(
+        default="global",
+        description="Register the models globally (riskops-<type>), for one portfolio "
+                    "(riskops-<type>--portfolio-<id>) or for this symbol set "
+                    "(riskops-<type>--symbols-<hash>): global | portfolio | symbols",
+        pattern="^(global|portfolio|symbols)$",
+    )
+    portfolio_id: Optional[int] = Field(
+        default=None, ge=1,
+        description="Portfolio the models are trained for (required with scope=portfolio)",
+    )
+
+
+class UniverseTrainRequestBody(BaseModel):
+    symbols: Optional[list[str]] = Field(
+        default=None,
+        description="Restrict the run to these symbols. If None, every symbol in processed_returns.",
+        min_length=1,
+    )
+    lookback_days: int = Field(default=252, ge=30, le=2520, description="Historical lookback window")
+    dist: str = Field(
+        default="normal",
+        description="Innovation distribution: normal | t",
+        pattern="^(normal|t)$",
+    )
+    force: bool = Field(
+        default=False,
+        description="Refit symbols whose stored model already covers their latest return",
+    )
 
 
 class TrainResponse(BaseModel):
@@ -251,6 +574,11 @@ class RunStatusResponse(BaseModel):
     error: Optional[str] = None
 
 
+class RunPlotsResponse(BaseModel):
+    run_id: str
+    artifacts: list[str]   # run-relative paths of the rendered PNGs
+
+
 # ---------------------------------------------------------------------------
 # Backtest request / response schemas
 # ---------------------------------------------------------------------------
@@ -283,6 +611,21 @@ class BacktestRequestBody(BaseModel):
         default=1_000, ge=100, le=10_000,
         description="Monte Carlo simulations per rolling step (only for montecarlo)",
     )
+    mc_sampler: str = Field(
+        default="pseudo",
+        description="Monte Carlo sampler: pseudo | antithetic | sobol | importance (only for montecarlo)",
+        pattern="^(pseudo|antithetic|sobol|importance)$",
+    )
+    refit_every: int = Field(
+        default=1, ge=1, le=252,
+        description="Re-estimate GARCH every N days; the variance is filtered forward "
+                    "with fixed parameters in between (only for garch)",
+    )
+    garch_engine: str = Field(
+        default="arch",
+        description="GARCH estimator: arch | native (vectorised batch over all refit windows)",
+        pattern="^(arch|native)$",
+    )
     weights: Optional[dict[str, float]] = Field(
         default=None,
         description="Portfolio weights per symbol. If None, equal weights are used.",
@@ -296,6 +639,11 @@ class BacktestRequestBody(BaseModel):
         default=True,
         description="Whether to log backtest results to MLflow.",
     )
+    incremental: bool = Field(
+        default=False,
+        description="Reuse the days stored in the backtest ledger for the same specification "
+                    "and predict only the missing dates.",
+    )
 
 
 class BacktestResponse(BaseModel):
@@ -322,7 +670,145 @@ class BacktestResponse(BaseModel):
     alpha: float
     lookback_days: int
     test_days: int
+    refit_every: int = 1
+    refit_days: list[int] = Field(default_factory=list)   # out-of-sample day offsets
     mlflow_run_id: Optional[str] = None
+    # Incremental backtests: days predicted by this request (the rest came from the ledger)
+    days_computed: Optional[int] = None
+
+
+class BacktestModelSpecBody(BaseModel):
+    model_type: str = Field(
+        default="garch",
+        description="Model type: garch | montecarlo | historical",
+        pattern="^(garch|montecarlo|historical)$",
+    )
+    label: Optional[str] = Field(
+        default=None,
+        description="Name of the model in the comparison; derived from the spec if None",
+    )
+    garch_p: int = Field(default=1, ge=1, le=3, description="ARCH order (only for garch)")
+    garch_q: int = Field(default=1, ge=1, le=3, description="GARCH order (only for garch)")
+    garch_dist: str = Field(
+        default="normal",
+        description="Innovation distribution: normal | t | skewt (only for garch)",
+        pattern="^(normal|t|skewt)$",
+    )
+    garch_mean: str = Field(
+        default="Zero",
+        description="Mean model: Zero | Constant (only for garch)",
+        pattern="^(Zero|Constant)$",
+    )
+    refit_every: int = Field(default=1, ge=1, le=252, description="Re-estimate GARCH every N days")
+    garch_engine: str = Field(default="arch", pattern="^(arch|native)$")
+    n_simulations: int = Field(
+        default=1_000, ge=100, le=10_000,
+        description="Monte Carlo simulations per rolling step (only for montecarlo)",
+    )
+    mc_sampler: str = Field(
+        default="pseudo",
+        pattern="^(pseudo|antithetic|sobol|importance)$",
+    )
+
+    def to_spec(self) -> ModelSpec:
+        return ModelSpec(
+            model_type=self.model_type,  # type: ignore[arg-type]
+            label=self.label,
+            garch_params=GARCHParams(
+                p=self.garch_p, q=self.garch_q, dist=self.garch_dist, mean=self.garch_mean,
+            ),
+            refit_every=self.refit_every,
+            garch_engine=self.garch_engine,
+            n_simulations=self.n_simulations,
+            mc_sampler=self.mc_sampler,
+        )
+
+
+class BacktestCompareRequestBody(BaseModel):
+    symbols: list[str] = Field(
+        default=["AAPL", "MSFT"],
+        description="List of ticker symbols to backtest",
+        min_length=1,
+    )
+    models: list[BacktestModelSpecBody] = Field(
+        default_factory=lambda: [
+            BacktestModelSpecBody(model_type="garch"),
+            BacktestModelSpecBody(model_type="montecarlo"),
+            BacktestModelSpecBody(model_type="historical"),
+        ],
+        description="Models to compare over the same windows",
+        min_length=1,
+        max_length=12,
+    )
+    alpha: float = Field(default=0.99, ge=0.9, le=0.9999, description="VaR confidence level")
+    lookback_days: int = Field(default=252, ge=30, le=2520, description="Rolling training window size (days)")
+    test_days: int = Field(default=60, ge=10, le=504, description="Number of out-of-sample days to evaluate")
+    horizon_days: int = Field(default=1, ge=1, le=30, description="VaR forecast horizon (days)")
+    weights: Optional[dict[str, float]] = Field(
+        default=None,
+        description="Portfolio weights per symbol. If None, equal weights are used.",
+    )
+
+
+class BacktestModelComparison(BaseModel):
+    label: str
+    model_type: str
+    rank: int                     # 1 = lowest mean quantile loss
+    status: str                   # OK | WARN | CRIT | UNKNOWN
+    violations: int
+    total_obs: int
+    violation_rate: float
+    kupiec_pvalue: float
+    christoffersen_pvalue_cc: float
+    quantile_loss: float          # mean over the common days
+    lopez_loss: float             # mean over the common days
+    refit_days: int               # number of GARCH refits
+
+
+class BacktestCompareResponse(BaseModel):
+    alpha: float
+    lookback_days: int
+    test_days: int
+    common_days: int              # days on which every model produced a VaR
+    models: list[BacktestModelComparison]   # in rank order
+    dates: list[str]              # the common days
+    hits: dict[str, list[int]]    # label → hit sequence on the common days
+    var: dict[str, list[float]]   # label → predicted VaR on the common days
+
+
+class BacktestJobResponse(BaseModel):
+    job_id: str
+    status: str   # queued | running | completed | failed | cancelled
+    days_done: int = 0
+    days_total: Optional[int] = None
+    percent_complete: float = 0.0
+    message: str = ""
+    result: Optional[dict] = None   # BacktestResponse fields once completed (NaN → null)
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+
+class BacktestDay(BaseModel):
+    price_date: str
+    var_predicted: float
+    realised_return: float
+    violation: bool
+
+
+def _backtest_job_response(job: dict[str, Any]) -> BacktestJobResponse:
+    total = job.get("days_total")
+    done = job.get("days_done") or 0
+    return BacktestJobResponse(
+        job_id=job["job_id"],
+        status=job["status"],
+        days_done=done,
+        days_total=total,
+        percent_complete=round(100.0 * done / total, 1) if total else 0.0,
+        message=job.get("error") or "",
+        result=job.get("result"),
+        created_at=job.get("created_at"),
+        updated_at=job.get("updated_at"),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -355,6 +841,21 @@ def _training_worker(job_id: str, req: TrainRequest) -> None:
         _job_set_failed(job_id, str(exc))
 
 
+def _universe_training_worker(job_id: str, req: UniverseTrainRequest) -> None:
+    """Universe counterpart of _training_worker; the job result is one summary dict."""
+    _job_set_running(job_id)
+    try:
+        result = run_universe_training(req)
+        _job_set_completed(job_id, [asdict(result)])
+        logger.info(
+            "Universe training job %s completed: %d fitted, %d failed",
+            job_id, result.n_fitted, len(result.failures),
+        )
+    except Exception as exc:
+        logger.exception("Universe training job %s failed: %s", job_id, exc)
+        _job_set_failed(job_id, str(exc))
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -374,7 +875,16 @@ async def trigger_training(body: TrainRequestBody, background_tasks: BackgroundT
         lookback_days=body.lookback_days,
         weights=body.weights,
         n_simulations=body.n_simulations,
+        mc_sampler=body.mc_sampler,
+        mc_target_rel_error=body.mc_target_rel_error,
+        garch_tournament=body.garch_tournament,
+        scope=body.scope,
+        portfolio_id=body.portfolio_id,
     )
+    try:
+        model_scope(req)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
 
     job_id = str(uuid.uuid4())
 
@@ -385,8 +895,8 @@ async def trigger_training(body: TrainRequestBody, background_tasks: BackgroundT
     background_tasks.add_task(_training_worker, job_id, req)
 
     logger.info(
-        "Queued training job %s: model_type=%s symbols=%s",
-        job_id, body.model_type, body.symbols,
+        "Queued training job %s: model_type=%s symbols=%s scope=%s",
+        job_id, body.model_type, body.symbols, model_scope(req),
     )
 
     return TrainResponse(
@@ -396,6 +906,36 @@ async def trigger_training(body: TrainRequestBody, background_tasks: BackgroundT
     )
 
 
+@router.post("/train/universe", response_model=TrainResponse, status_code=202)
+async def trigger_universe_training(
+    body: UniverseTrainRequestBody, background_tasks: BackgroundTasks,
+) -> TrainResponse:
+    """Refit the per-symbol volatility model of every symbol with fresh data.
+
+    Results land in symbol_volatility_models and one ``riskops-garch-universe``
+    MLflow run; poll GET /api/risk/train/status/{job_id} for the summary.
+    """
+    req = UniverseTrainRequest(
+        symbols=body.symbols,
+        lookback_days=body.lookback_days,
+        dist=body.dist,
+        force=body.force,
+    )
+    job_id = str(uuid.uuid4())
+    _job_create_universe(job_id, req)
+    background_tasks.add_task(_universe_training_worker, job_id, req)
+
+    logger.info(
+        "Queued universe training job %s: symbols=%s dist=%s force=%s",
+        job_id, body.symbols or "all", body.dist, body.force,
+    )
+    return TrainResponse(
+        job_id=job_id,
+        status="queued",
+        message=f"Universe training job {job_id} queued. Use GET /api/risk/train/status/{job_id} to poll.",
+    )
+
+
 @router.get("/train/status/{job_id}", response_model=TrainResponse)
 async def get_training_status(job_id: str) -> TrainResponse:
     """Get the status of a training job by its job_id (read from Postgres)."""
@@ -437,6 +977,24 @@ async def get_run_status(run_id: str) -> RunStatusResponse:
     )
 
 
+@router.post("/train/run/{run_id}/plots", response_model=RunPlotsResponse)
+def render_plots(run_id: str) -> RunPlotsResponse:
+    """Render the diagnostic plots of an MLflow run from its logged plot summaries.
+
+    For runs trained with ``diagnostic_plots`` = on_demand (or deferred, to
+    re-render). Plain def: FastAPI runs it in its thread pool.
+    """
+    cfg = get_settings()
+    mlflow.set_tracking_uri(cfg.mlflow_tracking_uri)
+    try:
+        artifacts = render_run_plots(run_id)
+    except mlflow.exceptions.MlflowException as exc:
+        raise HTTPException(status_code=404, detail=f"MLflow run {run_id} not found: {exc}") from exc
+    if not artifacts:
+        raise HTTPException(status_code=404, detail=f"MLflow run {run_id} has no plot summaries")
+    return RunPlotsResponse(run_id=run_id, artifacts=artifacts)
+
+
 @router.get("/models", response_model=ModelsResponse)
 async def list_models() -> ModelsResponse:
     """List all registered models from the Postgres model_registry table."""
@@ -468,76 +1026,125 @@ async def list_models() -> ModelsResponse:
     return ModelsResponse(models=models, total=len(models))
 
 
-@router.post("/backtest", response_model=BacktestResponse)
-async def run_backtest(body: BacktestRequestBody) -> BacktestResponse:
-    """Run a rolling window out-of-sample VaR backtest.
+# ---------------------------------------------------------------------------
+# Backtest execution (shared by the synchronous endpoint and backtest jobs)
+# ---------------------------------------------------------------------------
 
-    Loads historical returns from Postgres, builds a portfolio return series,
-    then evaluates VaR predictions day-by-day on an out-of-sample window.
-    Applies Kupiec (unconditional coverage) and Christoffersen (conditional
-    coverage) statistical tests to assess model calibration.
+class _BacktestInputError(ValueError):
+    """The request cannot be backtested as given (no or too little data) → HTTP 422."""
 
-    This endpoint is **synchronous** — it blocks until the backtest completes.
-    For large test_days or montecarlo model_type, expect 5–30 seconds.
 
-    Returns a BacktestResponse with violation counts, p-values, and a status
-    classification: OK / WARN / CRIT.
-    """
-    logger.info(
-        "Backtest request: model=%s  symbols=%s  alpha=%.4f  lookback=%d  test=%d",
-        body.model_type, body.symbols, body.alpha, body.lookback_days, body.test_days,
-    )
+def _load_backtest_returns(
+    symbols: list[str],
+    weights: Optional[dict[str, float]],
+    lookback_days: int,
+    test_days: int,
+    joint: bool,
+) -> tuple[np.ndarray, Optional[np.ndarray], Optional[list[str]], list[date]]:
+    """Load returns (with auto-ingest fallback) for a backtest.
 
-    # --- Load data (with auto-ingest fallback) ---
-    total_needed = body.lookback_days + body.test_days
+    With *joint* (a Monte Carlo model over several symbols) the assets are
+    returned as a matrix to be simulated jointly, else the portfolio series.
+
+    Returns (returns for run_rolling_backtest, asset weights or None, asset
+    symbols or None, date of every returns row).
+    """
+    total_needed = lookback_days + test_days
 
     try:
-        returns_df = load_returns(body.symbols, lookback_days=total_needed)
+        returns_df = load_returns(symbols, lookback_days=total_needed)
     except RuntimeError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
+        raise _BacktestInputError(str(exc)) from exc
 
-    port_rets = build_portfolio_returns(returns_df, weights=body.weights)
+    port_rets = build_portfolio_returns(returns_df, weights=weights)
 
     if len(port_rets) < total_needed:
         logger.info(
             "Insufficient data for backtest (%d < %d). Triggering auto-ingest for %s.",
-            len(port_rets), total_needed, body.symbols,
+            len(port_rets), total_needed, symbols,
         )
-        _trigger_market_data_ingest(body.symbols, total_needed=total_needed)
+        _trigger_market_data_ingest(symbols, total_needed=total_needed)
 
         # Reload after ingest
         try:
-            returns_df = load_returns(body.symbols, lookback_days=total_needed)
+            returns_df = load_returns(symbols, lookback_days=total_needed)
         except RuntimeError as exc:
-            raise HTTPException(status_code=422, detail=str(exc)) from exc
-        port_rets = build_portfolio_returns(returns_df, weights=body.weights)
+            raise _BacktestInputError(str(exc)) from exc
+        port_rets = build_portfolio_returns(returns_df, weights=weights)
 
     if len(port_rets) < total_needed:
-        raise HTTPException(
-            status_code=422,
-            detail=(
-                f"Insufficient data: need {total_needed} observations "
-                f"(lookback={body.lookback_days} + test={body.test_days}), "
-                f"got {len(port_rets)}. Ingest more market data first."
-            ),
+        raise _BacktestInputError(
+            f"Insufficient data: need {total_needed} observations "
+            f"(lookback={lookback_days} + test={test_days}), "
+            f"got {len(port_rets)}. Ingest more market data first."
         )
 
-    # --- Run rolling backtest ---
-    try:
+    # Multi-symbol Monte Carlo simulates the assets jointly (cached covariance factors)
+    if joint and len(symbols) > 1:
+        matrix, columns = build_returns_matrix(returns_df)
+        return matrix, portfolio_weight_vector(columns, weights), columns, returns_dates(returns_df)
+    return port_rets, None, None, returns_dates(returns_df)
+
+
+def _execute_backtest(
+    body: BacktestRequestBody,
+    progress_callback=None,
+) -> tuple[BacktestResponse, RollingBacktestResult, list[date]]:
+    """Load data, run the rolling backtest, log it and build the response.
+
+    Returns (response, result, dates of the backtest window — ``DayResult.t``
+    indexes into them).
+
+    Raises:
+        _BacktestInputError / ValueError: Invalid request or data (HTTP 422).
+        BacktestCancelled: Raised by *progress_callback*.
+    """
+    logger.info(
+        "Backtest request: model=%s  symbols=%s  alpha=%.4f  lookback=%d  test=%d",
+        body.model_type, body.symbols, body.alpha, body.lookback_days, body.test_days,
+    )
+    bt_returns, bt_weights, bt_symbols, dates = _load_backtest_returns(
+        body.symbols, body.weights, body.lookback_days, body.test_days,
+        joint=body.model_type == "montecarlo",
+    )
+
+    days_computed: Optional[int] = None
+    if body.incremental:
+        result, days_computed = run_incremental_backtest(
+            get_engine(),
+            bt_returns,
+            dates,
+            symbols=bt_symbols or body.symbols,
+            weights=body.weights,
+            model_type=body.model_type,  # type: ignore[arg-type]
+            alpha=body.alpha,
+            lookback_days=body.lookback_days,
+            test_days=body.test_days,
+            horizon_days=body.horizon_days,
+            n_simulations=body.n_simulations,
+            mc_sampler=body.mc_sampler,
+            refit_every=body.refit_every,
+            garch_engine=body.garch_engine,
+            n_workers=get_settings().backtest_workers,
+            progress_callback=progress_callback,
+        )
+    else:
         result = run_rolling_backtest(
-            returns=port_rets,
+            returns=bt_returns,
             model_type=body.model_type,  # type: ignore[arg-type]
             alpha=body.alpha,
             lookback_days=body.lookback_days,
             test_days=body.test_days,
             horizon_days=body.horizon_days,
             n_simulations=body.n_simulations,
+            mc_sampler=body.mc_sampler,
+            weights=bt_weights,
+            symbols=bt_symbols,
+            refit_every=body.refit_every,
+            garch_engine=body.garch_engine,
+            n_workers=get_settings().backtest_workers,
+            progress_callback=progress_callback,
         )
-    except ValueError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
-    except Exception as exc:
-        logger.exception("Backtest failed: %s", exc)
-        raise HTTPException(status_code=500, detail=f"Backtest failed: {exc}") from exc
 
     # --- Build report ---
     report = build_report(result, symbols=body.symbols, mlflow_run_id=body.mlflow_run_id)
@@ -554,7 +1161,10 @@ async def run_backtest(body: BacktestRequestBody) -> BacktestResponse:
                 result=result,
                 symbol=",".join(body.symbols),
                 run_id=body.mlflow_run_id,
+                plot_mode=cfg.diagnostic_plots,
             )
+            if cfg.diagnostic_plots == "deferred":
+                schedule_plot_rendering(used_run_id)
         except Exception as exc:
             # MLflow logging failure must not break the API response
             logger.warning("MLflow logging failed (non-fatal): %s", exc)
@@ -563,7 +1173,7 @@ async def run_backtest(body: BacktestRequestBody) -> BacktestResponse:
     kupiec = result.kupiec
     cc = result.christoffersen
 
-    return BacktestResponse(
+    response = BacktestResponse(
         violations=result.violations,
         total_obs=result.total_obs,
         violation_rate=result.violation_rate,
@@ -581,8 +1191,183 @@ async def run_backtest(body: BacktestRequestBody) -> BacktestResponse:
         alpha=result.alpha,
         lookback_days=result.lookback_days,
         test_days=result.test_days,
+        refit_every=report.refit_every,
+        refit_days=report.refit_days,
         mlflow_run_id=used_run_id,
+        days_computed=days_computed,
     )
+    window_dates = dates[-(body.lookback_days + body.test_days):]
+    return response, result, window_dates
+
+
+def _backtest_worker(job_id: str, body: BacktestRequestBody) -> None:
+    """Runs in the background; persists progress and results to backtest_jobs."""
+    if not _backtest_job_set_running(job_id, body.test_days):
+        logger.info("Backtest job %s was cancelled before it started", job_id)
+        return
+    try:
+        response, result, dates = _execute_backtest(body, progress_callback=_BacktestJobProgress(job_id))
+        _backtest_job_set_completed(job_id, response.model_dump(), result, dates)
+        logger.info(
+            "Backtest job %s completed: status=%s  violations=%d/%d",
+            job_id, response.status, response.violations, response.total_obs,
+        )
+    except BacktestCancelled as exc:
+        logger.info("Backtest job %s cancelled: %s", job_id, exc)
+        _backtest_job_set_finished(job_id, "cancelled", str(exc))
+    except Exception as exc:
+        logger.exception("Backtest job %s failed: %s", job_id, exc)
+        _backtest_job_set_finished(job_id, "failed", str(exc))
+
+
+@router.post("/backtest", response_model=BacktestResponse)
+def run_backtest(body: BacktestRequestBody) -> BacktestResponse:
+    """Run a rolling window out-of-sample VaR backtest.
+
+    Loads historical returns from Postgres, builds a portfolio return series,
+    then evaluates VaR predictions day-by-day on an out-of-sample window.
+    Applies Kupiec (unconditional coverage) and Christoffersen (conditional
+    coverage) statistical tests to assess model calibration.
+
+    This endpoint is **synchronous** — it blocks until the backtest completes
+    (in FastAPI's thread pool, not on the event loop). Long backtests should
+    use POST /api/risk/backtest/jobs instead.
+
+    Returns a BacktestResponse with violation counts, p-values, and a status
+    classification: OK / WARN / CRIT.
+    """
+    try:
+        response, _, _ = _execute_backtest(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Backtest failed: %s", exc)
+        raise HTTPException(status_code=500, detail=f"Backtest failed: {exc}") from exc
+    return response
+
+
+@router.post("/backtest/jobs", response_model=BacktestJobResponse, status_code=202)
+async def submit_backtest_job(
+    body: BacktestRequestBody, background_tasks: BackgroundTasks,
+) -> BacktestJobResponse:
+    """Queue a rolling backtest; poll GET /api/risk/backtest/jobs/{job_id} for progress."""
+    job_id = str(uuid.uuid4())
+    _backtest_job_create(job_id, body)
+    background_tasks.add_task(_backtest_worker, job_id, body)
+
+    logger.info(
+        "Queued backtest job %s: model=%s symbols=%s test_days=%d",
+        job_id, body.model_type, body.symbols, body.test_days,
+    )
+    return BacktestJobResponse(
+        job_id=job_id,
+        status="queued",
+        days_total=body.test_days,
+        message=f"Backtest job {job_id} queued. Use GET /api/risk/backtest/jobs/{job_id} to poll.",
+    )
+
+
+@router.get("/backtest/jobs/{job_id}", response_model=BacktestJobResponse)
+async def get_backtest_job(job_id: str) -> BacktestJobResponse:
+    """Status, percent complete and (once completed) the BacktestResponse of a job."""
+    job = _backtest_job_get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Backtest job {job_id} not found")
+    return _backtest_job_response(job)
+
+
+@router.get("/backtest/jobs/{job_id}/days", response_model=list[BacktestDay])
+async def get_backtest_job_days(job_id: str) -> list[BacktestDay]:
+    """Per-day VaR, realised return and violation of a completed job."""
+    job = _backtest_job_get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Backtest job {job_id} not found")
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Backtest job {job_id} is {job['status']}")
+    return [BacktestDay(**row) for row in _backtest_job_days(job_id)]
+
+
+@router.post("/backtest/compare", response_model=BacktestCompareResponse)
+def compare_backtests(body: BacktestCompareRequestBody) -> BacktestCompareResponse:
+    """Backtest several models over the same data and windows in one pass.
+
+    Returns are loaded once; ``run_comparative_backtest`` evaluates every
+    model on each rolling window and ranks the models by mean quantile loss
+    over the days all of them predicted. Synchronous, like POST /backtest.
+    """
+    specs = [m.to_spec() for m in body.models]
+    logger.info(
+        "Comparative backtest request: models=%s  symbols=%s  lookback=%d  test=%d",
+        [sp.describe() for sp in specs], body.symbols, body.lookback_days, body.test_days,
+    )
+    try:
+        bt_returns, bt_weights, bt_symbols, dates = _load_backtest_returns(
+            body.symbols, body.weights, body.lookback_days, body.test_days,
+            joint=any(sp.model_type == "montecarlo" for sp in specs),
+        )
+        comparison = run_comparative_backtest(
+            bt_returns,
+            specs,
+            alpha=body.alpha,
+            lookback_days=body.lookback_days,
+            test_days=body.test_days,
+            horizon_days=body.horizon_days,
+            weights=bt_weights,
+            symbols=bt_symbols,
+            n_workers=get_settings().backtest_workers,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Comparative backtest failed: %s", exc)
+        raise HTTPException(status_code=500, detail=f"Comparative backtest failed: {exc}") from exc
+
+    window_dates = dates[-(body.lookback_days + body.test_days):]
+    common = set(comparison.common_days)
+    models = []
+    for rank, label in enumerate(comparison.ranking(), start=1):
+        r, sc = comparison.results[label], comparison.scores[label]
+        models.append(BacktestModelComparison(
+            label=label,
+            model_type=r.model_type,
+            rank=rank,
+            status=r.status,
+            violations=r.violations,
+            total_obs=r.total_obs,
+            violation_rate=r.violation_rate,
+            kupiec_pvalue=r.kupiec.p_value if r.kupiec else float("nan"),
+            christoffersen_pvalue_cc=r.christoffersen.p_value_cc if r.christoffersen else float("nan"),
+            quantile_loss=sc.quantile_loss,
+            lopez_loss=sc.lopez_loss,
+            refit_days=len(r.refit_days),
+        ))
+    return BacktestCompareResponse(
+        alpha=body.alpha,
+        lookback_days=body.lookback_days,
+        test_days=body.test_days,
+        common_days=len(comparison.common_days),
+        models=models,
+        dates=[str(window_dates[t]) for t in comparison.common_days],
+        hits={
+            label: [d.violation for d in r.day_results if d.t in common]
+            for label, r in comparison.results.items()
+        },
+        var={
+            label: [d.var_predicted for d in r.day_results if d.t in common]
+            for label, r in comparison.results.items()
+        },
+    )
+
+
+@router.post("/backtest/jobs/{job_id}/cancel", response_model=BacktestJobResponse)
+async def cancel_backtest_job(job_id: str) -> BacktestJobResponse:
+    """Cancel a queued job at once, or a running one at its next progress update."""
+    if _backtest_job_request_cancel(job_id) is None:
+        job = _backtest_job_get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Backtest job {job_id} not found")
+        raise HTTPException(status_code=409, detail=f"Backtest job {job_id} is already {job['status']}")
+    return _backtest_job_response(_backtest_job_get(job_id))
 
 
 # ---------------------------------------------------------------------------
@@ -5,34 +5,92 @@ Public API
 Rolling window out-of-sample backtest:
     run_rolling_backtest(returns, model_type, alpha, lookback_days, test_days)
     → RollingBacktestResult
+    (a progress_callback may raise BacktestCancelled to abort it)
+
+Comparative backtest of several models over the same windows:
+    run_comparative_backtest(returns, [ModelSpec, ...], alpha, lookback_days, test_days)
+    → ComparativeBacktestResult (per-model results + loss scores + ranking)
+
+Incremental backtest over the persisted per-day ledger:
+    run_incremental_backtest(engine, returns, dates, symbols, weights, model_type, ...)
+    → (RollingBacktestResult, days predicted)
 
 Statistical tests:
     kupiec_test(violations, total_obs, alpha)       → KupiecResult
     christoffersen_test(hit_sequence, alpha)         → ChristoffersenResult
+    kupiec_test_batch(violations, total_obs, alpha)  → structured array (K,)
+    christoffersen_test_batch(hits (K × T), alpha)   → structured array (K,)
+    christoffersen_results_from_batch(batch, alpha)  → list[ChristoffersenResult]
+
+Loss functions (model ranking):
+    loss_scores(var, realised, alpha)                → LossScores
 
 Report & MLflow logging:
     build_report(result, symbols)                    → BacktestReport
     log_backtest_to_mlflow(report, result, symbol)   → run_id (str)
     plot_backtest(result, symbol)                    → bytes (PNG)
+    backtest_plot_summary(result, symbol)            → dict (downsampled, JSON)
+    render_backtest(summary)                         → bytes (PNG)
 """
-from .christoffersen import ChristoffersenResult, christoffersen_test
-from .kupiec import KupiecResult, kupiec_test
-from .report import BacktestReport, build_report, log_backtest_to_mlflow, plot_backtest
-from .rolling_backtest import DayResult, RollingBacktestResult, run_rolling_backtest
+from .christoffersen import (
+    ChristoffersenResult,
+    christoffersen_results_from_batch,
+    christoffersen_test,
+    christoffersen_test_batch,
+)
+from .kupiec import KupiecResult, kupiec_test, kupiec_test_batch
+from .ledger import ledger_key, ledger_spec, run_incremental_backtest
+from .report import (
+    BacktestReport,
+    backtest_plot_summary,
+    build_report,
+    log_backtest_to_mlflow,
+    plot_backtest,
+    render_backtest,
+)
+from .loss import LossScores, loss_scores, lopez_loss, quantile_loss
+from .rolling_backtest import (
+    BacktestCancelled,
+    ComparativeBacktestResult,
+    DayResult,
+    ModelSpec,
+    RollingBacktestResult,
+    run_comparative_backtest,
+    run_rolling_backtest,
+)
 
 __all__ = [
     # Rolling engine
     "run_rolling_backtest",
     "RollingBacktestResult",
     "DayResult",
+    "BacktestCancelled",
+    # Comparative backtest
+    "run_comparative_backtest",
+    "ModelSpec",
+    "ComparativeBacktestResult",
+    # Incremental ledger
+    "run_incremental_backtest",
+    "ledger_spec",
+    "ledger_key",
     # Statistical tests
     "kupiec_test",
+    "kupiec_test_batch",
     "KupiecResult",
     "christoffersen_test",
+    "christoffersen_test_batch",
+    "christoffersen_results_from_batch",
     "ChristoffersenResult",
+    # Loss functions
+    "loss_scores",
+    "LossScores",
+    "quantile_loss",
+    "lopez_loss",
     # Report
     "BacktestReport",
     "build_report",
     "log_backtest_to_mlflow",
     "plot_backtest",
+    "backtest_plot_summary",
+    "render_backtest",
 ]
@@ -25,6 +25,10 @@ Transition matrix notation:
 
 LR_ind = -2 * ln[ (1-π)^(n_00+n_10) * π^(n_01+n_11)
                   / (1-π_01)^n_00 * π_01^n_01 * (1-π_11)^n_10 * π_11^n_11 ]
+
+``christoffersen_test_batch`` runs the test for a (K × T) hit matrix — K
+portfolios, models or confidence levels — as array operations and returns a
+structured array instead of K ChristoffersenResult objects.
 """
 from __future__ import annotations
 
@@ -34,9 +38,9 @@ from dataclasses import dataclass
 from typing import Sequence
 
 import numpy as np
-from scipy import stats
+from scipy import special, stats
 
-from .kupiec import KupiecResult, kupiec_test
+from .kupiec import KupiecResult, kupiec_test, kupiec_test_batch
 
 logger = logging.getLogger(__name__)
 
@@ -182,3 +186,156 @@ def christoffersen_test(
         reject_h0=p_value_cc < significance,
         kupiec=kupiec,
     )
+
+
+# ---------------------------------------------------------------------------
+# Batch test
+# ---------------------------------------------------------------------------
+
+CHRISTOFFERSEN_BATCH_DTYPE = np.dtype([
+    ("total_obs", np.int64),
+    ("violations", np.int64),
+    ("n_00", np.int64),
+    ("n_01", np.int64),
+    ("n_10", np.int64),
+    ("n_11", np.int64),
+    ("pi_01", np.float64),
+    ("pi_11", np.float64),
+    ("pi_hat", np.float64),
+    ("lr_uc", np.float64),
+    ("p_value_uc", np.float64),
+    ("lr_ind", np.float64),
+    ("p_value_ind", np.float64),
+    ("lr_cc", np.float64),
+    ("p_value_cc", np.float64),
+    ("reject_h0", np.bool_),
+])
+
+
+def christoffersen_test_batch(
+    hits: np.ndarray,
+    alpha: np.ndarray | float,
+    significance: float = 0.05,
+    lengths: np.ndarray | None = None,
+) -> np.ndarray:
+    """Christoffersen test of K hit sequences at once.
+
+    Transition counts are column sums over the (K × T) matrix and the LR
+    statistics and χ² p-values are array expressions, so K sequences cost a
+    few passes over the matrix instead of K calls.
+
+    Args:
+        hits:         (K × T) 0/1 matrix, one hit sequence per row (K
+                      portfolios, models or confidence levels).
+        alpha:        VaR confidence level, scalar or (K,).
+        significance: Significance level for H0 rejection.
+        lengths:      (K,) valid length of each row, for sequences of
+                      different lengths padded at the end; all T if None.
+
+    Returns:
+        (K,) structured array of CHRISTOFFERSEN_BATCH_DTYPE — the fields of
+        ChristoffersenResult, with the embedded Kupiec result flattened into
+        total_obs / violations / lr_uc / p_value_uc.
+
+    Raises:
+        ValueError: For a sequence shorter than 2 or alpha outside (0, 1).
+    """
+    hits = np.atleast_2d(np.asarray(hits, dtype=np.int64))
+    K, T = hits.shape
+    lengths = np.full(K, T, dtype=np.int64) if lengths is None else np.asarray(lengths, dtype=np.int64)
+    if lengths.shape != (K,) or np.any(lengths > T):
+        raise ValueError(f"lengths must be {K} values <= {T}")
+    if np.any(lengths < 2):
+        raise ValueError("Need at least 2 observations per sequence for the Christoffersen test")
+    alpha = np.broadcast_to(np.asarray(alpha, dtype=float), (K,))
+    if np.any((alpha <= 0.0) | (alpha >= 1.0)):
+        raise ValueError("alpha must be in (0, 1)")
+
+    if np.any(lengths < T):
+        hits = hits * (np.arange(T) < lengths[:, None])
+    violations = hits.sum(axis=1)
+
+    # --- Transition counts over the lengths - 1 valid pairs of each row ---
+    # prev is masked too, so a hit on a row's last valid day does not count
+    # as a 1→0 transition into the padding; pairs beyond it are all-zero → n_00
+    prev, curr = hits[:, :-1], hits[:, 1:]
+    if np.any(lengths < T):
+        prev = prev * (np.arange(T - 1) < (lengths - 1)[:, None])
+    n_11 = (prev * curr).sum(axis=1)
+    n_01 = curr.sum(axis=1) - n_11
+    n_10 = prev.sum(axis=1) - n_11
+    n_00 = (lengths - 1) - n_01 - n_10 - n_11
+
+    # --- Transition probabilities ---
+    row0_total = n_00 + n_01
+    row1_total = n_10 + n_11
+    pi_01 = np.divide(n_01, row0_total, out=np.zeros(K), where=row0_total > 0)
+    pi_11 = np.divide(n_11, row1_total, out=np.zeros(K), where=row1_total > 0)
+    pi_hat = (n_01 + n_11) / (lengths - 1)
+
+    # --- LR_ind (xlogy: 0·ln(0) = 0, as _safe_log above) ---
+    ll_ind_h0 = special.xlogy(n_00 + n_10, 1.0 - pi_hat) + special.xlogy(n_01 + n_11, pi_hat)
+    ll_ind_h1 = (
+        special.xlogy(n_00, 1.0 - pi_01) + special.xlogy(n_01, pi_01)
+        + special.xlogy(n_10, 1.0 - pi_11) + special.xlogy(n_11, pi_11)
+    )
+    lr_ind = np.maximum(-2.0 * (ll_ind_h0 - ll_ind_h1), 0.0)
+
+    # --- Kupiec UC component and LR_cc = LR_uc + LR_ind ---
+    uc = kupiec_test_batch(violations, lengths, alpha, significance)
+    lr_uc = uc["lr_statistic"]
+    lr_cc = np.maximum(lr_uc + lr_ind, 0.0)
+    p_value_cc = stats.chi2.sf(lr_cc, df=2)
+
+    out = np.empty(K, dtype=CHRISTOFFERSEN_BATCH_DTYPE)
+    out["total_obs"] = lengths
+    out["violations"] = violations
+    out["n_00"], out["n_01"], out["n_10"], out["n_11"] = n_00, n_01, n_10, n_11
+    out["pi_01"], out["pi_11"], out["pi_hat"] = pi_01, pi_11, pi_hat
+    out["lr_uc"] = lr_uc
+    out["p_value_uc"] = uc["p_value"]
+    out["lr_ind"] = lr_ind
+    out["p_value_ind"] = stats.chi2.sf(lr_ind, df=1)
+    out["lr_cc"] = lr_cc
+    out["p_value_cc"] = p_value_cc
+    out["reject_h0"] = p_value_cc < significance
+    logger.debug("Christoffersen CC batch: %d tests, %d rejected", K, int(out["reject_h0"].sum()))
+    return out
+
+
+def christoffersen_results_from_batch(
+    batch: np.ndarray,
+    alpha: np.ndarray | float,
+    significance: float = 0.05,
+) -> list[ChristoffersenResult]:
+    """ChristoffersenResult (with its KupiecResult) of every row of a
+    ``christoffersen_test_batch`` output, for callers that need the dataclasses."""
+    alpha = np.broadcast_to(np.asarray(alpha, dtype=float), batch.shape)
+    out = []
+    for row, a in zip(batch, alpha):
+        total_obs, violations = int(row["total_obs"]), int(row["violations"])
+        kupiec = KupiecResult(
+            violations=violations,
+            total_obs=total_obs,
+            violation_rate=violations / total_obs,
+            expected_rate=1.0 - float(a),
+            lr_statistic=float(row["lr_uc"]),
+            p_value=float(row["p_value_uc"]),
+            reject_h0=float(row["p_value_uc"]) < significance,
+        )
+        out.append(ChristoffersenResult(
+            n_00=int(row["n_00"]),
+            n_01=int(row["n_01"]),
+            n_10=int(row["n_10"]),
+            n_11=int(row["n_11"]),
+            pi_01=float(row["pi_01"]),
+            pi_11=float(row["pi_11"]),
+            pi_hat=float(row["pi_hat"]),
+            lr_ind=float(row["lr_ind"]),
+            p_value_ind=float(row["p_value_ind"]),
+            lr_cc=float(row["lr_cc"]),
+            p_value_cc=float(row["p_value_cc"]),
+            reject_h0=bool(row["reject_h0"]),
+            kupiec=kupiec,
+        ))
+    return out
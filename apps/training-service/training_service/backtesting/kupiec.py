@@ -19,6 +19,9 @@ where:
     x     = number of VaR violations (exceedances)
     p0    = expected violation rate = 1 - alpha
     p_hat = observed violation rate = x / T
+
+``kupiec_test_batch`` runs the test for K (violations, T) pairs — portfolios,
+models or confidence levels — as array operations.
 """
 from __future__ import annotations
 
@@ -26,7 +29,8 @@ import logging
 import math
 from dataclasses import dataclass
 
-from scipy import stats
+import numpy as np
+from scipy import special, stats
 
 logger = logging.getLogger(__name__)
 
@@ -141,3 +145,69 @@ def kupiec_test(
         p_value=p_value,
         reject_h0=p_value < significance,
     )
+
+
+# ---------------------------------------------------------------------------
+# Batch test
+# ---------------------------------------------------------------------------
+
+KUPIEC_BATCH_DTYPE = np.dtype([
+    ("violations", np.int64),
+    ("total_obs", np.int64),
+    ("violation_rate", np.float64),
+    ("expected_rate", np.float64),
+    ("lr_statistic", np.float64),
+    ("p_value", np.float64),
+    ("reject_h0", np.bool_),
+])
+
+
+def kupiec_lr(violations: np.ndarray, total_obs: np.ndarray, p0: np.ndarray) -> np.ndarray:
+    """LR_uc for arrays of counts; 0·ln(0) = 0 covers the no / all violations cases."""
+    x = np.asarray(violations, dtype=float)
+    T = np.asarray(total_obs, dtype=float)
+    p_hat = x / T
+    ll_h0 = special.xlogy(T - x, 1.0 - p0) + special.xlogy(x, p0)
+    ll_h1 = special.xlogy(T - x, 1.0 - p_hat) + special.xlogy(x, p_hat)
+    return np.maximum(-2.0 * (ll_h0 - ll_h1), 0.0)
+
+
+def kupiec_test_batch(
+    violations: np.ndarray,
+    total_obs: np.ndarray,
+    alpha: np.ndarray | float,
+    significance: float = 0.05,
+) -> np.ndarray:
+    """Kupiec test of K (violations, total_obs) pairs at once.
+
+    Arguments broadcast against each other (e.g. one total_obs for every
+    portfolio, or one alpha per row). Same statistics as ``kupiec_test``,
+    without per-row logging.
+
+    Returns:
+        (K,) structured array of KUPIEC_BATCH_DTYPE (fields as KupiecResult).
+    """
+    violations, total_obs, alpha = np.broadcast_arrays(
+        np.asarray(violations, dtype=np.int64),
+        np.asarray(total_obs, dtype=np.int64),
+        np.asarray(alpha, dtype=float),
+    )
+    if np.any(total_obs <= 0):
+        raise ValueError("total_obs must be > 0")
+    if np.any((alpha <= 0.0) | (alpha >= 1.0)):
+        raise ValueError("alpha must be in (0, 1)")
+
+    p0 = 1.0 - alpha
+    lr = kupiec_lr(violations, total_obs, p0)
+    p_value = stats.chi2.sf(lr, df=1)
+
+    out = np.empty(violations.shape, dtype=KUPIEC_BATCH_DTYPE)
+    out["violations"] = violations
+    out["total_obs"] = total_obs
+    out["violation_rate"] = violations / total_obs
+    out["expected_rate"] = p0
+    out["lr_statistic"] = lr
+    out["p_value"] = p_value
+    out["reject_h0"] = p_value < significance
+    logger.debug("Kupiec UC batch: %d tests, %d rejected", out.size, int(out["reject_h0"].sum()))
+    return out
@@ -0,0 +1,381 @@
+"""Incremental rolling backtests over a persisted per-day ledger.
+
+A rolling backtest repeated daily re-predicts every day of its window,
+although only the newest day has inputs it has not seen before: the
+prediction for a date depends on the specification and on the returns of its
+training window (and, for arch GARCH, on where the optimiser started — see
+below). ``run_incremental_backtest`` therefore keeps each scored day in
+Postgres (``backtest_ledger``, migration 010) under
+
+    spec_key = sha256(canonical JSON of the specification)
+
+where the specification holds everything the prediction depends on — model
+type and parameters (GARCH spec, refit interval and engine; MC paths,
+sampler, seed and joint vs portfolio simulation), symbols, weights, alpha,
+lookback and horizon. A run looks up the dates of its window, predicts only
+the missing ones (normally the latest day) with ``rolling_predictions``,
+stores them, and reruns Kupiec / Christoffersen over the merged hit
+sequence — about one model fit per day instead of ``test_days``.
+
+Every ledger row also carries ``input_hash``, a digest of the returns the day
+was computed from (training window and realised return). Days whose inputs
+have changed since — a revised price, a different asset alignment — no
+longer match and are recomputed. Days whose prediction failed (NaN) are not
+stored and are retried on the next run.
+
+GARCH with ``refit_every = k > 1`` re-estimates every k-th day and filters the
+variance in between. To keep that schedule, a run of missing days that
+starts less than k days after the last stored refit is recomputed from that
+refit day on. Missing days are otherwise predicted by a fresh
+``rolling_predictions`` over just those days, so their first GARCH fit starts
+cold instead of warm-started from the previous day.
+
+Reuse is therefore exact for historical simulation and Monte Carlo (fixed
+seed), but not for arch GARCH: a warm-started fit depends on the path of
+fits before it, so a stored day can differ from what a full rerun would
+predict today. Both fits reach the same likelihood up to the optimiser's
+tolerance (``garch.WarmStartGarch`` re-checks fits that end on a parameter
+bound), yet where the likelihood is flat the VaR can differ by a few
+percent on isolated days. A ledger-backed GARCH backtest is reproducible
+from the ledger, not bit-for-bit from a fresh ``run_rolling_backtest``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from datetime import date
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Engine, text
+
+from ..models.garch import GARCHParams
+from .rolling_backtest import (
+    DayResult,
+    ModelType,
+    ProgressCallback,
+    RollingBacktestResult,
+    rolling_predictions,
+    summarise_backtest,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every stored day after a change to how predictions are computed
+LEDGER_VERSION = 1
+# Seed of the per-day Monte Carlo simulations in run_rolling_backtest
+_MC_SEED = 42
+
+
+# ---------------------------------------------------------------------------
+# Specification key
+# ---------------------------------------------------------------------------
+
+def ledger_spec(
+    model_type: str,
+    symbols: Sequence[str],
+    weights: Optional[dict[str, float]],
+    alpha: float,
+    lookback_days: int,
+    horizon_days: int = 1,
+    n_simulations: int = 1_000,
+    mc_sampler: str = "pseudo",
+    refit_every: int = 1,
+    garch_engine: str = "arch",
+    garch_params: Optional[GARCHParams] = None,
+    joint: bool = False,
+) -> dict[str, Any]:
+    """Canonical description of a backtest; equal specs predict equal VaR series.
+
+    Parameters that do not affect *model_type* are left out, so e.g. a
+    historical backtest has the same spec whatever ``n_simulations`` is.
+    """
+    symbols = sorted(symbols)
+    if weights is None:
+        weight_spec: Any = "equal"
+    else:
+        w = np.array([weights.get(s, 0.0) for s in symbols], dtype=float)
+        if w.sum() <= 0:
+            raise ValueError("Sum of weights must be > 0")
+        weight_spec = dict(zip(symbols, (w / w.sum()).tolist()))
+    spec: dict[str, Any] = {
+        "version": LEDGER_VERSION,
+        "model_type": model_type,
+        "symbols": symbols,
+        "weights": weight_spec,
+        "alpha": alpha,
+        "lookback_days": lookback_days,
+        "horizon_days": horizon_days,
+    }
+    if model_type == "garch":
+        spec["garch"] = asdict(garch_params or GARCHParams(p=1, q=1, dist="normal", mean="Zero"))
+        spec["refit_every"] = refit_every
+        spec["garch_engine"] = garch_engine
+    elif model_type == "montecarlo":
+        spec["n_simulations"] = n_simulations
+        spec["mc_sampler"] = mc_sampler
+        spec["seed"] = _MC_SEED
+        spec["joint"] = joint
+    return spec
+
+
+def ledger_key(spec: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _input_hashes(window: np.ndarray, lookback_days: int, test_days: int) -> list[str]:
+    """Digest of rows [i, i + lookback_days] (training window + realised return) per test day."""
+    return [
+        hashlib.blake2b(
+            np.ascontiguousarray(window[i : i + lookback_days + 1]).tobytes(), digest_size=16,
+        ).hexdigest()
+        for i in range(test_days)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Postgres
+# ---------------------------------------------------------------------------
+
+def _load_days(engine: Engine, key: str, first: date, last: date) -> dict[date, dict[str, Any]]:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT price_date, input_hash, var_predicted, realised_return, violation, refit
+                FROM backtest_ledger
+                WHERE spec_key = :key AND price_date BETWEEN :first AND :last
+                """
+            ),
+            {"key": key, "first": first, "last": last},
+        ).fetchall()
+    return {
+        r[0]: {
+            "input_hash": r[1],
+            "var_predicted": float(r[2]),
+            "realised_return": float(r[3]),
+            "violation": int(r[4]),
+            "refit": bool(r[5]),
+        }
+        for r in rows
+    }
+
+
+def _store_days(engine: Engine, key: str, spec: dict[str, Any], rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO backtest_ledger_specs (spec_key, spec)
+                VALUES (:key, cast(:spec as jsonb))
+                ON CONFLICT (spec_key) DO NOTHING
+                """
+            ),
+            {"key": key, "spec": json.dumps(spec, sort_keys=True)},
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO backtest_ledger
+                    (spec_key, price_date, input_hash, var_predicted, realised_return,
+                     violation, refit, computed_at)
+                VALUES
+                    (:key, :price_date, :input_hash, :var_predicted, :realised_return,
+                     :violation, :refit, NOW())
+                ON CONFLICT (spec_key, price_date) DO UPDATE SET
+                    input_hash = EXCLUDED.input_hash,
+                    var_predicted = EXCLUDED.var_predicted,
+                    realised_return = EXCLUDED.realised_return,
+                    violation = EXCLUDED.violation,
+                    refit = EXCLUDED.refit,
+                    computed_at = NOW()
+                """
+            ),
+            [{"key": key, **r} for r in rows],
+        )
+
+
+# ---------------------------------------------------------------------------
+# Incremental backtest
+# ---------------------------------------------------------------------------
+
+def _missing_runs(missing: list[int]) -> list[tuple[int, int]]:
+    """Contiguous [start, stop) runs of the sorted positions in *missing*."""
+    runs: list[tuple[int, int]] = []
+    for i in missing:
+        if runs and runs[-1][1] == i:
+            runs[-1] = (runs[-1][0], i + 1)
+        else:
+            runs.append((i, i + 1))
+    return runs
+
+
+def run_incremental_backtest(
+    engine: Engine,
+    returns: np.ndarray,
+    dates: Sequence[date],
+    symbols: list[str],
+    weights: Optional[dict[str, float]],
+    model_type: ModelType,
+    alpha: float = 0.99,
+    lookback_days: int = 252,
+    test_days: int = 60,
+    horizon_days: int = 1,
+    n_simulations: int = 1_000,
+    significance: float = 0.05,
+    mc_sampler: str = "pseudo",
+    refit_every: int = 1,
+    garch_engine: str = "arch",
+    garch_params: Optional[GARCHParams] = None,
+    n_workers: int = 1,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> tuple[RollingBacktestResult, int]:
+    """``run_rolling_backtest`` that reuses the days already in the ledger.
+
+    Args:
+        engine:  SQLAlchemy engine of the database holding ``backtest_ledger``.
+        returns: 1-D portfolio returns, or a (T × N) asset matrix whose
+                 columns are *symbols* (multi-asset Monte Carlo).
+        dates:   Date of every row of *returns*.
+        symbols, weights: The portfolio (weights over *symbols*, equal if
+                 None); part of the ledger key.
+        Other arguments as for ``run_rolling_backtest``;
+        *progress_callback* gets (days done, test_days), where days
+        taken from the ledger count as done from the start.
+
+    Returns:
+        (result over the whole window, number of days predicted by this call).
+
+    Raises:
+        ValueError: As ``run_rolling_backtest``, or if *dates* does not match
+                    *returns*.
+    """
+    returns = np.asarray(returns, dtype=float)
+    if len(dates) != len(returns):
+        raise ValueError(f"{len(dates)} dates for {len(returns)} returns")
+    n_window = lookback_days + test_days
+    if len(returns) < n_window:
+        raise ValueError(
+            f"Insufficient data: need {n_window} observations "
+            f"(lookback={lookback_days} + test={test_days}), got {len(returns)}."
+        )
+
+    joint = returns.ndim == 2
+    asset_weights: Optional[np.ndarray] = None
+    if joint:
+        asset_weights = (
+            np.ones(len(symbols)) if weights is None
+            else np.array([weights.get(s, 0.0) for s in symbols], dtype=float)
+        )
+    spec = ledger_spec(
+        model_type, symbols, weights, alpha, lookback_days, horizon_days,
+        n_simulations, mc_sampler, refit_every, garch_engine, garch_params, joint,
+    )
+    key = ledger_key(spec)
+
+    window = returns[-n_window:]
+    day_dates = list(dates[-test_days:])
+    hashes = _input_hashes(window, lookback_days, test_days)
+    stored = _load_days(engine, key, day_dates[0], day_dates[-1])
+
+    # Stored days whose inputs are unchanged; everything else is (re)predicted
+    cached = {
+        i: stored[d] for i, d in enumerate(day_dates)
+        if d in stored and stored[d]["input_hash"] == hashes[i]
+    }
+    runs = _missing_runs([i for i in range(test_days) if i not in cached])
+    if model_type == "garch" and refit_every > 1:
+        refits = [i for i, row in cached.items() if row["refit"]]
+        for r, (start, stop) in enumerate(runs):
+            last_refit = max((i for i in refits if i < start), default=None)
+            if last_refit is not None and start - last_refit < refit_every:
+                runs[r] = (last_refit, stop)
+        # Widened runs may now overlap or touch
+        runs = _missing_runs(sorted({i for start, stop in runs for i in range(start, stop)}))
+
+    n_missing = sum(stop - start for start, stop in runs)
+    logger.info(
+        "Incremental backtest %s (%s): %d/%d days in the ledger, predicting %d in %d run(s)",
+        key[:12], model_type, test_days - n_missing, test_days, n_missing, len(runs),
+    )
+
+    computed: dict[int, DayResult] = {}
+    computed_refits: set[int] = set()
+    # Progress is reported on the test_days scale, ledger days counting as done
+    done_before = test_days - n_missing
+    for start, stop in runs:
+        on_progress = None
+        if progress_callback is not None:
+            def on_progress(done: int, total: int, _offset: int = done_before) -> None:
+                progress_callback(_offset + done, test_days)
+
+        # The last lookback_days + (stop - start) rows of this prefix are exactly
+        # the windows of days [start, stop); their t is shifted by start
+        part_days, part_refit_days = rolling_predictions(
+            window[: lookback_days + stop],
+            model_type=model_type,
+            alpha=alpha,
+            lookback_days=lookback_days,
+            test_days=stop - start,
+            horizon_days=horizon_days,
+            n_simulations=n_simulations,
+            mc_sampler=mc_sampler,
+            weights=asset_weights,
+            symbols=symbols if joint else None,
+            refit_every=refit_every,
+            garch_engine=garch_engine,
+            garch_params=garch_params,
+            n_workers=n_workers,
+            progress_callback=on_progress,
+        )
+        part_refits = {t + start for t in part_refit_days}
+        rows = []
+        for d in part_days:
+            t = d.t + start
+            computed[t] = DayResult(t=t, var_predicted=d.var_predicted,
+                                    realised_return=d.realised_return, violation=d.violation)
+            i = t - lookback_days
+            rows.append({
+                "price_date": day_dates[i],
+                "input_hash": hashes[i],
+                "var_predicted": d.var_predicted,
+                "realised_return": d.realised_return,
+                "violation": bool(d.violation),
+                "refit": t in part_refits,
+            })
+        computed_refits |= part_refits
+        # Stored per run, so a cancelled backtest keeps the runs it finished
+        _store_days(engine, key, spec, rows)
+        done_before += stop - start
+
+    recomputed = {i for start, stop in runs for i in range(start, stop)}
+    day_results: list[DayResult] = []
+    refit_days: list[int] = []
+    for i in range(test_days):
+        t = lookback_days + i
+        if i in recomputed:
+            if t in computed:
+                day_results.append(computed[t])
+            if t in computed_refits:
+                refit_days.append(t)
+        elif i in cached:
+            row = cached[i]
+            day_results.append(DayResult(
+                t=t,
+                var_predicted=row["var_predicted"],
+                realised_return=row["realised_return"],
+                violation=row["violation"],
+            ))
+            if row["refit"]:
+                refit_days.append(t)
+
+    result = summarise_backtest(
+        day_results, model_type, alpha, lookback_days, test_days,
+        significance=significance, refit_every=refit_every,
+        refit_days=refit_days if model_type == "garch" else [],
+    )
+    return result, n_missing
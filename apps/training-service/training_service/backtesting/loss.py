@@ -0,0 +1,71 @@
+"""Loss functions for ranking VaR forecasts.
+
+Coverage tests (Kupiec, Christoffersen) say whether a model is acceptable;
+they do not say which of two acceptable models is better. Loss functions do:
+averaged over the same out-of-sample days, the model with the lower loss is
+preferred.
+
+Quantile (tick) loss — the consistent scoring function for a quantile:
+
+    L_t = (τ − 1{r_t < q_t}) · (r_t − q_t),   q_t = −VaR_t,  τ = 1 − α
+
+It rewards calibration and sharpness at once: a VaR that is too high is
+penalised on every quiet day, one that is too low on every violation.
+
+Reference:
+    Gneiting, T. (2011). "Making and Evaluating Point Forecasts."
+    Journal of the American Statistical Association, 106(494), 746–762.
+
+Lopez magnitude loss — counts violations and their size, ignores quiet days:
+
+    L_t = 1 + (r_t + VaR_t)²  if r_t < −VaR_t  else 0
+
+Reference:
+    Lopez, J. A. (1999). "Methods for Evaluating Value-at-Risk Estimates."
+    Federal Reserve Bank of San Francisco Economic Review, 2, 3–17.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class LossScores:
+    """Average losses of one VaR series over a set of days."""
+    n_obs: int
+    violations: int
+    quantile_loss: float    # mean tick loss (lower is better)
+    lopez_loss: float       # mean Lopez magnitude loss (lower is better)
+
+
+def quantile_loss(var: np.ndarray, realised: np.ndarray, alpha: float) -> np.ndarray:
+    """Per-day tick loss of the (1 − α) quantile forecast −VaR."""
+    var = np.asarray(var, dtype=float)
+    realised = np.asarray(realised, dtype=float)
+    q = -var
+    hit = realised < q
+    return ((1.0 - alpha) - hit) * (realised - q)
+
+
+def lopez_loss(var: np.ndarray, realised: np.ndarray) -> np.ndarray:
+    """Per-day Lopez magnitude loss."""
+    var = np.asarray(var, dtype=float)
+    realised = np.asarray(realised, dtype=float)
+    hit = realised < -var
+    return np.where(hit, 1.0 + (realised + var) ** 2, 0.0)
+
+
+def loss_scores(var: np.ndarray, realised: np.ndarray, alpha: float) -> LossScores:
+    """Mean quantile and Lopez losses; NaN for an empty series."""
+    var = np.asarray(var, dtype=float)
+    realised = np.asarray(realised, dtype=float)
+    if len(var) == 0:
+        return LossScores(n_obs=0, violations=0, quantile_loss=float("nan"), lopez_loss=float("nan"))
+    return LossScores(
+        n_obs=len(var),
+        violations=int(np.sum(realised < -var)),
+        quantile_loss=float(np.mean(quantile_loss(var, realised, alpha))),
+        lopez_loss=float(np.mean(lopez_loss(var, realised))),
+    )
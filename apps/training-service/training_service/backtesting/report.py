@@ -16,14 +16,17 @@ Diagnostic plot
 A two-panel PNG is generated:
   Left  — realised returns vs. predicted -VaR (violations highlighted in red)
   Right — violation hit sequence as a stem plot (clustering visible at a glance)
+
+It is rendered from ``backtest_plot_summary`` (downsampled lines, every
+violation); with a deferred / on-demand plot mode only the summary is logged
+and ``pipelines.plots`` renders the PNG later.
 """
 from __future__ import annotations
 
-import io
 import logging
 import os
 import tempfile
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -32,6 +35,7 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 
+from ..plotting import downsample_series, fig_to_png, log_plot_artifact, summary_floats
 from .rolling_backtest import RollingBacktestResult
 
 logger = logging.getLogger(__name__)
@@ -82,6 +86,10 @@ class BacktestReport:
     # Decision
     status: str   # OK | WARN | CRIT
 
+    # Refit schedule (GARCH): interval and out-of-sample day offsets of refits
+    refit_every: int = 1
+    refit_days: list[int] = field(default_factory=list)
+
     # Optional MLflow run linkage
     mlflow_run_id: Optional[str] = None
 
@@ -104,6 +112,7 @@ class BacktestReport:
             "christoffersen_pvalue_cc": self.christoffersen_pvalue_cc,
             "backtest_pi_01": self.pi_01,
             "backtest_pi_11": self.pi_11,
+            "backtest_n_refits": float(len(self.refit_days)),
         }
 
 
@@ -169,6 +178,8 @@ def build_report(
         pi_01=pi_01,
         pi_11=pi_11,
         status=result.status,
+        refit_every=result.refit_every,
+        refit_days=[t - result.lookback_days for t in result.refit_days],
         mlflow_run_id=mlflow_run_id,
     )
 
@@ -177,58 +188,70 @@ def build_report(
 # Diagnostic plot
 # ---------------------------------------------------------------------------
 
-def plot_backtest(
-    result: RollingBacktestResult,
-    symbol: str = "portfolio",
-) -> bytes:
-    """Generate a two-panel diagnostic PNG and return the bytes.
-
-    Panel 1 (left): Realised returns vs. predicted -VaR threshold.
-                    Violations are highlighted as red dots.
-    Panel 2 (right): Hit sequence stem plot — shows clustering of violations.
-
-    Args:
-        result: Output of run_rolling_backtest().
-        symbol: Label for the plot title.
+def backtest_plot_summary(result: RollingBacktestResult, symbol: str = "portfolio") -> dict:
+    """Downsampled data behind ``plot_backtest`` (JSON-serialisable).
 
-    Returns:
-        PNG image as bytes (suitable for mlflow.log_artifact).
+    The return and −VaR lines are min/max-decimated; every violation is kept
+    (it is both a scatter point and a stem).
     """
     days = result.day_results
-    if not days:
-        # Return a minimal blank PNG if no data
+    returns_arr = np.array([d.realised_return for d in days], dtype=float)
+    var_arr = np.array([d.var_predicted for d in days], dtype=float)
+    hits = np.array([d.violation for d in days], dtype=int)
+    viol_idx = np.flatnonzero(hits == 1)
+    ret_x, ret_y = downsample_series(returns_arr)
+    var_x, var_y = downsample_series(-var_arr)
+
+    kupiec, cc = result.kupiec, result.christoffersen
+    return {
+        "kind": "backtest",
+        "symbol": symbol,
+        "model_type": result.model_type,
+        "alpha": result.alpha,
+        "violations": result.violations,
+        "total_obs": result.total_obs,
+        "status": result.status,
+        "n_days": len(days),
+        "returns": {"x": ret_x, "y": ret_y},
+        "neg_var": {"x": var_x, "y": var_y},
+        "violation_days": viol_idx.tolist(),
+        "violation_returns": summary_floats(returns_arr[viol_idx]),
+        "tests": {
+            "kupiec_p": kupiec.p_value,
+            "cc_p": cc.p_value_cc,
+            "pi_01": cc.pi_01,
+            "pi_11": cc.pi_11,
+        } if kupiec and cc else None,
+    }
+
+
+def render_backtest(summary: dict) -> bytes:
+    """Render a ``backtest_plot_summary`` as the two-panel diagnostic PNG."""
+    if summary["n_days"] == 0:
+        # Minimal blank PNG if no data
         fig, ax = plt.subplots(figsize=(8, 4))
         ax.text(0.5, 0.5, "No backtest data", ha="center", va="center")
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=100)
-        plt.close(fig)
-        buf.seek(0)
-        return buf.read()
-
-    t_idx = np.arange(len(days))
-    returns_arr = np.array([d.realised_return for d in days])
-    var_arr = np.array([d.var_predicted for d in days])
-    hits = np.array([d.violation for d in days])
+        return fig_to_png(fig)
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
     fig.suptitle(
-        f"VaR Backtest — {symbol}  |  model={result.model_type}  "
-        f"α={result.alpha:.2%}  violations={result.violations}/{result.total_obs}  "
-        f"status={result.status}",
+        f"VaR Backtest — {summary['symbol']}  |  model={summary['model_type']}  "
+        f"α={summary['alpha']:.2%}  violations={summary['violations']}/{summary['total_obs']}  "
+        f"status={summary['status']}",
         fontsize=11,
     )
 
     # --- Panel 1: Returns vs. -VaR ---
     ax = axes[0]
-    ax.plot(t_idx, returns_arr, color="steelblue", linewidth=0.8, label="Realised return")
-    ax.plot(t_idx, -var_arr, color="darkorange", linewidth=1.2,
-            linestyle="--", label=f"-VaR ({result.alpha:.0%})")
+    ax.plot(summary["returns"]["x"], summary["returns"]["y"], color="steelblue", linewidth=0.8,
+            label="Realised return")
+    ax.plot(summary["neg_var"]["x"], summary["neg_var"]["y"], color="darkorange", linewidth=1.2,
+            linestyle="--", label=f"-VaR ({summary['alpha']:.0%})")
 
     # Highlight violations
-    viol_idx = t_idx[hits == 1]
-    viol_ret = returns_arr[hits == 1]
-    if len(viol_idx) > 0:
-        ax.scatter(viol_idx, viol_ret, color="red", zorder=5, s=30, label="Violation")
+    if summary["violation_days"]:
+        ax.scatter(summary["violation_days"], summary["violation_returns"], color="red", zorder=5, s=30,
+                   label="Violation")
 
     ax.axhline(0, color="black", linewidth=0.5, linestyle=":")
     ax.set_title("Realised Returns vs. −VaR Threshold")
@@ -236,28 +259,29 @@ def plot_backtest(
     ax.set_ylabel("Daily return")
     ax.legend(fontsize=8)
 
-    # --- Panel 2: Hit sequence ---
+    # --- Panel 2: Hit sequence (stems on violation days over a zero baseline) ---
     ax = axes[1]
-    ax.stem(
-        t_idx,
-        hits,
-        linefmt="C3-",
-        markerfmt="C3o",
-        basefmt="k-",
-    )
+    ax.plot([0, summary["n_days"] - 1], [0, 0], "k-")
+    if summary["violation_days"]:
+        ax.stem(
+            summary["violation_days"],
+            np.ones(len(summary["violation_days"])),
+            linefmt="C3-",
+            markerfmt="C3o",
+            basefmt=" ",
+        )
     ax.set_title("Violation Hit Sequence (1 = VaR exceeded)")
     ax.set_xlabel("Out-of-sample day")
     ax.set_ylabel("Violation")
     ax.set_ylim(-0.1, 1.4)
 
     # Annotate p-values
-    kupiec = result.kupiec
-    cc = result.christoffersen
-    if kupiec and cc:
+    tests = summary["tests"]
+    if tests:
         annotation = (
-            f"Kupiec p={kupiec.p_value:.3f}\n"
-            f"CC p={cc.p_value_cc:.3f}\n"
-            f"π₀₁={cc.pi_01:.3f}  π₁₁={cc.pi_11:.3f}"
+            f"Kupiec p={tests['kupiec_p']:.3f}\n"
+            f"CC p={tests['cc_p']:.3f}\n"
+            f"π₀₁={tests['pi_01']:.3f}  π₁₁={tests['pi_11']:.3f}"
         )
         ax.text(
             0.97, 0.97, annotation,
@@ -267,12 +291,27 @@ def plot_backtest(
             bbox=dict(boxstyle="round,pad=0.3", facecolor="lightyellow", alpha=0.8),
         )
 
-    plt.tight_layout()
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=100)
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return fig_to_png(fig)
+
+
+def plot_backtest(
+    result: RollingBacktestResult,
+    symbol: str = "portfolio",
+) -> bytes:
+    """Generate a two-panel diagnostic PNG and return the bytes.
+
+    Panel 1 (left): Realised returns vs. predicted -VaR threshold.
+                    Violations are highlighted as red dots.
+    Panel 2 (right): Hit sequence stem plot — shows clustering of violations.
+
+    Args:
+        result: Output of run_rolling_backtest().
+        symbol: Label for the plot title.
+
+    Returns:
+        PNG image as bytes (suitable for mlflow.log_artifact).
+    """
+    return render_backtest(backtest_plot_summary(result, symbol))
 
 
 # ---------------------------------------------------------------------------
@@ -284,6 +323,7 @@ def log_backtest_to_mlflow(
     result: RollingBacktestResult,
     symbol: str = "portfolio",
     run_id: Optional[str] = None,
+    plot_mode: str = "inline",
 ) -> str:
     """Log backtest metrics, report JSON, and diagnostic plot to MLflow.
 
@@ -291,10 +331,12 @@ def log_backtest_to_mlflow(
     Otherwise a new run is created in the "riskops-backtest" experiment.
 
     Args:
-        report:  BacktestReport to log.
-        result:  RollingBacktestResult (used for the plot).
-        symbol:  Label for the plot title.
-        run_id:  Optional existing MLflow run_id to append metrics to.
+        report:    BacktestReport to log.
+        result:    RollingBacktestResult (used for the plot).
+        symbol:    Label for the plot title.
+        run_id:    Optional existing MLflow run_id to append metrics to.
+        plot_mode: off | inline | deferred | on_demand (see ``plotting``);
+                   deferred / on_demand log only the plot summary.
 
     Returns:
         The MLflow run_id used (existing or newly created).
@@ -311,7 +353,8 @@ def log_backtest_to_mlflow(
         with mlflow.start_run(run_id=run_id):
             mlflow.log_metrics(metrics)
             mlflow.log_param("backtest_status", report.status)
-            _log_artifacts(report, result, symbol)
+            mlflow.log_param("backtest_refit_every", report.refit_every)
+            _log_artifacts(report, result, symbol, plot_mode)
         used_run_id = run_id
     else:
         # Standalone backtest run
@@ -326,9 +369,10 @@ def log_backtest_to_mlflow(
                 "lookback_days": report.lookback_days,
                 "test_days": report.test_days,
                 "backtest_status": report.status,
+                "refit_every": report.refit_every,
             })
             mlflow.log_metrics(metrics)
-            _log_artifacts(report, result, symbol)
+            _log_artifacts(report, result, symbol, plot_mode)
 
     logger.info(
         "Backtest logged to MLflow run %s: status=%s  violations=%d/%d  "
@@ -343,6 +387,7 @@ def _log_artifacts(
     report: BacktestReport,
     result: RollingBacktestResult,
     symbol: str,
+    plot_mode: str = "inline",
 ) -> None:
     """Log report JSON and diagnostic plot as MLflow artifacts (called inside an active run)."""
     import json
@@ -357,12 +402,7 @@ def _log_artifacts(
     finally:
         os.unlink(tmp_report)
 
-    # Diagnostic plot
-    plot_bytes = plot_backtest(result, symbol=symbol)
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        f.write(plot_bytes)
-        tmp_plot = f.name
-    try:
-        mlflow.log_artifact(tmp_plot, artifact_path="backtest_plots")
-    finally:
-        os.unlink(tmp_plot)
+    # Diagnostic plot (or its summary)
+    log_plot_artifact(
+        backtest_plot_summary(result, symbol), "backtest", "backtest_plots", plot_mode, render_backtest,
+    )
@@ -16,31 +16,83 @@ Supported model types
 - "garch"      : GARCH(1,1) with Normal innovations (fast, parametric)
 - "montecarlo" : Monte Carlo GBM (slower, empirical distribution)
 - "historical" : Historical simulation — empirical quantile of training window
-                 (no model fitting, fastest, useful as baseline)
+                 (no model fitting, fastest, useful as baseline). The whole
+                 VaR series is computed up front in one vectorised call
+                 (``historical.rolling_historical_var``).
+
+Refit schedule
+--------------
+With ``refit_every = k > 1`` GARCH is re-estimated only every k-th day and
+the conditional variance is filtered forward in between; refit days are
+recorded in ``RollingBacktestResult.refit_days``. ``garch_engine="native"``
+fits all refit windows in one batch (``garch.rolling_var_native``).
+
+Parallel execution
+------------------
+With ``n_workers > 1`` the out-of-sample days are split into contiguous
+blocks, one per process of a spawn pool, each running the serial loop. GARCH
+blocks start on a refit day and first fit the preceding refit window, so warm
+starts match the serial run up to optimiser tolerance; Monte Carlo results
+are identical. Batch-computed series (native GARCH, historical) run in-process.
+
+``progress_callback(done, total)`` reports progress; an exception it raises
+(``BacktestCancelled`` by convention) aborts the backtest.
+
+Comparative backtest
+--------------------
+``run_comparative_backtest`` runs several ``ModelSpec``s over the same
+windows in one pass, tests coverage with one ``christoffersen_test_batch``
+call and ranks the models by quantile loss (``loss.py``).
+
+Monte Carlo
+-----------
+Every window uses the same seed, so each block draws the shocks once
+(``montecarlo.CommonShocks``) and rescales them per window. With a (T × N)
+asset matrix and weights the assets are simulated jointly from a sliding
+``CovarianceCache``.
 
 Performance note
 ----------------
-Rolling GARCH over 60 test days with lookback=252 means 60 model fits.
-Each fit takes ~0.1–0.3 s → total ~6–18 s. This is acceptable for an
-async background task but would be too slow for a synchronous HTTP response.
-The endpoint in routes.py runs this in a thread pool.
+Rolling GARCH over N test days means N warm-started fits (``WarmStartGarch``),
+still too slow for a synchronous HTTP response; the endpoint in routes.py
+runs this in a thread pool. See ``benchmarks/garch_rolling.py`` for timings.
 """
 from __future__ import annotations
 
 import logging
+import math
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Callable, Literal, Optional
 
 import numpy as np
 
-from ..models.garch import GARCHParams, train_garch
-from ..models.montecarlo import MonteCarloParams, run_monte_carlo
-from .christoffersen import ChristoffersenResult, christoffersen_test
+from ..models.covariance import CovarianceCache, CovarianceFactors
+from ..models.garch import ENGINES, GARCHParams, WarmStartGarch, _check_native, rolling_var_native
+from ..models.historical import rolling_historical_var
+from ..models.montecarlo import CommonShocks, MonteCarloParams, run_monte_carlo
+from .christoffersen import (
+    ChristoffersenResult,
+    christoffersen_results_from_batch,
+    christoffersen_test,
+    christoffersen_test_batch,
+)
 from .kupiec import KupiecResult, kupiec_test
+from .loss import LossScores, loss_scores
 
 logger = logging.getLogger(__name__)
 
 ModelType = Literal["garch", "montecarlo", "historical"]
+ProgressCallback = Callable[[int, int], None]   # (days done, test_days)
+
+
+class BacktestCancelled(Exception):
+    """Raised by a progress callback to abort a running backtest."""
+
+
+# How often the calling thread polls the shared progress counter (seconds)
+_PROGRESS_POLL_S = 0.5
 
 
 # ---------------------------------------------------------------------------
@@ -84,6 +136,10 @@ class RollingBacktestResult:
     # Decision
     status: str = "UNKNOWN"   # OK | WARN | CRIT
 
+    # Refit schedule (GARCH): requested interval and the t of every actual refit
+    refit_every: int = 1
+    refit_days: list[int] = field(default_factory=list)
+
     def hit_sequence(self) -> list[int]:
         """Return the binary hit sequence (1 = violation, 0 = no violation)."""
         return [d.violation for d in self.day_results]
@@ -125,19 +181,23 @@ def _classify_status(kupiec_pvalue: float, cc_pvalue: float) -> str:
 # ---------------------------------------------------------------------------
 
 def _predict_var_garch(
-    train_returns: np.ndarray,
+    fitter: WarmStartGarch,
+    start: int,
+    end: int,
     alpha: float,
     horizon_days: int,
-    garch_params: GARCHParams,
+    refit: bool = True,
 ) -> float:
-    """Fit GARCH on train_returns and return 1-step-ahead VaR."""
+    """Return 1-step-ahead GARCH VaR for the window [start, end).
+
+    With ``refit=False`` the last fitted parameters are reused and only the
+    conditional variance is advanced to *end*.
+    """
     try:
-        result = train_garch(
-            train_returns,
-            alpha=alpha,
-            horizon_days=horizon_days,
-            garch_params=garch_params,
-        )
+        if refit:
+            result = fitter.fit_window(start, end, alpha=alpha, horizon_days=horizon_days)
+        else:
+            result = fitter.filtered_window(end, alpha=alpha, horizon_days=horizon_days)
         return result.var
     except Exception as exc:
         logger.warning("GARCH fit failed on rolling window: %s — using NaN", exc)
@@ -149,14 +209,25 @@ def _predict_var_montecarlo(
     alpha: float,
     horizon_days: int,
     mc_params: MonteCarloParams,
+    weights: Optional[np.ndarray] = None,
+    covariance: Optional[CovarianceFactors] = None,
+    shocks: Optional[CommonShocks] = None,
 ) -> float:
-    """Run Monte Carlo on train_returns and return simulated VaR."""
+    """Run Monte Carlo on train_returns and return simulated VaR.
+
+    With *shocks* the precomputed common random numbers are rescaled instead
+    of simulating the window from scratch.
+    """
     try:
+        if shocks is not None:
+            return shocks.var_cvar(train_returns, weights=weights, covariance=covariance)[0]
         result = run_monte_carlo(
             train_returns,
             alpha=alpha,
             horizon_days=horizon_days,
+            weights=weights,
             mc_params=mc_params,
+            covariance=covariance,
         )
         return result.var
     except Exception as exc:
@@ -164,111 +235,286 @@ def _predict_var_montecarlo(
         return float("nan")
 
 
-def _predict_var_historical(
-    train_returns: np.ndarray,
-    alpha: float,
-) -> float:
-    """Historical simulation: empirical quantile of training window."""
-    if len(train_returns) < 10:
-        return float("nan")
-    q = float(np.quantile(train_returns, 1.0 - alpha))
-    return -q  # positive loss number
-
-
 # ---------------------------------------------------------------------------
-# Main rolling engine
+# Block execution (one contiguous run of out-of-sample days)
 # ---------------------------------------------------------------------------
 
-def run_rolling_backtest(
-    returns: np.ndarray,
-    model_type: ModelType,
-    alpha: float = 0.99,
-    lookback_days: int = 252,
-    test_days: int = 60,
-    horizon_days: int = 1,
-    n_simulations: int = 1_000,
-    significance: float = 0.05,
-) -> RollingBacktestResult:
-    """Run a rolling window out-of-sample VaR backtest.
+@dataclass
+class _BlockSpec:
+    """Everything a block needs; picklable so it can be sent to a worker process."""
+    returns_window: np.ndarray            # last lookback_days + test_days portfolio returns
+    asset_window: Optional[np.ndarray]    # matching (T × N) asset returns, multi-asset MC only
+    model_type: str
+    alpha: float
+    lookback_days: int
+    horizon_days: int
+    refit_every: int
+    garch_params: GARCHParams
+    mc_params: MonteCarloParams
+    weights: Optional[np.ndarray] = None
+    symbols: Optional[list[str]] = None
 
-    Args:
-        returns:       Full 1-D array of daily portfolio returns (chronological).
-        model_type:    "garch" | "montecarlo" | "historical".
-        alpha:         VaR confidence level (e.g. 0.99).
-        lookback_days: Size of the rolling training window.
-        test_days:     Number of out-of-sample days to evaluate.
-                       Must satisfy: lookback_days + test_days ≤ len(returns).
-        horizon_days:  Forecast horizon (days). Typically 1 for daily VaR.
-        n_simulations: Number of MC simulations per day (only for montecarlo).
-        significance:  Significance level for statistical tests.
 
-    Returns:
-        RollingBacktestResult with per-day detail and statistical test results.
+@dataclass
+class _SpecState:
+    """Per-spec state while a block runs: GARCH fitter, refit schedule, results."""
+    fitter: Optional[WarmStartGarch]
+    next_refit: int   # first day index on which GARCH is re-estimated
+    shocks: Optional[CommonShocks] = None   # Monte Carlo common random numbers
+    day_results: list[DayResult] = field(default_factory=list)
+    refit_days: list[int] = field(default_factory=list)
 
-    Raises:
-        ValueError: If there are insufficient observations.
+
+def _common_shocks(spec: _BlockSpec, asset_window: Optional[np.ndarray]) -> Optional[CommonShocks]:
+    """Shared Monte Carlo shocks for *spec*'s block, or None to simulate per day."""
+    if spec.model_type != "montecarlo" or not CommonShocks.supports(spec.mc_params):
+        return None
+    n_assets = asset_window.shape[1] if asset_window is not None else 1
+    return CommonShocks(spec.mc_params, spec.alpha, spec.horizon_days, n_assets)
+
+
+def _warm_up(fitter: WarmStartGarch, i: int, lookback_days: int) -> None:
+    """Fit the refit window *i* before a block, so the block's first fit is warm-started.
+
+    In the serial schedule that window's parameters seed the block's first
+    day; a failed warm-up just leaves the first fit cold.
     """
-    n = len(returns)
-    required = lookback_days + test_days
-    if n < required:
-        raise ValueError(
-            f"Insufficient data: need {required} observations "
-            f"(lookback={lookback_days} + test={test_days}), got {n}."
-        )
+    try:
+        fitter.fit_window(i, i + lookback_days)
+    except Exception as exc:
+        logger.debug("GARCH warm-up fit on window %d failed: %s", i, exc)
 
-    logger.info(
-        "Rolling backtest: model=%s  alpha=%.4f  lookback=%d  test=%d  n=%d",
-        model_type, alpha, lookback_days, test_days, n,
-    )
 
-    # Use the last (lookback_days + test_days) observations so the backtest
-    # always uses the most recent data available.
-    returns_window = returns[-(lookback_days + test_days):]
+def _run_block(
+    spec: _BlockSpec,
+    start: int,
+    stop: int,
+    cov_cache: Optional[CovarianceCache] = None,
+    batch_var: Optional[np.ndarray] = None,
+    on_day: Optional[Callable[[], None]] = None,
+) -> tuple[list[DayResult], list[int]]:
+    """Predict and score out-of-sample days [start, stop).
 
-    # Pre-build model parameters once (reused across all rolling windows)
-    garch_params = GARCHParams(p=1, q=1, dist="normal", mean="Zero")
-    # Use a smaller n_simulations for speed in rolling mode; caller can override
-    mc_params = MonteCarloParams(n_simulations=n_simulations, seed=42)
+    *batch_var* holds VaR predictions computed up front for all test days
+    (native GARCH, historical); the per-day models are skipped then.
+
+    Returns (day results without NaN predictions, t of every GARCH refit).
+    """
+    return _run_specs_block([spec], start, stop, cov_cache, [batch_var], on_day)[0]
 
-    day_results: list[DayResult] = []
 
-    for i in range(test_days):
+def _run_specs_block(
+    specs: list[_BlockSpec],
+    start: int,
+    stop: int,
+    cov_cache: Optional[CovarianceCache] = None,
+    batch_vars: Optional[list[Optional[np.ndarray]]] = None,
+    on_day: Optional[Callable[[], None]] = None,
+) -> list[tuple[list[DayResult], list[int]]]:
+    """``_run_block`` for several specs over the same windows, day by day.
+
+    All specs must share ``returns_window`` / ``asset_window``. Each day's
+    window is sliced once and handed to every spec in turn, so multi-asset
+    Monte Carlo specs hit the covariance factors of that day in *cov_cache*.
+    *on_day* is called once per (day, spec).
+    """
+    first = specs[0]
+    returns_window, asset_window = first.returns_window, first.asset_window
+    lookback_days = first.lookback_days
+    batch_vars = batch_vars or [None] * len(specs)
+    if asset_window is not None and cov_cache is None and any(
+        sp.model_type == "montecarlo" and bv is None for sp, bv in zip(specs, batch_vars)
+    ):
+        cov_cache = CovarianceCache(max_entries=2)
+
+    states = [
+        _SpecState(
+            fitter=(
+                WarmStartGarch(returns_window, sp.garch_params)
+                if sp.model_type == "garch" and bv is None else None
+            ),
+            next_refit=start,
+            shocks=_common_shocks(sp, asset_window) if bv is None else None,
+        )
+        for sp, bv in zip(specs, batch_vars)
+    ]
+    if start > 0:
+        for spec, state in zip(specs, states):
+            if state.fitter is not None:
+                _warm_up(state.fitter, max(0, start - spec.refit_every), lookback_days)
+
+    for i in range(start, stop):
         # Training window: [i, i + lookback_days)
         train_slice = returns_window[i : i + lookback_days]
         # Out-of-sample observation: index i + lookback_days
         oos_idx = i + lookback_days
         realised = float(returns_window[oos_idx])
+        factors: Optional[CovarianceFactors] = None
 
-        # Predict VaR
-        if model_type == "garch":
-            var_pred = _predict_var_garch(train_slice, alpha, horizon_days, garch_params)
-        elif model_type == "montecarlo":
-            var_pred = _predict_var_montecarlo(train_slice, alpha, horizon_days, mc_params)
-        elif model_type == "historical":
-            var_pred = _predict_var_historical(train_slice, alpha)
-        else:
-            raise ValueError(f"Unknown model_type: {model_type!r}")
+        for spec, batch_var, state in zip(specs, batch_vars, states):
+            alpha, horizon_days = spec.alpha, spec.horizon_days
+            # Predict VaR
+            if batch_var is not None:
+                var_pred = float(batch_var[i])
+            elif spec.model_type == "garch":
+                refit = i >= state.next_refit
+                var_pred = _predict_var_garch(state.fitter, i, oos_idx, alpha, horizon_days, refit=refit)
+                if refit:
+                    # A failed fit is retried on the next day
+                    state.next_refit = i + (spec.refit_every if not np.isnan(var_pred) else 1)
+                    if not np.isnan(var_pred):
+                        state.refit_days.append(oos_idx)
+            elif spec.model_type == "montecarlo" and asset_window is not None:
+                if factors is None:
+                    factors = cov_cache.get(asset_window, oos_idx, lookback_days, spec.symbols)
+                var_pred = _predict_var_montecarlo(
+                    asset_window[i:oos_idx], alpha, horizon_days, spec.mc_params,
+                    weights=spec.weights, covariance=factors, shocks=state.shocks,
+                )
+            elif spec.model_type == "montecarlo":
+                var_pred = _predict_var_montecarlo(
+                    train_slice, alpha, horizon_days, spec.mc_params, shocks=state.shocks,
+                )
+            else:
+                raise ValueError(f"Unknown model_type: {spec.model_type!r}")
 
-        # Determine violation (skip NaN predictions — treat as no violation)
-        if np.isnan(var_pred):
-            logger.warning("Day %d: VaR prediction is NaN — skipping", i)
-            continue
+            if on_day is not None:
+                on_day()
 
-        violation = 1 if realised < -var_pred else 0
+            # Determine violation (skip NaN predictions — treat as no violation)
+            if np.isnan(var_pred):
+                logger.warning("Day %d: %s VaR prediction is NaN — skipping", i, spec.model_type)
+                continue
 
-        day_results.append(DayResult(
-            t=oos_idx,
-            var_predicted=var_pred,
-            realised_return=realised,
-            violation=violation,
-        ))
+            state.day_results.append(DayResult(
+                t=oos_idx,
+                var_predicted=var_pred,
+                realised_return=realised,
+                violation=1 if realised < -var_pred else 0,
+            ))
 
-        if (i + 1) % 10 == 0 or i == test_days - 1:
+        if (i + 1 - start) % 10 == 0 or i == stop - 1:
             logger.debug(
-                "Rolling backtest progress: %d/%d  violations so far: %d",
-                i + 1, test_days, sum(d.violation for d in day_results),
+                "Rolling backtest progress: %d/%d (block %d-%d)  violations so far: %s",
+                i + 1 - start, stop - start, start, stop,
+                [sum(d.violation for d in st.day_results) for st in states],
             )
 
+    return [(st.day_results, st.refit_days) for st in states]
+
+
+# Shared day counter and cancel flag of the current worker process (set by _init_block_worker)
+_worker_counter = None
+_worker_cancel = None
+
+
+def _init_block_worker(counter, cancel) -> None:
+    global _worker_counter, _worker_cancel
+    _worker_counter, _worker_cancel = counter, cancel
+
+
+def _count_day() -> None:
+    """Count a finished day; stop the block once the parent has aborted the backtest."""
+    with _worker_counter.get_lock():
+        _worker_counter.value += 1
+    if _worker_cancel.is_set():
+        raise BacktestCancelled("backtest aborted by the parent process")
+
+
+def _run_block_in_worker(spec: _BlockSpec, start: int, stop: int) -> tuple[list[DayResult], list[int]]:
+    return _run_block(spec, start, stop, on_day=_count_day)
+
+
+def _block_bounds(test_days: int, n_blocks: int, align: int) -> list[tuple[int, int]]:
+    """Split [0, test_days) into at most *n_blocks* contiguous blocks starting at multiples of *align*."""
+    size = math.ceil(math.ceil(test_days / n_blocks) / align) * align
+    return [(b, min(b + size, test_days)) for b in range(0, test_days, size)]
+
+
+def _run_tasks_parallel(
+    tasks: list[tuple[_BlockSpec, int, int]],
+    total: int,
+    n_workers: int,
+    progress_callback: Optional[ProgressCallback],
+) -> list[tuple[list[DayResult], list[int]]]:
+    """Run (spec, start, stop) blocks on a spawn pool; results in task order.
+
+    *progress_callback* receives (days done across all tasks, *total*).
+    """
+    # spawn, not fork: the training service runs FastAPI and Kafka threads
+    ctx = multiprocessing.get_context("spawn")
+    counter = ctx.Value("i", 0)
+    cancel = ctx.Event()
+    pool = ProcessPoolExecutor(
+        max_workers=min(n_workers, len(tasks)), mp_context=ctx,
+        initializer=_init_block_worker, initargs=(counter, cancel),
+    )
+    try:
+        futures: dict[Future, int] = {
+            pool.submit(_run_block_in_worker, spec, lo, hi): k for k, (spec, lo, hi) in enumerate(tasks)
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=_PROGRESS_POLL_S, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()   # a failed block fails the backtest at once
+            if progress_callback is not None:
+                progress_callback(counter.value, total)
+    except BaseException:
+        # Failed or aborted by the callback: drop queued blocks and have running
+        # ones stop after their current day, without waiting for them
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    # Workers that started late still unpickle the shared counter — wait for them
+    pool.shutdown(wait=True)
+
+    results: list = [None] * len(tasks)
+    for future, k in futures.items():
+        results[k] = future.result()
+    return results
+
+
+def _spec_tasks(spec: _BlockSpec, test_days: int, n_blocks: int) -> list[tuple[_BlockSpec, int, int]]:
+    align = spec.refit_every if spec.model_type == "garch" else 1
+    return [(spec, lo, hi) for lo, hi in _block_bounds(test_days, n_blocks, align)]
+
+
+def _join_blocks(
+    blocks: list[tuple[list[DayResult], list[int]]],
+) -> tuple[list[DayResult], list[int]]:
+    return [d for days, _ in blocks for d in days], [t for _, refits in blocks for t in refits]
+
+
+def _run_blocks_parallel(
+    spec: _BlockSpec,
+    test_days: int,
+    n_workers: int,
+    progress_callback: Optional[ProgressCallback],
+) -> tuple[list[DayResult], list[int]]:
+    tasks = _spec_tasks(spec, test_days, n_workers)
+    return _join_blocks(_run_tasks_parallel(tasks, test_days, n_workers, progress_callback))
+
+
+# ---------------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------------
+
+def summarise_backtest(
+    day_results: list[DayResult],
+    model_type: str,
+    alpha: float,
+    lookback_days: int,
+    test_days: int,
+    significance: float = 0.05,
+    refit_every: int = 1,
+    refit_days: Optional[list[int]] = None,
+) -> RollingBacktestResult:
+    """Count violations and run Kupiec + Christoffersen over *day_results*.
+
+    *day_results* must be in chronological order (Christoffersen tests the
+    transitions of the hit sequence).
+    """
     total_obs = len(day_results)
     violations = sum(d.violation for d in day_results)
     violation_rate = violations / total_obs if total_obs > 0 else 0.0
@@ -308,4 +554,503 @@ def run_rolling_backtest(
         kupiec=kupiec_result,
         christoffersen=cc_result,
         status=status,
+        refit_every=refit_every,
+        refit_days=refit_days or [],
+    )
+
+
+def _summarise_batch(
+    outcomes: list[tuple[list[DayResult], list[int]]],
+    model_types: list[str],
+    refit_every: list[int],
+    alpha: float,
+    lookback_days: int,
+    test_days: int,
+    significance: float,
+) -> list[RollingBacktestResult]:
+    """``summarise_backtest`` of several (day results, refit days) at once.
+
+    The coverage tests of every series with at least two days run in one
+    ``christoffersen_test_batch`` call over the padded hit matrix.
+    """
+    lengths = np.array([len(days) for days, _ in outcomes], dtype=np.int64)
+    tested = np.flatnonzero(lengths >= 2)
+    cc_results: dict[int, ChristoffersenResult] = {}
+    if len(tested):
+        hits = np.zeros((len(tested), int(lengths[tested].max())), dtype=np.int64)
+        for row, k in enumerate(tested):
+            hits[row, : lengths[k]] = [d.violation for d in outcomes[k][0]]
+        batch = christoffersen_test_batch(hits, alpha, significance, lengths=lengths[tested])
+        cc_results = dict(zip(tested.tolist(), christoffersen_results_from_batch(batch, alpha, significance)))
+
+    results = []
+    for k, ((days, refit_days), model_type, every) in enumerate(zip(outcomes, model_types, refit_every)):
+        total_obs = len(days)
+        violations = sum(d.violation for d in days)
+        cc = cc_results.get(k)
+        results.append(RollingBacktestResult(
+            model_type=model_type,
+            alpha=alpha,
+            lookback_days=lookback_days,
+            test_days=test_days,
+            day_results=days,
+            violations=violations,
+            total_obs=total_obs,
+            violation_rate=violations / total_obs if total_obs > 0 else 0.0,
+            expected_rate=1.0 - alpha,
+            kupiec=cc.kupiec if cc is not None else None,
+            christoffersen=cc,
+            status=_classify_status(cc.kupiec.p_value, cc.p_value_cc) if cc is not None else "UNKNOWN",
+            refit_every=every,
+            refit_days=refit_days or [],
+        ))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Main rolling engine
+# ---------------------------------------------------------------------------
+
+def _windows(
+    returns: np.ndarray,
+    weights: Optional[np.ndarray],
+    lookback_days: int,
+    test_days: int,
+) -> tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+    """(portfolio returns window, asset returns window or None, normalised weights).
+
+    Windows are the last lookback_days + test_days rows, so the backtest
+    always uses the most recent data available.
+    """
+    returns = np.asarray(returns, dtype=float)
+    asset_returns: Optional[np.ndarray] = None
+    if returns.ndim == 2:
+        n_assets = returns.shape[1]
+        weights = np.ones(n_assets) / n_assets if weights is None else np.asarray(weights, dtype=float)
+        if weights.shape != (n_assets,) or weights.sum() <= 0:
+            raise ValueError(f"weights must be {n_assets} values with a positive sum")
+        weights = weights / weights.sum()
+        asset_returns = returns
+        returns = asset_returns @ weights
+
+    n = len(returns)
+    required = lookback_days + test_days
+    if n < required:
+        raise ValueError(
+            f"Insufficient data: need {required} observations "
+            f"(lookback={lookback_days} + test={test_days}), got {n}."
+        )
+    asset_window = asset_returns[-required:] if asset_returns is not None else None
+    return returns[-required:], asset_window, weights
+
+
+def _batch_predictions(
+    returns_window: np.ndarray,
+    model_type: str,
+    alpha: float,
+    lookback_days: int,
+    test_days: int,
+    horizon_days: int,
+    garch_engine: str,
+    garch_params: GARCHParams,
+    refit_every: int,
+) -> tuple[Optional[np.ndarray], list[int]]:
+    """VaR of every test day for the models computed in one batch, else None.
+
+    Returns (batch VaR series or None, t of every native GARCH refit).
+    """
+    if model_type == "garch" and garch_engine == "native":
+        try:
+            batch_var, native_refits = rolling_var_native(
+                returns_window[:-1], lookback_days, test_days, alpha, horizon_days,
+                garch_params, refit_every,
+            )
+        except Exception as exc:
+            logger.warning("Native GARCH batch fit failed: %s — using NaN", exc)
+            batch_var, native_refits = np.full(test_days, np.nan), []
+        return batch_var, [lookback_days + i for i in native_refits]
+    if model_type == "historical":
+        # Window i is returns_window[i : i + lookback_days]
+        return rolling_historical_var(returns_window[:-1], lookback_days, alpha, n_windows=test_days), []
+    return None, []
+
+
+def _mc_params(n_simulations: int, mc_sampler: str) -> MonteCarloParams:
+    # Every day uses the same seed, so a day's VaR depends only on its window
+    # and the shocks can be drawn once per block (CommonShocks)
+    return MonteCarloParams(n_simulations=n_simulations, seed=42, sampler=mc_sampler)
+
+
+def rolling_predictions(
+    returns: np.ndarray,
+    model_type: ModelType,
+    alpha: float = 0.99,
+    lookback_days: int = 252,
+    test_days: int = 60,
+    horizon_days: int = 1,
+    n_simulations: int = 1_000,
+    mc_sampler: str = "pseudo",
+    weights: Optional[np.ndarray] = None,
+    symbols: Optional[list[str]] = None,
+    cov_cache: Optional[CovarianceCache] = None,
+    refit_every: int = 1,
+    garch_engine: str = "arch",
+    garch_params: Optional[GARCHParams] = None,
+    n_workers: int = 1,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> tuple[list[DayResult], list[int]]:
+    """Predict and score every out-of-sample day of a rolling window backtest.
+
+    Args:
+        returns:       Full 1-D array of daily portfolio returns (chronological),
+                       or a (T × N) matrix of asset returns (see *weights*).
+        model_type:    "garch" | "montecarlo" | "historical".
+        alpha:         VaR confidence level (e.g. 0.99).
+        lookback_days: Size of the rolling training window.
+        test_days:     Number of out-of-sample days to evaluate.
+                       Must satisfy: lookback_days + test_days ≤ len(returns).
+        horizon_days:  Forecast horizon (days). Typically 1 for daily VaR.
+        n_simulations: Number of MC simulations per day (only for montecarlo).
+        mc_sampler:    Monte Carlo sampler: "pseudo" | "antithetic" | "sobol" | "importance".
+        weights:       (N,) portfolio weights for a 2-D *returns*; equal weights if None.
+        symbols:       Column names of a 2-D *returns* (covariance cache key).
+        cov_cache:     Covariance cache for multi-asset Monte Carlo; a private
+                       one is created per call when None.
+        refit_every:   Re-estimate GARCH parameters every this many days and
+                       filter the variance forward in between (only for garch).
+        garch_engine:  "arch" | "native" — native fits all refit windows in one
+                       vectorised batch (only for garch).
+        garch_params:  GARCH specification to backtest; GARCH(1,1) with Normal
+                       innovations and zero mean if None (only for garch).
+        n_workers:     Worker processes; > 1 runs contiguous blocks of days in
+                       parallel (see "Parallel execution" above).
+        progress_callback: Called with (days done, test_days) while running.
+
+    Returns:
+        (day results without NaN predictions, t of every GARCH refit), in
+        chronological order; t indexes the last lookback_days + test_days
+        rows of *returns*.
+
+    Raises:
+        ValueError: If there are insufficient observations, refit_every < 1,
+                    n_workers < 1, an unknown model_type or garch_engine, or
+                    garch_params the native engine does not support.
+    """
+    if refit_every < 1:
+        raise ValueError(f"refit_every must be >= 1, got {refit_every}")
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be >= 1, got {n_workers}")
+    if model_type not in ("garch", "montecarlo", "historical"):
+        raise ValueError(f"Unknown model_type: {model_type!r}")
+    if garch_engine not in ENGINES:
+        raise ValueError(f"Unknown garch_engine {garch_engine!r}; expected one of {ENGINES}")
+    if garch_params is None:
+        garch_params = GARCHParams(p=1, q=1, dist="normal", mean="Zero")
+    if model_type == "garch" and garch_engine == "native":
+        _check_native(garch_params)
+    returns_window, asset_window, weights = _windows(returns, weights, lookback_days, test_days)
+
+    logger.info(
+        "Rolling backtest: model=%s  alpha=%.4f  lookback=%d  test=%d  n=%d  refit_every=%d  workers=%d",
+        model_type, alpha, lookback_days, test_days, len(returns), refit_every, n_workers,
+    )
+
+    batch_var, native_refit_days = _batch_predictions(
+        returns_window, model_type, alpha, lookback_days, test_days, horizon_days,
+        garch_engine, garch_params, refit_every,
+    )
+
+    spec = _BlockSpec(
+        returns_window=returns_window,
+        asset_window=asset_window,
+        model_type=model_type,
+        alpha=alpha,
+        lookback_days=lookback_days,
+        horizon_days=horizon_days,
+        refit_every=refit_every,
+        garch_params=garch_params,
+        mc_params=_mc_params(n_simulations, mc_sampler),
+        weights=weights,
+        symbols=symbols,
+    )
+    if n_workers > 1 and batch_var is None and test_days > 1:
+        day_results, refit_days = _run_blocks_parallel(spec, test_days, n_workers, progress_callback)
+    else:
+        done = 0
+
+        def _on_day() -> None:
+            nonlocal done
+            done += 1
+            if progress_callback is not None:
+                progress_callback(done, test_days)
+
+        day_results, refit_days = _run_block(
+            spec, 0, test_days, cov_cache=cov_cache, batch_var=batch_var, on_day=_on_day,
+        )
+        if model_type == "garch" and batch_var is not None:
+            refit_days = native_refit_days
+
+    return day_results, refit_days
+
+
+def run_rolling_backtest(
+    returns: np.ndarray,
+    model_type: ModelType,
+    alpha: float = 0.99,
+    lookback_days: int = 252,
+    test_days: int = 60,
+    horizon_days: int = 1,
+    n_simulations: int = 1_000,
+    significance: float = 0.05,
+    mc_sampler: str = "pseudo",
+    weights: Optional[np.ndarray] = None,
+    symbols: Optional[list[str]] = None,
+    cov_cache: Optional[CovarianceCache] = None,
+    refit_every: int = 1,
+    garch_engine: str = "arch",
+    garch_params: Optional[GARCHParams] = None,
+    n_workers: int = 1,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> RollingBacktestResult:
+    """Run a rolling window out-of-sample VaR backtest.
+
+    ``rolling_predictions`` followed by ``summarise_backtest``; see the
+    former for the arguments. *significance* is the level of the Kupiec and
+    Christoffersen tests.
+
+    Returns:
+        RollingBacktestResult with per-day detail and statistical test results.
+
+    Raises:
+        ValueError: If there are insufficient observations, refit_every < 1,
+                    n_workers < 1, an unknown model_type or garch_engine, or
+                    garch_params the native engine does not support.
+    """
+    day_results, refit_days = rolling_predictions(
+        returns, model_type, alpha, lookback_days, test_days, horizon_days,
+        n_simulations, mc_sampler, weights, symbols, cov_cache, refit_every,
+        garch_engine, garch_params, n_workers, progress_callback,
+    )
+    return summarise_backtest(
+        day_results, model_type, alpha, lookback_days, test_days,
+        significance=significance, refit_every=refit_every, refit_days=refit_days,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Comparative backtest
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """One model of a comparative backtest (fields as in run_rolling_backtest)."""
+    model_type: ModelType
+    label: Optional[str] = None              # defaults to describe()
+    garch_params: Optional[GARCHParams] = None
+    refit_every: int = 1
+    garch_engine: str = "arch"
+    n_simulations: int = 1_000
+    mc_sampler: str = "pseudo"
+
+    def describe(self) -> str:
+        if self.label:
+            return self.label
+        if self.model_type == "garch":
+            gp = self.garch_params or GARCHParams()
+            label = f"garch({gp.p},{gp.q})-{gp.dist}"
+            if gp.mean != "Zero":
+                label += f"-{gp.mean.lower()}"
+            if self.refit_every > 1:
+                label += f"-refit{self.refit_every}"
+            if self.garch_engine != "arch":
+                label += f"-{self.garch_engine}"
+            return label
+        if self.model_type == "montecarlo":
+            return f"montecarlo-{self.mc_sampler}-{self.n_simulations}"
+        return self.model_type
+
+
+@dataclass
+class ComparativeBacktestResult:
+    """Several models backtested over the same windows."""
+    alpha: float
+    lookback_days: int
+    test_days: int
+    results: dict[str, RollingBacktestResult]   # by label, in spec order
+    common_days: list[int]                      # t on which every model has a prediction
+    scores: dict[str, LossScores]               # losses over common_days
+
+    def labels(self) -> list[str]:
+        return list(self.results)
+
+    def hit_matrix(self) -> np.ndarray:
+        """(len(common_days), n_models) hit sequences on the common days."""
+        common = set(self.common_days)
+        return np.array(
+            [[d.violation for d in r.day_results if d.t in common] for r in self.results.values()],
+            dtype=int,
+        ).T
+
+    def ranking(self) -> list[str]:
+        """Labels by mean quantile loss over the common days, best first."""
+        return sorted(self.results, key=lambda label: (
+            math.isnan(self.scores[label].quantile_loss), self.scores[label].quantile_loss,
+        ))
+
+
+def run_comparative_backtest(
+    returns: np.ndarray,
+    specs: list[ModelSpec],
+    alpha: float = 0.99,
+    lookback_days: int = 252,
+    test_days: int = 60,
+    horizon_days: int = 1,
+    significance: float = 0.05,
+    weights: Optional[np.ndarray] = None,
+    symbols: Optional[list[str]] = None,
+    cov_cache: Optional[CovarianceCache] = None,
+    n_workers: int = 1,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> ComparativeBacktestResult:
+    """Backtest several model specs over the same rolling windows in one pass.
+
+    The windows, the portfolio series and the batch predictions are built
+    once. In-process, the days are walked once and every per-day model is
+    evaluated on each window in turn, which also lets multi-asset Monte
+    Carlo specs share each day's covariance factors. With ``n_workers > 1``
+    the per-day models run as (spec, block of days) tasks on one process
+    pool. Each model's result equals its own ``run_rolling_backtest``.
+
+    Args:
+        returns:  1-D portfolio returns or a (T × N) asset matrix, as for
+                  ``run_rolling_backtest`` (only Monte Carlo uses the assets).
+        specs:    Models to compare; their labels must be distinct.
+        progress_callback: Called with (predictions done, test_days × len(specs)).
+        Other arguments as for ``run_rolling_backtest``.
+
+    Returns:
+        ComparativeBacktestResult — per-model results (Kupiec, Christoffersen,
+        status) and loss scores over the days every model predicted.
+
+    Raises:
+        ValueError: No specs, duplicate labels, invalid spec fields or
+                    insufficient observations.
+    """
+    if not specs:
+        raise ValueError("At least one model spec is required")
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be >= 1, got {n_workers}")
+    labels = [sp.describe() for sp in specs]
+    if len(set(labels)) != len(labels):
+        raise ValueError(f"Model labels must be distinct, got {labels}")
+    for sp in specs:
+        if sp.model_type not in ("garch", "montecarlo", "historical"):
+            raise ValueError(f"Unknown model_type: {sp.model_type!r}")
+        if sp.refit_every < 1:
+            raise ValueError(f"refit_every must be >= 1, got {sp.refit_every}")
+        if sp.garch_engine not in ENGINES:
+            raise ValueError(f"Unknown garch_engine {sp.garch_engine!r}; expected one of {ENGINES}")
+        if sp.model_type == "garch" and sp.garch_engine == "native":
+            _check_native(sp.garch_params or GARCHParams(p=1, q=1, dist="normal", mean="Zero"))
+    returns_window, asset_window, weights = _windows(returns, weights, lookback_days, test_days)
+
+    logger.info(
+        "Comparative backtest: models=%s  alpha=%.4f  lookback=%d  test=%d  workers=%d",
+        labels, alpha, lookback_days, test_days, n_workers,
+    )
+
+    block_specs: list[_BlockSpec] = []
+    batch_vars: list[Optional[np.ndarray]] = []
+    native_refits: list[list[int]] = []
+    for sp in specs:
+        garch_params = sp.garch_params or GARCHParams(p=1, q=1, dist="normal", mean="Zero")
+        batch_var, refits = _batch_predictions(
+            returns_window, sp.model_type, alpha, lookback_days, test_days, horizon_days,
+            sp.garch_engine, garch_params, sp.refit_every,
+        )
+        batch_vars.append(batch_var)
+        native_refits.append(refits)
+        block_specs.append(_BlockSpec(
+            returns_window=returns_window,
+            asset_window=asset_window,
+            model_type=sp.model_type,
+            alpha=alpha,
+            lookback_days=lookback_days,
+            horizon_days=horizon_days,
+            refit_every=sp.refit_every,
+            garch_params=garch_params,
+            mc_params=_mc_params(sp.n_simulations, sp.mc_sampler),
+            weights=weights,
+            symbols=symbols,
+        ))
+
+    total = test_days * len(specs)
+    per_day = [k for k, bv in enumerate(batch_vars) if bv is None]
+    outcomes: list = [None] * len(specs)
+    if n_workers > 1 and per_day and test_days > 1:
+        # Batch series are already computed: score them here, fan the rest out
+        batched = [k for k in range(len(specs)) if k not in per_day]
+        if batched:
+            scored = _run_specs_block(
+                [block_specs[k] for k in batched], 0, test_days,
+                batch_vars=[batch_vars[k] for k in batched],
+            )
+            for k, out in zip(batched, scored):
+                outcomes[k] = out
+        offset = test_days * len(batched)
+        blocks_per_spec = max(1, n_workers // len(per_day))
+        task_specs = {k: _spec_tasks(block_specs[k], test_days, blocks_per_spec) for k in per_day}
+        tasks = [task for k in per_day for task in task_specs[k]]
+        on_progress = None
+        if progress_callback is not None:
+            def on_progress(done: int, _total: int) -> None:
+                progress_callback(offset + done, total)
+        blocks = iter(_run_tasks_parallel(tasks, test_days * len(per_day), n_workers, on_progress))
+        for k in per_day:
+            outcomes[k] = _join_blocks([next(blocks) for _ in task_specs[k]])
+    else:
+        done = 0
+
+        def _on_day() -> None:
+            nonlocal done
+            done += 1
+            if progress_callback is not None:
+                progress_callback(done, total)
+
+        outcomes = _run_specs_block(block_specs, 0, test_days, cov_cache, batch_vars, _on_day)
+
+    outcomes = [
+        (days, refits if sp.model_type == "garch" and batch_var is not None else refit_days)
+        for sp, batch_var, refits, (days, refit_days) in zip(specs, batch_vars, native_refits, outcomes)
+    ]
+    summaries = _summarise_batch(
+        outcomes, [sp.model_type for sp in specs], [sp.refit_every for sp in specs],
+        alpha, lookback_days, test_days, significance,
+    )
+    results: dict[str, RollingBacktestResult] = dict(zip(labels, summaries))
+
+    # Losses are compared on the days every model predicted
+    common = set.intersection(*(set(d.t for d in r.day_results) for r in results.values()))
+    common_days = sorted(common)
+    scores: dict[str, LossScores] = {}
+    for label, r in results.items():
+        days = [d for d in r.day_results if d.t in common]
+        scores[label] = loss_scores(
+            np.array([d.var_predicted for d in days]),
+            np.array([d.realised_return for d in days]),
+            alpha,
+        )
+        logger.info(
+            "Comparative backtest %s: status=%s  violations=%d/%d  quantile_loss=%.6g  lopez_loss=%.4g",
+            label, r.status, r.violations, r.total_obs,
+            scores[label].quantile_loss, scores[label].lopez_loss,
+        )
+
+    return ComparativeBacktestResult(
+        alpha=alpha,
+        lookback_days=lookback_days,
+        test_days=test_days,
+        results=results,
+        common_days=common_days,
+        scores=scores,
     )
@@ -0,0 +1,9 @@
+"""Offline performance benchmarks for the training service.
+
+Each module is runnable on its own, e.g.::
+
+    python -m training_service.benchmarks.mc_samplers --target 0.01
+    python -m training_service.benchmarks.mc_precision --n-simulations 1000000
+    python -m training_service.benchmarks.garch_rolling --test-days 1000
+    python -m training_service.benchmarks.garch_native --n-series 500 --dist t
+"""
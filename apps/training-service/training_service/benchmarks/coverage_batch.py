@@ -0,0 +1,79 @@
+"""Coverage tests: one kupiec_test / christoffersen_test call per sequence vs the batch variants.
+
+Simulates K hit sequences of length T — Bernoulli violations at rates around
+1 − α, some with clustering, one α per sequence drawn from {0.95, 0.99} —
+then runs ``christoffersen_test`` (which includes Kupiec) on every row and
+``christoffersen_test_batch`` on the whole matrix. Reports both wall times
+and the largest difference of each statistic (rounding only).
+
+Usage::
+
+    python -m training_service.benchmarks.coverage_batch --sequences 5000 --days 250
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from ..backtesting.christoffersen import christoffersen_test, christoffersen_test_batch
+
+
+def simulate_hits(n_sequences: int, n_days: int, seed: int = 11) -> tuple[np.ndarray, np.ndarray]:
+    """((K × T) hit matrix, (K,) alphas); a third of the rows have clustered violations."""
+    rng = np.random.default_rng(seed)
+    alphas = rng.choice([0.95, 0.99], size=n_sequences)
+    rates = (1.0 - alphas) * rng.uniform(0.5, 2.0, n_sequences)
+    hits = (rng.random((n_sequences, n_days)) < rates[:, None]).astype(np.int64)
+    clustered = rng.random(n_sequences) < 1 / 3
+    # Clustering: a violation makes the next day a violation with probability 0.3
+    follow = (rng.random((n_sequences, n_days)) < 0.3) & clustered[:, None]
+    hits[:, 1:] |= hits[:, :-1] & follow[:, 1:]
+    return hits, alphas
+
+
+def run_benchmark(n_sequences: int = 5000, n_days: int = 250) -> dict:
+    """Returns {"loop_s", "batch_s", "speedup", "max_diff": {field: float}}."""
+    hits, alphas = simulate_hits(n_sequences, n_days)
+
+    t0 = time.perf_counter()
+    loop = [christoffersen_test(row, a) for row, a in zip(hits, alphas)]
+    loop_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = christoffersen_test_batch(hits, alphas)
+    batch_s = time.perf_counter() - t0
+
+    fields = {
+        "lr_uc": [r.kupiec.lr_statistic for r in loop],
+        "p_value_uc": [r.kupiec.p_value for r in loop],
+        "lr_ind": [r.lr_ind for r in loop],
+        "p_value_ind": [r.p_value_ind for r in loop],
+        "lr_cc": [r.lr_cc for r in loop],
+        "p_value_cc": [r.p_value_cc for r in loop],
+        "n_11": [r.n_11 for r in loop],
+        "reject_h0": [r.reject_h0 for r in loop],
+    }
+    max_diff = {
+        name: float(np.max(np.abs(np.asarray(values, dtype=float) - batch[name].astype(float))))
+        for name, values in fields.items()
+    }
+    return {"loop_s": loop_s, "batch_s": batch_s, "speedup": loop_s / batch_s, "max_diff": max_diff}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sequences", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=250)
+    args = parser.parse_args()
+
+    res = run_benchmark(args.sequences, args.days)
+    print(f"\nCoverage tests  sequences={args.sequences}  days={args.days}")
+    print(f"  one call per sequence  {res['loop_s']:>8.3f} s")
+    print(f"  batch                  {res['batch_s']:>8.3f} s  x{res['speedup']:.0f}")
+    print("  max |loop − batch|:  " + "  ".join(f"{k}={v:.1e}" for k, v in res["max_diff"].items()))
+
+
+if __name__ == "__main__":
+    main()
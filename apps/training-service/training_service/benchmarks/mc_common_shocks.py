@@ -0,0 +1,115 @@
+"""Monte Carlo backtest: one ``run_monte_carlo`` per window vs common random numbers.
+
+Computes the rolling Monte Carlo VaR series twice on the same data — once
+with a ``run_monte_carlo`` call per window (the reference: same seed, so the
+same shocks, on every day), once with ``rolling_predictions``, which draws
+the shocks once per block (``CommonShocks``) and only rescales them per
+window. Reports both wall times and the largest relative VaR difference
+(summation order only). With ``--assets > 1`` the assets are simulated
+jointly from the sliding covariance factors.
+
+Usage::
+
+    python -m training_service.benchmarks.mc_common_shocks --sims 10000 --test-days 250
+    python -m training_service.benchmarks.mc_common_shocks --assets 5 --horizon 10
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from ..backtesting.rolling_backtest import _mc_params, rolling_predictions
+from ..models.covariance import CovarianceCache
+from ..models.montecarlo import run_monte_carlo
+from .backtest_compare import simulate_asset_returns
+from .garch_rolling import simulate_garch_returns
+
+
+def run_benchmark(
+    n_simulations: int = 10_000,
+    lookback_days: int = 252,
+    test_days: int = 250,
+    horizon_days: int = 1,
+    n_assets: int = 1,
+    sampler: str = "pseudo",
+    alpha: float = 0.99,
+) -> dict:
+    """Time the per-window reference against the common-shock backtest.
+
+    Returns:
+        {"per_window_s", "common_s", "speedup", "max_var_rel_diff", "n_days"}
+    """
+    n_obs = lookback_days + test_days
+    if n_assets > 1:
+        returns = simulate_asset_returns(n_obs, n_assets)
+        weights = np.ones(n_assets) / n_assets
+    else:
+        returns = simulate_garch_returns(n_obs)
+        weights = None
+    mc_params = _mc_params(n_simulations, sampler)
+
+    # run_monte_carlo logs one INFO line per call
+    mc_logger = logging.getLogger("training_service.models.montecarlo")
+    level = mc_logger.level
+    mc_logger.setLevel(logging.WARNING)
+    try:
+        t0 = time.perf_counter()
+        cache = CovarianceCache(max_entries=2)
+        reference = []
+        for i in range(test_days):
+            end = i + lookback_days
+            if n_assets > 1:
+                factors = cache.get(returns, end, lookback_days)
+                res = run_monte_carlo(returns[i:end], alpha, horizon_days, weights, mc_params, factors)
+            else:
+                res = run_monte_carlo(returns[i:end], alpha, horizon_days, mc_params=mc_params)
+            reference.append(res.var)
+        per_window_s = time.perf_counter() - t0
+    finally:
+        mc_logger.setLevel(level)
+
+    t0 = time.perf_counter()
+    day_results, _ = rolling_predictions(
+        returns, "montecarlo", alpha=alpha, lookback_days=lookback_days, test_days=test_days,
+        horizon_days=horizon_days, n_simulations=n_simulations, mc_sampler=sampler, weights=weights,
+    )
+    common_s = time.perf_counter() - t0
+
+    a = np.array([d.var_predicted for d in day_results])
+    b = np.asarray(reference)
+    max_diff = float(np.max(np.abs(a - b) / np.abs(b))) if a.shape == b.shape else float("nan")
+    return {
+        "per_window_s": per_window_s,
+        "common_s": common_s,
+        "speedup": per_window_s / common_s,
+        "max_var_rel_diff": max_diff,
+        "n_days": len(day_results),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sims", type=int, default=10_000)
+    parser.add_argument("--lookback-days", type=int, default=252)
+    parser.add_argument("--test-days", type=int, default=250)
+    parser.add_argument("--horizon", type=int, default=1)
+    parser.add_argument("--assets", type=int, default=1)
+    parser.add_argument("--sampler", default="pseudo", choices=["pseudo", "antithetic", "sobol"])
+    parser.add_argument("--alpha", type=float, default=0.99)
+    args = parser.parse_args()
+
+    res = run_benchmark(
+        args.sims, args.lookback_days, args.test_days, args.horizon, args.assets, args.sampler, args.alpha,
+    )
+    print(f"\nMonte Carlo backtest  sims={args.sims}  days={args.test_days}  horizon={args.horizon}  "
+          f"assets={args.assets}  sampler={args.sampler}")
+    print(f"  run_monte_carlo per window  {res['per_window_s']:>8.2f} s")
+    print(f"  common random numbers       {res['common_s']:>8.2f} s  x{res['speedup']:.1f}")
+    print(f"  max relative VaR difference {res['max_var_rel_diff']:.1e}  ({res['n_days']} days)")
+
+
+if __name__ == "__main__":
+    main()
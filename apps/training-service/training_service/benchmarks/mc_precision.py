@@ -0,0 +1,141 @@
+"""Float32 vs float64 accuracy and throughput check for the Monte Carlo engine.
+
+Two checks are run for a single-asset and a multi-asset portfolio:
+
+1. Arithmetic — the same float64 shocks are simulated once in float64 and
+   once after casting to float32; the relative VaR/CVaR deviation must stay
+   within ``FLOAT32_REL_TOLERANCE``. This isolates rounding error from
+   sampling noise.
+2. End to end — ``run_monte_carlo`` with ``dtype="float32"`` (its own float32
+   random stream) must agree with the float64 run within four combined
+   batch-means standard errors.
+
+Throughput (paths per second) of both precisions is reported alongside.
+The process exits with status 1 if any check fails, so it can gate CI::
+
+    python -m training_service.benchmarks.mc_precision --n-simulations 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from ..models.montecarlo import (
+    FLOAT32_REL_TOLERANCE,
+    MonteCarloParams,
+    TailAccumulator,
+    _estimate_gbm_params,
+    _gbm_multiasset_factors,
+    _simulate_gbm_1d,
+    _simulate_gbm_multiasset,
+    run_monte_carlo,
+)
+
+# Combined batch-means standard errors allowed between float32 and float64 runs
+_SE_MULTIPLE = 4.0
+
+
+def _var_cvar(sims: np.ndarray, alpha: float) -> tuple[float, float]:
+    acc = TailAccumulator(len(sims), alpha)
+    acc.update(sims)
+    return acc.var_cvar()
+
+
+def arithmetic_error(
+    returns: np.ndarray,
+    alpha: float,
+    horizon_days: int,
+    n_simulations: int,
+    seed: int = 0,
+    weights: np.ndarray | None = None,
+) -> tuple[float, float]:
+    """Max relative (VaR, CVaR) deviation of float32 arithmetic on identical shocks."""
+    rng = np.random.default_rng(seed)
+    if returns.ndim == 1:
+        mu, sigma = _estimate_gbm_params(returns)
+        z = rng.standard_normal((n_simulations, horizon_days))
+        sims64 = _simulate_gbm_1d(mu, sigma, z)
+        sims32 = _simulate_gbm_1d(mu, sigma, z.astype(np.float32))
+    else:
+        drift, L = _gbm_multiasset_factors(returns)
+        z = rng.standard_normal((n_simulations, horizon_days, returns.shape[1]))
+        sims64 = _simulate_gbm_multiasset(drift, L, weights, z)
+        sims32 = _simulate_gbm_multiasset(
+            drift.astype(np.float32), L.astype(np.float32), weights.astype(np.float32), z.astype(np.float32),
+        )
+    var64, cvar64 = _var_cvar(sims64, alpha)
+    var32, cvar32 = _var_cvar(sims32, alpha)
+    return abs(var32 / var64 - 1.0), abs(cvar32 / cvar64 - 1.0)
+
+
+def end_to_end(
+    returns: np.ndarray,
+    alpha: float,
+    horizon_days: int,
+    n_simulations: int,
+    weights: np.ndarray | None = None,
+) -> dict:
+    """Run both precisions through run_monte_carlo and compare within standard errors."""
+    out: dict = {}
+    for dtype in ("float64", "float32"):
+        t0 = time.perf_counter()
+        res = run_monte_carlo(
+            returns,
+            alpha=alpha,
+            horizon_days=horizon_days,
+            weights=weights,
+            mc_params=MonteCarloParams(n_simulations=n_simulations, seed=1, dtype=dtype),
+        )
+        out[dtype] = (res, n_simulations / (time.perf_counter() - t0))
+    r64, r32 = out["float64"][0], out["float32"][0]
+    var_tol = _SE_MULTIPLE * np.hypot(r64.var_se, r32.var_se)
+    cvar_tol = _SE_MULTIPLE * np.hypot(r64.cvar_se, r32.cvar_se)
+    return {
+        "var_diff": abs(r32.var - r64.var),
+        "cvar_diff": abs(r32.cvar - r64.cvar),
+        "var_tol": var_tol,
+        "cvar_tol": cvar_tol,
+        "ok": abs(r32.var - r64.var) <= var_tol and abs(r32.cvar - r64.cvar) <= cvar_tol,
+        "paths_per_s": {dtype: rate for dtype, (_, rate) in out.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alpha", type=float, default=0.99)
+    parser.add_argument("--horizon-days", type=int, default=10)
+    parser.add_argument("--n-simulations", type=int, default=200_000)
+    parser.add_argument("--n-assets", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    single = rng.normal(0.0003, 0.0125, size=750)
+    factor = rng.normal(size=(args.n_assets, args.n_assets)) * 0.01
+    cov = factor @ factor.T / args.n_assets + np.eye(args.n_assets) * 2e-5
+    multi = rng.multivariate_normal(np.full(args.n_assets, 0.0003), cov, size=750)
+    weights = np.full(args.n_assets, 1.0 / args.n_assets)
+
+    failed = False
+    for name, rets, w in (("single-asset", single, None), (f"{args.n_assets}-asset", multi, weights)):
+        var_err, cvar_err = arithmetic_error(rets, args.alpha, args.horizon_days, args.n_simulations, weights=w)
+        e2e = end_to_end(rets, args.alpha, args.horizon_days, args.n_simulations, weights=w)
+        arith_ok = max(var_err, cvar_err) <= FLOAT32_REL_TOLERANCE
+        failed |= not (arith_ok and e2e["ok"])
+
+        print(f"\n== {name}  (n={args.n_simulations:,}, h={args.horizon_days}, alpha={args.alpha}) ==")
+        print(f"  arithmetic  VaR rel err {var_err:.2e}  CVaR rel err {cvar_err:.2e}  "
+              f"tolerance {FLOAT32_REL_TOLERANCE:.0e}  {'OK' if arith_ok else 'FAIL'}")
+        print(f"  end-to-end  |dVaR| {e2e['var_diff']:.2e} <= {e2e['var_tol']:.2e}  "
+              f"|dCVaR| {e2e['cvar_diff']:.2e} <= {e2e['cvar_tol']:.2e}  {'OK' if e2e['ok'] else 'FAIL'}")
+        rates = e2e["paths_per_s"]
+        print(f"  throughput  float64 {rates['float64']:,.0f}/s  float32 {rates['float32']:,.0f}/s  "
+              f"(x{rates['float32'] / rates['float64']:.2f})")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
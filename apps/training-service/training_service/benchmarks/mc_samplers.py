@@ -0,0 +1,126 @@
+"""Paths-to-target-error benchmark for the Monte Carlo samplers.
+
+For a single-asset GBM the horizon log-return is exactly normal, so VaR and
+CVaR have closed forms and the estimation error of every sampler can be
+measured against the truth rather than against another simulation:
+
+    X ~ N(m, s²),  m = (μ − σ²/2)·h,  s = σ·√h,  z_q = Φ⁻¹(1 − α)
+    VaR  = 1 − exp(m + s·z_q)
+    CVaR = 1 − exp(m + s²/2) · Φ(z_q − s) / (1 − α)
+
+For each sampler and each path count n = 2^k, the benchmark runs
+``--replicates`` independent seeds and reports the relative RMSE of VaR and
+the mean batch-means standard error reported by ``run_monte_carlo``. The
+summary lists the smallest n at which the VaR relative RMSE falls below
+``--target``.
+
+Usage::
+
+    python -m training_service.benchmarks.mc_samplers --alpha 0.99 --target 0.01
+    python -m training_service.benchmarks.mc_samplers --alpha 0.999 --min-log2 12
+
+At α = 0.999 and beyond, the importance sampler typically reaches the target
+with about two orders of magnitude fewer paths than the plain samplers.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from scipy.stats import norm
+
+from ..models.montecarlo import SAMPLERS, MonteCarloParams, _estimate_gbm_params, run_monte_carlo
+
+
+def analytic_var_cvar(mu: float, sigma: float, alpha: float, horizon_days: int) -> tuple[float, float]:
+    """Exact VaR/CVaR of a GBM horizon return (positive loss numbers)."""
+    m = (mu - 0.5 * sigma ** 2) * horizon_days
+    s = sigma * np.sqrt(horizon_days)
+    z_q = norm.ppf(1.0 - alpha)
+    var = 1.0 - np.exp(m + s * z_q)
+    cvar = 1.0 - np.exp(m + 0.5 * s ** 2) * norm.cdf(z_q - s) / (1.0 - alpha)
+    return float(var), float(cvar)
+
+
+def run_benchmark(
+    alpha: float = 0.99,
+    horizon_days: int = 1,
+    target: float = 0.01,
+    replicates: int = 20,
+    min_log2: int = 10,
+    max_log2: int = 18,
+) -> dict[str, dict]:
+    """Measure VaR error against the analytic value for every sampler.
+
+    Returns:
+        {sampler: {"rows": [(n, var_rel_rmse, cvar_rel_rmse, mean_var_se_rel, seconds)],
+                   "paths_to_target": Optional[int]}}
+    """
+    # Synthetic daily returns with a realistic equity vol (~20 % annualised)
+    returns = np.random.default_rng(0).normal(0.0003, 0.0125, size=750)
+    mu, sigma = _estimate_gbm_params(returns)
+    var_true, cvar_true = analytic_var_cvar(mu, sigma, alpha, horizon_days)
+
+    out: dict[str, dict] = {}
+    for sampler in SAMPLERS:
+        rows = []
+        paths_to_target = None
+        for k in range(min_log2, max_log2 + 1):
+            n = 1 << k
+            var_err, cvar_err, var_se = [], [], []
+            t0 = time.perf_counter()
+            for seed in range(replicates):
+                res = run_monte_carlo(
+                    returns,
+                    alpha=alpha,
+                    horizon_days=horizon_days,
+                    mc_params=MonteCarloParams(n_simulations=n, seed=seed, sampler=sampler),
+                )
+                var_err.append(res.var / var_true - 1.0)
+                cvar_err.append(res.cvar / cvar_true - 1.0)
+                var_se.append(res.var_se / var_true)
+            elapsed = (time.perf_counter() - t0) / replicates
+
+            var_rmse = float(np.sqrt(np.mean(np.square(var_err))))
+            cvar_rmse = float(np.sqrt(np.mean(np.square(cvar_err))))
+            rows.append((n, var_rmse, cvar_rmse, float(np.mean(var_se)), elapsed))
+            if paths_to_target is None and var_rmse <= target:
+                paths_to_target = n
+        out[sampler] = {"rows": rows, "paths_to_target": paths_to_target}
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alpha", type=float, default=0.99)
+    parser.add_argument("--horizon-days", type=int, default=1)
+    parser.add_argument("--target", type=float, default=0.01, help="target relative RMSE of VaR")
+    parser.add_argument("--replicates", type=int, default=20)
+    parser.add_argument("--min-log2", type=int, default=10)
+    parser.add_argument("--max-log2", type=int, default=18)
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        alpha=args.alpha,
+        horizon_days=args.horizon_days,
+        target=args.target,
+        replicates=args.replicates,
+        min_log2=args.min_log2,
+        max_log2=args.max_log2,
+    )
+
+    for sampler, res in results.items():
+        print(f"\n== {sampler} ==")
+        print(f"{'paths':>9}  {'VaR rRMSE':>10}  {'CVaR rRMSE':>10}  {'mean SE/VaR':>11}  {'sec/run':>8}")
+        for n, var_rmse, cvar_rmse, se_rel, secs in res["rows"]:
+            print(f"{n:>9}  {var_rmse:>10.4%}  {cvar_rmse:>10.4%}  {se_rel:>11.4%}  {secs:>8.4f}")
+
+    print(f"\nPaths to reach VaR relative RMSE <= {args.target:.2%} (alpha={args.alpha}):")
+    for sampler, res in results.items():
+        n = res["paths_to_target"]
+        print(f"  {sampler:<11} {n if n is not None else f'> {1 << args.max_log2}'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Diagnostic plots on the training path: inline PNG rendering vs summary only.
+
+For each diagnostic plot (GARCH 2×2 diagnostics, Monte Carlo distribution,
+backtest) measures what the training run pays in each plot mode — rendering
+the PNG inline vs building the downsampled summary that deferred / on-demand
+modes log instead — and the size of that summary as JSON next to the raw
+arrays it replaces. Rendering from the summary is what the background worker
+(or the on-demand endpoint) pays later.
+
+Usage::
+
+    python -m training_service.benchmarks.plot_summaries --sims 100000 --obs 1000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from ..backtesting.report import backtest_plot_summary, plot_backtest, render_backtest
+from ..backtesting.rolling_backtest import run_rolling_backtest
+from ..models.garch import GARCHParams, garch_plot_summary, plot_garch_diagnostics, render_garch_diagnostics, train_garch
+from ..models.montecarlo import (
+    MonteCarloParams,
+    monte_carlo_plot_summary,
+    plot_monte_carlo_distribution,
+    render_monte_carlo_distribution,
+    run_monte_carlo,
+)
+from .garch_rolling import simulate_garch_returns
+
+
+def _timed(fn, *args) -> tuple[object, float]:
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def run_benchmark(n_simulations: int = 100_000, n_obs: int = 1_000, test_days: int = 250) -> dict:
+    """Returns {plot: {"inline_s", "summary_s", "render_s", "summary_kb", "raw_kb"}}."""
+    returns = simulate_garch_returns(n_obs + test_days)
+    garch = train_garch(returns[-n_obs:], garch_params=GARCHParams(p=1, q=1, dist="normal", mean="Zero"))
+    mc = run_monte_carlo(returns[-n_obs:], mc_params=MonteCarloParams(n_simulations=n_simulations, keep_samples=True))
+    bt = run_rolling_backtest(returns, "historical", lookback_days=n_obs, test_days=test_days)
+
+    cases = {
+        "garch_diagnostics": (plot_garch_diagnostics, garch_plot_summary, render_garch_diagnostics, garch,
+                              3 * n_obs),
+        "mc_distribution": (plot_monte_carlo_distribution, monte_carlo_plot_summary,
+                            render_monte_carlo_distribution, mc, n_simulations),
+        "backtest": (plot_backtest, backtest_plot_summary, render_backtest, bt, 3 * test_days),
+    }
+    out = {}
+    for name, (plot, summarise, render, result, raw_values) in cases.items():
+        _, inline_s = _timed(plot, result, "bench")
+        summary, summary_s = _timed(summarise, result, "bench")
+        _, render_s = _timed(render, summary)
+        out[name] = {
+            "inline_s": inline_s,
+            "summary_s": summary_s,
+            "render_s": render_s,
+            "summary_kb": len(json.dumps(summary)) / 1024,
+            "raw_kb": raw_values * 8 / 1024,
+        }
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sims", type=int, default=100_000)
+    parser.add_argument("--obs", type=int, default=1_000)
+    parser.add_argument("--test-days", type=int, default=250)
+    args = parser.parse_args()
+
+    res = run_benchmark(args.sims, args.obs, args.test_days)
+    print(f"\nDiagnostic plots  sims={args.sims}  obs={args.obs}  test_days={args.test_days}")
+    print(f"  {'plot':<18} {'inline':>9} {'summary':>9} {'render':>9} {'summary KB':>11} {'raw KB':>9}")
+    for name, r in res.items():
+        print(f"  {name:<18} {r['inline_s']:>8.3f}s {r['summary_s']:>8.3f}s {r['render_s']:>8.3f}s "
+              f"{r['summary_kb']:>11.1f} {r['raw_kb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
+from typing import Optional
 
 from pydantic_settings import BaseSettings
 
@@ -33,6 +34,29 @@ class Settings(BaseSettings):
     default_alpha: float = 0.99
     default_horizon_days: int = 1
     monte_carlo_simulations: int = 10_000
+    monte_carlo_sampler: str = "pseudo"    # pseudo | antithetic | sobol | importance
+    monte_carlo_workers: int = 1           # threads per simulation (results depend on this value)
+    # Adaptive MC: when set, monte_carlo_simulations is the pilot size and paths are
+    # added until max(SE/VaR, SE/CVaR) <= target or the budget is reached
+    monte_carlo_target_rel_error: Optional[float] = None
+    monte_carlo_max_simulations: int = 1_000_000
+    monte_carlo_dtype: str = "float64"     # float64 | float32 (simulation precision)
+    # Rolling GARCH backtests re-estimate every N days and filter the variance in between
+    garch_refit_every: int = 1
+    # Also log the pickled ARCHModelResult next to model/garch_params.json (debugging only)
+    garch_pickle_artifact: bool = False
+    # Rolling backtests: worker processes, each running a contiguous block of days (1 = in-process)
+    backtest_workers: int = 1
+    # Universe training: per-symbol GARCH fits across a process pool
+    universe_max_workers: int = 4
+    universe_task_timeout_s: float = 60.0  # per-symbol fit budget; timed-out symbols keep their previous row
+    universe_min_obs: int = 120            # symbols with fewer returns in the lookback are skipped
+    # GARCH spec tournament (TrainRequest.garch_tournament): worker processes and per-fit budget
+    garch_tournament_workers: int = 4
+    garch_tournament_timeout_s: float = 30.0
+    # Diagnostic plots: off | inline (rendered in the training run) | deferred (summaries logged,
+    # PNGs rendered in the background after registration) | on_demand (POST /train/run/{id}/plots)
+    diagnostic_plots: str = "deferred"
 
     # Downstream service URLs
     market_data_service_url: str = "http://market-data-service:8083"
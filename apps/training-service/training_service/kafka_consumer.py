@@ -100,6 +100,8 @@ def _handle_market_data_ingested(event: dict, executor: ThreadPoolExecutor) -> N
         horizon_days=cfg.default_horizon_days,
         lookback_days=cfg.default_lookback_days,
         n_simulations=cfg.monte_carlo_simulations,
+        mc_sampler=cfg.monte_carlo_sampler,
+        mc_target_rel_error=cfg.monte_carlo_target_rel_error,
     )
 
     logger.info(
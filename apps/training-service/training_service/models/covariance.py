@@ -0,0 +1,232 @@
+"""Covariance / Cholesky cache for multi-asset Monte Carlo.
+
+Multi-asset simulation needs the window mean vector and the Cholesky factor
+of the window covariance. Estimating them from scratch costs O(T·N²) for the
+covariance plus O(N³) for the factorisation; a rolling backtest pays that on
+every step although consecutive windows share all but one row.
+
+Incremental window sums
+-----------------------
+For each (symbol set, lookback) the cache keeps the sums of the current
+window, shifted by a fixed reference row c to avoid cancellation:
+
+    S₁ = Σ (xₜ − c)          S₂ = Σ (xₜ − c)(xₜ − c)ᵀ
+    mean = c + S₁/n          cov = (S₂ − S₁S₁ᵀ/n) / (n − 1)
+
+Sliding the window by one day is a rank-1 add of the new row and a rank-1
+drop of the oldest one, O(N²). The sums are rebuilt from scratch every
+``resync_every`` slides (and whenever the window jumps or the dropped row
+does not match the stored data) so rounding error cannot accumulate.
+
+Factor cache and PD repair
+--------------------------
+Finished factors are stored in an LRU keyed by
+(symbol set, window end, lookback). A covariance that is not numerically
+positive definite — collinear or nearly constant series, fewer observations
+than assets — (failed factorisation, or a pivot below the floor) is repaired by clipping
+its eigenvalues at ``eig_floor × mean eigenvalue`` and rebuilding it, instead of adding an
+arbitrary ridge; ``CovarianceFactors.repaired`` records that it happened.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Relative eigenvalue floor used by the PD repair
+_EIG_FLOOR = 1e-10
+
+
+@dataclass(frozen=True)
+class CovarianceFactors:
+    """Window moments and the Cholesky factor of their covariance."""
+    mean: np.ndarray        # (N,) window mean of the returns
+    cov: np.ndarray         # (N × N) sample covariance (ddof=1), PD-repaired if needed
+    chol: np.ndarray        # (N × N) lower-triangular factor, chol @ chol.T == cov
+    n_obs: int
+    repaired: bool = False
+
+
+# ---------------------------------------------------------------------------
+# PD repair / factorisation
+# ---------------------------------------------------------------------------
+
+def repair_pd(cov: np.ndarray, eig_floor: float = _EIG_FLOOR) -> tuple[np.ndarray, bool]:
+    """Return a positive-definite version of *cov* and whether it was changed.
+
+    Symmetrises *cov*, then clips its eigenvalues at
+    ``eig_floor × max(mean eigenvalue, tiny)`` if any fall below it.
+    """
+    cov = 0.5 * (cov + cov.T)
+    eigvals, eigvecs = np.linalg.eigh(cov)
+    floor = eig_floor * max(float(np.mean(np.abs(eigvals))), np.finfo(float).tiny)
+    if eigvals.min() >= floor:
+        return cov, False
+    clipped = np.maximum(eigvals, floor)
+    repaired = (eigvecs * clipped) @ eigvecs.T
+    return 0.5 * (repaired + repaired.T), True
+
+
+def cholesky_factor(cov: np.ndarray) -> tuple[np.ndarray, np.ndarray, bool]:
+    """Cholesky-factorise *cov*, repairing it first if it is not PD.
+
+    Returns:
+        (chol, cov_used, repaired)
+    """
+    cov = np.atleast_2d(np.asarray(cov, dtype=float))
+    try:
+        chol = np.linalg.cholesky(cov)
+        # Pivots L_ii² bound the smallest eigenvalue from above: a tiny pivot
+        # means the factorisation only succeeded through rounding
+        floor = _EIG_FLOOR * max(float(np.trace(cov)) / cov.shape[0], np.finfo(float).tiny)
+        if np.min(np.diag(chol)) ** 2 >= floor:
+            return chol, cov, False
+    except np.linalg.LinAlgError:
+        pass
+    fixed, _ = repair_pd(cov)
+    logger.debug("Covariance not positive definite (N=%d) — eigenvalues clipped", cov.shape[0])
+    return np.linalg.cholesky(fixed), fixed, True
+
+
+def estimate_factors(returns: np.ndarray) -> CovarianceFactors:
+    """Compute CovarianceFactors of a (T × N) returns window from scratch."""
+    returns = np.asarray(returns, dtype=float)
+    cov = np.atleast_2d(np.cov(returns.T, ddof=1))
+    chol, cov, repaired = cholesky_factor(cov)
+    return CovarianceFactors(
+        mean=returns.mean(axis=0),
+        cov=cov,
+        chol=chol,
+        n_obs=returns.shape[0],
+        repaired=repaired,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Rolling window sums
+# ---------------------------------------------------------------------------
+
+class _WindowSums:
+    """Shifted first/second moment sums of one sliding window."""
+
+    def __init__(self, window: np.ndarray, window_end: int) -> None:
+        self.reset(window, window_end)
+
+    def reset(self, window: np.ndarray, window_end: int) -> None:
+        self.shift = window[0].copy()
+        centred = window - self.shift
+        self.s1 = centred.sum(axis=0)
+        self.s2 = centred.T @ centred
+        self.n = window.shape[0]
+        self.window_end = window_end
+        self.first_row = window[0].copy()
+        self.slides = 0
+
+    def slide(self, new_row: np.ndarray, old_row: np.ndarray, next_first_row: np.ndarray) -> None:
+        """Add *new_row*, drop *old_row* (rank-1 each) and advance the window end."""
+        add = new_row - self.shift
+        drop = old_row - self.shift
+        self.s1 += add - drop
+        self.s2 += np.outer(add, add) - np.outer(drop, drop)
+        self.window_end += 1
+        self.first_row = next_first_row.copy()
+        self.slides += 1
+
+    def moments(self) -> tuple[np.ndarray, np.ndarray]:
+        mean = self.shift + self.s1 / self.n
+        cov = (self.s2 - np.outer(self.s1, self.s1) / self.n) / (self.n - 1)
+        return mean, cov
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+class CovarianceCache:
+    """LRU of Cholesky factors keyed by (symbol set, window end, lookback).
+
+    Args:
+        max_entries:  Number of factor sets kept before the least recently
+                      used one is evicted.
+        resync_every: Rebuild the window sums from scratch after this many
+                      incremental slides.
+    """
+
+    def __init__(self, max_entries: int = 64, resync_every: int = 250) -> None:
+        self.max_entries = max_entries
+        self.resync_every = resync_every
+        self._factors: OrderedDict[tuple, CovarianceFactors] = OrderedDict()
+        self._sums: dict[tuple, _WindowSums] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.incremental_updates = 0
+
+    def get(
+        self,
+        returns: np.ndarray,
+        window_end: int,
+        lookback: int,
+        symbols: Optional[Sequence[Hashable]] = None,
+    ) -> CovarianceFactors:
+        """Factors of the window ``returns[window_end - lookback : window_end]``.
+
+        Args:
+            returns:    (T × N) returns matrix in chronological order.
+            window_end: Exclusive end index of the window within *returns*.
+            lookback:   Window length in rows.
+            symbols:    Column identifiers; defaults to the column indices.
+                        Windows of different matrices must use different
+                        symbol sets (or different caches).
+
+        Returns:
+            CovarianceFactors of the window.
+        """
+        if not 2 <= lookback <= window_end <= returns.shape[0]:
+            raise ValueError(
+                f"Invalid window: end={window_end} lookback={lookback} rows={returns.shape[0]}"
+            )
+        sym_key = tuple(symbols) if symbols is not None else tuple(range(returns.shape[1]))
+        key = (sym_key, window_end, lookback)
+
+        with self._lock:
+            cached = self._factors.get(key)
+            if cached is not None:
+                self._factors.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+            start = window_end - lookback
+            sums = self._sums.get((sym_key, lookback))
+            if (
+                sums is not None
+                and sums.window_end == window_end - 1
+                and sums.slides < self.resync_every
+                and np.array_equal(sums.first_row, returns[start - 1])
+            ):
+                sums.slide(returns[window_end - 1], returns[start - 1], returns[start])
+                self.incremental_updates += 1
+            else:
+                sums = _WindowSums(np.asarray(returns[start:window_end], dtype=float), window_end)
+                self._sums[(sym_key, lookback)] = sums
+
+            mean, cov = sums.moments()
+            chol, cov, repaired = cholesky_factor(cov)
+            factors = CovarianceFactors(mean=mean, cov=cov, chol=chol, n_obs=lookback, repaired=repaired)
+
+            self._factors[key] = factors
+            while len(self._factors) > self.max_entries:
+                self._factors.popitem(last=False)
+            return factors
+
+    def clear(self) -> None:
+        with self._lock:
+            self._factors.clear()
+            self._sums.clear()
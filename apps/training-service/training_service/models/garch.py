@@ -7,13 +7,48 @@ Distribution support:
   - normal  : standard Normal innovations (fast, underestimates fat tails)
   - t       : Student-t innovations (captures fat tails; uses fitted df)
   - skewt   : Skewed Student-t innovations (asymmetric fat tails)
+
+Rolling refits
+--------------
+``WarmStartGarch`` builds the arch model once over the whole series and fits
+each window through ``first_obs`` / ``last_obs``, starting the optimiser from
+the previous window's parameters. A warm fit that ends on a parameter bound
+is re-run cold and the fit with the higher log-likelihood is kept.
+
+Engines
+-------
+``engine="arch"`` (default) fits through the arch library. ``engine="native"``
+uses the batched estimator in ``garch_batch`` (GARCH(1,1), zero mean, Normal
+or Student-t). ``rolling_var_native`` fits every refit window of a rolling
+backtest in one batch. Native results are ``NativeGarchFit`` objects rather
+than ``ARCHModelResult``s, so they are not meant to be pickled for the
+inference service.
+
+Between refits, ``WarmStartGarch.filtered_window`` keeps the last fitted
+parameters and advances the conditional variance over the new returns:
+
+    σ²ₜ₊₁ = ω + Σ αᵢ ε²ₜ₊₁₋ᵢ + Σ βⱼ σ²ₜ₊₁₋ⱼ
+
+arch already evaluates this recursion past ``last_obs`` when the refit's
+forecast is produced, so each filtered day is an O(1) lookup.
+
+Artifact
+--------
+``compact_artifact`` reduces a fit to what forecasting needs — the
+specification, parameters in decimal units, and the last p residuals and q
+conditional variances — as a small JSON document (``COMPACT_ARTIFACT``). The
+Inference Service rebuilds forecasts from it with the variance recursion
+above, without importing arch or unpickling an ``ARCHModelResult``.
 """
 from __future__ import annotations
 
-import io
 import logging
+import signal
+import warnings
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional
+from datetime import date
+from typing import Iterator, Optional
 
 import matplotlib
 matplotlib.use("Agg")  # non-interactive backend before pyplot import
@@ -21,12 +56,23 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from arch import arch_model
-from arch.univariate.base import ARCHModelResult
+from arch.univariate.base import ARCHModel, ARCHModelResult
+from arch.utility.exceptions import StartingValueWarning
 from scipy import stats
 
+from ..plotting import PLOT_MAX_POINTS, downsample_series, fig_to_png, histogram_summary, summary_floats
+from .garch_batch import NativeGarchFit, filter_variance, fit_garch_batch
+
 logger = logging.getLogger(__name__)
 
 
+ENGINES = ("arch", "native")
+
+# Distance from a parameter constraint at which a warm-started fit is
+# treated as "on the bound" and re-checked with a cold fit
+_BOUND_TOL = 1e-4
+
+
 @dataclass
 class GARCHParams:
     """Hyper-parameters for GARCH fitting."""
@@ -57,8 +103,8 @@ def _var_cvar_from_dist(
         - Normal: uses standard Normal quantile.
         - Student-t: uses fitted degrees-of-freedom from the arch result.
           Degrees of freedom are stored in fit_result.params under the key 'nu'.
-        - Skewed Student-t: uses fitted nu and lambda (skewness) parameters.
-          Falls back to Student-t if lambda is not available.
+        - Skewed Student-t: uses fitted degrees of freedom and lambda (skewness).
+          arch names the degrees of freedom 'eta' for this distribution.
         - CVaR = E[loss | loss > VaR] computed analytically for Normal/t,
           and numerically (from the fitted distribution) for skewt.
     """
@@ -98,8 +144,8 @@ def _var_cvar_from_dist(
 
     elif dist == "skewt":
         # Skewed Student-t: use numerical CVaR from the fitted distribution
-        # arch stores skewness parameter as 'lambda' (η in some notations)
-        nu = float(fit_result.params.get("nu", 0.0))
+        # arch's SkewStudent parameters are 'eta' (degrees of freedom) and 'lambda'
+        nu = float(fit_result.params.get("eta", fit_result.params.get("nu", 0.0)))
         lam = float(fit_result.params.get("lambda", 0.0))
 
         if nu < 2.1:
@@ -150,8 +196,8 @@ def _var_cvar_from_dist(
 @dataclass
 class GARCHResult:
     """Output of a GARCH training run."""
-    # Fitted model result (arch library object)
-    fit_result: ARCHModelResult
+    # Fitted model result (arch library object; NativeGarchFit for engine="native")
+    fit_result: ARCHModelResult | NativeGarchFit
 
     # Risk metrics
     var: float          # Value-at-Risk (positive number, loss)
@@ -174,47 +220,74 @@ class GARCHResult:
         return self.metrics
 
 
-def train_garch(
-    returns: np.ndarray,
-    alpha: float = 0.99,
-    horizon_days: int = 1,
-    garch_params: Optional[GARCHParams] = None,
-) -> GARCHResult:
-    """Fit GARCH(p,q) on *returns* and compute VaR/CVaR.
+class FitTimeout(TimeoutError):
+    """Raised inside a fit that overran ``fit_time_limit``."""
 
-    Args:
-        returns: 1-D array of daily portfolio returns (e.g. -0.02 = -2%).
-        alpha: Confidence level for VaR (e.g. 0.99).
-        horizon_days: Forecast horizon in trading days.
-        garch_params: Model hyper-parameters; defaults to GARCH(1,1) with Normal innovations.
 
-    Returns:
-        GARCHResult with fitted model and risk metrics.
-    """
-    if garch_params is None:
-        garch_params = GARCHParams()
+def _raise_fit_timeout(signum, frame) -> None:
+    raise FitTimeout()
 
-    if len(returns) < 30:
-        raise ValueError(f"Need at least 30 return observations, got {len(returns)}")
-
-    # arch expects returns scaled to percentage points for numerical stability
-    scaled = returns * 100.0
-
-    am = arch_model(
-        scaled,
-        mean=garch_params.mean,
-        vol="GARCH",
-        p=garch_params.p,
-        q=garch_params.q,
-        dist=garch_params.dist,
-    )
 
-    res = am.fit(disp="off", show_warning=False)
-    logger.info("GARCH fit: AIC=%.4f  BIC=%.4f  LL=%.4f", res.aic, res.bic, res.loglikelihood)
+@contextmanager
+def fit_time_limit(seconds: Optional[float]) -> Iterator[None]:
+    """Raise ``FitTimeout`` if the enclosed block runs longer than *seconds*.
 
-    # 1-step-ahead conditional volatility forecast (in percentage points)
-    forecast = res.forecast(horizon=horizon_days, reindex=False)
-    cond_var_pct = float(forecast.variance.iloc[-1, horizon_days - 1])
+    Implemented with a SIGALRM interval timer, so it only works in a process's
+    main thread — e.g. inside process-pool workers, where a timed-out fit
+    frees the worker for the next task. ``None`` disables the limit.
+    """
+    if seconds is None:
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_fit_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _fit(
+    am: ARCHModel,
+    starting_values: Optional[np.ndarray] = None,
+    first_obs: Optional[int] = None,
+    last_obs: Optional[int] = None,
+) -> ARCHModelResult:
+    """Run the arch optimiser, optionally warm-started.
+
+    Starting values that violate the stationarity constraints (e.g. a previous
+    fit with α + β ≈ 1) are dropped by arch in favour of its own grid; the
+    warning it emits for that is silenced here.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", StartingValueWarning)
+        return am.fit(
+            disp="off",
+            show_warning=False,
+            starting_values=starting_values,
+            first_obs=first_obs,
+            last_obs=last_obs,
+        )
+
+
+def _check_native(garch_params: GARCHParams) -> None:
+    if (garch_params.p, garch_params.q, garch_params.mean) != (1, 1, "Zero") or garch_params.dist not in ("normal", "t"):
+        raise ValueError(
+            "engine='native' supports GARCH(1,1) with mean='Zero' and dist 'normal' or 't', "
+            f"got p={garch_params.p} q={garch_params.q} mean={garch_params.mean!r} dist={garch_params.dist!r}"
+        )
+
+
+def _build_result(
+    res: ARCHModelResult | NativeGarchFit,
+    cond_var_pct: float,
+    garch_params: GARCHParams,
+    alpha: float,
+    horizon_days: int,
+    n_observations: int,
+) -> GARCHResult:
+    """Derive VaR/CVaR, params and metrics from a fit and its variance forecast."""
     cond_vol_pct = np.sqrt(cond_var_pct)
 
     # Convert back to decimal
@@ -240,7 +313,7 @@ def train_garch(
         "mean": garch_params.mean,
         "alpha": alpha,
         "horizon_days": horizon_days,
-        "n_observations": len(returns),
+        "n_observations": n_observations,
     }
     metrics = {
         "var": var,
@@ -267,18 +340,339 @@ def train_garch(
     )
 
 
-def plot_garch_diagnostics(result: GARCHResult, symbol: str = "portfolio") -> bytes:
-    """Generate a 2×2 diagnostic plot and return PNG bytes for MLflow artifact logging."""
+def train_garch(
+    returns: np.ndarray,
+    alpha: float = 0.99,
+    horizon_days: int = 1,
+    garch_params: Optional[GARCHParams] = None,
+    starting_values: Optional[np.ndarray] = None,
+    engine: str = "arch",
+) -> GARCHResult:
+    """Fit GARCH(p,q) on *returns* and compute VaR/CVaR.
+
+    Args:
+        returns: 1-D array of daily portfolio returns (e.g. -0.02 = -2%).
+        alpha: Confidence level for VaR (e.g. 0.99).
+        horizon_days: Forecast horizon in trading days.
+        garch_params: Model hyper-parameters; defaults to GARCH(1,1) with Normal innovations.
+        starting_values: Optional optimiser starting point in arch's parameter
+            order (e.g. ``previous.fit_result.params.values``); arch engine only.
+        engine: "arch" | "native" (see module docstring).
+
+    Returns:
+        GARCHResult with fitted model and risk metrics.
+    """
+    if garch_params is None:
+        garch_params = GARCHParams()
+
+    if len(returns) < 30:
+        raise ValueError(f"Need at least 30 return observations, got {len(returns)}")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown GARCH engine {engine!r}; expected one of {ENGINES}")
+
+    # arch expects returns scaled to percentage points for numerical stability
+    scaled = returns * 100.0
+
+    if engine == "native":
+        _check_native(garch_params)
+        batch = fit_garch_batch(returns, dist=garch_params.dist)
+        res = batch.series(0, scaled)
+        logger.info("GARCH fit (native): AIC=%.4f  BIC=%.4f  LL=%.4f", res.aic, res.bic, res.loglikelihood)
+        cond_var_pct = float(batch.forecast_variance(horizon_days)[0])
+        return _build_result(res, cond_var_pct, garch_params, alpha, horizon_days, len(returns))
+
+    am = arch_model(
+        scaled,
+        mean=garch_params.mean,
+        vol="GARCH",
+        p=garch_params.p,
+        q=garch_params.q,
+        dist=garch_params.dist,
+    )
+
+    res = _fit(am, starting_values)
+    logger.info("GARCH fit: AIC=%.4f  BIC=%.4f  LL=%.4f", res.aic, res.bic, res.loglikelihood)
+
+    # 1-step-ahead conditional volatility forecast (in percentage points)
+    forecast = res.forecast(horizon=horizon_days, reindex=False)
+    cond_var_pct = float(forecast.variance.iloc[-1, horizon_days - 1])
+
+    return _build_result(res, cond_var_pct, garch_params, alpha, horizon_days, len(returns))
+
+
+class WarmStartGarch:
+    """Warm-started GARCH refits over windows of a single series.
+
+    Args:
+        returns:      Full 1-D array of daily returns (chronological).
+        garch_params: Model hyper-parameters; defaults to GARCH(1,1) Normal.
+
+    Attributes:
+        fits:        Number of completed window fits.
+        warm_fits:   How many of them were started from a previous fit.
+        cold_checks: Warm fits that ended on a bound and were re-run cold.
+        cold_wins:   How many of those cold fits had the higher likelihood.
+    """
+
+    def __init__(self, returns: np.ndarray, garch_params: Optional[GARCHParams] = None) -> None:
+        self.garch_params = garch_params or GARCHParams()
+        self.n_obs = len(returns)
+        self._model = arch_model(
+            np.asarray(returns, dtype=float) * 100.0,
+            mean=self.garch_params.mean,
+            vol="GARCH",
+            p=self.garch_params.p,
+            q=self.garch_params.q,
+            dist=self.garch_params.dist,
+        )
+        self._last_params: Optional[np.ndarray] = None
+        # Last successful fit and its forecasts from the window end onwards
+        self._last_fit: Optional[ARCHModelResult] = None
+        self._fit_end = 0
+        self._fit_n_obs = 0
+        self._fit_variance: Optional[np.ndarray] = None
+        self.fits = 0
+        self.warm_fits = 0
+        self.cold_checks = 0
+        self.cold_wins = 0
+
+    def fit_window(
+        self,
+        start: int,
+        end: int,
+        alpha: float = 0.99,
+        horizon_days: int = 1,
+    ) -> GARCHResult:
+        """Fit ``returns[start:end]`` and forecast from its last observation.
+
+        Equivalent to ``train_garch(returns[start:end], ...)`` up to optimiser
+        tolerance: a warm fit that ends on a parameter bound is re-run cold and
+        the higher log-likelihood is kept. A failed fit clears the warm start
+        so the next window begins from arch's defaults.
+        """
+        if end - start < 30:
+            raise ValueError(f"Need at least 30 return observations, got {end - start}")
+        warm = self._last_params is not None
+        try:
+            res = _fit(self._model, self._last_params, first_obs=start, last_obs=end)
+            if warm and self._on_bound(res):
+                # A warm start sitting on a constraint (α = 0, α + β = 1) is
+                # not left by later windows; check it against a cold fit
+                cold = _fit(self._model, None, first_obs=start, last_obs=end)
+                self.cold_checks += 1
+                if cold.loglikelihood > res.loglikelihood:
+                    res = cold
+                    self.cold_wins += 1
+        except Exception:
+            self._last_params = None
+            raise
+        self._last_params = self._next_starting_values(res)
+        self.fits += 1
+        self.warm_fits += int(warm)
+
+        # Forecasts are produced from `start` to the end of the series; the
+        # first row is the one made at the window's last observation
+        forecast = res.forecast(horizon=horizon_days, start=end - 1, reindex=False)
+        self._last_fit = res
+        self._fit_end = end
+        self._fit_n_obs = end - start
+        self._fit_variance = forecast.variance.to_numpy()
+        cond_var_pct = float(self._fit_variance[0, horizon_days - 1])
+        return _build_result(res, cond_var_pct, self.garch_params, alpha, horizon_days, end - start)
+
+    def filtered_window(
+        self,
+        end: int,
+        alpha: float = 0.99,
+        horizon_days: int = 1,
+    ) -> GARCHResult:
+        """Forecast from ``returns[end - 1]`` with the last fitted parameters.
+
+        The conditional variance is filtered through the returns observed since
+        the last ``fit_window`` call; no re-estimation takes place. *horizon_days*
+        must match that call.
+
+        Raises:
+            ValueError: If there is no earlier fit ending at or before *end*.
+        """
+        if self._last_fit is None or not self._fit_end <= end <= self.n_obs:
+            raise ValueError(f"No GARCH fit to filter forward to window end {end}")
+        if horizon_days > self._fit_variance.shape[1]:
+            raise ValueError(
+                f"horizon_days={horizon_days} exceeds the last fit's forecast horizon "
+                f"({self._fit_variance.shape[1]})"
+            )
+        cond_var_pct = float(self._fit_variance[end - self._fit_end, horizon_days - 1])
+        return _build_result(
+            self._last_fit, cond_var_pct, self.garch_params, alpha, horizon_days, self._fit_n_obs,
+        )
+
+    def _on_bound(self, res: ARCHModelResult) -> bool:
+        """True if a volatility parameter of *res* sits on its constraint.
+
+        ω, αᵢ, βⱼ ≥ 0 and Σα + Σβ < 1 (arch's stationarity constraint).
+        """
+        n_mean = self._model.num_params
+        n_vol = self._model.volatility.num_params
+        vol = np.asarray(res.params.values, dtype=float)[n_mean : n_mean + n_vol]
+        return bool(np.any(vol < _BOUND_TOL) or vol[1:].sum() > 1.0 - _BOUND_TOL)
+
+    def _next_starting_values(self, res: ARCHModelResult) -> np.ndarray:
+        """Mean/volatility parameters of *res* plus fresh shape starting values.
+
+        The likelihood is nearly flat in the Student-t degrees of freedom, so
+        carrying ν over lets it drift from window to window (e.g. to ν > 200)
+        while the log-likelihood ends up below the cold fit. Shape parameters
+        therefore restart from arch's kurtosis-based estimate every window.
+        """
+        params = np.asarray(res.params.values, dtype=float)
+        n_shape = self._model.distribution.num_params
+        if n_shape == 0:
+            return params
+        std_resid = np.asarray(res.std_resid, dtype=float)
+        shape_sv = self._model.distribution.starting_values(std_resid[np.isfinite(std_resid)])
+        return np.concatenate([params[:-n_shape], shape_sv])
+
+
+def rolling_var_native(
+    returns: np.ndarray,
+    lookback_days: int,
+    test_days: int,
+    alpha: float = 0.99,
+    horizon_days: int = 1,
+    garch_params: Optional[GARCHParams] = None,
+    refit_every: int = 1,
+) -> tuple[np.ndarray, list[int]]:
+    """Rolling GARCH VaR with every refit window fitted in one native batch.
+
+    Day i (0 ≤ i < test_days) forecasts from the window
+    ``returns[i : i + lookback_days]``. Windows with i % refit_every == 0 are
+    fitted; the other days reuse the preceding fit and filter the variance
+    forward, as in ``WarmStartGarch.filtered_window``.
+
+    Args:
+        returns: 1-D array of length ≥ lookback_days + test_days - 1; the
+                 window of day i starts at returns[i].
+
+    Returns:
+        (var (test_days,), refit day offsets)
+    """
+    garch_params = garch_params or GARCHParams()
+    _check_native(garch_params)
+    returns = np.asarray(returns, dtype=float)
+    refit_offsets = list(range(0, test_days, refit_every))
+    windows = np.lib.stride_tricks.sliding_window_view(returns, lookback_days)[refit_offsets]
+    batch = fit_garch_batch(windows, dist=garch_params.dist)
+
+    # Extend each fitted window by the days it has to cover, zero-padding past
+    # the end of the data (those forecasts are never read)
+    span = lookback_days + refit_every - 1
+    padded = np.concatenate([returns, np.zeros(span)])
+    extended = np.lib.stride_tricks.sliding_window_view(padded, span)[refit_offsets]
+    sigma2 = filter_variance(batch, extended)
+
+    omega, persistence = batch.params[:, 0], batch.params[:, 1] + batch.params[:, 2]
+    uncond = omega / (1.0 - persistence)
+    var = np.empty(test_days)
+    for j, start in enumerate(refit_offsets):
+        params = batch.series(j, windows[j] * 100.0)
+        for i in range(start, min(start + refit_every, test_days)):
+            one_step = sigma2[j, lookback_days + i - start]
+            cond_var_pct = uncond[j] + persistence[j] ** (horizon_days - 1) * (one_step - uncond[j])
+            var[i], _ = _var_cvar_from_dist(garch_params.dist, params, np.sqrt(cond_var_pct) / 100.0, alpha)
+    return var, refit_offsets
+
+
+COMPACT_ARTIFACT = "garch_params.json"
+COMPACT_FORMAT = 1
+_COMPACT_MEANS = ("Zero", "Constant")
+_SHAPE_PARAMS = ("nu", "eta", "lambda")
+
+
+def compact_artifact(
+    result: GARCHResult,
+    garch_params: GARCHParams,
+    data_end: Optional[date] = None,
+) -> dict:
+    """JSON-serialisable summary of a fit, sufficient to forecast from its last observation.
+
+    Values are in decimal units (arch fits percentage returns). ``resid`` and
+    ``sigma2`` hold the last p residuals and the last q conditional variances,
+    newest first, so that
+
+        σ²ₜ₊₁ = omega + Σ alpha[i]·resid[i]² + Σ beta[j]·sigma2[j]
+
+    Shape parameters keep arch's names: ``nu`` (t), ``eta`` and ``lambda`` (skewt).
+
+    Raises:
+        ValueError: For mean models other than Zero / Constant.
+    """
+    if garch_params.mean not in _COMPACT_MEANS:
+        raise ValueError(f"compact artifact supports mean in {_COMPACT_MEANS}, got {garch_params.mean!r}")
     res = result.fit_result
-    # std_resid may be ndarray or Series depending on arch version — normalise to Series
-    std_resid = pd.Series(np.asarray(res.std_resid).ravel())
+    params = res.params
+    p, q = garch_params.p, garch_params.q
+
+    cond_vol = np.asarray(res.conditional_volatility, dtype=float)
+    # std_resid · σ = resid; NativeGarchFit has no resid of its own
+    resid = np.asarray(res.std_resid, dtype=float) * cond_vol
+    return {
+        "format": COMPACT_FORMAT,
+        "p": p,
+        "q": q,
+        "dist": garch_params.dist,
+        "mean": garch_params.mean,
+        "omega": float(params["omega"]) / 1e4,
+        "alpha": [float(params[f"alpha[{i}]"]) for i in range(1, p + 1)],
+        "beta": [float(params[f"beta[{j}]"]) for j in range(1, q + 1)],
+        "mu": float(params.get("mu", 0.0)) / 100.0,
+        "dist_params": {k: float(params[k]) for k in _SHAPE_PARAMS if k in params.index},
+        "resid": (resid[::-1][:p] / 100.0).tolist(),
+        "sigma2": (cond_vol[::-1][:q] ** 2 / 1e4).tolist(),
+        "data_end": data_end.isoformat() if data_end is not None else None,
+        "nobs": int(len(cond_vol)),
+    }
+
+
+def garch_plot_summary(result: GARCHResult, symbol: str = "portfolio") -> dict:
+    """Downsampled data behind ``plot_garch_diagnostics`` (JSON-serialisable).
+
+    Residual and volatility series are min/max-decimated, the QQ plot keeps
+    at most ``PLOT_MAX_POINTS`` evenly spaced order statistics (including
+    both extremes) and the residual histogram is stored as 50 bin densities.
+    """
+    res = result.fit_result
+    std_resid = np.asarray(res.std_resid, dtype=float).ravel()
+    cond_vol = np.asarray(res.conditional_volatility, dtype=float).ravel() / 100.0  # back to decimal
+    clean = std_resid[~np.isnan(std_resid)]
 
+    (osm, osr), (slope, intercept, _) = stats.probplot(clean, dist="norm")
+    keep = np.unique(np.linspace(0, len(osm) - 1, min(len(osm), PLOT_MAX_POINTS)).astype(int))
+    resid_x, resid_y = downsample_series(std_resid)
+    vol_x, vol_y = downsample_series(cond_vol)
+    return {
+        "kind": "garch_diagnostics",
+        "symbol": symbol,
+        "resid": {"x": resid_x, "y": resid_y},
+        "cond_vol": {"x": vol_x, "y": vol_y},
+        "qq": {
+            "osm": summary_floats(np.asarray(osm)[keep]),
+            "osr": summary_floats(np.asarray(osr)[keep]),
+            "slope": float(slope),
+            "intercept": float(intercept),
+        },
+        "hist": histogram_summary(clean, bins=50),
+    }
+
+
+def render_garch_diagnostics(summary: dict) -> bytes:
+    """Render a ``garch_plot_summary`` as the 2×2 diagnostic PNG."""
     fig, axes = plt.subplots(2, 2, figsize=(12, 8))
-    fig.suptitle(f"GARCH(1,1) Diagnostics — {symbol}", fontsize=14)
+    fig.suptitle(f"GARCH(1,1) Diagnostics — {summary['symbol']}", fontsize=14)
 
     # 1. Standardised residuals
     ax = axes[0, 0]
-    ax.plot(std_resid.values, linewidth=0.6, color="steelblue")
+    ax.plot(summary["resid"]["x"], summary["resid"]["y"], linewidth=0.6, color="steelblue")
     ax.axhline(0, color="black", linewidth=0.8, linestyle="--")
     ax.set_title("Standardised Residuals")
     ax.set_xlabel("Observation")
@@ -286,36 +680,35 @@ def plot_garch_diagnostics(result: GARCHResult, symbol: str = "portfolio") -> by
 
     # 2. Conditional volatility
     ax = axes[0, 1]
-    cond_vol = np.asarray(res.conditional_volatility).ravel() / 100.0  # back to decimal
-    ax.plot(cond_vol, linewidth=0.8, color="darkorange")
+    ax.plot(summary["cond_vol"]["x"], summary["cond_vol"]["y"], linewidth=0.8, color="darkorange")
     ax.set_title("Conditional Volatility (daily)")
     ax.set_xlabel("Observation")
     ax.set_ylabel("Volatility")
 
     # 3. QQ-plot of standardised residuals
     ax = axes[1, 0]
-    clean = std_resid.dropna().values
-    (osm, osr), (slope, intercept, _) = stats.probplot(clean, dist="norm")
-    ax.scatter(osm, osr, s=4, color="steelblue", alpha=0.6)
-    ax.plot(osm, slope * np.array(osm) + intercept, color="red", linewidth=1)
+    qq = summary["qq"]
+    osm = np.asarray(qq["osm"])
+    ax.scatter(osm, qq["osr"], s=4, color="steelblue", alpha=0.6)
+    ax.plot(osm, qq["slope"] * osm + qq["intercept"], color="red", linewidth=1)
     ax.set_title("QQ-Plot (Normal)")
     ax.set_xlabel("Theoretical Quantiles")
     ax.set_ylabel("Sample Quantiles")
 
     # 4. Histogram of standardised residuals
     ax = axes[1, 1]
-    clean = std_resid.dropna().values
-    ax.hist(clean, bins=50, density=True, color="steelblue", alpha=0.7, edgecolor="white")
-    x = np.linspace(clean.min(), clean.max(), 200)
+    edges = np.asarray(summary["hist"]["edges"])
+    ax.stairs(summary["hist"]["density"], edges, fill=True, color="steelblue", alpha=0.7)
+    x = np.linspace(edges[0], edges[-1], 200)
     ax.plot(x, stats.norm.pdf(x), color="red", linewidth=1.5, label="N(0,1)")
     ax.set_title("Residual Distribution")
     ax.set_xlabel("Std. Residual")
     ax.set_ylabel("Density")
     ax.legend()
 
-    plt.tight_layout()
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=100)
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return fig_to_png(fig)
+
+
+def plot_garch_diagnostics(result: GARCHResult, symbol: str = "portfolio") -> bytes:
+    """Generate a 2×2 diagnostic plot and return PNG bytes for MLflow artifact logging."""
+    return render_garch_diagnostics(garch_plot_summary(result, symbol))
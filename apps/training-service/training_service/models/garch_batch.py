@@ -0,0 +1,564 @@
+"""Native GARCH(1,1) estimator vectorised across a batch of series.
+
+``train_garch`` fits one series per ``arch_model(...).fit()`` call, and most of
+that time is arch's per-call overhead (starting-value grid, model copies,
+SLSQP bookkeeping), not the likelihood itself. This module fits B series of
+equal length T at once: every likelihood evaluation is a single pass over
+time with (B,)-vector operations, so the cost of fitting hundreds of symbols
+or rolling windows is close to the cost of fitting one.
+
+Model (zero mean, returns in percentage points as in arch)
+----------------------------------------------------------
+    εₜ = σₜ zₜ,    σ²ₜ = ω + α ε²ₜ₋₁ + β σ²ₜ₋₁
+    z ~ N(0, 1)  or standardised Student-t(ν)
+
+σ²₀ and ε²₋₁ are replaced by arch's backcast (exponentially weighted mean
+of the first 75 squared returns, decay 0.94), so estimates agree with
+``arch_model(mean="Zero", vol="GARCH", p=1, q=1)`` within optimiser
+tolerance. ``benchmarks/garch_native.py`` checks this and reports the speed-up.
+
+Optimiser
+---------
+Batched BFGS ascent on the log-likelihood in an unconstrained
+parameterisation that enforces the arch bounds by construction:
+
+    ω = eᵘ⁰,   α + β = P·σ(u₁),   α / (α + β) = σ(u₂),   ν = 2.05 + 497.95·σ(u₃)
+
+with P = 1 − 10⁻⁶ and σ the logistic function. The score and the BHHH matrix
+Σ sₜsₜᵀ come from the analytic recursion for ∂σ²ₜ/∂(ω, α, β) and the chain
+rule. Each series' inverse-Hessian approximation is seeded with its inverse
+BHHH matrix. Steps are halved per series until the likelihood rises.
+Series that have converged are frozen while the rest continue.
+
+Numba
+-----
+The time recursion is the only sequential part. When numba is installed
+(``pip install riskops-training-service[jit]``) and ``use_numba`` is not False,
+a compiled kernel runs it. Otherwise small batches use one
+``scipy.signal.lfilter`` call per series (the recursion is a first-order
+linear filter in σ²), and larger batches use a Python loop over time with
+NumPy operations across the batch.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+from scipy.special import digamma, expit, gammaln, logit
+
+try:
+    from numba import njit
+except ImportError:  # optional dependency
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+DISTS = ("normal", "t")
+
+# arch-compatible backcast: EWMA of the first 75 squared residuals
+_BACKCAST_OBS = 75
+_BACKCAST_DECAY = 0.94
+
+_PERSISTENCE_MAX = 1.0 - 1e-6
+_NU_MIN = 2.05
+_NU_MAX = 500.0
+
+# Batches up to this size use the per-series lfilter recursion without numba
+_LFILTER_MAX_BATCH = 64
+
+# Stand-in for infeasible rows during likelihood evaluation
+_SAFE_PARAMS = np.array([0.1, 0.05, 0.90, 8.0])
+
+# arch's GARCH starting grid: alpha × (alpha + beta), evaluated for every series
+_START_ALPHAS = (0.01, 0.05, 0.1, 0.2)
+_START_PERSISTENCE = (0.5, 0.7, 0.9, 0.98)
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+@dataclass
+class BatchGarchResult:
+    """Fitted parameters of a batch of GARCH(1,1) models.
+
+    Variances are in percentage points² (returns × 100), as in arch.
+    """
+    dist: str
+    params: np.ndarray          # (B, k): omega, alpha, beta[, nu]
+    log_likelihood: np.ndarray  # (B,)
+    converged: np.ndarray       # (B,) bool
+    n_iter: int
+    n_obs: int
+    sigma2: np.ndarray          # (B, T + 1): in-sample variances, last column = 1-step forecast
+
+    @property
+    def param_names(self) -> list[str]:
+        names = ["omega", "alpha[1]", "beta[1]"]
+        return names + ["nu"] if self.dist == "t" else names
+
+    def forecast_variance(self, horizon_days: int = 1) -> np.ndarray:
+        """(B,) variance of the *horizon_days*-th step ahead (not cumulative).
+
+        σ²ₜ₊ₕ = σ̄² + (α + β)ʰ⁻¹ (σ²ₜ₊₁ − σ̄²),  σ̄² = ω / (1 − α − β)
+        """
+        omega, alpha, beta = self.params[:, 0], self.params[:, 1], self.params[:, 2]
+        persistence = alpha + beta
+        uncond = omega / (1.0 - persistence)
+        return uncond + persistence ** (horizon_days - 1) * (self.sigma2[:, -1] - uncond)
+
+    def series(self, i: int, returns_pct: np.ndarray) -> "NativeGarchFit":
+        """Per-series view with the ARCHModelResult attributes train_garch uses."""
+        return NativeGarchFit(
+            params=pd.Series(self.params[i], index=self.param_names),
+            loglikelihood=float(self.log_likelihood[i]),
+            nobs=self.n_obs,
+            converged=bool(self.converged[i]),
+            conditional_volatility=np.sqrt(self.sigma2[i, :-1]),
+            std_resid=returns_pct / np.sqrt(self.sigma2[i, :-1]),
+            _forecast_var=self.forecast_variance,
+            _index=i,
+        )
+
+
+@dataclass
+class NativeGarchFit:
+    """Single-series fit exposing the subset of ``ARCHModelResult`` used here.
+
+    Supports ``params``, ``loglikelihood``, ``aic``, ``bic``, ``std_resid``,
+    ``conditional_volatility`` and ``forecast(horizon, reindex=False)``, so
+    ``_var_cvar_from_dist`` and ``plot_garch_diagnostics`` accept it.
+    """
+    params: pd.Series
+    loglikelihood: float
+    nobs: int
+    converged: bool
+    conditional_volatility: np.ndarray
+    std_resid: np.ndarray
+    _forecast_var: object = None
+    _index: int = 0
+
+    @property
+    def aic(self) -> float:
+        return -2.0 * self.loglikelihood + 2.0 * len(self.params)
+
+    @property
+    def bic(self) -> float:
+        return -2.0 * self.loglikelihood + np.log(self.nobs) * len(self.params)
+
+    def forecast(self, horizon: int = 1, reindex: bool = False) -> SimpleNamespace:
+        """Analytic forecast from the last observation, shaped like arch's."""
+        variance = [float(self._forecast_var(h)[self._index]) for h in range(1, horizon + 1)]
+        columns = [f"h.{h}" for h in range(1, horizon + 1)]
+        return SimpleNamespace(variance=pd.DataFrame([variance], columns=columns))
+
+
+# ---------------------------------------------------------------------------
+# Variance recursion
+# ---------------------------------------------------------------------------
+
+def _backcast(eps2: np.ndarray) -> np.ndarray:
+    """(B,) arch-style backcast of the initial variance."""
+    tau = min(_BACKCAST_OBS, eps2.shape[1])
+    w = _BACKCAST_DECAY ** np.arange(tau)
+    return eps2[:, :tau] @ (w / w.sum())
+
+
+def _recursion_numpy(
+    omega: np.ndarray,
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    eps2: np.ndarray,
+    bc: np.ndarray,
+    with_grad: bool,
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    b, t_obs = eps2.shape
+    sigma2 = np.empty((b, t_obs + 1))
+    d_sigma2 = np.empty((b, t_obs + 1, 3)) if with_grad else None
+    prev_e2, prev_s2 = bc, bc
+    d_prev = np.zeros((b, 3))
+    for t in range(t_obs + 1):
+        s2 = omega + alpha * prev_e2 + beta * prev_s2
+        sigma2[:, t] = s2
+        if with_grad:
+            # ∂σ²ₜ/∂(ω, α, β) = (1, ε²ₜ₋₁, σ²ₜ₋₁) + β ∂σ²ₜ₋₁/∂(ω, α, β)
+            d = beta[:, None] * d_prev
+            d[:, 0] += 1.0
+            d[:, 1] += prev_e2
+            d[:, 2] += prev_s2
+            d_sigma2[:, t] = d
+            d_prev = d
+        if t < t_obs:
+            prev_e2, prev_s2 = eps2[:, t], s2
+    return sigma2, d_sigma2
+
+
+def _recursion_lfilter(
+    omega: np.ndarray,
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    eps2: np.ndarray,
+    bc: np.ndarray,
+    with_grad: bool,
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    b, t_obs = eps2.shape
+    sigma2 = np.empty((b, t_obs + 1))
+    d_sigma2 = np.empty((b, t_obs + 1, 3)) if with_grad else None
+    lagged = np.empty(t_obs + 1)
+    for i in range(b):
+        # σ²ₜ − β σ²ₜ₋₁ = ω + α ε²ₜ₋₁, with ε²₋₁ = σ²₋₁ = backcast
+        den = np.array([1.0, -beta[i]])
+        lagged[0] = bc[i]
+        lagged[1:] = eps2[i]
+        sigma2[i], _ = lfilter([1.0], den, omega[i] + alpha[i] * lagged, zi=[beta[i] * bc[i]])
+        if with_grad:
+            d_sigma2[i, :, 0] = lfilter([1.0], den, np.ones(t_obs + 1))
+            d_sigma2[i, :, 1] = lfilter([1.0], den, lagged)
+            d_sigma2[i, 0, 2] = bc[i]
+            d_sigma2[i, 1:, 2] = sigma2[i, :-1]
+            d_sigma2[i, :, 2] = lfilter([1.0], den, d_sigma2[i, :, 2])
+    return sigma2, d_sigma2
+
+
+def _recursion_kernel(omega, alpha, beta, eps2, bc, sigma2, d_sigma2, with_grad):  # pragma: no cover
+    b, t_obs = eps2.shape
+    for i in range(b):
+        prev_e2 = bc[i]
+        prev_s2 = bc[i]
+        d0 = d1 = d2 = 0.0
+        for t in range(t_obs + 1):
+            s2 = omega[i] + alpha[i] * prev_e2 + beta[i] * prev_s2
+            sigma2[i, t] = s2
+            if with_grad:
+                d0 = 1.0 + beta[i] * d0
+                d1 = prev_e2 + beta[i] * d1
+                d2 = prev_s2 + beta[i] * d2
+                d_sigma2[i, t, 0] = d0
+                d_sigma2[i, t, 1] = d1
+                d_sigma2[i, t, 2] = d2
+            if t < t_obs:
+                prev_e2 = eps2[i, t]
+                prev_s2 = s2
+
+
+_compiled_kernel = None
+
+
+def _recursion_numba(omega, alpha, beta, eps2, bc, with_grad):
+    global _compiled_kernel
+    if _compiled_kernel is None:
+        _compiled_kernel = njit(cache=True, nogil=True)(_recursion_kernel)
+    b, t_obs = eps2.shape
+    sigma2 = np.empty((b, t_obs + 1))
+    d_sigma2 = np.empty((b, t_obs + 1, 3)) if with_grad else np.empty((0, 0, 3))
+    _compiled_kernel(omega, alpha, beta, eps2, bc, sigma2, d_sigma2, with_grad)
+    return sigma2, (d_sigma2 if with_grad else None)
+
+
+# ---------------------------------------------------------------------------
+# Likelihood
+# ---------------------------------------------------------------------------
+
+def _feasible(params: np.ndarray) -> np.ndarray:
+    ok = (params[:, 0] > 0) & (params[:, 1] >= 0) & (params[:, 2] >= 0)
+    ok &= params[:, 1] + params[:, 2] < _PERSISTENCE_MAX
+    if params.shape[1] == 4:
+        ok &= (params[:, 3] > _NU_MIN) & (params[:, 3] < _NU_MAX)
+    return ok
+
+
+def _loglik(
+    params: np.ndarray,
+    eps2: np.ndarray,
+    bc: np.ndarray,
+    dist: str,
+    recursion,
+    with_grad: bool = False,
+) -> tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+    """Log-likelihood per series, plus score and BHHH matrix when requested.
+
+    Infeasible parameter rows get a log-likelihood of −inf.
+
+    Returns:
+        (ll (B,), sigma2 (B, T+1), score (B, k) | None, bhhh (B, k, k) | None)
+    """
+    feasible = _feasible(params)
+    # Evaluate infeasible rows at a harmless point; their result is discarded
+    safe = params.copy()
+    safe[~feasible] = _SAFE_PARAMS[: params.shape[1]]
+    omega = np.ascontiguousarray(safe[:, 0])
+    alpha = np.ascontiguousarray(safe[:, 1])
+    beta = np.ascontiguousarray(safe[:, 2])
+    sigma2, d_sigma2 = recursion(omega, alpha, beta, eps2, bc, with_grad)
+    s2 = sigma2[:, :-1]
+    ratio = eps2 / s2
+
+    if dist == "normal":
+        ll_t = -0.5 * (np.log(2.0 * np.pi) + np.log(s2) + ratio)
+        # ∂ℓₜ/∂σ²ₜ
+        dl_ds2 = 0.5 * (ratio - 1.0) / s2 if with_grad else None
+    else:
+        nu = safe[:, 3][:, None]
+        x = ratio / (nu - 2.0)
+        const = gammaln(0.5 * (nu + 1.0)) - gammaln(0.5 * nu) - 0.5 * np.log(np.pi * (nu - 2.0))
+        ll_t = const - 0.5 * np.log(s2) - 0.5 * (nu + 1.0) * np.log1p(x)
+        dl_ds2 = 0.5 * ((nu + 1.0) * x / (1.0 + x) - 1.0) / s2 if with_grad else None
+
+    ll = np.where(feasible, ll_t.sum(axis=1), -np.inf)
+    if not with_grad:
+        return ll, sigma2, None, None
+
+    scores_t = dl_ds2[:, :, None] * d_sigma2[:, :-1, :]
+    if dist == "t":
+        dl_dnu = (
+            0.5 * digamma(0.5 * (nu + 1.0)) - 0.5 * digamma(0.5 * nu) - 0.5 / (nu - 2.0)
+            - 0.5 * np.log1p(x) + 0.5 * (nu + 1.0) * x / ((1.0 + x) * (nu - 2.0))
+        )
+        scores_t = np.concatenate([scores_t, dl_dnu[:, :, None]], axis=2)
+    score = scores_t.sum(axis=1)
+    bhhh = np.einsum("bti,btj->bij", scores_t, scores_t)
+    return ll, sigma2, score, bhhh
+
+
+# ---------------------------------------------------------------------------
+# Parameter transform
+# ---------------------------------------------------------------------------
+
+def _to_natural(u: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Map unconstrained u (B, k) to (omega, alpha, beta[, nu]) and the Jacobian (B, k, k)."""
+    b, k = u.shape
+    omega = np.exp(u[:, 0])
+    share = expit(u[:, 2])
+    persistence = _PERSISTENCE_MAX * expit(u[:, 1])
+    d_persistence = persistence * (1.0 - persistence / _PERSISTENCE_MAX)
+    d_share = share * (1.0 - share)
+
+    params = np.empty((b, k))
+    params[:, 0] = omega
+    params[:, 1] = persistence * share
+    params[:, 2] = persistence * (1.0 - share)
+    jac = np.zeros((b, k, k))
+    jac[:, 0, 0] = omega
+    jac[:, 1, 1] = share * d_persistence
+    jac[:, 1, 2] = persistence * d_share
+    jac[:, 2, 1] = (1.0 - share) * d_persistence
+    jac[:, 2, 2] = -persistence * d_share
+    if k == 4:
+        frac = expit(u[:, 3])
+        params[:, 3] = _NU_MIN + (_NU_MAX - _NU_MIN) * frac
+        jac[:, 3, 3] = (_NU_MAX - _NU_MIN) * frac * (1.0 - frac)
+    return params, jac
+
+
+def _to_unconstrained(params: np.ndarray) -> np.ndarray:
+    """Inverse of _to_natural for interior parameters."""
+    eps = 1e-8
+    persistence = params[:, 1] + params[:, 2]
+    u = np.empty_like(params)
+    u[:, 0] = np.log(params[:, 0])
+    u[:, 1] = logit(np.clip(persistence / _PERSISTENCE_MAX, eps, 1.0 - eps))
+    u[:, 2] = logit(np.clip(params[:, 1] / persistence, eps, 1.0 - eps))
+    if params.shape[1] == 4:
+        u[:, 3] = logit(np.clip((params[:, 3] - _NU_MIN) / (_NU_MAX - _NU_MIN), eps, 1.0 - eps))
+    return u
+
+
+def _objective(
+    u: np.ndarray,
+    eps2: np.ndarray,
+    bc: np.ndarray,
+    dist: str,
+    recursion,
+    with_grad: bool = False,
+) -> tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+    """_loglik in the unconstrained parameterisation (score and BHHH by the chain rule)."""
+    params, jac = _to_natural(u)
+    ll, sigma2, score, bhhh = _loglik(params, eps2, bc, dist, recursion, with_grad)
+    if not with_grad:
+        return ll, sigma2, None, None
+    score_u = np.einsum("bi,bij->bj", score, jac)
+    bhhh_u = np.einsum("bki,bkl,blj->bij", jac, bhhh, jac)
+    return ll, sigma2, score_u, bhhh_u
+
+
+def _inverse_bhhh(bhhh: np.ndarray) -> np.ndarray:
+    k = bhhh.shape[1]
+    ridge = 1e-8 * np.maximum(np.trace(bhhh, axis1=1, axis2=2), 1e-12)
+    return np.linalg.inv(bhhh + ridge[:, None, None] * np.eye(k))
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def _select_recursion(batch_size: int, use_numba: Optional[bool]):
+    if use_numba and njit is None:
+        raise ValueError("use_numba=True but numba is not installed")
+    if use_numba is not False and njit is not None:
+        return _recursion_numba
+    return _recursion_lfilter if batch_size <= _LFILTER_MAX_BATCH else _recursion_numpy
+
+
+def _starting_values(eps2: np.ndarray, bc: np.ndarray, dist: str, recursion) -> np.ndarray:
+    """Best (omega, alpha, beta[, nu]) of a small grid, per series."""
+    b = eps2.shape[0]
+    var = eps2.mean(axis=1)
+    nu0 = None
+    if dist == "t":
+        # arch's kurtosis-based starting value for nu
+        kurt = np.mean(eps2 ** 2, axis=1) / np.maximum(var ** 2, np.finfo(float).tiny)
+        nu0 = np.where(kurt > 3.75, (4.0 * kurt - 6.0) / np.maximum(kurt - 3.0, 1e-12), 12.0)
+        nu0 = np.maximum(nu0, 4.0)
+    best = None
+    best_ll = np.full(b, -np.inf)
+    for a, persistence in itertools.product(_START_ALPHAS, _START_PERSISTENCE):
+        cand = np.column_stack([var * (1.0 - persistence), np.full(b, a), np.full(b, persistence - a)])
+        if nu0 is not None:
+            cand = np.column_stack([cand, nu0])
+        ll, *_ = _loglik(cand, eps2, bc, dist, recursion)
+        if best is None:
+            best = cand.copy()
+        better = ll > best_ll
+        best[better] = cand[better]
+        best_ll[better] = ll[better]
+    return best
+
+
+def fit_garch_batch(
+    returns: np.ndarray,
+    dist: str = "normal",
+    max_iter: int = 200,
+    tol: float = 1e-9,
+    use_numba: Optional[bool] = None,
+) -> BatchGarchResult:
+    """Fit zero-mean GARCH(1,1) to every row of *returns* simultaneously.
+
+    Args:
+        returns:   (B × T) daily returns in decimal, one series per row
+                   (a 1-D array is treated as B = 1).
+        dist:      "normal" | "t" (standardised Student-t).
+        max_iter:  Optimiser iteration cap.
+        tol:       Convergence threshold on the relative log-likelihood gain
+                   and on the Newton decrement.
+        use_numba: Use the compiled recursion; None = when numba is installed.
+
+    Returns:
+        BatchGarchResult (variances in percentage points²).
+
+    Raises:
+        ValueError: Unknown *dist*, too few observations, or numba requested
+                    but not installed.
+    """
+    if dist not in DISTS:
+        raise ValueError(f"Native GARCH supports dist in {DISTS}, got {dist!r}")
+    returns_pct = np.atleast_2d(np.asarray(returns, dtype=float)) * 100.0
+    if returns_pct.shape[1] < 30:
+        raise ValueError(f"Need at least 30 return observations, got {returns_pct.shape[1]}")
+    b = returns_pct.shape[0]
+    recursion = _select_recursion(b, use_numba)
+
+    eps2 = np.ascontiguousarray(returns_pct ** 2)
+    bc = _backcast(eps2)
+
+    u = _to_unconstrained(_starting_values(eps2, bc, dist, recursion))
+    ll, sigma2, score, bhhh = _objective(u, eps2, bc, dist, recursion, with_grad=True)
+    h_inv = _inverse_bhhh(bhhh)
+    eye = np.eye(u.shape[1])
+    active = np.ones(b, dtype=bool)
+
+    n_iter = 0
+    for n_iter in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        direction = np.einsum("bij,bj->bi", h_inv[idx], score[idx])
+
+        # Step halving per series until the likelihood does not decrease
+        step = np.ones(idx.size)
+        new_u = u[idx].copy()
+        pending = np.ones(idx.size, dtype=bool)
+        for _ in range(30):
+            p = np.flatnonzero(pending)
+            if p.size == 0:
+                break
+            trial = u[idx[p]] + step[p, None] * direction[p]
+            trial_ll, *_ = _objective(trial, eps2[idx[p]], bc[idx[p]], dist, recursion)
+            ok = trial_ll >= ll[idx[p]]
+            new_u[p[ok]] = trial[ok]
+            pending[p[ok]] = False
+            step[p[~ok]] *= 0.5
+
+        # No ascent along the direction: optimum reached to machine precision
+        active[idx[pending]] = False
+        m = idx[~pending]
+        if m.size == 0:
+            continue
+        old_u, old_ll, old_score = u[m], ll[m], score[m]
+        u[m] = new_u[~pending]
+        m_ll, m_sigma2, m_score, m_bhhh = _objective(u[m], eps2[m], bc[m], dist, recursion, with_grad=True)
+        ll[m], sigma2[m], score[m] = m_ll, m_sigma2, m_score
+
+        # BFGS update of the inverse Hessian of −ℓ; reseed from BHHH on bad curvature
+        s = u[m] - old_u
+        y = old_score - m_score
+        sy = np.einsum("bi,bi->b", s, y)
+        good = sy > 1e-10 * np.linalg.norm(s, axis=1) * np.linalg.norm(y, axis=1)
+        rho = np.where(good, 1.0 / np.where(good, sy, 1.0), 0.0)
+        left = eye - rho[:, None, None] * np.einsum("bi,bj->bij", s, y)
+        updated = left @ h_inv[m] @ left.transpose(0, 2, 1) + rho[:, None, None] * np.einsum("bi,bj->bij", s, s)
+        h_inv[m] = np.where(good[:, None, None], updated, _inverse_bhhh(m_bhhh))
+
+        scale = np.maximum(np.abs(m_ll), 1.0)
+        gain = (m_ll - old_ll) / scale
+        decrement = np.einsum("bi,bij,bj->b", m_score, h_inv[m], m_score) / scale
+        active[m[(gain < tol) & (decrement < tol)]] = False
+
+    converged = ~active
+    if active.any():
+        logger.warning(
+            "Native GARCH: %d/%d series did not converge in %d iterations",
+            int(active.sum()), b, max_iter,
+        )
+    params, _ = _to_natural(u)
+    return BatchGarchResult(
+        dist=dist,
+        params=params,
+        log_likelihood=ll,
+        converged=converged,
+        n_iter=n_iter,
+        n_obs=eps2.shape[1],
+        sigma2=sigma2,
+    )
+
+
+def filter_variance(result: BatchGarchResult, returns: np.ndarray) -> np.ndarray:
+    """Run each fitted model over a longer *returns* matrix with fixed parameters.
+
+    The backcast is taken from the first ``n_obs`` returns of each row, as in
+    the fit, so for rows that extend the fitted windows the first
+    ``n_obs + 1`` columns reproduce ``result.sigma2``.
+
+    Args:
+        result:  Fitted batch.
+        returns: (B × T') decimal returns, T' ≥ result.n_obs.
+
+    Returns:
+        (B, T' + 1) conditional variances in percentage points²; column t is the
+        1-step forecast made after observing returns[:, :t].
+    """
+    eps2 = np.ascontiguousarray((np.atleast_2d(np.asarray(returns, dtype=float)) * 100.0) ** 2)
+    bc = _backcast(eps2[:, : result.n_obs])
+    recursion = _select_recursion(eps2.shape[0], None)
+    sigma2, _ = recursion(
+        np.ascontiguousarray(result.params[:, 0]),
+        np.ascontiguousarray(result.params[:, 1]),
+        np.ascontiguousarray(result.params[:, 2]),
+        eps2, bc, False,
+    )
+    return sigma2
@@ -0,0 +1,292 @@
+"""GARCH specification tournament.
+
+``run_tournament`` fits a grid of GARCH specifications — (p, q, dist, mean) —
+to one return series on a process pool and keeps a single winner:
+
+1. Screening. Every spec is fitted on the first ``screen_fraction`` of the
+   series. Specs whose screening BIC trails the best one by more than
+   ``bic_margin`` (10 ≈ "very strong" evidence on the Kass–Raftery scale) are
+   dropped without a full fit: the partial likelihood already rules them out.
+   Skipped when the prefix would be shorter than ``_MIN_SCREEN_OBS``.
+2. Full fit. The survivors are refitted on the whole series.
+3. Selection. The ``finalists`` lowest-BIC full fits get a quick backtest —
+   one-step VaR from their conditional volatility over the last
+   ``backtest_days`` observations, scored with the Kupiec test. The winner is
+   the lowest-BIC finalist with a Kupiec p-value ≥ ``significance``; if none
+   passes, the finalist with the highest p-value. The parameters were fitted
+   on the scored days too, so this is a calibration check that breaks BIC
+   ties towards well-covered tails, not a substitute for the rolling backtest.
+
+Each fit runs in a worker process under ``fit_time_limit(timeout_s)``; specs
+that time out or fail are recorded in the leaderboard and skipped. Only the
+winner's ``GARCHResult`` is returned, so callers log one set of artifacts.
+
+The worker pool outlives a single tournament: spawning and importing a worker
+costs seconds, more than a whole grid of 250-day fits, so it is paid once per
+process. A pool whose workers stop responding is discarded, its worker
+processes terminated, and rebuilt.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from ..backtesting.kupiec import kupiec_test
+from .garch import FitTimeout, GARCHParams, GARCHResult, _var_cvar_from_dist, fit_time_limit, train_garch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPECS: tuple[GARCHParams, ...] = tuple(
+    GARCHParams(p=p, q=q, dist=dist, mean=mean)
+    for p, q in ((1, 1), (1, 2), (2, 1))
+    for dist in ("normal", "t", "skewt")
+    for mean in ("Zero", "Constant")
+)
+
+# Shortest prefix worth screening on; shorter series go straight to full fits
+_MIN_SCREEN_OBS = 120
+# Allowance on top of the per-fit timeouts for spawning and importing workers
+_POOL_STARTUP_S = 60.0
+
+_pool_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Shared worker pool, rebuilt when the requested size changes."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            # spawn, not fork: the training service runs FastAPI and Kafka threads
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool_workers = max_workers
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop *pool* and terminate its workers: a fit past its SIGALRM limit is stuck, not slow."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    # ProcessPoolExecutor has no public way to stop running tasks; shutdown() clears _processes
+    workers = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in workers:
+        if process.is_alive():
+            process.terminate()
+
+
+def spec_label(spec: GARCHParams) -> str:
+    return f"GARCH({spec.p},{spec.q})-{spec.dist}-{spec.mean}"
+
+
+@dataclass
+class TournamentEntry:
+    """One specification's progress through the tournament."""
+    spec: GARCHParams
+    status: str = "pending"   # dominated | failed | timeout | fitted | finalist | winner
+    screen_bic: Optional[float] = None
+    bic: Optional[float] = None
+    violations: Optional[int] = None
+    kupiec_pvalue: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {"spec": spec_label(self.spec), **asdict(self.spec), **{
+            k: v for k, v in asdict(self).items() if k != "spec"
+        }}
+
+
+@dataclass
+class TournamentResult:
+    winner: GARCHResult
+    winner_spec: GARCHParams
+    entries: list[TournamentEntry] = field(default_factory=list)
+    backtest_days: int = 0
+    seconds: float = 0.0
+
+    @property
+    def n_dominated(self) -> int:
+        return sum(e.status == "dominated" for e in self.entries)
+
+    def leaderboard(self) -> list[dict]:
+        """Entries ordered by full-sample BIC (unfitted specs last)."""
+        ranked = sorted(self.entries, key=lambda e: (e.bic is None, e.bic or 0.0, e.screen_bic or 0.0))
+        return [e.to_dict() for e in ranked]
+
+
+@dataclass
+class _SpecFit:
+    bic: float
+    result: Optional[GARCHResult] = None   # full-sample stage only
+    violations: Optional[int] = None
+
+
+def _fit_spec(
+    returns: np.ndarray,
+    spec: GARCHParams,
+    alpha: float,
+    horizon_days: int,
+    backtest_days: int,
+    timeout_s: Optional[float],
+    full: bool,
+) -> _SpecFit:
+    """Process-pool task: fit one spec; the full-sample stage also counts VaR violations."""
+    try:
+        with fit_time_limit(timeout_s):
+            result = train_garch(returns, alpha=alpha, horizon_days=horizon_days, garch_params=spec)
+    except FitTimeout:
+        raise TimeoutError(f"fit exceeded {timeout_s:g}s") from None
+    if not full:
+        return _SpecFit(bic=result.bic)
+
+    # VaR is linear in σ: scale the unit-σ VaR of the fitted distribution
+    unit_var, _ = _var_cvar_from_dist(spec.dist, result.fit_result, cond_vol=1.0, alpha=alpha)
+    cond_vol = np.asarray(result.fit_result.conditional_volatility, dtype=float)[-backtest_days:] / 100.0
+    violations = int(np.sum(returns[-backtest_days:] < -unit_var * cond_vol))
+    return _SpecFit(bic=result.bic, result=result, violations=violations)
+
+
+def _run_stage(
+    pool: ProcessPoolExecutor,
+    entries: list[TournamentEntry],
+    returns: np.ndarray,
+    alpha: float,
+    horizon_days: int,
+    backtest_days: int,
+    timeout_s: Optional[float],
+    max_workers: int,
+    full: bool,
+) -> dict[int, _SpecFit]:
+    """Fit *entries* in parallel; failures and timeouts are recorded on the entries."""
+    futures: dict[Future, int] = {
+        pool.submit(_fit_spec, returns, e.spec, alpha, horizon_days, backtest_days, timeout_s, full): i
+        for i, e in enumerate(entries)
+    }
+    budget = None
+    if timeout_s is not None:
+        budget = timeout_s * math.ceil(len(futures) / max_workers) + _POOL_STARTUP_S
+
+    fits: dict[int, _SpecFit] = {}
+    try:
+        for future in as_completed(futures, timeout=budget):
+            i = futures[future]
+            try:
+                fits[i] = future.result()
+            except TimeoutError as exc:
+                entries[i].status, entries[i].error = "timeout", str(exc)
+            except Exception as exc:
+                entries[i].status, entries[i].error = "failed", str(exc)
+    except FuturesTimeout:
+        logger.error("GARCH tournament stage overran its %.0fs budget — discarding the worker pool", budget)
+        for future, i in futures.items():
+            if not future.done():
+                entries[i].status, entries[i].error = "timeout", "worker did not return"
+        _discard_pool(pool)
+    return fits
+
+
+def run_tournament(
+    returns: np.ndarray,
+    alpha: float = 0.99,
+    horizon_days: int = 1,
+    specs: tuple[GARCHParams, ...] = DEFAULT_SPECS,
+    max_workers: int = 4,
+    timeout_s: Optional[float] = 30.0,
+    screen_fraction: float = 0.5,
+    bic_margin: float = 10.0,
+    finalists: int = 3,
+    backtest_days: int = 250,
+    significance: float = 0.05,
+) -> TournamentResult:
+    """Fit *specs* to *returns* in parallel and return the winning specification.
+
+    Args:
+        returns: 1-D array of daily portfolio returns.
+        alpha: VaR confidence level (also used by the quick backtest).
+        horizon_days: Forecast horizon of the returned GARCHResult.
+        specs: Candidate specifications.
+        max_workers: Worker processes.
+        timeout_s: Per-fit time limit in seconds (None disables it).
+        screen_fraction: Share of the series (from the start) used for screening.
+        bic_margin: Screening BIC gap beyond which a spec is dropped.
+        finalists: Number of lowest-BIC full fits that are backtested.
+        backtest_days: Observations scored by the quick backtest.
+        significance: Kupiec p-value a finalist needs to be preferred on BIC.
+
+    Raises:
+        RuntimeError: If no specification could be fitted on the full series.
+    """
+    returns = np.asarray(returns, dtype=float)
+    t0 = time.perf_counter()
+    entries = [TournamentEntry(spec=s) for s in specs]
+    backtest_days = min(backtest_days, len(returns))
+    n_screen = int(len(returns) * screen_fraction)
+
+    contenders = entries
+    if n_screen >= _MIN_SCREEN_OBS and len(entries) > 1:
+        screened = _run_stage(
+            _get_pool(max_workers), entries, returns[:n_screen], alpha, horizon_days,
+            backtest_days, timeout_s, max_workers, full=False,
+        )
+        for i, fit in screened.items():
+            entries[i].screen_bic = fit.bic
+        if screened:
+            best = min(fit.bic for fit in screened.values())
+            for i, fit in screened.items():
+                if fit.bic - best > bic_margin:
+                    entries[i].status = "dominated"
+        contenders = [entries[i] for i in sorted(screened) if entries[i].status == "pending"]
+
+    full_fits = _run_stage(
+        _get_pool(max_workers), contenders, returns, alpha, horizon_days,
+        backtest_days, timeout_s, max_workers, full=True,
+    )
+
+    results: dict[int, GARCHResult] = {}
+    for j, fit in full_fits.items():
+        entry = contenders[j]
+        entry.status, entry.bic, entry.violations = "fitted", fit.bic, fit.violations
+        entry.kupiec_pvalue = kupiec_test(fit.violations, backtest_days, alpha, significance).p_value
+        results[id(entry)] = fit.result
+    if not results:
+        errors = {spec_label(e.spec): e.error for e in entries if e.error}
+        raise RuntimeError(f"GARCH tournament: no specification could be fitted ({errors})")
+
+    ranked = sorted((e for e in contenders if e.status == "fitted"), key=lambda e: e.bic)
+    final = ranked[:finalists]
+    for e in final:
+        e.status = "finalist"
+    passing = [e for e in final if e.kupiec_pvalue >= significance]
+    winner = passing[0] if passing else max(final, key=lambda e: e.kupiec_pvalue)
+    winner.status = "winner"
+
+    seconds = time.perf_counter() - t0
+    logger.info(
+        "GARCH tournament: %d specs, %d dominated at screening, %d fitted — winner %s "
+        "(BIC=%.1f, %d/%d violations, kupiec_p=%.3f) in %.1fs",
+        len(entries), sum(e.status == "dominated" for e in entries), len(ranked),
+        spec_label(winner.spec), winner.bic, winner.violations, backtest_days,
+        winner.kupiec_pvalue, seconds,
+    )
+    return TournamentResult(
+        winner=results[id(winner)],
+        winner_spec=winner.spec,
+        entries=entries,
+        backtest_days=backtest_days,
+        seconds=seconds,
+    )
@@ -0,0 +1,152 @@
+"""Rolling historical-simulation VaR.
+
+Historical simulation predicts VaR(α) of day t as minus the (1 − α) empirical
+quantile of the previous ``lookback_days`` returns (linear interpolation, as
+``np.quantile``). ``rolling_historical_var`` returns that series for every
+window of a return array in one call, for one or many confidence levels.
+
+Two evaluation strategies, selected by ``method``:
+
+- "partition" — the windows are a ``sliding_window_view`` of the series,
+  and ``np.partition`` selects the two order statistics around each quantile
+  position for a chunk of windows at once. Everything runs in C, at O(L)
+  per window for a window of L returns; chunks bound the copy to
+  ``_PARTITION_CHUNK`` values.
+- "sorted" — one sorted window is slid through the series, deleting the
+  oldest return and inserting the newest (bisection), and the order
+  statistics are read off by position. This costs O(log L) comparisons and
+  a short memmove per day, plus Python overhead of a few µs, so it wins for
+  long windows.
+
+"auto" uses "sorted" from ``_SORTED_MIN_LOOKBACK`` returns per window up
+(see ``benchmarks/historical_var.py``). Both give the same values as
+``np.quantile`` per window, up to the rounding of the interpolation.
+"""
+from __future__ import annotations
+
+import bisect
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+METHODS = ("auto", "partition", "sorted")
+
+# Windows shorter than this give no VaR (NaN)
+MIN_WINDOW_OBS = 10
+# Values copied per np.partition call
+_PARTITION_CHUNK = 1 << 22
+# "auto" switches to the sliding sorted window from this window length
+_SORTED_MIN_LOOKBACK = 200
+
+
+def _quantile_positions(n: int, alphas: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Lower / upper order-statistic indices and interpolation weights of the (1 − α) quantiles."""
+    h = (n - 1) * (1.0 - alphas)
+    lo = np.floor(h).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    return lo, hi, h - lo
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """a + t·(b − a), evaluated from the nearer end (as np.quantile does)."""
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1.0 - t), a + diff * t)
+
+
+def _order_stats_partition(
+    returns: np.ndarray,
+    lookback_days: int,
+    n_windows: int,
+    ranks: np.ndarray,
+) -> np.ndarray:
+    """(n_windows, len(ranks)) order statistics of every window via np.partition."""
+    windows = sliding_window_view(returns, lookback_days)[:n_windows]
+    kth = np.unique(ranks)
+    out = np.empty((n_windows, len(ranks)))
+    step = max(1, _PARTITION_CHUNK // lookback_days)
+    for start in range(0, n_windows, step):
+        part = np.partition(windows[start:start + step], kth, axis=1)
+        out[start:start + step] = part[:, ranks]
+    return out
+
+
+def _order_stats_sorted(
+    returns: np.ndarray,
+    lookback_days: int,
+    n_windows: int,
+    ranks: np.ndarray,
+) -> np.ndarray:
+    """(n_windows, len(ranks)) order statistics of every window from one sliding sorted window."""
+    values = returns.tolist()
+    window = sorted(values[:lookback_days])
+    rank_list = ranks.tolist()
+    out = np.empty((n_windows, len(ranks)))
+    out[0] = [window[k] for k in rank_list]
+    for i in range(1, n_windows):
+        del window[bisect.bisect_left(window, values[i - 1])]
+        bisect.insort(window, values[i + lookback_days - 1])
+        out[i] = [window[k] for k in rank_list]
+    return out
+
+
+def rolling_historical_var(
+    returns: np.ndarray,
+    lookback_days: int,
+    alpha: Union[float, Sequence[float]] = 0.99,
+    n_windows: Optional[int] = None,
+    method: str = "auto",
+) -> np.ndarray:
+    """Historical-simulation VaR of every rolling window.
+
+    Window i is ``returns[i : i + lookback_days]``; its VaR forecasts the
+    return that follows it.
+
+    Args:
+        returns:       1-D array of daily returns (chronological).
+        lookback_days: Window length.
+        alpha:         Confidence level, or a sequence of levels.
+        n_windows:     Number of windows, from the start of *returns*; all
+                       ``len(returns) - lookback_days + 1`` if None.
+        method:        "auto" | "partition" | "sorted" (see module docstring).
+
+    Returns:
+        (n_windows,) VaR series for a scalar *alpha*, else
+        (n_windows, len(alpha)); positive loss numbers, NaN when
+        lookback_days < MIN_WINDOW_OBS.
+
+    Raises:
+        ValueError: For an unknown method, lookback_days < 1 or more windows
+                    than *returns* holds.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {METHODS}")
+    if lookback_days < 1:
+        raise ValueError(f"lookback_days must be >= 1, got {lookback_days}")
+    returns = np.asarray(returns, dtype=float)
+    max_windows = len(returns) - lookback_days + 1
+    n_windows = max_windows if n_windows is None else n_windows
+    if n_windows > max_windows:
+        raise ValueError(
+            f"{n_windows} windows of {lookback_days} need {lookback_days + n_windows - 1} "
+            f"returns, got {len(returns)}"
+        )
+
+    scalar = np.ndim(alpha) == 0
+    alphas = np.atleast_1d(np.asarray(alpha, dtype=float))
+    if n_windows <= 0 or lookback_days < MIN_WINDOW_OBS:
+        out = np.full((max(n_windows, 0), len(alphas)), np.nan)
+        return out[:, 0] if scalar else out
+
+    lo, hi, t = _quantile_positions(lookback_days, alphas)
+    ranks = np.concatenate([lo, hi])
+    if method == "auto":
+        method = "sorted" if lookback_days >= _SORTED_MIN_LOOKBACK else "partition"
+    if method == "sorted":
+        stats = _order_stats_sorted(returns, lookback_days, n_windows, ranks)
+    else:
+        stats = _order_stats_partition(returns, lookback_days, n_windows, ranks)
+
+    k = len(alphas)
+    var = -_lerp(stats[:, :k], stats[:, k:], t)
+    return var[:, 0] if scalar else var
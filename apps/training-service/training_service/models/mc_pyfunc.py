@@ -15,22 +15,52 @@ Input to predict():
         - n_simulations  (int,   default 10_000)
         - horizon_days   (int,   default 1)
         - alpha          (float, default 0.99)
+        - sampler        (str,   default "pseudo") — pseudo | antithetic | sobol |
+                           importance (tail-shifted mixture, likelihood-ratio
+                           weighted; for alpha ≥ 0.999)
+        - n_workers      (int,   default 1) — threads; each draws from a
+                           SeedSequence(seed).spawn child stream, so results
+                           are reproducible for a given worker count
+        - target_rel_error (float, optional) — adaptive mode: n_simulations is
+                           the pilot size; batches are added until the
+                           batch-means max(SE/VaR, SE/CVaR) reaches the target
+        - max_simulations  (int, default 1_000_000) — adaptive path budget
+        - dtype          (str,   default "float64") — float32 halves memory
+                           traffic; risk numbers are still computed in float64
 
 Output of predict():
     pandas.DataFrame with columns:
         - var        (float) — positive loss number
         - cvar       (float) — positive loss number
         - volatility (float) — annualised
+        - n_simulations (int) — paths actually simulated
         - method     (str)   — always "montecarlo"
+
+MultiAssetMonteCarloModel
+-------------------------
+Logged next to the scalar model under the 'multiasset_model/' artifact path.
+It stores per-symbol drift, the covariance Cholesky factor and the symbol
+order, so one trained model can price any portfolio over that universe.
+Its predict() takes the same columns plus:
+        - weights        ({symbol: weight} or list in model symbol order;
+                           default equal weights)
+Rows with equal (n_simulations, horizon_days, sampler, n_workers) share one
+set of simulated asset returns.
 """
 from __future__ import annotations
 
 import logging
-from typing import Any
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
 import mlflow.pyfunc
 import numpy as np
 import pandas as pd
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+from .covariance import CovarianceFactors, estimate_factors
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +68,14 @@ logger = logging.getLogger(__name__)
 _DEFAULT_N_SIMS = 10_000
 _DEFAULT_HORIZON = 1
 _DEFAULT_ALPHA = 0.99
+_DEFAULT_SAMPLER = "pseudo"
+_DEFAULT_N_WORKERS = 1
+_DEFAULT_MAX_SIMS = 1_000_000
+_DEFAULT_DTYPE = "float64"
+
+# Adaptive mode: pilot batch count and minimum expected tail points per batch
+_ADAPTIVE_BATCHES = 10
+_MIN_BATCH_TAIL_POINTS = 10
 
 
 class MonteCarloModel(mlflow.pyfunc.PythonModel):
@@ -68,24 +106,37 @@ class MonteCarloModel(mlflow.pyfunc.PythonModel):
         Args:
             context:     MLflow context (unused).
             model_input: DataFrame with optional columns:
-                         n_simulations, horizon_days, alpha.
+                         n_simulations, horizon_days, alpha, sampler, n_workers,
+                         target_rel_error, max_simulations, dtype.
                          Missing columns use defaults.
 
         Returns:
             DataFrame with one row per input row containing:
-            var, cvar, volatility, method.
+            var, cvar, volatility, n_simulations (paths used), method.
         """
         results = []
         for _, row in model_input.iterrows():
             n_sims = int(row.get("n_simulations", _DEFAULT_N_SIMS))
             horizon = int(row.get("horizon_days", _DEFAULT_HORIZON))
             alpha = float(row.get("alpha", _DEFAULT_ALPHA))
+            sampler = str(row.get("sampler", _DEFAULT_SAMPLER))
+            n_workers = int(row.get("n_workers", _DEFAULT_N_WORKERS))
+            target = row.get("target_rel_error")
+            max_sims = int(row.get("max_simulations", _DEFAULT_MAX_SIMS))
+            dtype = str(row.get("dtype", _DEFAULT_DTYPE))
 
-            var, cvar, vol = self._run_simulation(n_sims, horizon, alpha)
+            if target is not None and pd.notna(target) and float(target) > 0:
+                var, cvar, vol, n_used = self._run_adaptive(
+                    n_sims, horizon, alpha, sampler, float(target), max_sims, n_workers, dtype,
+                )
+            else:
+                var, cvar, vol = self._run_simulation(n_sims, horizon, alpha, sampler, n_workers, dtype)
+                n_used = n_sims
             results.append({
                 "var": var,
                 "cvar": cvar,
                 "volatility": vol,
+                "n_simulations": n_used,
                 "method": "montecarlo",
             })
 
@@ -100,32 +151,116 @@ class MonteCarloModel(mlflow.pyfunc.PythonModel):
         n_simulations: int,
         horizon_days: int,
         alpha: float,
+        sampler: str = _DEFAULT_SAMPLER,
+        n_workers: int = _DEFAULT_N_WORKERS,
+        dtype: str = _DEFAULT_DTYPE,
     ) -> tuple[float, float, float]:
         """Run GBM simulation and return (var, cvar, annualised_vol)."""
-        rng = np.random.default_rng(self.seed)
+        n_workers = max(1, min(n_workers, n_simulations))
+        if n_workers == 1:
+            rng = np.random.default_rng(self.seed)
+            parts = [self._simulate_paths(n_simulations, horizon_days, sampler, rng, alpha, dtype)]
+        else:
+            # Child streams concatenated in worker order → reproducible per worker count
+            sizes = [len(p) for p in np.array_split(np.arange(n_simulations), n_workers)]
+            rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(self.seed).spawn(n_workers)]
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                parts = list(pool.map(
+                    lambda rng, n: self._simulate_paths(n, horizon_days, sampler, rng, alpha, dtype), rngs, sizes,
+                ))
+        simulated, log_w = _concat_paths(parts)
+
+        var, cvar, vol = _risk_from_sample(simulated, alpha, horizon_days, log_w)
+
+        logger.debug(
+            "MC simulation: n=%d  horizon=%d  alpha=%.4f  sampler=%s  workers=%d  VaR=%.6f  CVaR=%.6f",
+            n_simulations, horizon_days, alpha, sampler, n_workers, var, cvar,
+        )
+        return var, cvar, vol
+
+    def _run_adaptive(
+        self,
+        n_initial: int,
+        horizon_days: int,
+        alpha: float,
+        sampler: str,
+        target_rel_error: float,
+        max_simulations: int,
+        n_workers: int = _DEFAULT_N_WORKERS,
+        dtype: str = _DEFAULT_DTYPE,
+    ) -> tuple[float, float, float, int]:
+        """Add batches until max(SE/VaR, SE/CVaR) <= target or the budget is spent.
+
+        Every batch draws from its own SeedSequence(seed).spawn child stream,
+        so the result does not depend on the worker count.
 
+        Returns:
+            (var, cvar, annualised_vol, paths_used)
+        """
+        tail_prob = 0.25 if sampler == "importance" else 1.0 - alpha
+        min_batch = int(np.ceil(_MIN_BATCH_TAIL_POINTS / max(tail_prob, 1e-12)))
+        batch_n = max(n_initial // _ADAPTIVE_BATCHES, min_batch)
+        root = np.random.SeedSequence(self.seed)
+
+        parts: list[tuple[np.ndarray, Optional[np.ndarray]]] = []
+        estimates: list[tuple[float, float]] = []
+        n_new = _ADAPTIVE_BATCHES
+        with ThreadPoolExecutor(max_workers=max(1, n_workers)) as pool:
+            while True:
+                rngs = [np.random.default_rng(s) for s in root.spawn(n_new)]
+                new = list(pool.map(
+                    lambda rng: self._simulate_paths(batch_n, horizon_days, sampler, rng, alpha, dtype), rngs,
+                ))
+                parts.extend(new)
+                estimates.extend(_risk_from_sample(p, alpha, horizon_days, w)[:2] for p, w in new)
+
+                simulated, log_w = _concat_paths(parts)
+                var, cvar, vol = _risk_from_sample(simulated, alpha, horizon_days, log_w)
+                n_batches = len(parts)
+                se = np.std(np.asarray(estimates), axis=0, ddof=1) / np.sqrt(n_batches)
+                rel = max(se[0] / abs(var), se[1] / abs(cvar)) if var and cvar else float("inf")
+
+                room = (max_simulations - n_batches * batch_n) // batch_n
+                if rel <= target_rel_error or room <= 0:
+                    break
+                # Batch-means SE decays as 1/√B — extrapolate, but at most double per round
+                needed = int(np.ceil(n_batches * (rel / target_rel_error) ** 2)) - n_batches
+                n_new = min(max(needed, 1), n_batches, room)
+
+        return var, cvar, vol, len(simulated)
+
+    def _simulate_paths(
+        self,
+        n_simulations: int,
+        horizon_days: int,
+        sampler: str,
+        rng: np.random.Generator,
+        alpha: float = _DEFAULT_ALPHA,
+        dtype: str = _DEFAULT_DTYPE,
+    ) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """Simulated simple returns over the horizon, shape (n_simulations,),
+        and their log likelihood-ratio weights (None unless sampler="importance")."""
         dt = 1.0
         drift = (self.mu - 0.5 * self.sigma ** 2) * dt
         diffusion = self.sigma * np.sqrt(dt)
 
         # Shape: (n_simulations, horizon_days)
-        daily_log_returns = rng.normal(
-            loc=drift, scale=diffusion, size=(n_simulations, horizon_days)
-        )
+        if sampler == "pseudo" and dtype == "float64":
+            daily_log_returns = rng.normal(
+                loc=drift, scale=diffusion, size=(n_simulations, horizon_days)
+            )
+            log_w = None
+        elif sampler == "importance":
+            theta = np.full(horizon_days, ndtri(1.0 - alpha) / np.sqrt(horizon_days))
+            z, log_w = _importance_normals(n_simulations, theta, rng, dtype)
+            daily_log_returns = drift + diffusion * z
+        else:
+            # float32: drift / diffusion are Python floats, so the arithmetic stays float32
+            z = _standard_normals(sampler, n_simulations, horizon_days, rng, dtype)
+            daily_log_returns = drift + diffusion * z
+            log_w = None
         total_log_returns = daily_log_returns.sum(axis=1)
-        simulated = np.exp(total_log_returns) - 1.0  # simple returns
-
-        var_quantile = np.quantile(simulated, 1.0 - alpha)
-        var = float(-var_quantile)
-        tail = simulated[simulated <= var_quantile]
-        cvar = float(-tail.mean()) if len(tail) > 0 else var
-        vol = float(np.std(simulated, ddof=1) * np.sqrt(252 / horizon_days))
-
-        logger.debug(
-            "MC simulation: n=%d  horizon=%d  alpha=%.4f  VaR=%.6f  CVaR=%.6f",
-            n_simulations, horizon_days, alpha, var, cvar,
-        )
-        return var, cvar, vol
+        return np.exp(total_log_returns) - 1.0, log_w  # simple returns
 
     # ------------------------------------------------------------------
     # Convenience: build from historical returns
@@ -150,3 +285,301 @@ class MonteCarloModel(mlflow.pyfunc.PythonModel):
         mu = float(np.mean(returns)) + 0.5 * sigma ** 2
         logger.info("MC pyfunc: estimated mu=%.6f  sigma=%.6f from %d observations", mu, sigma, len(returns))
         return cls(mu=mu, sigma=sigma, seed=seed)
+
+
+class MultiAssetMonteCarloModel(mlflow.pyfunc.PythonModel):
+    """MLflow pyfunc model that prices any weight vector over a symbol universe.
+
+    Stores per-symbol daily log drift, the Cholesky factor of the daily
+    covariance matrix and the symbol order. ``predict()`` accepts one weight
+    vector per input row; rows sharing (n_simulations, horizon_days, sampler)
+    are priced off a single set of simulated asset returns, so a whole book
+    costs one simulation plus a matrix product.
+
+    Attributes:
+        symbols: Symbol order of *drift* and the rows/columns of *chol*.
+        drift:   (N,) daily log-return drift per symbol (the return mean, as
+                 the scalar model's mu − ½σ²).
+        chol:    (N × N) lower-triangular Cholesky factor of the covariance.
+        seed:    Random seed for reproducibility (None = random).
+    """
+
+    def __init__(
+        self,
+        symbols: list[str],
+        drift: np.ndarray,
+        chol: np.ndarray,
+        seed: int | None = 42,
+    ) -> None:
+        self.symbols = list(symbols)
+        self.drift = np.asarray(drift, dtype=float)
+        self.chol = np.asarray(chol, dtype=float)
+        self.seed = seed
+        self._index = {s: i for i, s in enumerate(self.symbols)}
+
+    # ------------------------------------------------------------------
+    # mlflow.pyfunc.PythonModel interface
+    # ------------------------------------------------------------------
+
+    def predict(self, context: Any, model_input: pd.DataFrame) -> pd.DataFrame:
+        """Run one correlated simulation per parameter group and price every row.
+
+        Args:
+            context:     MLflow context (unused).
+            model_input: DataFrame with optional columns:
+                         weights ({symbol: weight} or a list in ``symbols``
+                         order; default equal weights), n_simulations,
+                         horizon_days, alpha, sampler, n_workers.
+                         Missing columns use defaults. Adaptive mode is not
+                         available here — n_simulations paths are always used.
+
+        Returns:
+            DataFrame with one row per input row containing:
+            var, cvar, volatility, n_simulations, method.
+
+        Raises:
+            ValueError: If a weight refers to a symbol the model was not trained on.
+        """
+        rows = []
+        for _, row in model_input.iterrows():
+            sampler = str(row.get("sampler", _DEFAULT_SAMPLER))
+            weights = self._weight_vector(row.get("weights"))
+            rows.append({
+                "weights": weights,
+                "n_simulations": int(row.get("n_simulations", _DEFAULT_N_SIMS)),
+                "horizon_days": int(row.get("horizon_days", _DEFAULT_HORIZON)),
+                "alpha": float(row.get("alpha", _DEFAULT_ALPHA)),
+                "sampler": sampler,
+                "n_workers": int(row.get("n_workers", _DEFAULT_N_WORKERS)),
+                "dtype": str(row.get("dtype", _DEFAULT_DTYPE)),
+            })
+
+        # Group rows that can share draws; importance sampling tilts the shocks
+        # toward one portfolio's loss tail, so those rows are simulated alone
+        groups: dict[tuple, list[int]] = {}
+        for i, r in enumerate(rows):
+            key = (r["n_simulations"], r["horizon_days"], r["sampler"], r["n_workers"], r["dtype"])
+            if r["sampler"] == "importance":
+                key += (i,)
+            groups.setdefault(key, []).append(i)
+
+        results: list[dict] = [{}] * len(rows)
+        for (n_sims, horizon, sampler, n_workers, dtype, *_), idx in groups.items():
+            shift = None
+            if sampler == "importance":
+                shift = self._importance_shift(rows[idx[0]]["weights"], horizon, rows[idx[0]]["alpha"])
+            asset_returns, log_w = self._simulate_assets(n_sims, horizon, sampler, n_workers, shift, dtype)
+            weight_matrix = np.column_stack([rows[i]["weights"] for i in idx])
+            portfolio_returns = asset_returns @ weight_matrix      # (n_sims, n_portfolios)
+            for col, i in enumerate(idx):
+                var, cvar, vol = _risk_from_sample(
+                    portfolio_returns[:, col], rows[i]["alpha"], horizon, log_w,
+                )
+                results[i] = {
+                    "var": var,
+                    "cvar": cvar,
+                    "volatility": vol,
+                    "n_simulations": n_sims,
+                    "method": "montecarlo",
+                }
+
+        logger.debug(
+            "Multi-asset MC: %d portfolios priced from %d simulation(s) over %d symbols",
+            len(rows), len(groups), len(self.symbols),
+        )
+        return pd.DataFrame(results)
+
+    # ------------------------------------------------------------------
+    # Internal simulation
+    # ------------------------------------------------------------------
+
+    def _weight_vector(self, weights: Any) -> np.ndarray:
+        """Normalised (N,) weights in ``symbols`` order from a dict or a sequence."""
+        n_assets = len(self.symbols)
+        if weights is None or (np.isscalar(weights) and pd.isna(weights)):
+            return np.ones(n_assets) / n_assets
+        if isinstance(weights, dict):
+            unknown = sorted(set(weights) - set(self._index))
+            if unknown:
+                raise ValueError(f"Model has no parameters for symbols: {unknown}")
+            w = np.zeros(n_assets)
+            for sym, value in weights.items():
+                w[self._index[sym]] = float(value)
+        else:
+            w = np.asarray(weights, dtype=float)
+            if w.shape != (n_assets,):
+                raise ValueError(f"Expected {n_assets} weights, got shape {w.shape}")
+        total = w.sum()
+        if total <= 0:
+            raise ValueError("Sum of weights must be > 0")
+        return w / total
+
+    def _importance_shift(self, weights: np.ndarray, horizon_days: int, alpha: float) -> np.ndarray:
+        """Per-day shift along Lᵀw (the portfolio's worst-loss shock direction)."""
+        direction = self.chol.T @ weights
+        direction = direction / np.linalg.norm(direction)
+        return np.tile(direction * (ndtri(1.0 - alpha) / np.sqrt(horizon_days)), horizon_days)
+
+    def _simulate_assets(
+        self,
+        n_simulations: int,
+        horizon_days: int,
+        sampler: str,
+        n_workers: int,
+        shift: Optional[np.ndarray],
+        dtype: str = _DEFAULT_DTYPE,
+    ) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """(n_simulations, N) simulated asset simple returns and optional log weights."""
+        n_workers = max(1, min(n_workers, n_simulations))
+        if n_workers == 1:
+            rng = np.random.default_rng(self.seed)
+            parts = [self._simulate_chunk(n_simulations, horizon_days, sampler, rng, shift, dtype)]
+        else:
+            sizes = [len(p) for p in np.array_split(np.arange(n_simulations), n_workers)]
+            rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(self.seed).spawn(n_workers)]
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                parts = list(pool.map(
+                    lambda rng, n: self._simulate_chunk(n, horizon_days, sampler, rng, shift, dtype), rngs, sizes,
+                ))
+        return _concat_paths(parts)
+
+    def _simulate_chunk(
+        self,
+        n: int,
+        horizon_days: int,
+        sampler: str,
+        rng: np.random.Generator,
+        shift: Optional[np.ndarray],
+        dtype: str = _DEFAULT_DTYPE,
+    ) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        n_assets = len(self.symbols)
+        dim = horizon_days * n_assets
+        log_w = None
+        if sampler == "importance":
+            z, log_w = _importance_normals(n, shift, rng, dtype)
+        else:
+            z = _standard_normals(sampler, n, dim, rng, dtype)
+        # (n, horizon, N) correlated daily log-returns, summed over the horizon
+        chol, drift = self.chol.astype(dtype, copy=False), self.drift.astype(dtype, copy=False)
+        daily_log_returns = drift + z.reshape(n, horizon_days, n_assets) @ chol.T
+        return np.exp(daily_log_returns.sum(axis=1)) - 1.0, log_w
+
+    # ------------------------------------------------------------------
+    # Convenience: build from historical returns
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_returns(
+        cls,
+        returns: np.ndarray,
+        symbols: list[str],
+        seed: int | None = 42,
+        covariance: Optional[CovarianceFactors] = None,
+    ) -> "MultiAssetMonteCarloModel":
+        """Estimate per-symbol drift and the covariance Cholesky factor.
+
+        Args:
+            returns:    (T × N) matrix of daily returns, columns in *symbols* order.
+            symbols:    Symbol names of the columns.
+            seed:       Random seed for reproducibility.
+            covariance: Precomputed factors of *returns* (e.g. from
+                        ``CovarianceCache``); estimated, with PD repair, when None.
+
+        Returns:
+            MultiAssetMonteCarloModel over *symbols*.
+        """
+        returns = np.asarray(returns, dtype=float)
+        if returns.ndim != 2 or returns.shape[1] != len(symbols):
+            raise ValueError(
+                f"returns must be (T × {len(symbols)}), got shape {returns.shape}"
+            )
+        if covariance is None:
+            covariance = estimate_factors(returns)
+        if covariance.repaired:
+            logger.warning("MC pyfunc: covariance was not positive definite — eigenvalues clipped")
+        # Same convention as MonteCarloModel: log drift = mean return
+        drift = covariance.mean
+        logger.info(
+            "MC pyfunc: estimated multi-asset params for %d symbols from %d observations",
+            len(symbols), returns.shape[0],
+        )
+        return cls(symbols=symbols, drift=drift, chol=covariance.chol, seed=seed)
+
+def _standard_normals(
+    sampler: str,
+    n: int,
+    dim: int,
+    rng: np.random.Generator,
+    dtype: str = _DEFAULT_DTYPE,
+) -> np.ndarray:
+    """(n, dim) standard normals of *dtype* for the pseudo / antithetic / sobol samplers."""
+    if sampler == "pseudo":
+        return rng.standard_normal((n, dim), dtype=dtype)
+    if sampler == "antithetic":
+        half = rng.standard_normal(((n + 1) // 2, dim), dtype=dtype)
+        return np.concatenate([half, -half])[:n]
+    if sampler == "sobol":
+        with warnings.catch_warnings():
+            # Non power-of-two n is fine here — it only weakens the net's balance
+            warnings.filterwarnings("ignore", message=".*balance properties.*")
+            u = qmc.Sobol(d=dim, scramble=True, seed=rng).random(n)
+        eps = np.finfo(np.float64).eps
+        return ndtri(np.clip(u, eps, 1.0 - eps)).astype(dtype, copy=False)
+    raise ValueError(f"Unknown sampler {sampler!r}; expected pseudo | antithetic | sobol | importance")
+
+
+def _importance_normals(
+    n: int,
+    theta: np.ndarray,
+    rng: np.random.Generator,
+    dtype: str = _DEFAULT_DTYPE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(n, len(theta)) normals from the mixture ½N(0, I) + ½N(θ, I) and their log p/q.
+
+    Callers choose θ so that the shifted half is centred on the VaR quantile.
+    """
+    z = rng.standard_normal((n, len(theta)), dtype=dtype)
+    z[1::2] += theta.astype(dtype)
+    log_ratio = z.astype(np.float64, copy=False) @ theta - 0.5 * float(theta @ theta)
+    return z, np.log(2.0) - np.logaddexp(0.0, log_ratio)
+
+
+def _concat_paths(
+    parts: list[tuple[np.ndarray, Optional[np.ndarray]]],
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """Concatenate (simulated, log_w) pieces in order."""
+    simulated = np.concatenate([p for p, _ in parts])
+    if parts[0][1] is None:
+        return simulated, None
+    return simulated, np.concatenate([w for _, w in parts])
+
+
+def _risk_from_sample(
+    simulated: np.ndarray,
+    alpha: float,
+    horizon_days: int,
+    log_w: Optional[np.ndarray] = None,
+) -> tuple[float, float, float]:
+    """(var, cvar, annualised_vol) of a simulated horizon-return sample.
+
+    With *log_w* the sample is importance-weighted: VaR comes from the
+    weighted empirical CDF (1/n) Σ wᵢ 1{xᵢ ≤ x}. float32 samples are widened
+    to float64 first.
+    """
+    simulated = np.asarray(simulated, dtype=np.float64)
+    if log_w is not None:
+        w = np.exp(log_w)
+        order = np.argsort(simulated, kind="stable")
+        x, w_sorted = simulated[order], w[order]
+        idx = min(int(np.searchsorted(np.cumsum(w_sorted) / len(x), 1.0 - alpha)), len(x) - 1)
+        var = float(-x[idx])
+        cvar = float(-(w_sorted[: idx + 1] @ x[: idx + 1]) / w_sorted[: idx + 1].sum())
+        mean = np.average(simulated, weights=w)
+        vol = float(np.sqrt(np.average((simulated - mean) ** 2, weights=w)) * np.sqrt(252 / horizon_days))
+        return var, cvar, vol
+    var_quantile = np.quantile(simulated, 1.0 - alpha)
+    var = float(-var_quantile)
+    tail = simulated[simulated <= var_quantile]
+    cvar = float(-tail.mean()) if len(tail) > 0 else var
+    vol = float(np.std(simulated, ddof=1) * np.sqrt(252 / horizon_days))
+    return var, cvar, vol
@@ -2,11 +2,19 @@
 
 Simulates N future price paths for each asset, computes portfolio P&L distribution,
 and derives VaR/CVaR from the empirical distribution of simulated returns.
+
+Paths are simulated in chunks and streamed through a ``TailAccumulator``
+that keeps only the tail needed for an exact VaR/CVaR. ``MonteCarloParams``
+selects the sampler (pseudo | antithetic | sobol | importance), the number of
+worker threads (each on its own ``SeedSequence`` child stream), float32
+simulation and an adaptive path count driven by batch-means standard errors.
+``CommonShocks`` reuses one set of shocks across rolling backtest windows.
 """
 from __future__ import annotations
 
-import io
 import logging
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -15,15 +23,52 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+from ..plotting import fig_to_png, histogram_summary
+from .covariance import CovarianceFactors, estimate_factors
 
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on random normals materialised per chunk (≈ 32 MB of float64).
+# Multi-asset chunks are shrunk so that chunk × horizon × n_assets stays below it.
+_MAX_CHUNK_ELEMENTS = 4_000_000
+
+SAMPLERS = ("pseudo", "antithetic", "sobol", "importance")
+
+DTYPES = ("float64", "float32")
+
+# Max relative VaR/CVaR deviation of float32 arithmetic from float64 on the
+# same shocks (see benchmarks/mc_precision.py)
+FLOAT32_REL_TOLERANCE = 1e-4
+
+# Each batch should hold at least this many expected tail points, otherwise
+# batch VaR estimates are biased and batch means understate the error
+_MIN_BATCH_TAIL_POINTS = 10
+
+# scipy's Sobol' direction numbers support at most this many dimensions
+_SOBOL_MAX_DIM = 21_201
+
+# Samplers whose shocks do not depend on the window (importance shifts along
+# the window's loss direction)
+_COMMON_SHOCK_SAMPLERS = ("pseudo", "antithetic", "sobol")
+
+
 @dataclass
 class MonteCarloParams:
     """Hyper-parameters for Monte Carlo simulation."""
     n_simulations: int = 10_000
     seed: Optional[int] = 42
+    chunk_size: int = 50_000        # max paths simulated per chunk
+    keep_samples: bool = False      # retain the full simulated sample (for plotting)
+    sampler: str = "pseudo"         # pseudo | antithetic | sobol | importance
+    n_batches: int = 20             # batches for batch-means standard errors
+    n_workers: int = 1              # worker threads (each with a spawned RNG stream)
+    target_rel_error: Optional[float] = None  # adaptive mode: stop at this relative SE
+    max_simulations: int = 1_000_000          # adaptive mode: path budget
+    dtype: str = "float64"          # float64 | float32 (simulation precision)
 
 
 @dataclass
@@ -43,9 +88,24 @@ class MonteCarloResult:
     params: dict = field(default_factory=dict)
     metrics: dict = field(default_factory=dict)
 
-    # Simulated returns array (kept for plotting)
+    # Simulated returns array (kept for plotting, only with keep_samples=True)
     simulated_returns: Optional[np.ndarray] = None
 
+    # Batch-means standard errors of the VaR / CVaR estimates
+    sampler: str = "pseudo"
+    var_se: float = float("nan")
+    cvar_se: float = float("nan")
+
+    # Adaptive mode: achieved max(SE/VaR, SE/CVaR) and whether the target was met
+    rel_error: float = float("nan")
+    converged: bool = True
+
+    # Importance sampling: likelihood-ratio weights of simulated_returns
+    # (normalised, only with keep_samples=True) and effective sample sizes
+    sample_weights: Optional[np.ndarray] = None
+    ess: float = float("nan")
+    tail_ess: float = float("nan")
+
     def to_mlflow_params(self) -> dict:
         return self.params
 
@@ -64,9 +124,204 @@ def _estimate_gbm_params(returns: np.ndarray) -> tuple[float, float]:
     return mu, sigma
 
 
-def _estimate_covariance(returns_matrix: np.ndarray) -> np.ndarray:
-    """Estimate covariance matrix from a (T x N) returns matrix."""
-    return np.cov(returns_matrix.T, ddof=1)
+# ---------------------------------------------------------------------------
+# Streaming tail / moment accumulator
+# ---------------------------------------------------------------------------
+
+class TailAccumulator:
+    """Streaming VaR/CVaR and moment estimator over simulated returns.
+
+    Keeps running count/mean/M2 and a buffer of the k smallest values seen,
+    with k chosen so that the (1 − α) linear-interpolation quantile of the
+    full *n_total* sample is recoverable exactly. Accumulators built over
+    disjoint parts of the same sample can be combined with ``merge``.
+
+    Args:
+        n_total: Total number of values that will be streamed in.
+        alpha: VaR confidence level (e.g. 0.99).
+        keep_samples: Also retain every value (for plotting).
+    """
+
+    def __init__(self, n_total: int, alpha: float, keep_samples: bool = False) -> None:
+        if n_total < 1:
+            raise ValueError(f"n_total must be >= 1, got {n_total}")
+        self.n_total = int(n_total)
+        self.alpha = float(alpha)
+        self.q = 1.0 - self.alpha
+        self.k = min(self.n_total, int(np.floor((self.n_total - 1) * self.q)) + 2)
+
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._tail = np.empty(0, dtype=np.float64)
+        self._samples: Optional[list[np.ndarray]] = [] if keep_samples else None
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a chunk of simulated returns."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        n_b = values.size
+        if n_b == 0:
+            return
+
+        # Chan et al. parallel update of mean / M2
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        self._combine_moments(n_b, mean_b, m2_b)
+
+        self._tail = _smallest(np.concatenate([self._tail, values]), self.k)
+        if self._samples is not None:
+            self._samples.append(values.copy())
+
+    def merge(self, other: "TailAccumulator") -> None:
+        """Fold another accumulator (over a disjoint part of the sample) into this one."""
+        if other.count == 0:
+            return
+        self._combine_moments(other.count, other.mean, other._m2)
+        self._tail = _smallest(np.concatenate([self._tail, other._tail]), self.k)
+        if self._samples is not None and other._samples is not None:
+            self._samples.extend(other._samples)
+
+    def _combine_moments(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self._m2 += m2_b + delta * delta * n_a * n_b / n
+        self.count = n
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        if self.count < 2:
+            return 0.0
+        return float(np.sqrt(self._m2 / (self.count - 1)))
+
+    def quantile(self) -> float:
+        """(1 − α) quantile of the streamed sample (numpy "linear" method)."""
+        if self.count == 0:
+            raise ValueError("No values accumulated")
+        tail = np.sort(self._tail)
+        pos = (self.count - 1) * self.q
+        lo = int(np.floor(pos))
+        if lo + 1 >= len(tail):
+            return float(tail[min(lo, len(tail) - 1)])
+        return _lerp(float(tail[lo]), float(tail[lo + 1]), pos - lo)
+
+    def var_cvar(self) -> tuple[float, float]:
+        """Return (VaR, CVaR) as positive loss numbers."""
+        q_value = self.quantile()
+        tail = self._tail[self._tail <= q_value]
+        var = float(-q_value)
+        cvar = float(-tail.mean()) if len(tail) > 0 else var
+        return var, cvar
+
+    def samples(self) -> Optional[np.ndarray]:
+        """Full streamed sample in generation order, or None if not retained."""
+        if self._samples is None:
+            return None
+        if not self._samples:
+            return np.empty(0, dtype=np.float64)
+        return np.concatenate(self._samples)
+
+
+def _smallest(values: np.ndarray, k: int) -> np.ndarray:
+    """Return the k smallest entries of *values* (unordered)."""
+    if values.size <= k:
+        return values
+    return np.partition(values, k - 1)[:k]
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    """Linear interpolation, evaluated the same way as numpy.quantile."""
+    diff = b - a
+    if t >= 0.5:
+        return b - diff * (1.0 - t)
+    return a + diff * t
+
+
+class WeightedTailAccumulator:
+    """Likelihood-ratio weighted counterpart of ``TailAccumulator``.
+
+    Used by the importance sampler. Keeps every (value, log-weight) pair —
+    importance sampling needs few paths — and exposes the same interface.
+
+    Args:
+        n_total: Unused; kept for interface compatibility.
+        alpha: VaR confidence level (e.g. 0.999).
+        keep_samples: Expose the sample through ``samples()`` / ``weights()``.
+    """
+
+    def __init__(self, n_total: int, alpha: float, keep_samples: bool = False) -> None:
+        self.alpha = float(alpha)
+        self.q = 1.0 - self.alpha
+        self.keep_samples = keep_samples
+        self._values: list[np.ndarray] = []
+        self._log_w: list[np.ndarray] = []
+        self.count = 0
+
+    def update(self, values: np.ndarray, log_w: Optional[np.ndarray] = None) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        if log_w is None:
+            log_w = np.zeros_like(values)
+        self._values.append(values)
+        self._log_w.append(np.asarray(log_w, dtype=np.float64).ravel())
+        self.count += values.size
+
+    def merge(self, other: "WeightedTailAccumulator") -> None:
+        self._values.extend(other._values)
+        self._log_w.extend(other._log_w)
+        self.count += other.count
+
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        if self.count == 0:
+            raise ValueError("No values accumulated")
+        return np.concatenate(self._values), np.exp(np.concatenate(self._log_w))
+
+    @property
+    def mean(self) -> float:
+        values, w = self._arrays()
+        return float(np.average(values, weights=w))
+
+    @property
+    def std(self) -> float:
+        values, w = self._arrays()
+        mean = np.average(values, weights=w)
+        return float(np.sqrt(np.average((values - mean) ** 2, weights=w)))
+
+    def var_cvar(self) -> tuple[float, float]:
+        """Return (VaR, CVaR) from the weighted empirical CDF."""
+        values, w = self._arrays()
+        order = np.argsort(values, kind="stable")
+        values, w = values[order], w[order]
+        cdf = np.cumsum(w) / self.count
+        idx = min(int(np.searchsorted(cdf, self.q)), len(values) - 1)
+        var = float(-values[idx])
+        tail_w = w[: idx + 1]
+        cvar = float(-(tail_w @ values[: idx + 1]) / tail_w.sum())
+        return var, cvar
+
+    def ess(self) -> tuple[float, float]:
+        """Effective sample size (ESS) overall and within the VaR tail."""
+        values, w = self._arrays()
+        var, _ = self.var_cvar()
+        tail_w = w[values <= -var]
+        ess = float(w.sum() ** 2 / (w ** 2).sum())
+        tail_ess = float(tail_w.sum() ** 2 / (tail_w ** 2).sum()) if len(tail_w) else 0.0
+        return ess, tail_ess
+
+    def samples(self) -> Optional[np.ndarray]:
+        if not self.keep_samples:
+            return None
+        return np.concatenate(self._values) if self._values else np.empty(0)
+
+    def weights(self) -> Optional[np.ndarray]:
+        """Normalised likelihood-ratio weights aligned with ``samples()``."""
+        if not self.keep_samples or not self._values:
+            return None
+        w = np.exp(np.concatenate(self._log_w))
+        return w / w.sum()
 
 
 def run_monte_carlo(
@@ -75,6 +330,7 @@ def run_monte_carlo(
     horizon_days: int = 1,
     weights: Optional[np.ndarray] = None,
     mc_params: Optional[MonteCarloParams] = None,
+    covariance: Optional[CovarianceFactors] = None,
 ) -> MonteCarloResult:
     """Run Monte Carlo simulation on portfolio returns.
 
@@ -87,6 +343,9 @@ def run_monte_carlo(
         horizon_days: Forecast horizon in trading days.
         weights: Portfolio weights (N,) for multi-asset case. Must sum to 1.
         mc_params: Simulation hyper-parameters.
+        covariance: Precomputed window moments / Cholesky factor for the
+                    multi-asset case (e.g. from ``CovarianceCache``); estimated
+                    from *returns* when None.
 
     Returns:
         MonteCarloResult with simulated risk metrics.
@@ -94,14 +353,22 @@ def run_monte_carlo(
     if mc_params is None:
         mc_params = MonteCarloParams()
 
-    rng = np.random.default_rng(mc_params.seed)
+    if mc_params.sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler {mc_params.sampler!r}; expected one of {SAMPLERS}")
+    if mc_params.dtype not in DTYPES:
+        raise ValueError(f"Unknown dtype {mc_params.dtype!r}; expected one of {DTYPES}")
+    dtype = np.dtype(mc_params.dtype)
 
     if returns.ndim == 1:
         # Single-asset / pre-aggregated portfolio returns
         if len(returns) < 30:
             raise ValueError(f"Need at least 30 return observations, got {len(returns)}")
         mu, sigma = _estimate_gbm_params(returns)
-        simulated = _simulate_gbm_1d(mu, sigma, horizon_days, mc_params.n_simulations, rng)
+        shape: tuple[int, ...] = (horizon_days,)
+        loss_direction = np.ones(1)
+
+        def simulate(z: np.ndarray) -> np.ndarray:
+            return _simulate_gbm_1d(mu, sigma, z)
     else:
         # Multi-asset: returns is (T × N)
         if returns.shape[0] < 30:
@@ -112,30 +379,157 @@ def run_monte_carlo(
         weights = np.asarray(weights, dtype=float)
         weights = weights / weights.sum()
 
-        simulated = _simulate_gbm_multiasset(returns, weights, horizon_days, mc_params.n_simulations, rng)
-
-    # Risk metrics from empirical distribution
-    var_quantile = np.quantile(simulated, 1.0 - alpha)  # negative number (loss)
-    var = float(-var_quantile)
-    tail = simulated[simulated <= var_quantile]
-    cvar = float(-tail.mean()) if len(tail) > 0 else var
-
-    vol_annualised = float(np.std(simulated, ddof=1) * np.sqrt(252 / horizon_days))
-    mean_ret = float(np.mean(simulated))
-    std_ret = float(np.std(simulated, ddof=1))
+        drift_vec, L = _gbm_multiasset_factors(returns, covariance)
+        shape = (horizon_days, n_assets)
+        # Portfolio log-return responds to shocks z through wᵀL z
+        loss_direction = L.T @ weights
+        loss_direction = loss_direction / np.linalg.norm(loss_direction)
+
+        # Simulation-precision copies (no-ops for float64)
+        drift_sim, L_sim = drift_vec.astype(dtype), L.astype(dtype)
+        weights_sim = weights.astype(dtype)
+
+        def simulate(z: np.ndarray) -> np.ndarray:
+            return _simulate_gbm_multiasset(drift_sim, L_sim, weights_sim, z)
+
+    dim = int(np.prod(shape))
+    chunk_size = _chunk_rows(mc_params.chunk_size, dim)
+    if mc_params.sampler in ("antithetic", "importance"):
+        chunk_size = max(2, chunk_size - chunk_size % 2)  # keep ± / mixture pairs inside one chunk
+    batch_sizes = _batch_sizes(mc_params.n_simulations, mc_params.n_batches, mc_params.sampler, alpha)
+
+    target = mc_params.target_rel_error
+    adaptive = target is not None
+    if adaptive and target <= 0:
+        raise ValueError(f"target_rel_error must be > 0, got {target}")
+    # Accumulators are sized for the largest sample they may see
+    capacity = max(mc_params.max_simulations, sum(batch_sizes)) if adaptive else sum(batch_sizes)
+    n_workers = max(1, mc_params.n_workers)
+
+    root_seq = np.random.SeedSequence(mc_params.seed)
+    batch_seeds = root_seq.spawn(len(batch_sizes))     # per-batch streams / Sobol' scrambles
+
+    importance = mc_params.sampler == "importance"
+    accumulator = WeightedTailAccumulator if importance else TailAccumulator
+    shift = _importance_shift(loss_direction, horizon_days, alpha) if importance else None
+
+    def run_group(
+        batch_ids: list[int],
+        rng: Optional[np.random.Generator],
+    ) -> tuple[TailAccumulator, list]:
+        # Stream chunks through the accumulators — peak memory is bounded by
+        # chunk_size and the (1 − α) tail, not by n_simulations.
+        # rng=None → every batch draws from its own spawned stream.
+        group_acc = accumulator(capacity, alpha, keep_samples=mc_params.keep_samples)
+        estimates = []
+        for b in batch_ids:
+            batch_n = batch_sizes[b]
+            batch_rng = rng if rng is not None else np.random.default_rng(batch_seeds[b])
+            normals = _NormalSampler(mc_params.sampler, dim, batch_rng, batch_seeds[b], shift, dtype)
+            batch_acc = accumulator(batch_n, alpha)
+            done = 0
+            while done < batch_n:
+                n = min(chunk_size, batch_n - done)
+                z = normals.draw(n)
+                sims = simulate(z.reshape((n,) + shape))
+                if importance:
+                    log_w = normals.log_weights(z)
+                    group_acc.update(sims, log_w)
+                    batch_acc.update(sims, log_w)
+                else:
+                    group_acc.update(sims)
+                    batch_acc.update(sims)
+                done += n
+            estimates.append(batch_acc.var_cvar())
+        return group_acc, estimates
+
+    def run_batches(
+        batch_ids: list[int],
+        worker_rngs: Optional[list[np.random.Generator]],
+    ) -> tuple[TailAccumulator, list]:
+        workers = min(n_workers, len(batch_ids))
+        if workers == 1:
+            return run_group(batch_ids, worker_rngs[0] if worker_rngs else None)
+        groups = [g.tolist() for g in np.array_split(np.asarray(batch_ids), workers)]
+        rngs = worker_rngs if worker_rngs else [None] * workers
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mc-worker") as pool:
+            partials = list(pool.map(run_group, groups, rngs))
+        # Merge in worker order so the result does not depend on thread timing
+        merged, merged_estimates = partials[0]
+        for part_acc, part_estimates in partials[1:]:
+            merged.merge(part_acc)
+            merged_estimates.extend(part_estimates)
+        return merged, merged_estimates
+
+    if n_workers == 1:
+        # Single sequential stream — identical paths to the original implementation
+        worker_rngs: Optional[list[np.random.Generator]] = [np.random.default_rng(mc_params.seed)]
+    elif not adaptive:
+        workers = min(n_workers, len(batch_sizes))
+        worker_rngs = [np.random.default_rng(s) for s in root_seq.spawn(workers)]
+    else:
+        worker_rngs = None
+
+    acc, estimates = run_batches(list(range(len(batch_sizes))), worker_rngs)
+    var, cvar = acc.var_cvar()
+    var_se, cvar_se = _batch_means_se_pair(estimates)
+    rel_error = _relative_error(var, var_se, cvar, cvar_se)
+
+    while adaptive and rel_error > target:
+        n_done = len(batch_sizes)
+        room = (capacity - sum(batch_sizes)) // batch_sizes[0]
+        # Batch-means SE decays as 1/√B — extrapolate, but at most double per round
+        needed = int(np.ceil(n_done * (rel_error / target) ** 2)) - n_done
+        extra = min(max(needed, 1), n_done, room)
+        if extra <= 0:
+            break
+        batch_sizes.extend([batch_sizes[0]] * extra)
+        batch_seeds.extend(root_seq.spawn(extra))
+
+        part_acc, part_estimates = run_batches(list(range(n_done, len(batch_sizes))), worker_rngs)
+        acc.merge(part_acc)
+        estimates.extend(part_estimates)
+
+        var, cvar = acc.var_cvar()
+        var_se, cvar_se = _batch_means_se_pair(estimates)
+        rel_error = _relative_error(var, var_se, cvar, cvar_se)
+        logger.debug(
+            "Monte Carlo adaptive: n=%d  rel_error=%.4f  target=%.4f",
+            sum(batch_sizes), rel_error, target,
+        )
+
+    n_sims = int(sum(batch_sizes))
+    converged = (not adaptive) or rel_error <= target
+
+    # Risk metrics from the empirical distribution
+    mean_ret = acc.mean
+    std_ret = acc.std
+    vol_annualised = float(std_ret * np.sqrt(252 / horizon_days))
 
     logger.info(
-        "Monte Carlo: n=%d  VaR(%.0f%%)=%.6f  CVaR=%.6f  vol=%.4f",
-        mc_params.n_simulations, alpha * 100, var, cvar, vol_annualised,
+        "Monte Carlo: n=%d  sampler=%s  VaR(%.0f%%)=%.6f (±%.6f)  CVaR=%.6f (±%.6f)  vol=%.4f",
+        n_sims, mc_params.sampler, alpha * 100, var, var_se, cvar, cvar_se, vol_annualised,
     )
+    if adaptive and not converged:
+        logger.warning(
+            "Monte Carlo adaptive: path budget %d exhausted at rel_error=%.4f (target %.4f)",
+            capacity, rel_error, target,
+        )
 
     params = {
         "model_type": "montecarlo",
-        "n_simulations": mc_params.n_simulations,
+        "n_simulations": n_sims,
         "alpha": alpha,
         "horizon_days": horizon_days,
         "n_observations": int(returns.shape[0]),
         "seed": mc_params.seed if mc_params.seed is not None else -1,
+        "chunk_size": chunk_size,
+        "sampler": mc_params.sampler,
+        "dtype": mc_params.dtype,
+        "n_batches": len(batch_sizes),
+        "n_workers": n_workers,
+        "target_rel_error": target if adaptive else -1,
+        "max_simulations": capacity if adaptive else n_sims,
     }
     metrics = {
         "var": var,
@@ -144,6 +538,18 @@ def run_monte_carlo(
         "mean_simulated_return": mean_ret,
         "std_simulated_return": std_ret,
     }
+    if np.isfinite(var_se):
+        metrics["var_se"] = var_se
+        metrics["cvar_se"] = cvar_se
+        metrics["mc_rel_error"] = rel_error
+    if adaptive:
+        metrics["mc_paths_used"] = float(n_sims)
+    ess = tail_ess = float("nan")
+    if importance:
+        ess, tail_ess = acc.ess()
+        metrics["is_ess"] = ess
+        metrics["is_tail_ess"] = tail_ess
+        logger.info("Monte Carlo importance sampling: ESS=%.0f  tail ESS=%.0f of %d paths", ess, tail_ess, n_sims)
 
     return MonteCarloResult(
         var=var,
@@ -151,72 +557,323 @@ def run_monte_carlo(
         volatility=vol_annualised,
         mean_return=mean_ret,
         std_return=std_ret,
-        n_simulations=mc_params.n_simulations,
+        n_simulations=n_sims,
         params=params,
         metrics=metrics,
-        simulated_returns=simulated,
+        simulated_returns=acc.samples(),
+        sampler=mc_params.sampler,
+        var_se=var_se,
+        cvar_se=cvar_se,
+        rel_error=rel_error,
+        converged=converged,
+        sample_weights=acc.weights() if importance else None,
+        ess=ess,
+        tail_ess=tail_ess,
     )
 
 
+# ---------------------------------------------------------------------------
+# Common random numbers (rolling backtests)
+# ---------------------------------------------------------------------------
+
+class CommonShocks:
+    """Horizon-summed standard normals shared by every window of a backtest.
+
+    Draws the stream ``run_monte_carlo`` would draw for *mc_params* once and
+    stores ΣZ over the horizon, shape (n_simulations, n_assets). ``var_cvar``
+    rescales it with a window's GBM parameters.
+
+    Args:
+        mc_params: Simulation hyper-parameters (see ``supports``).
+        alpha: VaR confidence level.
+        horizon_days: Forecast horizon in trading days.
+        n_assets: 1 for portfolio returns, N for a (T × N) asset matrix.
+    """
+
+    def __init__(
+        self,
+        mc_params: MonteCarloParams,
+        alpha: float,
+        horizon_days: int,
+        n_assets: int = 1,
+    ) -> None:
+        if not self.supports(mc_params):
+            raise ValueError(
+                f"Common shocks need sampler in {_COMMON_SHOCK_SAMPLERS}, one worker, float64 "
+                f"and no target_rel_error; got sampler={mc_params.sampler!r}"
+            )
+        self.alpha = float(alpha)
+        self.horizon_days = int(horizon_days)
+        self.n_assets = int(n_assets)
+
+        dim = self.horizon_days * self.n_assets
+        chunk_size = _chunk_rows(mc_params.chunk_size, dim)
+        if mc_params.sampler == "antithetic":
+            chunk_size = max(2, chunk_size - chunk_size % 2)
+        batch_sizes = _batch_sizes(mc_params.n_simulations, mc_params.n_batches, mc_params.sampler, alpha)
+        batch_seeds = np.random.SeedSequence(mc_params.seed).spawn(len(batch_sizes))
+        rng = np.random.default_rng(mc_params.seed)
+
+        # Same batch / chunk order as run_monte_carlo with n_workers == 1
+        sums = []
+        for batch_n, seed_seq in zip(batch_sizes, batch_seeds):
+            normals = _NormalSampler(mc_params.sampler, dim, rng, seed_seq)
+            done = 0
+            while done < batch_n:
+                n = min(chunk_size, batch_n - done)
+                z = normals.draw(n)
+                sums.append(z.reshape(n, self.horizon_days, self.n_assets).sum(axis=1))
+                done += n
+        self.shock_sums = np.concatenate(sums)    # (n_simulations, n_assets)
+        self.n_simulations = len(self.shock_sums)
+
+    @staticmethod
+    def supports(mc_params: MonteCarloParams) -> bool:
+        """True if *mc_params* draws the same shocks for every window."""
+        return (
+            mc_params.sampler in _COMMON_SHOCK_SAMPLERS
+            and mc_params.n_workers <= 1
+            and mc_params.target_rel_error is None
+            and mc_params.dtype == "float64"
+        )
+
+    def var_cvar(
+        self,
+        returns: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+        covariance: Optional[CovarianceFactors] = None,
+    ) -> tuple[float, float]:
+        """(VaR, CVaR) of one window, as ``run_monte_carlo`` would estimate them.
+
+        Args:
+            returns: 1-D window of portfolio returns, or (T × N) asset returns.
+            weights: Portfolio weights (N,) for the multi-asset case.
+            covariance: Precomputed window factors (multi-asset case).
+        """
+        h = self.horizon_days
+        if returns.shape[0] < 30:
+            raise ValueError(f"Need at least 30 return observations, got {returns.shape[0]}")
+        if returns.ndim == 1:
+            mu, sigma = _estimate_gbm_params(returns)
+            total_log_returns = h * (mu - 0.5 * sigma ** 2) + sigma * self.shock_sums[:, 0]
+            sims = np.exp(total_log_returns) - 1.0
+        else:
+            if returns.shape[1] != self.n_assets:
+                raise ValueError(f"Expected {self.n_assets} assets, got {returns.shape[1]}")
+            if weights is None:
+                weights = np.ones(self.n_assets) / self.n_assets
+            weights = np.asarray(weights, dtype=float)
+            weights = weights / weights.sum()
+            drift_vec, L = _gbm_multiasset_factors(returns, covariance)
+            total_log_returns = h * drift_vec + self.shock_sums @ L.T
+            sims = (np.exp(total_log_returns) - 1.0) @ weights
+
+        acc = TailAccumulator(self.n_simulations, self.alpha)
+        acc.update(sims)
+        return acc.var_cvar()
+
+
+# ---------------------------------------------------------------------------
+# Samplers
+# ---------------------------------------------------------------------------
+
+class _NormalSampler:
+    """Produces (n, dim) standard normals for one batch according to *sampler*.
+
+    pseudo / antithetic / importance draw from the shared generator *rng* so
+    that batches continue one stream; sobol builds an independently scrambled
+    net per batch from *seed_seq*. importance adds the mean *shift* θ to every
+    other draw; ``log_weights`` returns the matching log likelihood ratios.
+    """
+
+    def __init__(
+        self,
+        sampler: str,
+        dim: int,
+        rng: np.random.Generator,
+        seed_seq: np.random.SeedSequence,
+        shift: Optional[np.ndarray] = None,
+        dtype: np.dtype = np.dtype(np.float64),
+    ) -> None:
+        self.sampler = sampler
+        self.dim = dim
+        self.rng = rng
+        self.shift = shift
+        self.dtype = dtype
+        self._sobol: Optional[qmc.Sobol] = None
+        if sampler == "sobol":
+            if dim > _SOBOL_MAX_DIM:
+                raise ValueError(
+                    f"Sobol sampler supports at most {_SOBOL_MAX_DIM} dimensions "
+                    f"(horizon × assets), got {dim}"
+                )
+            self._sobol = qmc.Sobol(d=dim, scramble=True, seed=np.random.default_rng(seed_seq))
+
+    def draw(self, n: int) -> np.ndarray:
+        if self.sampler == "pseudo":
+            return self.rng.standard_normal((n, self.dim), dtype=self.dtype)
+        if self.sampler == "importance":
+            z = self.rng.standard_normal((n, self.dim), dtype=self.dtype)
+            z[1::2] += self.shift.astype(self.dtype)   # defensive mixture: every other path is shifted
+            return z
+        if self.sampler == "antithetic":
+            half = self.rng.standard_normal(((n + 1) // 2, self.dim), dtype=self.dtype)
+            return np.concatenate([half, -half])[:n]
+        with warnings.catch_warnings():
+            # Chunks inside a power-of-two batch need not be powers of two themselves
+            warnings.filterwarnings("ignore", message=".*balance properties.*")
+            u = self._sobol.random(n)
+        # Scrambled points are never exactly 0 or 1, but guard Φ⁻¹ anyway
+        eps = np.finfo(np.float64).eps
+        return ndtri(np.clip(u, eps, 1.0 - eps)).astype(self.dtype, copy=False)
+
+    def log_weights(self, z: np.ndarray) -> np.ndarray:
+        """log p(z) − log q(z) for the mixture q = ½N(0, I) + ½N(θ, I).
+
+        p/q = 1 / (½ + ½·exp(θ·z − ½‖θ‖²)), which is bounded by 2.
+        """
+        log_ratio = z.astype(np.float64, copy=False) @ self.shift - 0.5 * float(self.shift @ self.shift)
+        return np.log(2.0) - np.logaddexp(0.0, log_ratio)
+
+
+def _importance_shift(loss_direction: np.ndarray, horizon_days: int, alpha: float) -> np.ndarray:
+    """Flattened per-day mean shift that centres the horizon P&L on the VaR quantile.
+
+    Args:
+        loss_direction: Unit vector of daily shocks that moves the portfolio
+                        log-return the most (length = number of assets).
+        horizon_days:   Horizon in trading days.
+        alpha:          VaR confidence level.
+
+    Returns:
+        1-D array of length horizon_days × n_assets, in the sampler's layout.
+    """
+    z_q = float(ndtri(1.0 - alpha))
+    return np.tile(loss_direction * (z_q / np.sqrt(horizon_days)), horizon_days)
+
+
+def _batch_sizes(n_simulations: int, n_batches: int, sampler: str, alpha: float) -> list[int]:
+    """Split *n_simulations* into equal batches for batch-means standard errors.
+
+    Fewer than *n_batches* are used when batches would hold less than
+    ``_MIN_BATCH_TAIL_POINTS`` expected tail observations (but at least two
+    whenever possible). Under importance sampling about a quarter of the
+    paths land in the tail.
+
+    Sobol' batches are a power of two: the smallest one that meets the tail
+    minimum and keeps to *n_batches* batches, as many of them as fit in
+    *n_simulations* (two of the largest fitting size if none does). The
+    total therefore never exceeds *n_simulations* but may fall short of it
+    by up to half; ``MonteCarloResult.n_simulations`` is the count used.
+    """
+    if n_simulations < 1:
+        raise ValueError(f"n_simulations must be >= 1, got {n_simulations}")
+    tail_prob = 0.25 if sampler == "importance" else 1.0 - alpha
+    min_batch = int(np.ceil(_MIN_BATCH_TAIL_POINTS / max(tail_prob, 1e-12)))
+    if sampler == "sobol":
+        per_batch = 1 << int(np.ceil(np.log2(max(min_batch, -(-n_simulations // max(1, n_batches))))))
+        if n_simulations // per_batch < 2:
+            per_batch = 1 << max(0, int(np.log2(max(1, n_simulations // 2))))
+        return [per_batch] * max(1, n_simulations // per_batch)
+    n_b = min(n_batches, n_simulations // min_batch)
+    if n_b < 2:
+        n_b = min(2, n_simulations)
+    base, rem = divmod(n_simulations, n_b)
+    return [base + (1 if i < rem else 0) for i in range(n_b)]
+
+
+def _batch_means_se(estimates: np.ndarray) -> float:
+    """Standard error of the pooled estimate from per-batch estimates."""
+    if len(estimates) < 2:
+        return float("nan")
+    return float(np.std(estimates, ddof=1) / np.sqrt(len(estimates)))
+
+
+def _batch_means_se_pair(estimates: list[tuple[float, float]]) -> tuple[float, float]:
+    """Batch-means SE of (VaR, CVaR) from per-batch (var, cvar) pairs."""
+    arr = np.asarray(estimates, dtype=float).reshape(-1, 2)
+    return _batch_means_se(arr[:, 0]), _batch_means_se(arr[:, 1])
+
+
+def _relative_error(var: float, var_se: float, cvar: float, cvar_se: float) -> float:
+    """max(SE(VaR)/|VaR|, SE(CVaR)/|CVaR|); inf when undefined."""
+    if not (np.isfinite(var_se) and np.isfinite(cvar_se)) or var == 0 or cvar == 0:
+        return float("inf")
+    return float(max(var_se / abs(var), cvar_se / abs(cvar)))
+
+
 def _simulate_gbm_1d(
     mu: float,
     sigma: float,
-    horizon: int,
-    n_sims: int,
-    rng: np.random.Generator,
+    z: np.ndarray,
 ) -> np.ndarray:
-    """Simulate GBM log-returns for a single asset over *horizon* days.
+    """Simulate GBM returns for a single asset from standard normals.
+
+    Args:
+        mu: Daily GBM drift.
+        sigma: Daily GBM volatility.
+        z: (n_sims, horizon) standard normal shocks.
 
-    Returns array of shape (n_sims,) with total log-returns over the horizon.
+    Returns array of shape (n_sims,) with total simple returns over the horizon,
+    in the dtype of *z*.
     """
     # Each simulation: sum of horizon daily log-returns
     # log-return ~ N((mu - 0.5*sigma^2)*dt, sigma^2*dt), dt=1 day
     dt = 1.0
     drift = (mu - 0.5 * sigma ** 2) * dt
     diffusion = sigma * np.sqrt(dt)
-    # Shape: (n_sims, horizon)
-    daily_log_returns = rng.normal(loc=drift, scale=diffusion, size=(n_sims, horizon))
+    daily_log_returns = drift + diffusion * z
     total_log_returns = daily_log_returns.sum(axis=1)
     # Convert log-return to simple return: e^r - 1
     return np.exp(total_log_returns) - 1.0
 
 
-def _simulate_gbm_multiasset(
+def _chunk_rows(chunk_size: int, elements_per_path: int) -> int:
+    """Paths per chunk, capped so one chunk holds at most _MAX_CHUNK_ELEMENTS normals."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    return max(1, min(chunk_size, _MAX_CHUNK_ELEMENTS // max(1, elements_per_path)))
+
+
+def _gbm_multiasset_factors(
     returns: np.ndarray,
+    covariance: Optional[CovarianceFactors] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Daily drift vector and Cholesky factor for a (T × N) returns matrix.
+
+    Uses *covariance* when given, otherwise estimates it (with PD repair).
+
+    Returns:
+        (drift_vec, L) — drift_vec is (N,), L is lower-triangular (N × N).
+    """
+    if covariance is None:
+        covariance = estimate_factors(returns)
+    if covariance.repaired:
+        logger.warning("Monte Carlo: covariance was not positive definite — eigenvalues clipped")
+
+    # Daily log drift = mean return, as _estimate_gbm_params' mu − ½σ² for one asset
+    drift_vec = covariance.mean
+    return drift_vec, covariance.chol
+
+
+def _simulate_gbm_multiasset(
+    drift_vec: np.ndarray,
+    L: np.ndarray,
     weights: np.ndarray,
-    horizon: int,
-    n_sims: int,
-    rng: np.random.Generator,
+    z: np.ndarray,
 ) -> np.ndarray:
-    """Simulate correlated GBM paths for multiple assets using Cholesky decomposition.
+    """Simulate one chunk of correlated GBM paths for multiple assets.
 
     Args:
-        returns: (T × N) historical returns matrix.
+        drift_vec: (N,) daily log-return drift per asset.
+        L: (N × N) Cholesky factor of the daily covariance matrix.
         weights: (N,) portfolio weights.
-        horizon: Forecast horizon in days.
-        n_sims: Number of simulations.
-        rng: Random number generator.
+        z: (n_sims, horizon, N) independent standard normal shocks
+           (same dtype as drift_vec / L / weights).
 
     Returns:
         (n_sims,) array of simulated portfolio returns over the horizon.
     """
-    n_assets = returns.shape[1]
-    mu_vec = np.mean(returns, axis=0)
-    cov_mat = _estimate_covariance(returns)
-
-    # Cholesky decomposition for correlated sampling
-    try:
-        L = np.linalg.cholesky(cov_mat)
-    except np.linalg.LinAlgError:
-        # Fallback: add small regularisation if matrix is not positive definite
-        cov_mat += np.eye(n_assets) * 1e-8
-        L = np.linalg.cholesky(cov_mat)
-
-    sigma_vec = np.sqrt(np.diag(cov_mat))
-    drift_vec = mu_vec - 0.5 * sigma_vec ** 2  # daily drift
-
-    # Simulate: (n_sims, horizon, n_assets)
-    z = rng.standard_normal((n_sims, horizon, n_assets))
     # Apply Cholesky: correlated shocks
     corr_z = z @ L.T  # (n_sims, horizon, n_assets)
 
@@ -229,40 +886,63 @@ def _simulate_gbm_multiasset(
     return portfolio_returns
 
 
-def plot_monte_carlo_distribution(result: MonteCarloResult, symbol: str = "portfolio") -> bytes:
-    """Generate a return distribution plot and return PNG bytes for MLflow artifact logging."""
+def monte_carlo_plot_summary(
+    result: MonteCarloResult,
+    symbol: str = "portfolio",
+    bins: int = 200,
+) -> dict:
+    """Downsampled data behind ``plot_monte_carlo_distribution`` (JSON-serialisable).
+
+    One (likelihood-ratio weighted) histogram of the simulated returns gives
+    both panels: bin densities and the CDF at the bin edges. O(n), no sort;
+    afterwards ``result.simulated_returns`` may be dropped.
+    """
     if result.simulated_returns is None:
-        raise ValueError("simulated_returns not available in result")
+        raise ValueError(
+            "simulated_returns not available in result — run with MonteCarloParams(keep_samples=True)"
+        )
+    return {
+        "kind": "mc_distribution",
+        "symbol": symbol,
+        "n_simulations": result.n_simulations,
+        "var": result.var,
+        "cvar": result.cvar,
+        "hist": histogram_summary(result.simulated_returns, bins=bins, weights=result.sample_weights),
+    }
 
-    sims = result.simulated_returns
+
+def render_monte_carlo_distribution(summary: dict) -> bytes:
+    """Render a ``monte_carlo_plot_summary`` as the two-panel distribution PNG."""
+    var, cvar = summary["var"], summary["cvar"]
+    edges = np.asarray(summary["hist"]["edges"])
     fig, axes = plt.subplots(1, 2, figsize=(12, 5))
-    fig.suptitle(f"Monte Carlo Simulation — {symbol} ({result.n_simulations:,} paths)", fontsize=13)
+    fig.suptitle(
+        f"Monte Carlo Simulation — {summary['symbol']} ({summary['n_simulations']:,} paths)", fontsize=13,
+    )
 
     # 1. Return distribution histogram
     ax = axes[0]
-    ax.hist(sims, bins=100, density=True, color="steelblue", alpha=0.7, edgecolor="white")
-    ax.axvline(-result.var, color="red", linewidth=1.5, linestyle="--", label=f"VaR = {result.var:.4f}")
-    ax.axvline(-result.cvar, color="darkred", linewidth=1.5, linestyle=":", label=f"CVaR = {result.cvar:.4f}")
+    ax.stairs(summary["hist"]["density"], edges, fill=True, color="steelblue", alpha=0.7)
+    ax.axvline(-var, color="red", linewidth=1.5, linestyle="--", label=f"VaR = {var:.4f}")
+    ax.axvline(-cvar, color="darkred", linewidth=1.5, linestyle=":", label=f"CVaR = {cvar:.4f}")
     ax.set_title("Simulated Return Distribution")
     ax.set_xlabel("Portfolio Return")
     ax.set_ylabel("Density")
     ax.legend()
 
-    # 2. Cumulative distribution
+    # 2. Cumulative distribution (at the bin edges)
     ax = axes[1]
-    sorted_sims = np.sort(sims)
-    cdf = np.arange(1, len(sorted_sims) + 1) / len(sorted_sims)
-    ax.plot(sorted_sims, cdf, color="steelblue", linewidth=1)
-    ax.axvline(-result.var, color="red", linewidth=1.5, linestyle="--", label=f"VaR = {result.var:.4f}")
-    ax.axvline(-result.cvar, color="darkred", linewidth=1.5, linestyle=":", label=f"CVaR = {result.cvar:.4f}")
+    ax.plot(edges, np.concatenate([[0.0], summary["hist"]["cdf"]]), color="steelblue", linewidth=1)
+    ax.axvline(-var, color="red", linewidth=1.5, linestyle="--", label=f"VaR = {var:.4f}")
+    ax.axvline(-cvar, color="darkred", linewidth=1.5, linestyle=":", label=f"CVaR = {cvar:.4f}")
     ax.set_title("Cumulative Distribution")
     ax.set_xlabel("Portfolio Return")
     ax.set_ylabel("Probability")
     ax.legend()
 
-    plt.tight_layout()
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=100)
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    return fig_to_png(fig)
+
+
+def plot_monte_carlo_distribution(result: MonteCarloResult, symbol: str = "portfolio") -> bytes:
+    """Generate a return distribution plot and return PNG bytes for MLflow artifact logging."""
+    return render_monte_carlo_distribution(monte_carlo_plot_summary(result, symbol))
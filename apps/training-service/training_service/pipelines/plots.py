@@ -0,0 +1,83 @@
+"""Deferred / on-demand rendering of diagnostic plots.
+
+With ``Settings.diagnostic_plots`` = "deferred" or "on_demand" the training
+pipeline logs only plot summaries (``plots/summaries/*.json``, see
+``training_service.plotting``) inside its MLflow run, so matplotlib stays
+off the path to ``model.trained``. ``render_run_plots`` turns a run's
+summaries into PNG artifacts:
+
+    deferred   — ``schedule_plot_rendering(run_id)`` after the model is
+                 registered; a single background thread renders the plots
+    on_demand  — POST /api/risk/train/run/{run_id}/plots
+
+Rendering is idempotent: a PNG re-rendered from the same summary replaces
+the previous artifact of the same name.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import mlflow
+
+from ..backtesting.report import render_backtest
+from ..models.garch import render_garch_diagnostics
+from ..models.montecarlo import render_monte_carlo_distribution
+from ..plotting import SUMMARY_ARTIFACT_DIR
+
+logger = logging.getLogger(__name__)
+
+# Summary "kind" → renderer
+_RENDERERS: dict[str, Callable[[dict], bytes]] = {
+    "garch_diagnostics": render_garch_diagnostics,
+    "mc_distribution": render_monte_carlo_distribution,
+    "backtest": render_backtest,
+}
+
+# One thread: pyplot is not thread-safe, and plots are never urgent
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plots")
+
+
+def render_run_plots(run_id: str) -> list[str]:
+    """Render every plot summary of MLflow run *run_id* and log the PNGs to it.
+
+    Returns the run-relative paths of the PNG artifacts written. Summaries of
+    an unknown kind are skipped with a warning.
+    """
+    client = mlflow.tracking.MlflowClient()
+    summaries = [a.path for a in client.list_artifacts(run_id, SUMMARY_ARTIFACT_DIR) if a.path.endswith(".json")]
+    written: list[str] = []
+    with tempfile.TemporaryDirectory(prefix="riskops-plots-") as tmp_dir:
+        for artifact in summaries:
+            local = mlflow.artifacts.download_artifacts(run_id=run_id, artifact_path=artifact, dst_path=tmp_dir)
+            with open(local) as f:
+                summary = json.load(f)
+            render = _RENDERERS.get(summary.get("kind"))
+            if render is None:
+                logger.warning(
+                    "Run %s: unknown plot summary kind %r in %s — skipped", run_id, summary.get("kind"), artifact,
+                )
+                continue
+            png = os.path.join(tmp_dir, f"{summary['name']}.png")
+            with open(png, "wb") as f:
+                f.write(render(summary))
+            client.log_artifact(run_id, png, artifact_path=summary["artifact_path"])
+            written.append(f"{summary['artifact_path']}/{summary['name']}.png")
+    logger.info("Run %s: rendered %d diagnostic plots", run_id, len(written))
+    return written
+
+
+def _render_quietly(run_id: str) -> None:
+    try:
+        render_run_plots(run_id)
+    except Exception as exc:
+        logger.warning("Deferred plot rendering failed for run %s (non-fatal): %s", run_id, exc)
+
+
+def schedule_plot_rendering(run_id: str) -> Future:
+    """Queue ``render_run_plots(run_id)`` on the background plot thread."""
+    return _executor.submit(_render_quietly, run_id)
@@ -3,17 +3,24 @@
 This module is the single entry point for all training runs. It is called:
   - By the FastAPI endpoint POST /api/risk/train
   - By the Kafka consumer when a market.data.ingested event arrives
+  - By POST /api/risk/train/universe for the per-symbol volatility models
+    (``run_universe_training``; see "Universe training" below)
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import math
+import multiprocessing
 import os
 import pickle
 import socket
 import tempfile
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timezone
 from typing import Optional
 
 import mlflow
@@ -21,14 +28,41 @@ import mlflow.pyfunc
 import numpy as np
 import pandas as pd
 from sqlalchemy import text
-
-from ..backtesting import build_report, log_backtest_to_mlflow, run_rolling_backtest
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..backtesting import (
+    RollingBacktestResult,
+    build_report,
+    log_backtest_to_mlflow,
+    run_incremental_backtest,
+    run_rolling_backtest,
+)
 from ..config import get_settings
 from ..db import get_engine
 from ..metrics.risk_metrics import RiskMetrics, compute_all as compute_risk_metrics
-from ..models.garch import GARCHParams, GARCHResult, plot_garch_diagnostics, train_garch
-from ..models.mc_pyfunc import MonteCarloModel
-from ..models.montecarlo import MonteCarloParams, MonteCarloResult, plot_monte_carlo_distribution, run_monte_carlo
+from ..models.covariance import CovarianceCache, CovarianceFactors, estimate_factors
+from ..models.garch import (
+    COMPACT_ARTIFACT,
+    FitTimeout,
+    GARCHParams,
+    GARCHResult,
+    compact_artifact,
+    fit_time_limit,
+    garch_plot_summary,
+    render_garch_diagnostics,
+    train_garch,
+)
+from ..models.garch_tournament import TournamentResult, run_tournament, spec_label
+from ..models.mc_pyfunc import MonteCarloModel, MultiAssetMonteCarloModel
+from ..models.montecarlo import (
+    MonteCarloParams,
+    MonteCarloResult,
+    monte_carlo_plot_summary,
+    render_monte_carlo_distribution,
+    run_monte_carlo,
+)
+from ..plotting import log_plot_artifact
+from .plots import schedule_plot_rendering
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +168,41 @@ def load_benchmark_returns(
     return None
 
 
+def build_returns_matrix(returns_df: pd.DataFrame) -> tuple[np.ndarray, list[str]]:
+    """Pivot returns into a (T × N) matrix on dates where every symbol has data.
+
+    Returns (matrix, symbols) with columns in *symbols* order.
+    """
+    pivot = returns_df.pivot(index="price_date", columns="symbol", values="ret").dropna()
+    return pivot.values.astype(float), list(pivot.columns)
+
+
+def returns_dates(returns_df: pd.DataFrame) -> list[date]:
+    """Dates of the rows of ``build_returns_matrix`` / ``build_portfolio_returns``."""
+    pivot = returns_df.pivot(index="price_date", columns="symbol", values="ret").dropna()
+    return [pd.Timestamp(d).date() for d in pivot.index]
+
+
+# Multi-asset MC factors, reused when a run sees the same window again
+# (retrain of the same universe, or several scopes over one symbol set)
+_MULTIASSET_COV_CACHE = CovarianceCache(max_entries=16)
+
+
+def _multiasset_factors(
+    asset_returns: np.ndarray,
+    asset_symbols: list[str],
+    dates: Optional[list[date]],
+) -> CovarianceFactors:
+    """CovarianceFactors of the full returns matrix, cached by (symbols, last date, length)."""
+    if not dates:
+        return estimate_factors(asset_returns)
+    n_obs = len(asset_returns)
+    # The last date goes into the column key: a new trading day is a new matrix
+    return _MULTIASSET_COV_CACHE.get(
+        asset_returns, n_obs, n_obs, symbols=[(sym, dates[-1]) for sym in asset_symbols],
+    )
+
+
 def build_portfolio_returns(
     returns_df: pd.DataFrame,
     weights: Optional[dict[str, float]] = None,
@@ -143,20 +212,23 @@ def build_portfolio_returns(
     If *weights* is None, uses equal weights.
     Returns a 1-D numpy array of portfolio returns.
     """
-    pivot = returns_df.pivot(index="price_date", columns="symbol", values="ret").dropna()
-    symbols = list(pivot.columns)
+    matrix, symbols = build_returns_matrix(returns_df)
+    port_rets = matrix @ portfolio_weight_vector(symbols, weights)
+    return port_rets.astype(float)
 
-    if weights is None:
-        w = np.ones(len(symbols)) / len(symbols)
-    else:
-        w = np.array([weights.get(s, 0.0) for s in symbols], dtype=float)
-        total = w.sum()
-        if total <= 0:
-            raise ValueError("Sum of weights must be > 0")
-        w = w / total
 
-    port_rets = pivot.values @ w
-    return port_rets.astype(float)
+def portfolio_weight_vector(
+    symbols: list[str],
+    weights: Optional[dict[str, float]] = None,
+) -> np.ndarray:
+    """Normalised weights aligned with *symbols*; equal weights if *weights* is None."""
+    if weights is None:
+        return np.ones(len(symbols)) / len(symbols)
+    w = np.array([weights.get(s, 0.0) for s in symbols], dtype=float)
+    total = w.sum()
+    if total <= 0:
+        raise ValueError("Sum of weights must be > 0")
+    return w / total
 
 
 # ---------------------------------------------------------------------------
@@ -214,6 +286,11 @@ class TrainRequest:
     lookback_days: int = 252
     weights: Optional[dict[str, float]] = None
     n_simulations: int = 10_000
+    mc_sampler: str = "pseudo"       # pseudo | antithetic | sobol | importance
+    mc_target_rel_error: Optional[float] = None  # adaptive MC: n_simulations becomes the pilot size
+    garch_tournament: bool = False   # pick the GARCH (p, q, dist, mean) by tournament
+    scope: str = "global"            # global | portfolio | symbols (see registered_model_name)
+    portfolio_id: Optional[int] = None  # required for scope="portfolio"
 
 
 @dataclass
@@ -230,30 +307,117 @@ class TrainResult:
     error: Optional[str] = None
 
 
+# ---------------------------------------------------------------------------
+# Registered model names
+# ---------------------------------------------------------------------------
+#
+# A training request registers its models as riskops-<type> (scope "global")
+# or, for a model fitted to one portfolio or one symbol set, as
+# riskops-<type>--portfolio-<id> / riskops-<type>--symbols-<hash>. The
+# Inference Service serves a portfolio from its most specific registered
+# model; the names must match inference_service.models.loader.
+
+MODEL_SCOPES = ("global", "portfolio", "symbols")
+
+
+def model_scope(req: TrainRequest) -> str:
+    """Scope suffix of *req*'s models: "global", "portfolio-<id>" or "symbols-<hash>"."""
+    if req.scope == "global":
+        return "global"
+    if req.scope == "portfolio":
+        if req.portfolio_id is None:
+            raise ValueError("scope='portfolio' requires portfolio_id")
+        return f"portfolio-{req.portfolio_id}"
+    if req.scope == "symbols":
+        # Order-independent, hashed to keep MLflow names short
+        digest = hashlib.sha1(",".join(sorted(set(req.symbols))).encode("utf-8")).hexdigest()
+        return f"symbols-{digest[:12]}"
+    raise ValueError(f"Unknown scope {req.scope!r}; expected one of {MODEL_SCOPES}")
+
+
+def registered_model_name(model_type: str, scope: str = "global") -> str:
+    """MLflow registered model name of (model_type, scope)."""
+    base = f"riskops-{model_type}"
+    return base if scope == "global" else f"{base}--{scope}"
+
+
 # ---------------------------------------------------------------------------
 # Individual model trainers
 # ---------------------------------------------------------------------------
 
+def _auto_backtest(
+    port_rets: np.ndarray,
+    dates: Optional[list[date]],
+    req: TrainRequest,
+    model_type: str,
+    **kwargs,
+) -> RollingBacktestResult:
+    """Out-of-sample backtest of a training run.
+
+    With the *dates* of *port_rets* only the days missing from the backtest
+    ledger are predicted (``run_incremental_backtest``); without them, or if
+    the ledger is unavailable, the whole window is.
+    """
+    if dates is not None:
+        try:
+            result, n_new = run_incremental_backtest(
+                get_engine(), port_rets, dates, req.symbols, req.weights, model_type, **kwargs,
+            )
+            logger.info("Auto-backtest (%s): %d new day(s) predicted", model_type, n_new)
+            return result
+        except SQLAlchemyError as exc:
+            logger.warning("Backtest ledger unavailable (%s) — backtesting the full window", exc)
+        except Exception:
+            logger.exception("Incremental backtest failed — backtesting the full window")
+    return run_rolling_backtest(port_rets, model_type, **kwargs)
+
+
 def _train_garch_pipeline(
     port_rets: np.ndarray,
     req: TrainRequest,
     experiment_name: str,
     benchmark_returns: Optional[np.ndarray] = None,
+    data_end: Optional[date] = None,
+    dates: Optional[list[date]] = None,
 ) -> TrainResult:
-    """Train GARCH(1,1), log to MLflow, register model."""
+    """Train GARCH, log to MLflow, register model.
+
+    The specification is GARCH(1,1) with Normal innovations unless
+    ``req.garch_tournament`` is set, in which case ``run_tournament`` picks it
+    and only the winner's artifacts are logged (plus the leaderboard report).
+
+    *data_end* (date of the last return in *port_rets*) and the portfolio
+    weights are logged as run params so the Inference Service can carry the
+    conditional variance forward from there as new returns arrive. *dates*
+    (one per return) makes the auto-backtest incremental.
+    """
     _setup_mlflow()
     mlflow.set_experiment(experiment_name)
-
-    garch_params = GARCHParams(p=1, q=1, dist="normal", mean="Zero")
-    result: GARCHResult = train_garch(
-        port_rets,
-        alpha=req.alpha,
-        horizon_days=req.horizon_days,
-        garch_params=garch_params,
-    )
+    plot_mode = get_settings().diagnostic_plots
+
+    tournament: Optional[TournamentResult] = None
+    if req.garch_tournament:
+        cfg = get_settings()
+        tournament = run_tournament(
+            port_rets,
+            alpha=req.alpha,
+            horizon_days=req.horizon_days,
+            max_workers=cfg.garch_tournament_workers,
+            timeout_s=cfg.garch_tournament_timeout_s,
+        )
+        result: GARCHResult = tournament.winner
+        garch_params = tournament.winner_spec
+    else:
+        garch_params = GARCHParams(p=1, q=1, dist="normal", mean="Zero")
+        result = train_garch(
+            port_rets,
+            alpha=req.alpha,
+            horizon_days=req.horizon_days,
+            garch_params=garch_params,
+        )
 
     run_name = f"garch-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}"
-    model_name = "riskops-garch"
+    model_name = registered_model_name("garch", model_scope(req))
 
     with mlflow.start_run(run_name=run_name) as run:
         run_id = run.info.run_id
@@ -275,17 +439,21 @@ def _train_garch_pipeline(
         )
 
         # Log params and metrics (core + additional)
-        mlflow.log_params({**result.to_mlflow_params(), "symbols": ",".join(req.symbols)})
+        mlflow.log_params({
+            **result.to_mlflow_params(),
+            "symbols": ",".join(req.symbols),
+            "weights": json.dumps(req.weights) if req.weights else "equal",
+            "data_end": data_end.isoformat() if data_end is not None else "",
+        })
         all_metrics = {**result.to_mlflow_metrics(), **extra_metrics.to_dict()}
         mlflow.log_metrics(all_metrics)
 
-        # Log diagnostic plot
-        plot_bytes = plot_garch_diagnostics(result, symbol=",".join(req.symbols))
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(plot_bytes)
-            tmp_plot = f.name
-        mlflow.log_artifact(tmp_plot, artifact_path="plots")
-        os.unlink(tmp_plot)
+        # Log diagnostic plot (or only its summary, see plotting.py)
+        if plot_mode != "off":
+            log_plot_artifact(
+                garch_plot_summary(result, symbol=",".join(req.symbols)),
+                "garch_diagnostics", "plots", plot_mode, render_garch_diagnostics,
+            )
 
         # Log risk report JSON (extended with additional metrics)
         # Out-of-sample backtest metrics are added after training by the
@@ -314,12 +482,44 @@ def _train_garch_pipeline(
         mlflow.log_artifact(tmp_report, artifact_path="reports")
         os.unlink(tmp_report)
 
-        # Pickle and log the fitted arch model result
-        with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as f:
-            pickle.dump(result.fit_result, f)
-            tmp_model = f.name
-        mlflow.log_artifact(tmp_model, artifact_path="model")
-        os.unlink(tmp_model)
+        if tournament is not None:
+            mlflow.log_params({
+                "tournament_specs": len(tournament.entries),
+                "tournament_winner": spec_label(tournament.winner_spec),
+            })
+            mlflow.log_metrics({
+                "tournament_dominated": tournament.n_dominated,
+                "tournament_seconds": tournament.seconds,
+            })
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+                json.dump({
+                    "backtest_days": tournament.backtest_days,
+                    "leaderboard": tournament.leaderboard(),
+                }, f, indent=2)
+                tmp_tournament = f.name
+            mlflow.log_artifact(tmp_tournament, artifact_path="reports")
+            os.unlink(tmp_tournament)
+
+        # Compact model artifact (what the Inference Service loads); the pickled
+        # ARCHModelResult is only logged for debugging or when the mean model has
+        # no compact form
+        try:
+            compact = compact_artifact(result, garch_params, data_end=data_end)
+        except ValueError as exc:
+            logger.warning("No compact GARCH artifact (%s) — logging the pickle instead", exc)
+            compact = None
+        if compact is not None:
+            with tempfile.TemporaryDirectory(prefix="riskops-garch-") as tmp_dir:
+                compact_path = os.path.join(tmp_dir, COMPACT_ARTIFACT)
+                with open(compact_path, "w") as f:
+                    json.dump(compact, f, indent=2)
+                mlflow.log_artifact(compact_path, artifact_path="model")
+        if compact is None or get_settings().garch_pickle_artifact:
+            with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as f:
+                pickle.dump(result.fit_result, f)
+                tmp_model = f.name
+            mlflow.log_artifact(tmp_model, artifact_path="model")
+            os.unlink(tmp_model)
 
         # Register model version in MLflow Model Registry
         model_version_str = _register_mlflow_model(run_id, model_name)
@@ -338,13 +538,14 @@ def _train_garch_pipeline(
     _BACKTEST_LOOKBACK = min(req.lookback_days, len(port_rets) - _MIN_BACKTEST_TEST_DAYS)
     if len(port_rets) >= _BACKTEST_LOOKBACK + _MIN_BACKTEST_TEST_DAYS and _BACKTEST_LOOKBACK >= 30:
         try:
-            bt_result = run_rolling_backtest(
-                returns=port_rets,
-                model_type="garch",
+            bt_result = _auto_backtest(
+                port_rets, dates, req, "garch",
                 alpha=req.alpha,
                 lookback_days=_BACKTEST_LOOKBACK,
                 test_days=_MIN_BACKTEST_TEST_DAYS,
                 horizon_days=req.horizon_days,
+                refit_every=get_settings().garch_refit_every,
+                garch_params=garch_params,
             )
             bt_report = build_report(bt_result, symbols=req.symbols, mlflow_run_id=run_id)
             log_backtest_to_mlflow(
@@ -352,6 +553,7 @@ def _train_garch_pipeline(
                 result=bt_result,
                 symbol=",".join(req.symbols),
                 run_id=run_id,
+                plot_mode=plot_mode,
             )
             # Merge backtest status into all_metrics for Postgres storage
             all_metrics["backtest_status"] = bt_report.status
@@ -378,6 +580,8 @@ def _train_garch_pipeline(
         mlflow_run_id=run_id,
         metrics=all_metrics,
     )
+    if plot_mode == "deferred":
+        schedule_plot_rendering(run_id)
 
     logger.info(
         "GARCH training complete: run_id=%s  VaR=%.6f  CVaR=%.6f  MDD=%.4f  Sharpe=%.3f",
@@ -402,21 +606,47 @@ def _train_montecarlo_pipeline(
     req: TrainRequest,
     experiment_name: str,
     benchmark_returns: Optional[np.ndarray] = None,
+    asset_returns: Optional[np.ndarray] = None,
+    asset_symbols: Optional[list[str]] = None,
+    dates: Optional[list[date]] = None,
 ) -> TrainResult:
-    """Run Monte Carlo simulation, log to MLflow, register model."""
+    """Run Monte Carlo simulation, log to MLflow, register model.
+
+    When the per-symbol *asset_returns* matrix is given, a
+    MultiAssetMonteCarloModel over *asset_symbols* is logged next to the
+    portfolio-level model so inference can price any weight vector. *dates*
+    (one per return) makes the auto-backtest incremental.
+    """
     _setup_mlflow()
     mlflow.set_experiment(experiment_name)
-
-    mc_params = MonteCarloParams(n_simulations=req.n_simulations, seed=42)
+    plot_mode = get_settings().diagnostic_plots
+
+    # The full sample is retained only for the distribution plot summary
+    mc_params = MonteCarloParams(
+        n_simulations=req.n_simulations,
+        seed=42,
+        keep_samples=plot_mode != "off",
+        sampler=req.mc_sampler,
+        n_workers=get_settings().monte_carlo_workers,
+        target_rel_error=req.mc_target_rel_error,
+        max_simulations=get_settings().monte_carlo_max_simulations,
+        dtype=get_settings().monte_carlo_dtype,
+    )
     result: MonteCarloResult = run_monte_carlo(
         port_rets,
         alpha=req.alpha,
         horizon_days=req.horizon_days,
         mc_params=mc_params,
     )
+    plot_summary: Optional[dict] = None
+    if plot_mode != "off":
+        # Reduce the sample to a histogram right away and let it go
+        plot_summary = monte_carlo_plot_summary(result, symbol=",".join(req.symbols))
+        result.simulated_returns = None
+        result.sample_weights = None
 
     run_name = f"montecarlo-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}"
-    model_name = "riskops-montecarlo"
+    model_name = registered_model_name("montecarlo", model_scope(req))
 
     with mlflow.start_run(run_name=run_name) as run:
         run_id = run.info.run_id
@@ -441,13 +671,9 @@ def _train_montecarlo_pipeline(
         all_metrics = {**result.to_mlflow_metrics(), **extra_metrics.to_dict()}
         mlflow.log_metrics(all_metrics)
 
-        # Log distribution plot
-        plot_bytes = plot_monte_carlo_distribution(result, symbol=",".join(req.symbols))
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(plot_bytes)
-            tmp_plot = f.name
-        mlflow.log_artifact(tmp_plot, artifact_path="plots")
-        os.unlink(tmp_plot)
+        # Log distribution plot (or only its summary, see plotting.py)
+        if plot_summary is not None:
+            log_plot_artifact(plot_summary, "mc_distribution", "plots", plot_mode, render_monte_carlo_distribution)
 
         # Log risk report JSON (extended with additional metrics)
         report = {
@@ -455,9 +681,14 @@ def _train_montecarlo_pipeline(
             "symbols": req.symbols,
             "alpha": req.alpha,
             "horizon_days": req.horizon_days,
-            "n_simulations": req.n_simulations,
+            "n_simulations": result.n_simulations,
+            "sampler": result.sampler,
             "var": result.var,
             "cvar": result.cvar,
+            "var_se": result.var_se,
+            "cvar_se": result.cvar_se,
+            "mc_rel_error": result.rel_error,
+            "mc_target_rel_error": req.mc_target_rel_error,
             "volatility": result.volatility,
             "max_drawdown": extra_metrics.max_drawdown,
             "sharpe_ratio": extra_metrics.sharpe_ratio,
@@ -502,6 +733,17 @@ def _train_montecarlo_pipeline(
         )
         os.unlink(tmp_params)
 
+        if asset_returns is not None and asset_symbols:
+            try:
+                multiasset_model = MultiAssetMonteCarloModel.from_returns(
+                    asset_returns, asset_symbols, seed=mc_params.seed,
+                    covariance=_multiasset_factors(asset_returns, asset_symbols, dates),
+                )
+                mlflow.pyfunc.log_model(artifact_path="multiasset_model", python_model=multiasset_model)
+                mlflow.log_param("multiasset_symbols", ",".join(asset_symbols))
+            except Exception as exc:
+                logger.warning("Multi-asset MC model not logged (non-fatal): %s", exc)
+
         model_version_str = _register_mlflow_model(run_id, model_name)
 
     # Publish model.trained Kafka event so Inference Service hot-reloads
@@ -512,20 +754,19 @@ def _train_montecarlo_pipeline(
     )
 
     # --- Out-of-sample backtest (appended to the same MLflow run) ---
-    # Use historical simulation for MC pipeline — it's fast and model-agnostic.
+    # Use historical simulation for MC pipeline — it's fast (one vectorised
+    # rolling_historical_var call) and model-agnostic.
     # A full MC rolling backtest can be triggered via POST /api/risk/backtest.
     _MIN_BACKTEST_TEST_DAYS = 30
     _BACKTEST_LOOKBACK = min(req.lookback_days, len(port_rets) - _MIN_BACKTEST_TEST_DAYS)
     if len(port_rets) >= _BACKTEST_LOOKBACK + _MIN_BACKTEST_TEST_DAYS and _BACKTEST_LOOKBACK >= 30:
         try:
-            bt_result = run_rolling_backtest(
-                returns=port_rets,
-                model_type="montecarlo",
+            bt_result = _auto_backtest(
+                port_rets, dates, req, "historical",
                 alpha=req.alpha,
                 lookback_days=_BACKTEST_LOOKBACK,
                 test_days=_MIN_BACKTEST_TEST_DAYS,
                 horizon_days=req.horizon_days,
-                n_simulations=500,
             )
             bt_report = build_report(bt_result, symbols=req.symbols, mlflow_run_id=run_id)
             log_backtest_to_mlflow(
@@ -533,6 +774,7 @@ def _train_montecarlo_pipeline(
                 result=bt_result,
                 symbol=",".join(req.symbols),
                 run_id=run_id,
+                plot_mode=plot_mode,
             )
             all_metrics["backtest_status"] = bt_report.status
             all_metrics["backtest_kupiec_pvalue"] = bt_report.kupiec_pvalue
@@ -557,6 +799,8 @@ def _train_montecarlo_pipeline(
         mlflow_run_id=run_id,
         metrics=all_metrics,
     )
+    if plot_mode == "deferred":
+        schedule_plot_rendering(run_id)
 
     logger.info(
         "Monte Carlo training complete: run_id=%s  VaR=%.6f  CVaR=%.6f  MDD=%.4f  Sharpe=%.3f",
@@ -668,14 +912,21 @@ def run_training(req: TrainRequest) -> list[TrainResult]:
 
     Returns a list of TrainResult (one per model trained).
     """
+    scope = model_scope(req)
     logger.info(
-        "Starting training: model_type=%s  symbols=%s  alpha=%.2f  horizon=%d",
-        req.model_type, req.symbols, req.alpha, req.horizon_days,
+        "Starting training: model_type=%s  symbols=%s  alpha=%.2f  horizon=%d  scope=%s",
+        req.model_type, req.symbols, req.alpha, req.horizon_days, scope,
     )
 
     # Load data
     returns_df = load_returns(req.symbols, lookback_days=req.lookback_days)
     port_rets = build_portfolio_returns(returns_df, weights=req.weights)
+    asset_rets, asset_symbols = build_returns_matrix(returns_df)
+    dates = returns_dates(returns_df)
+    # Last date of the aligned portfolio series (same alignment as build_returns_matrix)
+    data_end = (
+        returns_df.pivot(index="price_date", columns="symbol", values="ret").dropna().index.max()
+    )
 
     # Load benchmark returns for Beta calculation (non-fatal if unavailable)
     benchmark_rets = load_benchmark_returns(
@@ -692,9 +943,15 @@ def run_training(req: TrainRequest) -> list[TrainResult]:
         experiment_name = f"riskops-{mt}"
         try:
             if mt == "garch":
-                r = _train_garch_pipeline(port_rets, req, experiment_name, benchmark_returns=benchmark_rets)
+                r = _train_garch_pipeline(
+                    port_rets, req, experiment_name,
+                    benchmark_returns=benchmark_rets, data_end=data_end, dates=dates,
+                )
             elif mt == "montecarlo":
-                r = _train_montecarlo_pipeline(port_rets, req, experiment_name, benchmark_returns=benchmark_rets)
+                r = _train_montecarlo_pipeline(
+                    port_rets, req, experiment_name, benchmark_returns=benchmark_rets,
+                    asset_returns=asset_rets, asset_symbols=asset_symbols, dates=dates,
+                )
             else:
                 logger.warning("Unknown model type: %s — skipping", mt)
                 continue
@@ -705,7 +962,7 @@ def run_training(req: TrainRequest) -> list[TrainResult]:
                 TrainResult(
                     run_id="",
                     model_type=mt,
-                    model_name=f"riskops-{mt}",
+                    model_name=registered_model_name(mt, scope),
                     model_version="",
                     var=0.0,
                     cvar=0.0,
@@ -717,3 +974,316 @@ def run_training(req: TrainRequest) -> list[TrainResult]:
             )
 
     return results
+
+
+# ---------------------------------------------------------------------------
+# Universe training — one volatility model per symbol
+# ---------------------------------------------------------------------------
+#
+# The bulk ingest loads hundreds of tickers; modelling each one as its own
+# MLflow run would mean hundreds of runs, registry versions and model.trained
+# events per day. Instead every symbol whose processed_returns moved past its
+# stored fit is refitted as a GARCH(1,1) in a process pool, and the whole
+# batch is published as:
+#
+#   - one row per symbol in symbol_volatility_models (decimal units, upserted),
+#   - one MLflow run of the "riskops-garch-universe" model whose only artifact
+#     is model/volatility_models.json (the same parameters, columnar),
+#   - one model.trained event for that model version.
+#
+# Each fit runs under its own timeout, enforced inside the worker by
+# fit_time_limit: a pathological series raises TimeoutError in its worker,
+# which then moves on to the next symbol. Failed and timed-out symbols
+# keep their previous row and are retried on the next run because their
+# data_end is still behind.
+
+UNIVERSE_MODEL_NAME = "riskops-garch-universe"
+UNIVERSE_ARTIFACT = "volatility_models.json"
+# Allowance on top of the per-task timeouts for spawning and importing workers
+_UNIVERSE_POOL_STARTUP_S = 60.0
+
+
+@dataclass
+class UniverseTrainRequest:
+    symbols: Optional[list[str]] = None   # None → every symbol in processed_returns
+    lookback_days: int = 252
+    dist: str = "normal"                  # normal | t
+    force: bool = False                   # refit symbols whose stored fit is already current
+
+
+@dataclass
+class SymbolVolatilityFit:
+    """GARCH(1,1) parameters of one symbol in decimal-return units."""
+    symbol: str
+    dist: str
+    omega: float
+    alpha: float
+    beta: float
+    nu: Optional[float]
+    sigma2_next: float      # variance of the first return after data_end
+    log_likelihood: float
+    n_obs: int
+    data_end: date
+
+
+@dataclass
+class UniverseTrainResult:
+    run_id: str
+    model_name: str
+    model_version: str
+    n_candidates: int       # symbols with returns newer than their stored fit
+    n_fitted: int
+    n_skipped: int          # fewer than universe_min_obs returns in the lookback
+    n_timed_out: int
+    failures: dict[str, str] = field(default_factory=dict)  # symbol → error (incl. timeouts)
+    fit_seconds: float = 0.0
+    status: str = "completed"
+
+
+def _universe_candidates(req: UniverseTrainRequest) -> list[str]:
+    """Symbols whose latest processed return is newer than their stored fit."""
+    engine = get_engine()
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT r.symbol
+                FROM processed_returns r
+                LEFT JOIN symbol_volatility_models m ON m.symbol = r.symbol
+                WHERE (cast(:symbols as text[]) IS NULL OR r.symbol = ANY(:symbols))
+                GROUP BY r.symbol, m.data_end
+                HAVING :force OR m.data_end IS NULL OR MAX(r.price_date) > m.data_end
+                ORDER BY r.symbol
+                """
+            ),
+            {"symbols": req.symbols, "force": req.force},
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _fit_symbol_volatility(
+    symbol: str,
+    returns: np.ndarray,
+    data_end: date,
+    dist: str,
+    timeout_s: float,
+) -> SymbolVolatilityFit:
+    """Process-pool task: fit GARCH(1,1) to one symbol within *timeout_s* seconds."""
+    if not np.std(returns) > 0:
+        raise ValueError("returns have zero variance (stale or suspended price)")
+    try:
+        with fit_time_limit(timeout_s):
+            res = train_garch(
+                returns, garch_params=GARCHParams(p=1, q=1, dist=dist, mean="Zero"),
+            ).fit_result
+            sigma2_pct = float(res.forecast(horizon=1, reindex=False).variance.iloc[-1, 0])
+    except FitTimeout:
+        raise TimeoutError(f"fit exceeded {timeout_s:g}s") from None
+
+    # arch fits percentage returns: ω and σ² scale by 100², the log-likelihood
+    # of the decimal series gains ln(100) per observation
+    params = res.params
+    return SymbolVolatilityFit(
+        symbol=symbol,
+        dist=dist,
+        omega=float(params["omega"]) / 1e4,
+        alpha=float(params["alpha[1]"]),
+        beta=float(params["beta[1]"]),
+        nu=float(params["nu"]) if "nu" in params else None,
+        sigma2_next=sigma2_pct / 1e4,
+        log_likelihood=float(res.loglikelihood) + len(returns) * math.log(100.0),
+        n_obs=len(returns),
+        data_end=data_end,
+    )
+
+
+def _fit_universe(
+    tasks: dict[str, tuple[np.ndarray, date]],
+    dist: str,
+    max_workers: int,
+    timeout_s: float,
+) -> tuple[list[SymbolVolatilityFit], dict[str, str], int]:
+    """Fan *tasks* (symbol → (returns, data_end)) out over a process pool.
+
+    Returns (fits, failures, n_timed_out). The per-task timeout is enforced in
+    the workers; the parent additionally gives up on the pool if the whole
+    batch overruns its worst case (every task hitting its timeout), which only
+    happens if a fit is stuck in native code that never returns to Python.
+    """
+    fits: list[SymbolVolatilityFit] = []
+    failures: dict[str, str] = {}
+    n_timed_out = 0
+    batch_budget = timeout_s * math.ceil(len(tasks) / max_workers) + _UNIVERSE_POOL_STARTUP_S
+
+    # spawn, not fork: the service process runs FastAPI and Kafka threads
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+    )
+    futures: dict[Future, str] = {
+        pool.submit(_fit_symbol_volatility, symbol, rets, data_end, dist, timeout_s): symbol
+        for symbol, (rets, data_end) in tasks.items()
+    }
+    try:
+        for future in as_completed(futures, timeout=batch_budget):
+            symbol = futures[future]
+            try:
+                fits.append(future.result())
+            except TimeoutError as exc:
+                n_timed_out += 1
+                failures[symbol] = f"timeout: {exc}"
+            except Exception as exc:
+                failures[symbol] = str(exc)
+    except FuturesTimeout:
+        pending = [s for f, s in futures.items() if not f.done()]
+        logger.error(
+            "Universe fit overran its %.0fs budget — abandoning %d symbols", batch_budget, len(pending),
+        )
+        for symbol in pending:
+            n_timed_out += 1
+            failures[symbol] = "timeout: worker did not return"
+        pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        pool.shutdown(wait=True)
+    return fits, failures, n_timed_out
+
+
+def _store_symbol_volatility_models(fits: list[SymbolVolatilityFit], model_version: str) -> None:
+    """Upsert one symbol_volatility_models row per fit."""
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO symbol_volatility_models
+                    (symbol, model_version, dist, omega, alpha, beta, nu, sigma2_next,
+                     log_likelihood, n_obs, data_end, fitted_at)
+                VALUES
+                    (:symbol, :model_version, :dist, :omega, :alpha, :beta, :nu, :sigma2_next,
+                     :log_likelihood, :n_obs, :data_end, NOW())
+                ON CONFLICT (symbol) DO UPDATE SET
+                    model_version = EXCLUDED.model_version,
+                    dist = EXCLUDED.dist,
+                    omega = EXCLUDED.omega,
+                    alpha = EXCLUDED.alpha,
+                    beta = EXCLUDED.beta,
+                    nu = EXCLUDED.nu,
+                    sigma2_next = EXCLUDED.sigma2_next,
+                    log_likelihood = EXCLUDED.log_likelihood,
+                    n_obs = EXCLUDED.n_obs,
+                    data_end = EXCLUDED.data_end,
+                    fitted_at = NOW()
+                """
+            ),
+            [{**asdict(f), "model_version": model_version} for f in fits],
+        )
+    logger.info("Stored %d symbol volatility models (version %s)", len(fits), model_version)
+
+
+def run_universe_training(req: UniverseTrainRequest) -> UniverseTrainResult:
+    """Refit the per-symbol volatility models of every symbol with fresh data."""
+    cfg = get_settings()
+    if req.dist not in ("normal", "t"):
+        raise ValueError(f"dist must be 'normal' or 't', got {req.dist!r}")
+
+    candidates = _universe_candidates(req)
+    if not candidates:
+        logger.info("Universe training: all symbol volatility models are up to date")
+        return UniverseTrainResult(
+            run_id="", model_name=UNIVERSE_MODEL_NAME, model_version="",
+            n_candidates=0, n_fitted=0, n_skipped=0, n_timed_out=0,
+        )
+
+    returns_df = load_returns(candidates, lookback_days=req.lookback_days)
+    tasks: dict[str, tuple[np.ndarray, date]] = {}
+    n_skipped = 0
+    for symbol, g in returns_df.groupby("symbol"):
+        if len(g) < cfg.universe_min_obs:
+            n_skipped += 1
+            continue
+        tasks[symbol] = (g["ret"].to_numpy(dtype=float), g["price_date"].iloc[-1])
+
+    logger.info(
+        "Universe training: %d candidates, %d to fit, %d skipped (< %d obs), workers=%d timeout=%.0fs",
+        len(candidates), len(tasks), n_skipped, cfg.universe_min_obs,
+        cfg.universe_max_workers, cfg.universe_task_timeout_s,
+    )
+    t0 = time.perf_counter()
+    fits, failures, n_timed_out = _fit_universe(
+        tasks, req.dist, cfg.universe_max_workers, cfg.universe_task_timeout_s,
+    )
+    fit_seconds = time.perf_counter() - t0
+    if not fits:
+        raise RuntimeError(
+            f"Universe training produced no fits ({len(failures)} failed, {n_skipped} skipped)"
+        )
+    fits.sort(key=lambda f: f.symbol)
+
+    _setup_mlflow()
+    mlflow.set_experiment(UNIVERSE_MODEL_NAME)
+    run_name = f"garch-universe-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}"
+    persistence = np.array([f.alpha + f.beta for f in fits])
+    metrics = {
+        "n_fitted": len(fits),
+        "n_failed": len(failures) - n_timed_out,
+        "n_timed_out": n_timed_out,
+        "n_skipped": n_skipped,
+        "fit_seconds": fit_seconds,
+        "median_persistence": float(np.median(persistence)),
+    }
+
+    with mlflow.start_run(run_name=run_name) as run:
+        run_id = run.info.run_id
+        mlflow.log_params({
+            "model_type": "garch_universe",
+            "dist": req.dist,
+            "lookback_days": req.lookback_days,
+            "min_obs": cfg.universe_min_obs,
+            "task_timeout_s": cfg.universe_task_timeout_s,
+        })
+        mlflow.log_metrics(metrics)
+
+        # All symbols in one columnar JSON document instead of one run each
+        rows = [{**asdict(f), "data_end": f.data_end.isoformat()} for f in fits]
+        columns = {name: [row[name] for row in rows] for name in rows[0]}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, UNIVERSE_ARTIFACT)
+            with open(path, "w") as f:
+                json.dump({
+                    "dist": req.dist,
+                    "units": "decimal",
+                    "trained_at": datetime.now(timezone.utc).isoformat(),
+                    "models": columns,
+                    "failures": failures,
+                }, f)
+            mlflow.log_artifact(path, artifact_path="model")
+
+        model_version_str = _register_mlflow_model(run_id, UNIVERSE_MODEL_NAME)
+
+    _store_symbol_volatility_models(fits, model_version_str)
+    _register_model_in_db(
+        model_name=UNIVERSE_MODEL_NAME,
+        model_version=model_version_str,
+        mlflow_run_id=run_id,
+        metrics=metrics,
+    )
+    _publish_model_trained(
+        model_name=UNIVERSE_MODEL_NAME,
+        model_version=model_version_str,
+        run_id=run_id,
+    )
+
+    logger.info(
+        "Universe training complete: run_id=%s  fitted=%d  failed=%d  timed_out=%d  %.1fs",
+        run_id, len(fits), len(failures) - n_timed_out, n_timed_out, fit_seconds,
+    )
+    return UniverseTrainResult(
+        run_id=run_id,
+        model_name=UNIVERSE_MODEL_NAME,
+        model_version=model_version_str,
+        n_candidates=len(candidates),
+        n_fitted=len(fits),
+        n_skipped=n_skipped,
+        n_timed_out=n_timed_out,
+        failures=failures,
+        fit_seconds=fit_seconds,
+    )
@@ -0,0 +1,129 @@
+"""Downsampled plot summaries shared by the diagnostic plots.
+
+Every diagnostic plot is split into a summary builder (model output → small
+JSON-serialisable dict) and a renderer (dict → PNG bytes). Summaries hold
+what the figure actually shows — histogram counts, a bounded number of line
+points, plotting positions — rather than the raw arrays, so they are cheap
+to log with the training run and can be rendered later by
+``pipelines.plots`` (deferred / on demand) without keeping the simulated
+sample or the fitted model in memory.
+
+Line series are decimated min/max per bucket, so isolated spikes (a
+volatility burst, a large residual) survive downsampling.
+
+Plot modes (``Settings.diagnostic_plots``)
+------------------------------------------
+    off        — no plots and no summaries
+    inline     — PNGs rendered inside the MLflow run (original behaviour)
+    deferred   — summaries logged to ``plots/summaries/``; PNGs rendered by a
+                 background worker once the model is registered
+    on_demand  — summaries only; PNGs rendered by
+                 POST /api/risk/train/run/{run_id}/plots
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import tempfile
+from typing import Callable, Optional
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Upper bound on points per line series in a summary
+PLOT_MAX_POINTS = 500
+
+# Significant digits kept for summary values (far below what a 100-dpi PNG resolves)
+_SUMMARY_DIGITS = 6
+
+PLOT_MODES = ("off", "inline", "deferred", "on_demand")
+
+# Run-relative artifact directory of the plot summaries
+SUMMARY_ARTIFACT_DIR = "plots/summaries"
+
+
+def summary_floats(values: np.ndarray) -> list[float]:
+    """*values* as a JSON-friendly list, rounded to ``_SUMMARY_DIGITS`` significant digits."""
+    return [float(f"{v:.{_SUMMARY_DIGITS}g}") for v in np.asarray(values, dtype=float).ravel()]
+
+
+def downsample_series(values: np.ndarray, max_points: int = PLOT_MAX_POINTS) -> tuple[list[int], list[float]]:
+    """(x, y) of a line series with at most ~*max_points* points.
+
+    Series longer than *max_points* are split into max_points / 2 buckets and
+    each bucket contributes its minimum and maximum (in index order).
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    n = len(values)
+    if n <= max_points:
+        return list(range(n)), summary_floats(values)
+    n_buckets = max(1, max_points // 2)
+    idx: list[int] = []
+    for bucket in np.array_split(np.arange(n), n_buckets):
+        seg = values[bucket]
+        lo, hi = int(bucket[np.nanargmin(seg)]), int(bucket[np.nanargmax(seg)])
+        idx.extend(sorted({lo, hi}))
+    return idx, summary_floats(values[idx])
+
+
+def histogram_summary(
+    values: np.ndarray,
+    bins: int,
+    weights: Optional[np.ndarray] = None,
+) -> dict:
+    """{"edges", "density", "cdf"} of *values* (optionally weighted); O(n), no sort.
+
+    ``cdf`` is the empirical (weighted) CDF at each right bin edge.
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    counts, edges = np.histogram(values, bins=bins, weights=weights)
+    total = float(counts.sum())
+    widths = np.diff(edges)
+    density = counts / (total * widths) if total > 0 else np.zeros_like(widths)
+    cdf = np.cumsum(counts) / total if total > 0 else np.zeros_like(widths)
+    return {"edges": summary_floats(edges), "density": summary_floats(density), "cdf": summary_floats(cdf)}
+
+
+def fig_to_png(fig) -> bytes:
+    """Render *fig* to PNG bytes and close it."""
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100)
+    plt.close(fig)
+    buf.seek(0)
+    return buf.read()
+
+
+def log_plot_artifact(
+    summary: dict,
+    name: str,
+    artifact_path: str,
+    mode: str,
+    render: Callable[[dict], bytes],
+) -> None:
+    """Log one diagnostic plot of the active MLflow run according to *mode*.
+
+    inline renders ``<artifact_path>/<name>.png`` now; deferred / on_demand
+    log the summary as ``plots/summaries/<name>.json`` (with *artifact_path*
+    recorded for the renderer); off logs nothing.
+    """
+    import mlflow
+
+    if mode not in PLOT_MODES:
+        raise ValueError(f"Unknown plot mode {mode!r}; expected one of {PLOT_MODES}")
+    if mode == "off":
+        return
+    with tempfile.TemporaryDirectory(prefix="riskops-plot-") as tmp_dir:
+        if mode == "inline":
+            path = os.path.join(tmp_dir, f"{name}.png")
+            with open(path, "wb") as f:
+                f.write(render(summary))
+            mlflow.log_artifact(path, artifact_path=artifact_path)
+        else:
+            path = os.path.join(tmp_dir, f"{name}.json")
+            with open(path, "w") as f:
+                json.dump({**summary, "name": name, "artifact_path": artifact_path}, f)
+            mlflow.log_artifact(path, artifact_path=SUMMARY_ARTIFACT_DIR)
@@ -8,7 +8,7 @@ Pipeline steps (in order):
   4. poll_training          — GET  /api/risk/train/status/{id}  (poll until done)
   5. run_inference          — POST /api/risk/predict            (Inference Service, all portfolios)
   6. verify_results         — sanity-check that risk_results rows were written
-  7. run_backtest           — POST /api/risk/backtest for garch + montecarlo models
+  7. run_backtest           — POST /api/risk/backtest/jobs for garch + montecarlo models, poll until done
   8. aggregate_alerts       — combine backtest statuses → OK / WARN / CRIT severity
   9. conditional_retrain    — re-trigger training only when aggregate severity == CRIT
 
@@ -268,19 +268,34 @@ _BACKTEST_MODELS  = ["garch", "montecarlo"]
 #   p ≤ 0.01        → CRIT  ← triggers conditional_retrain
 
 
+# Backtest jobs: total wait for all models and poll interval (seconds)
+_BACKTEST_MAX_WAIT_S = 1080
+_BACKTEST_POLL_S = 15
+
+
+def _nan_if_none(value: Any) -> float:
+    """Job results store NaN statistics as JSON null."""
+    return float("nan") if value is None else value
+
+
 def run_backtest(**context) -> None:
     """Run rolling out-of-sample VaR backtest for each configured model type.
 
-    Calls POST /api/risk/backtest synchronously for each model in
-    _BACKTEST_MODELS.  Each call returns a BacktestResponse that includes
-    Kupiec / Christoffersen p-values and a pre-classified status
-    (OK | WARN | CRIT).
+    Submits one POST /api/risk/backtest/jobs per model in _BACKTEST_MODELS
+    (the jobs run concurrently in the training service), then polls
+    GET /api/risk/backtest/jobs/{job_id} until each one finishes. A completed
+    job carries a BacktestResponse that includes Kupiec / Christoffersen
+    p-values and a pre-classified status (OK | WARN | CRIT); jobs still
+    running after _BACKTEST_MAX_WAIT_S are cancelled. The jobs are
+    incremental: days already in the backtest ledger are reused, so a daily
+    run predicts about one new day per model.
 
     Results are pushed to XCom under key ``backtest_results`` as a list of
     dicts, one per model type.
     """
-    url = f"{_training_url()}/api/risk/backtest"
-    backtest_results = []
+    jobs_url = f"{_training_url()}/api/risk/backtest/jobs"
+    outcomes: dict[str, dict[str, Any]] = {}
+    pending: dict[str, str] = {}   # model_type → job_id
 
     for model_type in _BACKTEST_MODELS:
         payload = {
@@ -292,41 +307,84 @@ def run_backtest(**context) -> None:
             "horizon_days": 1,
             "n_simulations": 1000,   # reduced for speed in rolling mode
             "log_to_mlflow": True,
+            "incremental": True,     # only days not yet in the backtest ledger are predicted
         }
-        log.info("Running backtest: model=%s  symbols=%s", model_type, _BACKTEST_SYMBOLS)
+        log.info("Submitting backtest: model=%s  symbols=%s", model_type, _BACKTEST_SYMBOLS)
         try:
-            result = _post(url, payload, timeout=300)   # up to 5 min per model
-            status = result.get("status", "UNKNOWN")
+            job_id = _post(jobs_url, payload, timeout=30)["job_id"]
+            log.info("Backtest job queued: model=%s  job_id=%s", model_type, job_id)
+            pending[model_type] = job_id
+        except Exception as exc:
+            # A failed backtest call is non-fatal: log and continue with other models.
+            log.error("Backtest submission failed for model=%s: %s", model_type, exc)
+            outcomes[model_type] = {"model_type": model_type, "status": "ERROR", "error": str(exc)}
+
+    elapsed = 0
+    while pending and elapsed < _BACKTEST_MAX_WAIT_S:
+        time.sleep(_BACKTEST_POLL_S)
+        elapsed += _BACKTEST_POLL_S
+        for model_type, job_id in list(pending.items()):
+            try:
+                job = _get(f"{jobs_url}/{job_id}", timeout=30)
+            except Exception as exc:
+                log.warning("Backtest job %s status check failed: %s", job_id, exc)
+                continue
+            status = job.get("status", "unknown")
+            log.info(
+                "Backtest job %s (%s): %s  %d/%s days (elapsed %ds)",
+                job_id, model_type, status, job.get("days_done", 0), job.get("days_total"), elapsed,
+            )
+            if status in ("queued", "running"):
+                continue
+            del pending[model_type]
+            if status != "completed":
+                log.error("Backtest failed for model=%s: %s %s", model_type, status, job.get("message"))
+                outcomes[model_type] = {
+                    "model_type": model_type,
+                    "status": "ERROR",
+                    "error": f"job {job_id} {status}: {job.get('message', '')}",
+                }
+                continue
+
+            result = job.get("result") or {}
+            bt_status = result.get("status", "UNKNOWN")
             log.info(
                 "Backtest %s: status=%s  violations=%d/%d  "
-                "kupiec_p=%.4f  cc_p=%.4f  violation_rate=%.4f  expected=%.4f",
-                model_type, status,
+                "kupiec_p=%.4f  cc_p=%.4f  violation_rate=%.4f  expected=%.4f  new_days=%s",
+                model_type, bt_status,
                 result.get("violations", 0), result.get("total_obs", 0),
-                result.get("kupiec_pvalue", float("nan")),
-                result.get("christoffersen_pvalue_cc", float("nan")),
-                result.get("violation_rate", float("nan")),
-                result.get("expected_rate", float("nan")),
+                _nan_if_none(result.get("kupiec_pvalue")),
+                _nan_if_none(result.get("christoffersen_pvalue_cc")),
+                _nan_if_none(result.get("violation_rate")),
+                _nan_if_none(result.get("expected_rate")),
+                result.get("days_computed"),
             )
-            backtest_results.append({
+            outcomes[model_type] = {
                 "model_type": model_type,
-                "status": status,
+                "status": bt_status,
                 "violations": result.get("violations", 0),
                 "total_obs": result.get("total_obs", 0),
                 "violation_rate": result.get("violation_rate", 0.0),
                 "expected_rate": result.get("expected_rate", 0.0),
-                "kupiec_pvalue": result.get("kupiec_pvalue", float("nan")),
-                "christoffersen_pvalue_cc": result.get("christoffersen_pvalue_cc", float("nan")),
+                "kupiec_pvalue": _nan_if_none(result.get("kupiec_pvalue")),
+                "christoffersen_pvalue_cc": _nan_if_none(result.get("christoffersen_pvalue_cc")),
                 "mlflow_run_id": result.get("mlflow_run_id"),
-            })
+                "backtest_job_id": job_id,
+            }
+
+    for model_type, job_id in pending.items():
+        log.error("Backtest job %s (%s) timed out after %ds; cancelling", job_id, model_type, elapsed)
+        try:
+            _post(f"{jobs_url}/{job_id}/cancel", {}, timeout=30)
         except Exception as exc:
-            # A failed backtest call is non-fatal: log and continue with other models.
-            log.error("Backtest failed for model=%s: %s", model_type, exc)
-            backtest_results.append({
-                "model_type": model_type,
-                "status": "ERROR",
-                "error": str(exc),
-            })
+            log.warning("Could not cancel backtest job %s: %s", job_id, exc)
+        outcomes[model_type] = {
+            "model_type": model_type,
+            "status": "ERROR",
+            "error": f"job {job_id} timed out after {elapsed}s",
+        }
 
+    backtest_results = [outcomes[m] for m in _BACKTEST_MODELS]
     context["ti"].xcom_push(key="backtest_results", value=backtest_results)
     log.info("Backtest step complete: %d model(s) evaluated", len(backtest_results))
 
@@ -528,7 +586,7 @@ with DAG(
     t_backtest = PythonOperator(
         task_id="run_backtest",
         python_callable=run_backtest,
-        execution_timeout=timedelta(minutes=20),  # 2 models × up to 5 min each + buffer
+        execution_timeout=timedelta(minutes=20),  # _BACKTEST_MAX_WAIT_S (18 min) + buffer
     )
 
     t_aggregate = PythonOperator(
@@ -0,0 +1,35 @@
+-- Migration 007: persisted stress scenario catalogue
+-- Replaces the hard-coded SCENARIOS dict in inference-service as the source
+-- of truth. The inference service compiles each row into an immutable
+-- scenario object and hot-reloads the catalogue when rows change.
+
+CREATE TABLE IF NOT EXISTS stress_scenarios (
+    scenario_id    TEXT PRIMARY KEY,
+    scenario_type  TEXT NOT NULL CHECK (scenario_type IN ('historical', 'parametric')),
+    name           TEXT NOT NULL,
+    description    TEXT NOT NULL DEFAULT '',
+    vol_multiplier NUMERIC(10, 4),         -- parametric: σ multiplier; historical: replay scale (NULL → default)
+    corr_shock     NUMERIC(10, 4),         -- parametric only (0–1)
+    period_start   DATE,                   -- historical only
+    period_end     DATE,                   -- historical only
+    builtin        BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CHECK (
+        (scenario_type = 'historical' AND period_start IS NOT NULL AND period_end IS NOT NULL)
+        OR (scenario_type = 'parametric' AND vol_multiplier IS NOT NULL AND corr_shock IS NOT NULL)
+    )
+);
+
+CREATE INDEX IF NOT EXISTS idx_stress_scenarios_updated ON stress_scenarios (updated_at DESC);
+
+-- Seed the built-in catalogue (safe to re-run)
+INSERT INTO stress_scenarios
+    (scenario_id, scenario_type, name, description, vol_multiplier, corr_shock, period_start, period_end, builtin)
+VALUES
+    ('historical_2008',   'historical', 'Global Financial Crisis 2008',  'Lehman collapse, credit freeze, global equity −50 %',          NULL, NULL, '2008-09-01', '2009-03-31', TRUE),
+    ('historical_2020',   'historical', 'COVID-19 Crash 2020',           'Fastest 30 % drawdown in history, VIX > 80',                   NULL, NULL, '2020-02-19', '2020-03-23', TRUE),
+    ('historical_1998',   'historical', 'LTCM / Russia Default 1998',    'Russian sovereign default, LTCM collapse, liquidity crisis',   NULL, NULL, '1998-08-01', '1998-10-31', TRUE),
+    ('parametric_mild',   'parametric', 'Mild Stress (2× volatility)',   'Moderate stress: 2× volatility, correlations pushed to 0.7',   2.0,  0.7,  NULL,         NULL,         TRUE),
+    ('parametric_severe', 'parametric', 'Severe Stress (4× volatility)', 'Severe stress: 4× volatility, correlations → 1',                4.0,  0.95, NULL,         NULL,         TRUE)
+ON CONFLICT (scenario_id) DO NOTHING;
@@ -0,0 +1 @@
+DROP TABLE IF EXISTS symbol_volatility_models;
@@ -0,0 +1,23 @@
+-- Migration 008: per-symbol volatility models from the universe training job
+-- One row per symbol, overwritten on every refit. Parameters are stored in
+-- decimal-return units (ω and σ² are per day, not in percent²), so a
+-- consumer can advance the variance with σ²ₜ₊₁ = ω + α·rₜ² + β·σ²ₜ without
+-- any rescaling. model_version ties each row to the MLflow run that logged
+-- the same parameters as a single JSON artifact.
+
+CREATE TABLE IF NOT EXISTS symbol_volatility_models (
+    symbol         TEXT PRIMARY KEY,
+    model_version  TEXT NOT NULL,
+    dist           TEXT NOT NULL CHECK (dist IN ('normal', 't')),
+    omega          DOUBLE PRECISION NOT NULL,
+    alpha          DOUBLE PRECISION NOT NULL,
+    beta           DOUBLE PRECISION NOT NULL,
+    nu             DOUBLE PRECISION,           -- Student-t degrees of freedom (NULL for normal)
+    sigma2_next    DOUBLE PRECISION NOT NULL,  -- 1-step-ahead conditional variance after data_end
+    log_likelihood DOUBLE PRECISION NOT NULL,
+    n_obs          INT NOT NULL,
+    data_end       DATE NOT NULL,              -- last processed_returns date used in the fit
+    fitted_at      TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_symbol_volatility_models_version ON symbol_volatility_models (model_version);
@@ -0,0 +1,2 @@
+DROP TABLE IF EXISTS backtest_results;
+DROP TABLE IF EXISTS backtest_jobs;
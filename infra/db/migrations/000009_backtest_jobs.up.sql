@@ -0,0 +1,37 @@
+-- Migration 009: asynchronous backtest jobs
+-- POST /api/risk/backtest/jobs inserts a queued backtest_jobs row and runs the
+-- rolling backtest in the background. The worker updates days_done as out-of-sample
+-- days complete and polls cancel_requested through the same UPDATE, so
+-- GET /api/risk/backtest/jobs/{job_id} reports progress while the run continues.
+-- A completed job stores its summary (BacktestResponse) in result and one
+-- backtest_results row per scored day.
+
+CREATE TABLE IF NOT EXISTS backtest_jobs (
+    job_id           TEXT PRIMARY KEY,
+    status           TEXT NOT NULL DEFAULT 'queued',  -- queued | running | completed | failed | cancelled
+    model_type       TEXT NOT NULL,
+    symbols          TEXT[] NOT NULL,
+    alpha            NUMERIC(8, 6) NOT NULL,
+    lookback_days    INT NOT NULL,
+    test_days        INT NOT NULL,
+    request          JSONB NOT NULL,                  -- full request body
+    days_done        INT NOT NULL DEFAULT 0,
+    days_total       INT,
+    cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+    result           JSONB,                           -- BacktestResponse once completed
+    error            TEXT,                            -- error message if failed
+    created_at       TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at       TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_backtest_jobs_status ON backtest_jobs (status);
+CREATE INDEX IF NOT EXISTS idx_backtest_jobs_created ON backtest_jobs (created_at DESC);
+
+CREATE TABLE IF NOT EXISTS backtest_results (
+    job_id          TEXT NOT NULL REFERENCES backtest_jobs (job_id) ON DELETE CASCADE,
+    price_date      DATE NOT NULL,               -- date of the realised return
+    var_predicted   DOUBLE PRECISION NOT NULL,   -- positive loss number
+    realised_return DOUBLE PRECISION NOT NULL,
+    violation       BOOLEAN NOT NULL,            -- realised_return < -var_predicted
+    PRIMARY KEY (job_id, price_date)
+);
@@ -0,0 +1,2 @@
+DROP TABLE IF EXISTS backtest_ledger;
+DROP TABLE IF EXISTS backtest_ledger_specs;
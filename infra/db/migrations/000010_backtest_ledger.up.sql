@@ -0,0 +1,26 @@
+-- Migration 010: per-day backtest ledger
+-- Incremental backtests (backtesting/ledger.py) store every scored out-of-sample
+-- day under the hash of the backtest specification (model and its parameters,
+-- symbols, weights, alpha, lookback, horizon). A later run with the same
+-- specification only predicts the dates that are not in the ledger yet and
+-- reruns Kupiec / Christoffersen over the merged hit sequence.
+-- input_hash digests the returns the day was computed from (its training window
+-- and realised return), so days whose inputs were revised are recomputed.
+
+CREATE TABLE IF NOT EXISTS backtest_ledger_specs (
+    spec_key   TEXT PRIMARY KEY,                 -- sha256 of the canonical spec JSON
+    spec       JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS backtest_ledger (
+    spec_key        TEXT NOT NULL REFERENCES backtest_ledger_specs (spec_key) ON DELETE CASCADE,
+    price_date      DATE NOT NULL,               -- date of the realised return
+    input_hash      TEXT NOT NULL,
+    var_predicted   DOUBLE PRECISION NOT NULL,   -- positive loss number
+    realised_return DOUBLE PRECISION NOT NULL,
+    violation       BOOLEAN NOT NULL,            -- realised_return < -var_predicted
+    refit           BOOLEAN NOT NULL DEFAULT FALSE,  -- GARCH parameters re-estimated on this day
+    computed_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (spec_key, price_date)
+);